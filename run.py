@@ -473,6 +473,8 @@ def run_phase(phase: str, args: List[str], debug: bool = False) -> Tuple[int, st
         "enrich": "sotd.enrich.run",
         "aggregate": "sotd.aggregate.run",
         "report": "sotd.report.run",
+        "in_memory": "sotd.pipeline.run",  # extract..aggregate fused with --in-memory
+        "pipelined": "sotd.pipeline.scheduler",  # extract..report as tasks with --pipelined
     }
 
     if phase not in phase_modules:
@@ -495,7 +497,15 @@ def run_phase(phase: str, args: List[str], debug: bool = False) -> Tuple[int, st
             # Handle arguments that take values
             if arg.startswith("--delta-months"):
                 # Only pass delta-months to phases that support it
-                if phase in ["fetch", "extract", "match", "enrich", "aggregate"]:
+                if phase in [
+                    "fetch",
+                    "extract",
+                    "match",
+                    "enrich",
+                    "aggregate",
+                    "in_memory",
+                    "pipelined",
+                ]:
                     phase_args.append(arg)
                     # Add the value too (next argument)
                     if i + 1 < len(args):
@@ -507,7 +517,15 @@ def run_phase(phase: str, args: List[str], debug: bool = False) -> Tuple[int, st
 
             elif arg.startswith("--max-workers"):
                 # Only pass max-workers to phases that support parallel processing
-                if phase in ["extract", "match", "enrich", "aggregate", "report"]:
+                if phase in [
+                    "extract",
+                    "match",
+                    "enrich",
+                    "aggregate",
+                    "report",
+                    "in_memory",
+                    "pipelined",
+                ]:
                     phase_args.append(arg)
                     # Add the value too (next argument)
                     if i + 1 < len(args):
@@ -523,8 +541,72 @@ def run_phase(phase: str, args: List[str], debug: bool = False) -> Tuple[int, st
                 continue
 
             elif arg.startswith("--format"):
-                # Only pass format to report phase
-                if phase == "report":
+                # Only pass format to the phases that write reports
+                if phase in ["report", "pipelined"]:
+                    phase_args.append(arg)
+                    # Add the value too (next argument)
+                    if i + 1 < len(args):
+                        phase_args.append(args[i + 1])
+                        i += 1  # Skip the value in next iteration
+                else:
+                    # If phase doesn't support it, skip both flag and value
+                    if i + 1 < len(args):
+                        i += 1  # Skip the value in next iteration
+                # Always skip the flag itself
+                i += 1
+                continue
+
+            elif arg.startswith("--immutable-after-days"):
+                # Only pass immutable-after-days to fetch_json phase
+                if phase == "fetch_json":
+                    phase_args.append(arg)
+                    # Add the value too (next argument)
+                    if i + 1 < len(args):
+                        phase_args.append(args[i + 1])
+                        i += 1  # Skip the value in next iteration
+                else:
+                    # If phase doesn't support it, skip both flag and value
+                    if i + 1 < len(args):
+                        i += 1  # Skip the value in next iteration
+                # Always skip the flag itself
+                i += 1
+                continue
+
+            elif arg.startswith("--artifact-format"):
+                # Only pass artifact-format to the phases that write enriched data
+                if phase in ["enrich", "in_memory", "pipelined"]:
+                    phase_args.append(arg)
+                    # Add the value too (next argument)
+                    if i + 1 < len(args):
+                        phase_args.append(args[i + 1])
+                        i += 1  # Skip the value in next iteration
+                else:
+                    # If phase doesn't support it, skip both flag and value
+                    if i + 1 < len(args):
+                        i += 1  # Skip the value in next iteration
+                # Always skip the flag itself
+                i += 1
+                continue
+
+            elif arg.startswith("--compress"):
+                # Pass to every phase that writes month artifacts (not report)
+                if phase != "report":
+                    phase_args.append(arg)
+                    # Add the value too (next argument)
+                    if i + 1 < len(args):
+                        phase_args.append(args[i + 1])
+                        i += 1  # Skip the value in next iteration
+                else:
+                    # If phase doesn't support it, skip both flag and value
+                    if i + 1 < len(args):
+                        i += 1  # Skip the value in next iteration
+                # Always skip the flag itself
+                i += 1
+                continue
+
+            elif arg.startswith("--phases"):
+                # Only pass the fused phase list to in-memory and scheduled runs
+                if phase in ["in_memory", "pipelined"]:
                     phase_args.append(arg)
                     # Add the value too (next argument)
                     if i + 1 < len(args):
@@ -539,8 +621,8 @@ def run_phase(phase: str, args: List[str], debug: bool = False) -> Tuple[int, st
                 continue
 
             elif arg.startswith("--type"):
-                # Only pass type to report phase
-                if phase == "report":
+                # Only pass type to the phases that write reports
+                if phase in ["report", "pipelined"]:
                     phase_args.append(arg)
                     # Add the value too (next argument)
                     if i + 1 < len(args):
@@ -566,7 +648,31 @@ def run_phase(phase: str, args: List[str], debug: bool = False) -> Tuple[int, st
                 i += 1
                 continue
 
-            elif arg.startswith("--parallel-comments"):
+            elif arg.startswith("--incremental"):
+                # Pass to the record-level phases
+                if phase in ["extract", "match", "enrich", "in_memory", "pipelined"]:
+                    phase_args.append(arg)
+                # If phase doesn't support it, skip it
+                i += 1
+                continue
+
+            elif arg.startswith("--in-memory"):
+                # Scheduled runs fuse each month's extract..aggregate tasks with it
+                if phase == "pipelined":
+                    phase_args.append(arg)
+                # If phase doesn't support it, skip it
+                i += 1
+                continue
+
+            elif arg.startswith("--delta-comments"):
+                # Pass to both fetch and fetch_json phases
+                if phase in ["fetch", "fetch_json"]:
+                    phase_args.append(arg)
+                # If phase doesn't support it, skip it
+                i += 1
+                continue
+
+            elif arg.startswith(("--parallel-comments", "--async-comments", "--http-cache")):
                 # Only pass to fetch_json phase
                 if phase == "fetch_json":
                     phase_args.append(arg)
@@ -845,6 +951,49 @@ def get_phase_range(phase_range: str) -> List[str]:
     return result
 
 
+def _fuse_phases(
+    phases: List[str], fusable: List[str], pseudo_phase: str
+) -> Tuple[List[str], List[str]]:
+    """Replace the consecutive ``fusable`` phases of a phase list with ``pseudo_phase``."""
+    fused = [phase for phase in phases if phase in fusable]
+    if len(fused) < 2:
+        return phases, []
+    start = phases.index(fused[0])
+    return phases[:start] + [pseudo_phase] + phases[start + len(fused) :], fused
+
+
+def fuse_in_memory_phases(phases: List[str], annual: bool = False) -> Tuple[List[str], List[str]]:
+    """
+    Replace the extract..aggregate part of a phase list with one in-memory run.
+
+    Args:
+        phases: Phases to run, in order
+        annual: Whether aggregation runs in annual mode (kept as its own phase)
+
+    Returns:
+        Tuple of (phases with the fused part replaced by "in_memory", fused phases).
+        The phases are returned unchanged if fewer than two of them can be fused.
+    """
+    fusable = ["extract", "match", "enrich"] + ([] if annual else ["aggregate"])
+    return _fuse_phases(phases, fusable, "in_memory")
+
+
+def fuse_pipelined_phases(phases: List[str], annual: bool = False) -> Tuple[List[str], List[str]]:
+    """
+    Replace the extract..report part of a phase list with one scheduled run.
+
+    Args:
+        phases: Phases to run, in order
+        annual: Whether aggregation and reports run in annual mode (kept as their own phases)
+
+    Returns:
+        Tuple of (phases with the fused part replaced by "pipelined", fused phases).
+        The phases are returned unchanged if fewer than two of them can be fused.
+    """
+    fusable = ["extract", "match", "enrich"] + ([] if annual else ["aggregate", "report"])
+    return _fuse_phases(phases, fusable, "pipelined")
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the SOTD pipeline.
@@ -896,6 +1045,12 @@ Examples:
   python run.py :aggregate
   python run.py fetch:match
   
+  # Run extract through aggregate per month without re-reading artifacts
+  python run.py extract:aggregate --in-memory
+
+  # Rebuild a long range with phases of different months overlapping
+  python run.py extract:report --range 2016-01:2025-12 --pipelined
+
   # Run with debug logging
   python run.py --debug --force
         """,
@@ -972,6 +1127,23 @@ Examples:
         action="store_true",
         help="Show INFO messages during pipeline execution",
     )
+    # Enrich-specific arguments
+    parser.add_argument(
+        "--artifact-format",
+        choices=["json", "parquet"],
+        default="json",
+        help=(
+            "Also write a Parquet copy of enriched data for aggregation "
+            "(enrich only, needs pyarrow)"
+        ),
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["none", "zstd", "gzip"],
+        default="none",
+        help="Write month artifacts as compact compressed JSON (.json.zst or .json.gz, zstd "
+        "needs zstandard); every phase reads either form (all phases except report)",
+    )
     # fetch_json-specific arguments
     parser.add_argument(
         "--skip-unchanged",
@@ -983,6 +1155,46 @@ Examples:
         action="store_true",
         help="Use parallel processing for comment fetching (fetch_json only)",
     )
+    parser.add_argument(
+        "--async-comments",
+        action="store_true",
+        help="Fetch comments with the asyncio engine, needs httpx (fetch_json only)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only reprocess records whose inputs changed (extract, match and enrich)",
+    )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Run consecutive extract/match/enrich/aggregate phases per month in one "
+        "process, passing records in memory instead of re-reading each phase's files",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Run consecutive extract..report phases as per-month tasks on one process "
+        "pool, starting each task as soon as the data it reads is ready",
+    )
+    parser.add_argument(
+        "--delta-comments",
+        action="store_true",
+        help="Only fetch comments newer than each thread's newest stored comment "
+        "(fetch and fetch_json)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache and revalidate comment responses in data/.cache/http (fetch_json only)",
+    )
+    parser.add_argument(
+        "--immutable-after-days",
+        type=float,
+        default=7.0,
+        help="With --http-cache, reuse cached comments of threads older than this "
+        "(fetch_json only, default: 7)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -1039,6 +1251,12 @@ Examples:
             logger.error("No phases specified to run")
             return 1
 
+        fused_phases: List[str] = []
+        if args.pipelined:
+            phases, fused_phases = fuse_pipelined_phases(phases, annual=args.annual)
+        elif args.in_memory:
+            phases, fused_phases = fuse_in_memory_phases(phases, annual=args.annual)
+
         if args.debug:
             logger.debug(f"Running phases: {', '.join(phases)}")
 
@@ -1115,6 +1333,27 @@ Examples:
         common_args.extend(["--format", args.format])
         if args.annual:
             common_args.append("--annual")
+        if args.artifact_format != "json":
+            common_args.extend(["--artifact-format", args.artifact_format])
+        if args.compress != "none":
+            common_args.extend(["--compress", args.compress])
+        # Phase-specific switches; the argument filter only passes each to its phases
+        for flag in (
+            "skip_unchanged",
+            "parallel_comments",
+            "async_comments",
+            "http_cache",
+            "delta_comments",
+            "incremental",
+        ):
+            if getattr(args, flag):
+                common_args.append("--" + flag.replace("_", "-"))
+        if fused_phases:
+            common_args.extend(["--phases", ",".join(fused_phases)])
+        if args.pipelined and args.in_memory:
+            common_args.append("--in-memory")
+        if args.http_cache and args.immutable_after_days != 7.0:
+            common_args.extend(["--immutable-after-days", str(args.immutable_after_days)])
 
         return run_pipeline(phases, common_args, debug=args.debug)
 
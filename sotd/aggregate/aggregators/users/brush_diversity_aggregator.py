@@ -73,38 +73,35 @@ class BrushDiversityAggregator(BaseAggregator):
     def _create_composite_name(self, df: pd.DataFrame) -> pd.Series:
         """Create composite names combining all brush fields."""
 
-        def create_brush_key(row):
-            parts = []
-
-            # Add top-level brand and model
-            if pd.notna(row["brand"]) and row["brand"]:
-                parts.append(str(row["brand"]))
-            if pd.notna(row["model"]) and row["model"]:
-                parts.append(str(row["model"]))
-
-            # Add knot information if available
-            if pd.notna(row["knot_brand"]) and row["knot_brand"]:
-                parts.append(f"knot:{row['knot_brand']}")
-            if pd.notna(row["knot_model"]) and row["knot_model"]:
-                parts.append(f"knot:{row['knot_model']}")
-
-            # Add handle information if available
-            if pd.notna(row["handle_brand"]) and row["handle_brand"]:
-                parts.append(f"handle:{row['handle_brand']}")
-
+        key_columns = [
+            ("brand", ""),
+            ("model", ""),
+            ("knot_brand", "knot:"),
+            ("knot_model", "knot:"),
+            ("handle_brand", "handle:"),
+        ]
+
+        def create_brush_key(values) -> str:
+            parts = [
+                f"{prefix}{value}"
+                for (_, prefix), value in zip(key_columns, values)
+                if pd.notna(value) and value
+            ]
             return " ".join(parts) if parts else "unknown"
 
-        result = df.apply(create_brush_key, axis=1)
-        # Ensure we return a Series
-        if isinstance(result, pd.Series):
-            return result
-        else:
-            return pd.Series(result, index=df.index)
+        # Build keys from plain column values rather than a row-wise DataFrame.apply,
+        # which constructs a Series per row
+        columns = [df[column].tolist() for column, _ in key_columns]
+        return pd.Series([create_brush_key(values) for values in zip(*columns)], index=df.index)
 
     def _group_and_aggregate(self, df: pd.DataFrame) -> pd.DataFrame:
         """Group data and calculate aggregation metrics."""
-        # Create composite brush key for uniqueness counting
-        df["brush_key"] = self._create_composite_name(df)
+        # Create composite brush key for uniqueness counting (aggregate() has
+        # usually built it already as the composite name)
+        if "name" in df.columns:
+            df["brush_key"] = df["name"]
+        else:
+            df["brush_key"] = self._create_composite_name(df)
 
         # Group by author to count unique brushes
         grouped = (
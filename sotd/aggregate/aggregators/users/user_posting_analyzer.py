@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """User posting analyzer for the SOTD pipeline."""
 
-import json
 import logging
 from calendar import monthrange
 from datetime import date
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from sotd.utils.file_io import json_file_exists, load_json_data
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,12 +33,11 @@ class UserPostingAnalyzer:
             project_root = Path(__file__).parent.parent.parent.parent.parent
             data_path = project_root / "data" / "enriched" / f"{month}.json"
 
-            if not data_path.exists():
+            if not json_file_exists(data_path):
                 logger.warning(f"Enriched data file not found: {data_path}")
                 return []
 
-            with open(data_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_data(data_path)
 
             return data.get("data", [])
 
@@ -11,10 +11,11 @@ from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from tqdm import tqdm
 
+from ..utils.file_io import json_file_exists
 from ..utils.logging_config import should_disable_tqdm
 from ..utils.performance_base import BasePerformanceMetrics, BasePerformanceMonitor
 from .aggregators.annual_aggregator import (
@@ -32,6 +33,17 @@ from .aggregators.brush_specialized import (
     aggregate_knot_sizes,
 )
 from .annual_loader import load_annual_data
+from .annual_partials import (
+    build_partial,
+    category_user_shaves,
+    diversity_records,
+    get_aggregator_class,
+    load_month_partial,
+    merge_partials,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +131,9 @@ class AnnualAggregationEngine:
         self._cached_enriched_records: Optional[List[Dict[str, Any]]] = (
             None  # Cache for enriched records
         )
+        self._cached_month_partials: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cached_annual_partial: Optional[Dict[str, Any]] = None
+        self._cached_user_shaves: Dict[str, Optional["pd.DataFrame"]] = {}
 
     def aggregate_razors(self, monthly_data: Dict[str, Dict]) -> List[Dict[str, Any]]:
         """
@@ -646,7 +661,8 @@ class AnnualAggregationEngine:
     def _load_enriched_records(self) -> List[Dict[str, Any]]:
         """Load enriched records for all months in the year.
 
-        Uses cached records if available to avoid redundant file I/O.
+        Uses cached records if available to avoid redundant file I/O, and reads a
+        month's Parquet copy instead of its JSON file when one is current.
 
         Returns:
             List of enriched records from all months
@@ -655,8 +671,11 @@ class AnnualAggregationEngine:
         if self._cached_enriched_records is not None:
             return self._cached_enriched_records
 
+        from sotd.utils.columnar_artifact import load_records_with_columnar
         from sotd.utils.file_io import load_json_data
 
+        from .load import AGGREGATION_COLUMNS
+
         enriched_dir = self.data_dir / "enriched"
         all_enriched_records = []
 
@@ -664,7 +683,11 @@ class AnnualAggregationEngine:
         for month in range(1, 13):
             month_str = f"{self.year}-{month:02d}"
             enriched_file = enriched_dir / f"{month_str}.json"
-            if enriched_file.exists():
+            if json_file_exists(enriched_file):
+                columnar_records = load_records_with_columnar(enriched_file, AGGREGATION_COLUMNS)
+                if columnar_records is not None:
+                    all_enriched_records.extend(columnar_records)
+                    continue
                 try:
                     enriched_data = load_json_data(enriched_file)
                     # Handle both list and dict structures
@@ -681,6 +704,62 @@ class AnnualAggregationEngine:
         self._cached_enriched_records = all_enriched_records
         return all_enriched_records
 
+    def _load_month_partials(self) -> Dict[str, Dict[str, Any]]:
+        """Load the partial aggregate of every month of the year that has enriched data.
+
+        Partials that are missing or older than their enriched file are rebuilt
+        (and saved) from that month's enriched records.
+
+        Returns:
+            Dictionary of partial aggregates keyed by month
+        """
+        if self._cached_month_partials is not None:
+            return self._cached_month_partials
+
+        month_partials = {}
+        for month in range(1, 13):
+            month_str = f"{self.year}-{month:02d}"
+            partial = load_month_partial(month_str, self.data_dir)
+            if partial is not None:
+                month_partials[month_str] = partial
+
+        self._cached_month_partials = month_partials
+        return month_partials
+
+    def _load_annual_partial(self) -> Dict[str, Any]:
+        """Merge the year's monthly partial aggregates.
+
+        Returns:
+            Partial aggregate covering every month with enriched data
+        """
+        if self._cached_annual_partial is not None:
+            return self._cached_annual_partial
+
+        month_partials = self._load_month_partials()
+        if month_partials:
+            annual_partial = merge_partials(month_partials.values())
+        else:
+            annual_partial = build_partial(self._load_enriched_records())
+
+        self._cached_annual_partial = annual_partial
+        return annual_partial
+
+    def _get_user_shaves_for_category(self, category: str) -> Optional["pd.DataFrame"]:
+        """Get shaves per user per composite identifier for a category.
+
+        Args:
+            category: Category name (e.g., "razors", "brush_knot_sizes")
+
+        Returns:
+            DataFrame with composite_identifier, author and user_shaves columns, or
+            None if the category has no data for the year
+        """
+        if category not in self._cached_user_shaves:
+            self._cached_user_shaves[category] = category_user_shaves(
+                self._load_annual_partial(), category
+            )
+        return self._cached_user_shaves[category]
+
     def _calculate_medians_for_category(
         self,
         category: str,
@@ -689,7 +768,7 @@ class AnnualAggregationEngine:
         identifier_field_in_extracted: str = "name",
     ) -> "pd.Series":
         """
-        Calculate median shaves per user for a category by loading enriched records and calculating directly.
+        Calculate median shaves per user for a category from the year's merged partial aggregates.
 
         Args:
             category: Category name (e.g., "razors", "blades", "razor_manufacturers")
@@ -706,39 +785,12 @@ class AnnualAggregationEngine:
         if not isinstance(grouped, pd.DataFrame):
             return pd.Series(0.0, index=[])
 
-        # Load enriched records
-        all_enriched_records = self._load_enriched_records()
+        # Shaves per user per identifier, merged from the monthly partials
+        user_shaves_per_identifier = self._get_user_shaves_for_category(category)
 
-        if not all_enriched_records:
-            # If no enriched records, return zeros
+        if user_shaves_per_identifier is None:
             return pd.Series(0.0, index=grouped[identifier_col])
 
-        # Get the appropriate aggregator class to extract data
-        aggregator_class = self._get_aggregator_class_for_category(category)
-        if not aggregator_class:
-            # If aggregator not found, return zeros
-            return pd.Series(0.0, index=grouped[identifier_col])
-
-        # Create aggregator instance and extract data
-        aggregator = aggregator_class()
-        extracted_data = aggregator._extract_data(all_enriched_records)
-
-        if not extracted_data:
-            return pd.Series(0.0, index=grouped[identifier_col])
-
-        # Convert to DataFrame
-        df = pd.DataFrame(extracted_data)
-
-        # Create composite identifier using the aggregator's logic
-        # This handles cases like brushes which group by name and fiber
-        df["composite_identifier"] = aggregator._create_composite_name(df)
-
-        # Group by composite identifier and author to get shaves per user per identifier
-        user_shaves_per_identifier = (
-            df.groupby(["composite_identifier", "author"]).size().reset_index()
-        )
-        user_shaves_per_identifier.columns = ["composite_identifier", "author", "user_shaves"]
-
         # Calculate median shaves per user for each composite identifier
         median_shaves = (
             user_shaves_per_identifier.groupby("composite_identifier")["user_shaves"]
@@ -757,7 +809,7 @@ class AnnualAggregationEngine:
         # Convert identifier column to string to match composite_identifier (which is always string)
         # For numeric identifiers (like knot sizes), normalize to float then string for consistent matching
         # This handles cases where monthly data might have 24 (int) vs enriched data having 24.0 (float)
-        identifier_series = grouped[identifier_col]
+        identifier_series: "pd.Series" = grouped[identifier_col]  # type: ignore
         # Try to convert to float first for numeric values, then to string for consistent formatting
         try:
             identifier_series = identifier_series.astype(float).astype(str)
@@ -776,7 +828,7 @@ class AnnualAggregationEngine:
         identifier_field_in_extracted: str = "name",
     ) -> "pd.Series":
         """
-        Calculate accurate unique_users for a category by loading enriched records and counting unique authors.
+        Calculate accurate unique_users for a category by counting unique authors in the partials.
 
         Args:
             category: Category name (e.g., "razors", "blades", "razor_manufacturers")
@@ -793,37 +845,18 @@ class AnnualAggregationEngine:
         if not isinstance(grouped, pd.DataFrame):
             return pd.Series(0, index=[], dtype=int)
 
-        # Load enriched records
-        all_enriched_records = self._load_enriched_records()
+        # Shaves per user per identifier, merged from the monthly partials
+        user_shaves_per_identifier = self._get_user_shaves_for_category(category)
 
-        if not all_enriched_records:
-            # If no enriched records, return zeros with same index as grouped DataFrame
+        if user_shaves_per_identifier is None:
+            # If no data, return zeros with same index as grouped DataFrame
             return pd.Series(0, index=grouped.index, dtype=int)
 
-        # Get the appropriate aggregator class to extract data
-        aggregator_class = self._get_aggregator_class_for_category(category)
-        if not aggregator_class:
-            # If aggregator not found, return zeros with same index as grouped DataFrame
-            return pd.Series(0, index=grouped.index, dtype=int)
-
-        # Create aggregator instance and extract data
-        aggregator = aggregator_class()
-        extracted_data = aggregator._extract_data(all_enriched_records)
-
-        if not extracted_data:
-            # If no extracted data, return zeros with same index as grouped DataFrame
-            return pd.Series(0, index=grouped.index, dtype=int)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(extracted_data)
-
-        # Create composite identifier using the aggregator's logic
-        # This handles cases like brushes which group by name and fiber
-        df["composite_identifier"] = aggregator._create_composite_name(df)
-
-        # Group by composite identifier and author, then count unique authors per identifier
+        # Count unique authors per identifier
         unique_users_per_identifier = (
-            df.groupby("composite_identifier")["author"].nunique().reset_index()
+            user_shaves_per_identifier.groupby("composite_identifier")["author"]
+            .nunique()
+            .reset_index()
         )
         unique_users_per_identifier.columns = ["composite_identifier", "unique_users"]
 
@@ -839,7 +872,7 @@ class AnnualAggregationEngine:
         # Convert identifier column to string to match composite_identifier (which is always string)
         # For numeric identifiers (like knot sizes), normalize to float then string for consistent matching
         # This handles cases where monthly data might have 24 (int) vs enriched data having 24.0 (float)
-        identifier_series = grouped[identifier_col]
+        identifier_series: "pd.Series" = grouped[identifier_col]  # type: ignore
         # Try to convert to float first for numeric values, then to string for consistent formatting
         try:
             identifier_series = identifier_series.astype(float).astype(str)
@@ -861,83 +894,7 @@ class AnnualAggregationEngine:
         Returns:
             Aggregator class or None if not found
         """
-        # Map category names to their aggregator classes
-        aggregator_class_map = {
-            "razors": __import__(
-                "sotd.aggregate.aggregators.core.razor_aggregator", fromlist=["RazorAggregator"]
-            ).RazorAggregator,
-            "blades": __import__(
-                "sotd.aggregate.aggregators.core.blade_aggregator", fromlist=["BladeAggregator"]
-            ).BladeAggregator,
-            "brushes": __import__(
-                "sotd.aggregate.aggregators.core.brush_aggregator", fromlist=["BrushAggregator"]
-            ).BrushAggregator,
-            "soaps": __import__(
-                "sotd.aggregate.aggregators.core.soap_aggregator", fromlist=["SoapAggregator"]
-            ).SoapAggregator,
-            "razor_manufacturers": __import__(
-                "sotd.aggregate.aggregators.manufacturers.razor_manufacturer_aggregator",
-                fromlist=["RazorManufacturerAggregator"],
-            ).RazorManufacturerAggregator,
-            "blade_manufacturers": __import__(
-                "sotd.aggregate.aggregators.manufacturers.blade_manufacturer_aggregator",
-                fromlist=["BladeManufacturerAggregator"],
-            ).BladeManufacturerAggregator,
-            "soap_makers": __import__(
-                "sotd.aggregate.aggregators.manufacturers.soap_maker_aggregator",
-                fromlist=["SoapMakerAggregator"],
-            ).SoapMakerAggregator,
-            "brush_handle_makers": __import__(
-                "sotd.aggregate.aggregators.brush_specialized.handle_maker_aggregator",
-                fromlist=["HandleMakerAggregator"],
-            ).HandleMakerAggregator,
-            "brush_knot_makers": __import__(
-                "sotd.aggregate.aggregators.brush_specialized.knot_maker_aggregator",
-                fromlist=["KnotMakerAggregator"],
-            ).KnotMakerAggregator,
-            "brush_fibers": __import__(
-                "sotd.aggregate.aggregators.brush_specialized.fiber_aggregator",
-                fromlist=["FiberAggregator"],
-            ).FiberAggregator,
-            "brush_knot_sizes": __import__(
-                "sotd.aggregate.aggregators.brush_specialized.knot_size_aggregator",
-                fromlist=["KnotSizeAggregator"],
-            ).KnotSizeAggregator,
-            "blackbird_plates": __import__(
-                "sotd.aggregate.aggregators.razor_specialized.blackbird_plate_aggregator",
-                fromlist=["BlackbirdPlateAggregator"],
-            ).BlackbirdPlateAggregator,
-            "christopher_bradley_plates": __import__(
-                "sotd.aggregate.aggregators.razor_specialized.christopher_bradley_plate_aggregator",
-                fromlist=["ChristopherBradleyPlateAggregator"],
-            ).ChristopherBradleyPlateAggregator,
-            "game_changer_plates": __import__(
-                "sotd.aggregate.aggregators.razor_specialized.game_changer_plate_aggregator",
-                fromlist=["GameChangerPlateAggregator"],
-            ).GameChangerPlateAggregator,
-            "straight_widths": __import__(
-                "sotd.aggregate.aggregators.razor_specialized.straight_width_aggregator",
-                fromlist=["StraightWidthAggregator"],
-            ).StraightWidthAggregator,
-            "straight_grinds": __import__(
-                "sotd.aggregate.aggregators.razor_specialized.straight_grind_aggregator",
-                fromlist=["StraightGrindAggregator"],
-            ).StraightGrindAggregator,
-            "straight_points": __import__(
-                "sotd.aggregate.aggregators.razor_specialized.straight_point_aggregator",
-                fromlist=["StraightPointAggregator"],
-            ).StraightPointAggregator,
-            "razor_blade_combinations": __import__(
-                "sotd.aggregate.aggregators.cross_product.razor_blade_combo_aggregator",
-                fromlist=["RazorBladeComboAggregator"],
-            ).RazorBladeComboAggregator,
-            "razor_formats": __import__(
-                "sotd.aggregate.aggregators.formats.razor_format_aggregator",
-                fromlist=["RazorFormatAggregator"],
-            ).RazorFormatAggregator,
-        }
-
-        return aggregator_class_map.get(category)
+        return get_aggregator_class(category)
 
     def _calculate_razor_format_medians(
         self, grouped: "pd.DataFrame", identifier_col: str
@@ -1184,32 +1141,25 @@ class AnnualAggregationEngine:
             .reset_index()
         )
 
-        # Recalculate unique_combinations, HHI, and effective_soaps from enriched records
-        # for accurate annual values. Load enriched records for all months and recalculate
-        # from combined distribution to get true unique combinations across the year.
+        # Recalculate unique_combinations, HHI, and effective_soaps from the monthly partial
+        # aggregates for accurate annual values. Merge the soap rows of the included months and
+        # recalculate from the combined distribution to get true unique combinations.
         try:
-            from .load import load_enriched_data
             from .aggregators.users.soap_brand_scent_diversity_aggregator import (
                 SoapBrandScentDiversityAggregator,
             )
 
-            # Collect all enriched records for the year
-            all_enriched_records = []
-            for month in monthly_data.keys():
-                try:
-                    enriched_records = load_enriched_data(month, self.data_dir)
-                    all_enriched_records.extend(enriched_records)
-                except FileNotFoundError:
-                    # Skip missing months gracefully
-                    continue
-                except Exception:
-                    # Skip corrupted months gracefully
-                    continue
+            # Collect soap rows for the included months
+            month_partials = self._load_month_partials()
+            included_partials = [
+                month_partials[month] for month in monthly_data.keys() if month in month_partials
+            ]
+            soap_records = diversity_records(merge_partials(included_partials))
 
-            if all_enriched_records:
-                # Recalculate unique_combinations, HHI, and effective_soaps from combined enriched records
+            if soap_records:
+                # Recalculate unique_combinations, HHI, and effective_soaps from combined records
                 aggregator = SoapBrandScentDiversityAggregator()
-                hhi_results = aggregator.aggregate(all_enriched_records)
+                hhi_results = aggregator.aggregate(soap_records)
 
                 # Create mapping of user -> unique_combinations, hhi, effective_soaps
                 hhi_map = {
@@ -1237,7 +1187,7 @@ class AnnualAggregationEngine:
                     .fillna(0.0)
                 )
             else:
-                # Fallback if no enriched records available - use summed values (less accurate)
+                # Fallback if no enriched data available - use summed values (less accurate)
                 # This should rarely happen, but provides a fallback
                 unique_combinations_sum = (
                     df.groupby("user")["unique_combinations"].sum().reset_index()
@@ -1321,16 +1271,9 @@ class AnnualAggregationEngine:
                 meta = data["meta"]
                 total_shaves += meta.get("total_shaves", 0)
 
-        # Calculate accurate unique_shavers from enriched records (not summing monthly counts)
-        all_enriched_records = self._load_enriched_records()
-        if all_enriched_records:
-            # Count unique authors across all enriched records
-            import pandas as pd
-
-            df = pd.DataFrame(all_enriched_records)
-            total_unique_shavers = int(df["author"].nunique()) if "author" in df.columns else 0
-        else:
-            total_unique_shavers = 0
+        # Calculate accurate unique_shavers from the partials (not summing monthly counts)
+        annual_partial = self._load_annual_partial()
+        total_unique_shavers = len(annual_partial["authors"])
 
         # Calculate average shaves per user
         avg_shaves_per_user = 0.0
@@ -1340,24 +1283,11 @@ class AnnualAggregationEngine:
         # Calculate median shaves per user by aggregating user data from monthly records
         median_shaves_per_user = self._calculate_median_shaves_per_user(monthly_data)
 
-        # Calculate sample-related metrics from enriched records
-        from sotd.aggregate.utils.metrics import (
-            calculate_total_samples,
-            calculate_sample_users,
-            calculate_sample_brands,
-            calculate_unique_sample_soaps,
-        )
-
-        total_samples = 0
-        sample_users = 0
-        sample_brands = 0
-        unique_sample_soaps = 0
-
-        if all_enriched_records:
-            total_samples = calculate_total_samples(all_enriched_records)
-            sample_users = calculate_sample_users(all_enriched_records)
-            sample_brands = calculate_sample_brands(all_enriched_records)
-            unique_sample_soaps = calculate_unique_sample_soaps(all_enriched_records)
+        # Sample-related metrics from the merged partials
+        total_samples = annual_partial["total_samples"]
+        sample_users = len(annual_partial["sample_users"])
+        sample_brands = len(annual_partial["sample_brands"])
+        unique_sample_soaps = len(annual_partial["sample_soaps"])
 
         # Calculate sample percentage
         sample_percentage = 0.0
@@ -1413,9 +1343,8 @@ class AnnualAggregationEngine:
         Returns:
             Dictionary with all aggregated data and metadata
         """
-        # Pre-load enriched records once to cache them for all category calculations
-        # This eliminates redundant file I/O when calculating medians and unique_users
-        _ = self._load_enriched_records()
+        # Load and merge the monthly partial aggregates once for all category calculations
+        _ = self._load_annual_partial()
 
         metadata = self.generate_metadata(monthly_data, included_months, missing_months)
 
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from ..utils.file_io import load_json_data
+from ..utils.file_io import get_file_size_mb, load_json_data
 from ..utils.performance_base import BasePerformanceMetrics, BasePerformanceMonitor
 
 logger = logging.getLogger(__name__)
@@ -148,8 +148,7 @@ class AnnualDataLoader:
         try:
             data = load_json_data(file_path)
             # Update file size metrics
-            if file_path.exists():
-                self.monitor.metrics.total_file_size_mb += file_path.stat().st_size / 1024 / 1024
+            self.monitor.metrics.total_file_size_mb += get_file_size_mb(file_path)
             return data
         except FileNotFoundError:
             self.monitor.metrics.files_missing += 1
@@ -0,0 +1,341 @@
+"""
+Mergeable per-month partial aggregates for annual rollups.
+
+Annual unique-user counts, medians and user diversity cannot be derived from
+the monthly report tables (a user counted in two months is still one user), so
+the annual engine used to reload every enriched record of the year. Instead,
+each month now keeps a small partial in ``data/aggregated/partials/YYYY-MM.json``
+holding exactly the state those figures need:
+
+- for each product category, the distinct rows the category's aggregator
+  extracts from the records (identifier fields plus author) with a shave count
+- the distinct authors, for the annual unique shaver count
+- the sample totals and the sample user, brand and soap sets
+
+Partials merge by summing row counts and taking set unions, so an annual (or
+multi-year) rollup is the merge of the month partials and is exact. A partial
+records the size and mtime of the enriched file it was built from and a
+fingerprint of the code that built it; when the enriched month changes, only
+that month's partial is rebuilt, and a change to the aggregators rebuilds them all.
+"""
+
+import functools
+import importlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from sotd.utils.file_io import (
+    json_file_exists,
+    load_json_data,
+    resolve_json_path,
+    save_json_data,
+)
+from sotd.utils.record_hash import compute_phase_fingerprint
+
+from .load import load_enriched_data
+from .utils.metrics import scan_record_sets
+
+PARTIAL_VERSION = 1
+
+# Source code whose behaviour is baked into a partial (row extraction, composite
+# names, field validation and the sample sets)
+PARTIAL_SOURCE_PACKAGES = ("aggregate.aggregators", "aggregate.annual_partials", "aggregate.utils")
+
+_AGGREGATORS_PACKAGE = "sotd.aggregate.aggregators"
+
+# Category name -> (module under sotd.aggregate.aggregators, aggregator class)
+AGGREGATOR_CLASSES = {
+    "razors": ("core.razor_aggregator", "RazorAggregator"),
+    "blades": ("core.blade_aggregator", "BladeAggregator"),
+    "brushes": ("core.brush_aggregator", "BrushAggregator"),
+    "soaps": ("core.soap_aggregator", "SoapAggregator"),
+    "razor_manufacturers": (
+        "manufacturers.razor_manufacturer_aggregator",
+        "RazorManufacturerAggregator",
+    ),
+    "blade_manufacturers": (
+        "manufacturers.blade_manufacturer_aggregator",
+        "BladeManufacturerAggregator",
+    ),
+    "soap_makers": ("manufacturers.soap_maker_aggregator", "SoapMakerAggregator"),
+    "brush_handle_makers": (
+        "brush_specialized.handle_maker_aggregator",
+        "HandleMakerAggregator",
+    ),
+    "brush_knot_makers": ("brush_specialized.knot_maker_aggregator", "KnotMakerAggregator"),
+    "brush_fibers": ("brush_specialized.fiber_aggregator", "FiberAggregator"),
+    "brush_knot_sizes": ("brush_specialized.knot_size_aggregator", "KnotSizeAggregator"),
+    "blackbird_plates": (
+        "razor_specialized.blackbird_plate_aggregator",
+        "BlackbirdPlateAggregator",
+    ),
+    "christopher_bradley_plates": (
+        "razor_specialized.christopher_bradley_plate_aggregator",
+        "ChristopherBradleyPlateAggregator",
+    ),
+    "game_changer_plates": (
+        "razor_specialized.game_changer_plate_aggregator",
+        "GameChangerPlateAggregator",
+    ),
+    "straight_widths": ("razor_specialized.straight_width_aggregator", "StraightWidthAggregator"),
+    "straight_grinds": ("razor_specialized.straight_grind_aggregator", "StraightGrindAggregator"),
+    "straight_points": ("razor_specialized.straight_point_aggregator", "StraightPointAggregator"),
+    "razor_blade_combinations": (
+        "cross_product.razor_blade_combo_aggregator",
+        "RazorBladeComboAggregator",
+    ),
+    "razor_formats": ("formats.razor_format_aggregator", "RazorFormatAggregator"),
+    "user_soap_brand_scent_diversity": (
+        "users.soap_brand_scent_diversity_aggregator",
+        "SoapBrandScentDiversityAggregator",
+    ),
+}
+
+
+def get_aggregator_class(category: str):
+    """Return the aggregator class for a category, or None if there is none."""
+    entry = AGGREGATOR_CLASSES.get(category)
+    if entry is None:
+        return None
+    module_name, class_name = entry
+    module = importlib.import_module(f"{_AGGREGATORS_PACKAGE}.{module_name}")
+    return getattr(module, class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def partial_code_fingerprint() -> str:
+    """Return the fingerprint of the code that builds partials (computed once per process)."""
+    return compute_phase_fingerprint(PARTIAL_SOURCE_PACKAGES)
+
+
+def partial_path(month: str, data_dir: Path) -> Path:
+    """Return the path of a month's partial aggregate."""
+    return data_dir / "aggregated" / "partials" / f"{month}.json"
+
+
+def _row_key(row: Dict[str, Any]) -> Any:
+    """Return a hashable key for a row that tells 24 and 24.0 (or 1 and True) apart."""
+    key = tuple((name, value.__class__, value) for name, value in row.items())
+    try:
+        hash(key)
+    except TypeError:
+        # Rows holding lists or dicts
+        return json.dumps(row, ensure_ascii=False)
+    return key
+
+
+def _count_rows(rows: Iterable[Dict[str, Any]], counts: Dict[Any, List[Any]], weight: int = 1):
+    for row in rows:
+        key = _row_key(row)
+        entry = counts.get(key)
+        if entry is None:
+            counts[key] = [row, weight]
+        else:
+            entry[1] += weight
+
+
+def build_partial(
+    records: List[Dict[str, Any]], source: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
+    """
+    Build the mergeable partial aggregate for a set of enriched records.
+
+    Args:
+        records: Enriched comment records (usually one month)
+        source: Size and mtime of the enriched file the records came from
+
+    Returns:
+        Partial aggregate dictionary
+    """
+    categories = {}
+    for category in AGGREGATOR_CLASSES:
+        aggregator_class = get_aggregator_class(category)
+        if aggregator_class is None:
+            continue
+        counts: Dict[Any, List[Any]] = {}
+        _count_rows(aggregator_class()._extract_data(records), counts)
+        categories[category] = list(counts.values())
+
+    authors: Dict[Any, None] = {}
+    for record in records:
+        author = record.get("author")
+        if author is not None:
+            authors[author] = None
+
+    sets = scan_record_sets(records)
+    return {
+        "version": PARTIAL_VERSION,
+        "code": partial_code_fingerprint(),
+        "source": source,
+        "authors": list(authors),
+        "total_samples": sets["total_samples"],
+        "sample_users": sorted(sets["sample_users"]),
+        "sample_brands": sorted(sets["sample_brands"]),
+        "sample_soaps": sorted(sets["sample_soaps"]),
+        "categories": categories,
+    }
+
+
+def merge_partials(partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge partial aggregates (e.g. the months of a year) into one.
+
+    Args:
+        partials: Partial aggregates built by build_partial
+
+    Returns:
+        Partial aggregate covering all inputs (without a source)
+    """
+    category_counts: Dict[str, Dict[Any, List[Any]]] = {}
+    authors: Dict[Any, None] = {}
+    total_samples = 0
+    sample_users, sample_brands, sample_soaps = set(), set(), set()
+
+    for partial in partials:
+        for category, rows in partial["categories"].items():
+            counts = category_counts.setdefault(category, {})
+            for row, count in rows:
+                _count_rows([row], counts, count)
+        authors.update(dict.fromkeys(partial["authors"]))
+        total_samples += partial["total_samples"]
+        sample_users.update(partial["sample_users"])
+        sample_brands.update(partial["sample_brands"])
+        sample_soaps.update(partial["sample_soaps"])
+
+    return {
+        "version": PARTIAL_VERSION,
+        "code": partial_code_fingerprint(),
+        "source": None,
+        "authors": list(authors),
+        "total_samples": total_samples,
+        "sample_users": sorted(sample_users),
+        "sample_brands": sorted(sample_brands),
+        "sample_soaps": sorted(sample_soaps),
+        "categories": {
+            category: list(counts.values()) for category, counts in category_counts.items()
+        },
+    }
+
+
+def _source_stat(enriched_file: Path) -> Dict[str, int]:
+    stat = resolve_json_path(enriched_file).stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def save_month_partial(records: List[Dict[str, Any]], month: str, data_dir: Path) -> Optional[Path]:
+    """
+    Build and save a month's partial from its enriched records.
+
+    Call this with records just loaded from ``data/enriched/YYYY-MM.json``; the
+    file's current size and mtime are recorded as the partial's source.
+
+    Args:
+        records: Enriched records for the month
+        month: Month in YYYY-MM format
+        data_dir: Data directory
+
+    Returns:
+        Path to the saved partial, or None if the enriched file does not exist
+    """
+    enriched_file = data_dir / "enriched" / f"{month}.json"
+    if not json_file_exists(enriched_file):
+        return None
+    path = partial_path(month, data_dir)
+    save_json_data(build_partial(records, _source_stat(enriched_file)), path)
+    return path
+
+
+def load_month_partial(month: str, data_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Return a month's partial, rebuilding and saving it if it is missing or stale.
+
+    A partial is stale if its enriched file has changed, or if it was built by
+    different aggregator code (see PARTIAL_SOURCE_PACKAGES).
+
+    Args:
+        month: Month in YYYY-MM format
+        data_dir: Data directory
+
+    Returns:
+        Partial aggregate, or None if the month has no readable enriched data
+    """
+    enriched_file = data_dir / "enriched" / f"{month}.json"
+    if not json_file_exists(enriched_file):
+        return None
+
+    path = partial_path(month, data_dir)
+    if json_file_exists(path):
+        try:
+            partial = load_json_data(path)
+            if (
+                partial.get("version") == PARTIAL_VERSION
+                and partial.get("code") == partial_code_fingerprint()
+                and partial.get("source") == _source_stat(enriched_file)
+            ):
+                return partial
+        except (json.JSONDecodeError, OSError, AttributeError):
+            pass
+
+    try:
+        records = load_enriched_data(month, data_dir)
+    except Exception:
+        # Skip corrupted months, as the annual engine always has
+        return None
+    save_month_partial(records, month, data_dir)
+    return build_partial(records)
+
+
+def category_user_shaves(partial: Dict[str, Any], category: str) -> Optional[pd.DataFrame]:
+    """
+    Return shaves per user for each identifier of a category.
+
+    Identifiers are the aggregator's composite names, computed over the merged
+    rows so they match what the aggregator produces for the combined records.
+
+    Args:
+        partial: Partial aggregate (usually merged over a year)
+        category: Category name (e.g. "razors", "brush_knot_sizes")
+
+    Returns:
+        DataFrame with composite_identifier, author and user_shaves columns, or
+        None if the category has no data
+    """
+    rows = partial["categories"].get(category)
+    aggregator_class = get_aggregator_class(category)
+    if not rows or aggregator_class is None:
+        return None
+
+    df = pd.DataFrame([row for row, _count in rows])
+    df["composite_identifier"] = aggregator_class()._create_composite_name(df)
+    df["user_shaves"] = [count for _row, count in rows]
+    grouped = df.groupby(["composite_identifier", "author"]).agg({"user_shaves": "sum"})
+    return grouped.reset_index()
+
+
+def diversity_records(partial: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Rebuild minimal soap records from a partial for the user diversity aggregator.
+
+    Args:
+        partial: Partial aggregate
+
+    Returns:
+        One record per soap shave with the author and matched soap fields
+    """
+    records = []
+    for row, count in partial["categories"].get("user_soap_brand_scent_diversity", []):
+        record = {
+            "author": row["author"],
+            "soap": {
+                "matched": {
+                    "brand": row["brand"],
+                    "scent": row["scent"],
+                    "countable": row["countable"],
+                }
+            },
+        }
+        records.extend([record] * count)
+    return records
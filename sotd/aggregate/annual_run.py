@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Optional
 
+from ..utils.file_io import iter_json_files, json_file_exists
 from ..utils.performance_base import BasePerformanceMetrics, BasePerformanceMonitor
 from .annual_engine import process_annual, process_annual_range
 
@@ -219,9 +220,9 @@ def validate_annual_data(year: str, data_dir: Path) -> dict:
     try:
         # Check if annual file exists
         annual_file = data_dir / "aggregated" / "annual" / f"{year}.json"
-        validation_result["file_exists"] = annual_file.exists()
+        validation_result["file_exists"] = json_file_exists(annual_file)
 
-        if not annual_file.exists():
+        if not validation_result["file_exists"]:
             validation_result["errors"].append(f"Annual file not found: {annual_file}")
             return validation_result
 
@@ -331,7 +332,7 @@ def get_annual_summary(year: str, data_dir: Path) -> Optional[dict]:
     try:
         annual_file = data_dir / "aggregated" / "annual" / f"{year}.json"
 
-        if not annual_file.exists():
+        if not json_file_exists(annual_file):
             return None
 
         # Use unified file I/O patterns
@@ -381,7 +382,7 @@ def list_available_annual_years(data_dir: Path) -> list:
             return []
 
         years = []
-        for file_path in annual_dir.glob("*.json"):
+        for file_path in iter_json_files(annual_dir):
             year = file_path.stem
             if year.isdigit() and len(year) == 4:
                 years.append(year)
@@ -22,6 +22,8 @@ class AggregateCLIParser(BaseCLIParser):
         self._add_annual_argument()
         # Add parallel processing support
         self.add_parallel_processing_arguments()
+        # Compressed aggregated/ output (readers accept either form)
+        self.add_compression_arguments()
 
     def _add_annual_argument(self) -> None:
         """Add annual aggregation argument."""
@@ -6,9 +6,11 @@ from typing import Sequence
 
 from tqdm import tqdm
 
+from sotd.utils.file_io import json_file_exists
 from sotd.utils.logging_config import should_disable_tqdm
 from sotd.utils.performance import PerformanceMonitor, PipelineOutputFormatter
 
+from .annual_partials import save_month_partial
 from .load import load_enriched_data
 from .processor import aggregate_all
 from .save import save_aggregated_data, save_product_usage_data, save_user_analysis_data
@@ -16,6 +18,24 @@ from .save import save_aggregated_data, save_product_usage_data, save_user_analy
 logger = logging.getLogger(__name__)
 
 
+def save_month_aggregates(
+    aggregated_data: dict, records: list, month: str, data_dir: Path
+) -> None:
+    """Save a month's aggregate_all output and the partial built from its enriched records."""
+    # Save main aggregated data (remove specialized aggregations first)
+    user_analysis = aggregated_data.pop("_user_analysis", {})
+    product_usage = aggregated_data.pop("_product_usage", {})
+    save_aggregated_data(aggregated_data, month, data_dir)
+
+    # Save specialized aggregations to separate files
+    if user_analysis:
+        save_user_analysis_data(user_analysis, month, data_dir)
+    if product_usage:
+        save_product_usage_data(product_usage, month, data_dir)
+    # Mergeable partial state for annual rollups
+    save_month_partial(records, month, data_dir)
+
+
 def process_months(
     months: Sequence[str],
     data_dir: Path,
@@ -34,7 +54,7 @@ def process_months(
 
         # Check if output already exists and force is not set
         output_path = data_dir / "aggregated" / f"{month}.json"
-        if output_path.exists() and not force:
+        if json_file_exists(output_path) and not force:
             logger.debug(f"  {month}: output exists")
             continue
 
@@ -52,16 +72,7 @@ def process_months(
             aggregated_data = aggregate_all(records, month, debug=debug)
 
             monitor.start_file_io_timing()
-            # Save main aggregated data (remove specialized aggregations first)
-            user_analysis = aggregated_data.pop("_user_analysis", {})
-            product_usage = aggregated_data.pop("_product_usage", {})
-            save_aggregated_data(aggregated_data, month, data_dir)
-
-            # Save specialized aggregations to separate files
-            if user_analysis:
-                save_user_analysis_data(user_analysis, month, data_dir)
-            if product_usage:
-                save_product_usage_data(product_usage, month, data_dir)
+            save_month_aggregates(aggregated_data, records, month, data_dir)
             monitor.end_file_io_timing()
 
             monitor.end_total_timing()
@@ -233,7 +244,7 @@ def process_single_month(
 
         # Check if output already exists and force is not set
         output_path = data_dir / "aggregated" / f"{month}.json"
-        if output_path.exists() and not force:
+        if json_file_exists(output_path) and not force:
             return None
 
         monitor.start_file_io_timing()
@@ -249,16 +260,7 @@ def process_single_month(
         aggregated_data = aggregate_all(records, month, debug=debug)
 
         monitor.start_file_io_timing()
-        # Save main aggregated data (remove specialized aggregations first)
-        user_analysis = aggregated_data.pop("_user_analysis", {})
-        product_usage = aggregated_data.pop("_product_usage", {})
-        save_aggregated_data(aggregated_data, month, data_dir)
-
-        # Save specialized aggregations to separate files
-        if user_analysis:
-            save_user_analysis_data(user_analysis, month, data_dir)
-        if product_usage:
-            save_product_usage_data(product_usage, month, data_dir)
+        save_month_aggregates(aggregated_data, records, month, data_dir)
         monitor.end_file_io_timing()
 
         monitor.end_total_timing()
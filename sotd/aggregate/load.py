@@ -2,19 +2,40 @@ import json
 from pathlib import Path
 from typing import Any
 
-from sotd.utils.file_io import load_json_data
+from sotd.utils.columnar_artifact import load_records_with_columnar
+from sotd.utils.file_io import json_file_exists, load_json_data
+
+# Record fields the aggregators read. Parquet copies are loaded with only these
+# columns, so the comment body and other unused fields are never decoded.
+AGGREGATION_COLUMNS = (
+    "author",
+    "id",
+    "thread_title",
+    "url",
+    "blade_enriched",
+    "razor",
+    "blade",
+    "brush",
+    "soap",
+)
 
 
 def load_enriched_data(month: str, data_dir: Path) -> list[dict[str, Any]]:
     """Load enriched SOTD data for a given month from JSON file.
     Returns a list of enriched comment records.
+    Reads the Parquet copy (--artifact-format parquet) instead when it is current,
+    in which case records hold only the AGGREGATION_COLUMNS fields.
     Raises FileNotFoundError if the file does not exist.
     Raises ValueError if the file is malformed or missing required fields.
     """
     file_path = data_dir / "enriched" / f"{month}.json"
-    if not file_path.exists():
+    if not json_file_exists(file_path):
         raise FileNotFoundError(f"Enriched data file not found: {file_path}")
 
+    columnar_records = load_records_with_columnar(file_path, AGGREGATION_COLUMNS)
+    if columnar_records is not None:
+        return columnar_records
+
     try:
         content = load_json_data(file_path)
     except (json.JSONDecodeError, OSError) as e:
@@ -9,6 +9,7 @@ from tqdm import tqdm
 
 from ..cli_utils.date_span import month_span
 from ..utils.data_dir import get_data_dir
+from ..utils.file_io import json_file_exists, set_artifact_compression
 from ..utils.logging_config import setup_pipeline_logging, should_disable_tqdm
 from .annual_engine import process_annual, process_annual_range, process_annual_range_parallel
 from .annual_loader import load_annual_data
@@ -29,6 +30,7 @@ __all__ = [
 def run(args) -> bool:
     """Run the aggregate phase for the specified date range."""
     data_dir = get_data_dir(args.data_dir)
+    set_artifact_compression(getattr(args, "compress", "none"))
     if args.annual:
         # Handle annual aggregation (annual handles missing files gracefully)
         if args.year:
@@ -148,14 +150,14 @@ def _create_annual_files(
         for month_num in range(1, 13):
             month_str = f"{year}-{month_num:02d}"
             month_file = monthly_data_dir / f"{month_str}.json"
-            if month_file.exists():
+            if json_file_exists(month_file):
                 months_present.append(month_str)
 
         # If at least one month is present, add to processing list
         if months_present:
             # Check if annual file already exists and force is False
             annual_file = monthly_data_dir / "annual" / f"{year}.json"
-            if annual_file.exists() and not force:
+            if json_file_exists(annual_file) and not force:
                 if debug:
                     logger.debug(
                         f"Annual file for {year} already exists, skipping (use --force to regenerate)"
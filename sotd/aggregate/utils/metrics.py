@@ -1,353 +1,227 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-import pandas as pd
 
+def _matched_dict(record: Dict[str, Any], field: str) -> Optional[Dict[str, Any]]:
+    """Return a product's non-empty matched dict, or None."""
+    product = record.get(field)
+    if product is not None and isinstance(product, dict):
+        matched = product.get("matched", {})
+        if matched and isinstance(matched, dict):
+            return matched
+    return None
 
-def calculate_shaves(records: List[Dict[str, Any]]) -> int:
-    """Calculate total number of shaves from records."""
-    return len(records)
 
+def _clean_str(value: Any) -> str:
+    """Return a stripped string value, or "" for missing and non-string values."""
+    if value and isinstance(value, str):
+        return value.strip()
+    return ""
 
-def calculate_unique_users(records: List[Dict[str, Any]]) -> int:
-    """Calculate number of unique users from records."""
-    if not records:
-        return 0
 
-    # Use a more defensive approach with pandas
-    authors = set()
-    for record in records:
-        author = record.get("author")
-        if author and author is not None:
-            author = str(author).strip()
-            if author:
-                authors.add(author)
-    return len(authors)
+def _brand_model_key(record: Dict[str, Any], field: str) -> Optional[str]:
+    """Return "Brand Model" for a product with a string brand and model."""
+    matched = _matched_dict(record, field)
+    if matched is None:
+        return None
+    brand = _clean_str(matched.get("brand"))
+    model = _clean_str(matched.get("model"))
+    if brand and model:
+        return f"{brand} {model}"
+    return None
 
 
-def calculate_avg_shaves_per_user(records: List[Dict[str, Any]]) -> float:
-    """Calculate average shaves per user."""
-    total_shaves = calculate_shaves(records)
-    unique_users = calculate_unique_users(records)
-    if unique_users == 0:
-        return 0.0
-    return round(total_shaves / unique_users, 2)
+def scan_record_sets(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Collect the per-user counts and distinct-value sets behind the record-level metrics.
 
+    The sets can be merged across months (see ``sotd.aggregate.annual_partials``)
+    before they are counted.
 
-def calculate_median_shaves_per_user(records: List[Dict[str, Any]]) -> float:
-    """Calculate median shaves per user."""
-    if not records:
-        return 0.0
+    Args:
+        records: List of enriched comment records
+
+    Returns:
+        Dictionary with user_shaves (author -> shaves), total_samples and the sets
+        soaps, soap_brands, sample_users, sample_brands, sample_soaps, razors,
+        blades and brushes
+    """
+    user_shaves: Dict[str, int] = {}
+    soaps = set()
+    soap_brands = set()
+    total_samples = 0
+    sample_users = set()
+    sample_brands = set()
+    sample_soaps = set()
+    razors = set()
+    blades = set()
+    brushes = set()
 
-    # Count shaves per user using a more defensive approach
-    user_shaves = {}
     for record in records:
         author = record.get("author")
-        if author and author is not None:
+        if author:
             author = str(author).strip()
-            if author:  # Skip None, empty strings, and whitespace-only strings
+            if author:
                 user_shaves[author] = user_shaves.get(author, 0) + 1
 
-    if not user_shaves:
-        return 0.0
+        for field, seen in (("razor", razors), ("blade", blades), ("brush", brushes)):
+            key = _brand_model_key(record, field)
+            if key is not None:
+                seen.add(key)
+
+        soap = record.get("soap")
+        if soap is None or not isinstance(soap, dict):
+            continue
+
+        matched = _matched_dict(record, "soap")
+        if matched is not None:
+            brand = _clean_str(matched.get("brand"))
+            scent = _clean_str(matched.get("scent"))
+            if brand:
+                soap_brands.add(brand)
+            # Non-countable scents (countable defaults to True) are not unique soaps
+            if brand and scent and matched.get("countable", True):
+                soaps.add(f"{brand} - {scent}".lower())
+
+        enriched = soap.get("enriched", {})
+        if not (enriched and enriched.get("sample_type")):
+            continue
+        total_samples += 1
+        sample_author = record.get("author")
+        if sample_author and isinstance(sample_author, str) and sample_author.strip():
+            sample_users.add(sample_author.strip())
+        if matched is not None:
+            brand = _clean_str(matched.get("brand"))
+            scent = _clean_str(matched.get("scent"))
+            if brand:
+                sample_brands.add(brand)
+            if brand and scent:
+                sample_soaps.add(f"{brand} - {scent}")
 
-    # Calculate median
-    shave_counts = list(user_shaves.values())
-    shave_counts.sort()
-    n = len(shave_counts)
+    return {
+        "user_shaves": user_shaves,
+        "soaps": soaps,
+        "soap_brands": soap_brands,
+        "total_samples": total_samples,
+        "sample_users": sample_users,
+        "sample_brands": sample_brands,
+        "sample_soaps": sample_soaps,
+        "razors": razors,
+        "blades": blades,
+        "brushes": brushes,
+    }
 
-    if n % 2 == 0:
-        # Even number of users, average of two middle values
-        median = (shave_counts[n // 2 - 1] + shave_counts[n // 2]) / 2
-    else:
-        # Odd number of users, middle value
-        median = shave_counts[n // 2]
 
-    return round(median, 2)
+def scan_record_metrics(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Calculate every record-level metric in a single pass over the records.
 
+    Args:
+        records: List of enriched comment records
 
-def calculate_unique_soaps(records: List[Dict[str, Any]]) -> int:
-    """Calculate number of unique soaps from records, excluding non-countable scents."""
-    if not records:
-        return 0
+    Returns:
+        Dictionary with total_shaves, unique_shavers, avg_shaves_per_user,
+        median_shaves_per_user, unique_soaps, unique_brands, total_samples,
+        sample_users, sample_brands, unique_sample_soaps, unique_razors,
+        unique_blades and unique_brushes
+    """
+    sets = scan_record_sets(records)
+    user_shaves = sets["user_shaves"]
+
+    total_shaves = len(records)
+    unique_shavers = len(user_shaves)
+    avg_shaves_per_user = round(total_shaves / unique_shavers, 2) if unique_shavers else 0.0
+
+    median_shaves_per_user = 0.0
+    if user_shaves:
+        shave_counts = sorted(user_shaves.values())
+        n = len(shave_counts)
+        if n % 2 == 0:
+            # Even number of users, average of two middle values
+            median = (shave_counts[n // 2 - 1] + shave_counts[n // 2]) / 2
+        else:
+            # Odd number of users, middle value
+            median = shave_counts[n // 2]
+        median_shaves_per_user = round(median, 2)
 
-    df = pd.DataFrame(records)
+    return {
+        "total_shaves": total_shaves,
+        "unique_shavers": unique_shavers,
+        "avg_shaves_per_user": avg_shaves_per_user,
+        "median_shaves_per_user": median_shaves_per_user,
+        "unique_soaps": len(sets["soaps"]),
+        "unique_brands": len(sets["soap_brands"]),
+        "total_samples": sets["total_samples"],
+        "sample_users": len(sets["sample_users"]),
+        "sample_brands": len(sets["sample_brands"]),
+        "unique_sample_soaps": len(sets["sample_soaps"]),
+        "unique_razors": len(sets["razors"]),
+        "unique_blades": len(sets["blades"]),
+        "unique_brushes": len(sets["brushes"]),
+    }
 
-    # Extract soap data and filter for valid entries
-    soap_data = []
-    for _, row in df.iterrows():
-        soap = row.get("soap")
-        if soap is not None and isinstance(soap, dict):
-            matched = soap.get("matched", {})
-            if matched and isinstance(matched, dict):
-                brand = matched.get("brand")
-                scent = matched.get("scent")
-                countable = matched.get("countable", True)  # Default to True
 
-                # Skip non-countable scents
-                if not countable:
-                    continue
+def calculate_shaves(records: List[Dict[str, Any]]) -> int:
+    """Calculate total number of shaves from records."""
+    return len(records)
 
-                if brand and isinstance(brand, str) and scent and isinstance(scent, str):
-                    brand = brand.strip()
-                    scent = scent.strip()
-                    if brand and scent:
-                        soap_data.append(f"{brand} - {scent}".lower())
 
-    if not soap_data:
-        return 0
+def calculate_unique_users(records: List[Dict[str, Any]]) -> int:
+    """Calculate number of unique users from records."""
+    return scan_record_metrics(records)["unique_shavers"]
 
-    # Use pandas for deduplication
-    soap_series = pd.Series(soap_data)
-    return len(soap_series.unique())
 
+def calculate_avg_shaves_per_user(records: List[Dict[str, Any]]) -> float:
+    """Calculate average shaves per user."""
+    return scan_record_metrics(records)["avg_shaves_per_user"]
 
-def calculate_unique_brands(records: List[Dict[str, Any]]) -> int:
-    """Calculate number of unique soap brands from records."""
-    if not records:
-        return 0
 
-    df = pd.DataFrame(records)
+def calculate_median_shaves_per_user(records: List[Dict[str, Any]]) -> float:
+    """Calculate median shaves per user."""
+    return scan_record_metrics(records)["median_shaves_per_user"]
+
 
-    # Extract soap brands and filter for valid entries
-    brands = []
-    for _, row in df.iterrows():
-        soap = row.get("soap")
-        if soap is not None and isinstance(soap, dict):
-            matched = soap.get("matched", {})
-            if matched and isinstance(matched, dict):
-                brand = matched.get("brand")
-                if brand and isinstance(brand, str):
-                    brand = brand.strip()
-                    if brand:
-                        brands.append(brand)
+def calculate_unique_soaps(records: List[Dict[str, Any]]) -> int:
+    """Calculate number of unique soaps from records, excluding non-countable scents."""
+    return scan_record_metrics(records)["unique_soaps"]
 
-    if not brands:
-        return 0
 
-    # Use pandas for deduplication
-    brand_series = pd.Series(brands)
-    return len(brand_series.unique())
+def calculate_unique_brands(records: List[Dict[str, Any]]) -> int:
+    """Calculate number of unique soap brands from records."""
+    return scan_record_metrics(records)["unique_brands"]
 
 
 def calculate_total_samples(records: List[Dict[str, Any]]) -> int:
     """Calculate total number of sample shaves from records."""
-    if not records:
-        return 0
-
-    df = pd.DataFrame(records)
-
-    # Count records with sample_type
-    sample_count = 0
-    for _, row in df.iterrows():
-        soap = row.get("soap")
-        if soap is not None and isinstance(soap, dict):
-            enriched = soap.get("enriched", {})
-            if enriched and enriched.get("sample_type"):
-                sample_count += 1
-
-    return sample_count
+    return scan_record_metrics(records)["total_samples"]
 
 
 def calculate_sample_users(records: List[Dict[str, Any]]) -> int:
     """Calculate number of unique users who used samples."""
-    if not records:
-        return 0
-
-    df = pd.DataFrame(records)
-
-    # Extract users who used samples
-    sample_users = []
-    for _, row in df.iterrows():
-        soap = row.get("soap")
-        if soap is not None and isinstance(soap, dict):
-            enriched = soap.get("enriched", {})
-            if enriched and enriched.get("sample_type"):
-                author = row.get("author")
-                if author and isinstance(author, str) and author.strip():
-                    sample_users.append(author.strip())
-
-    if not sample_users:
-        return 0
-
-    # Use pandas for deduplication
-    user_series = pd.Series(sample_users)
-    return len(user_series.unique())
+    return scan_record_metrics(records)["sample_users"]
 
 
 def calculate_sample_brands(records: List[Dict[str, Any]]) -> int:
     """Calculate number of unique brands sampled."""
-    if not records:
-        return 0
-
-    df = pd.DataFrame(records)
-
-    # Extract brands from samples
-    sample_brands = []
-    for _, row in df.iterrows():
-        soap = row.get("soap")
-        if soap is not None and isinstance(soap, dict):
-            enriched = soap.get("enriched", {})
-            matched = soap.get("matched", {})
-
-            # Skip if no sample data OR if sample_type is None/empty (not actually used)
-            if not enriched or "sample_type" not in enriched:
-                continue
-
-            # Check if sample_type actually has a value (not None or empty string)
-            sample_type = enriched.get("sample_type")
-            if not sample_type:  # This catches None, "", and other falsy values
-                continue
-
-            if matched and isinstance(matched, dict):
-                brand = matched.get("brand")
-                if brand and isinstance(brand, str):
-                    brand = brand.strip()
-                    if brand:
-                        sample_brands.append(brand)
-
-    if not sample_brands:
-        return 0
-
-    # Use pandas for deduplication
-    brand_series = pd.Series(sample_brands)
-    return len(brand_series.unique())
+    return scan_record_metrics(records)["sample_brands"]
 
 
 def calculate_unique_sample_soaps(records: List[Dict[str, Any]]) -> int:
     """Calculate number of unique sample soaps from records."""
-    if not records:
-        return 0
-
-    df = pd.DataFrame(records)
-
-    # Extract sample soaps and filter for valid entries
-    sample_soaps = []
-    for _, row in df.iterrows():
-        soap = row.get("soap")
-        if soap is not None and isinstance(soap, dict):
-            enriched = soap.get("enriched", {})
-            matched = soap.get("matched", {})
-
-            # Skip if no sample data OR if sample_type is None/empty (not actually used)
-            if not enriched or "sample_type" not in enriched:
-                continue
-
-            # Check if sample_type actually has a value (not None or empty string)
-            sample_type = enriched.get("sample_type")
-            if not sample_type:  # This catches None, "", and other falsy values
-                continue
-
-            # Skip if no matched soap data
-            if not matched or not matched.get("brand") or not matched.get("scent"):
-                continue
-
-            brand = matched.get("brand")
-            scent = matched.get("scent")
-
-            if brand and isinstance(brand, str) and scent and isinstance(scent, str):
-                brand = brand.strip()
-                scent = scent.strip()
-                if brand and scent:
-                    soap_name = f"{brand} - {scent}"
-                    sample_soaps.append(soap_name)
-
-    if not sample_soaps:
-        return 0
-
-    # Use pandas for deduplication
-    soap_series = pd.Series(sample_soaps)
-    return len(soap_series.unique())
+    return scan_record_metrics(records)["unique_sample_soaps"]
 
 
 def calculate_unique_razors(records: List[Dict[str, Any]]) -> int:
     """Calculate number of unique razors from records."""
-    if not records:
-        return 0
-
-    df = pd.DataFrame(records)
-
-    # Extract razor data and filter for valid entries
-    razors = []
-    for _, row in df.iterrows():
-        razor = row.get("razor")
-        if razor is not None and isinstance(razor, dict):
-            matched = razor.get("matched", {})
-            if matched and isinstance(matched, dict):
-                brand = matched.get("brand")
-                model = matched.get("model")
-                if brand and isinstance(brand, str) and model and isinstance(model, str):
-                    brand = brand.strip()
-                    model = model.strip()
-                    if brand and model:
-                        razors.append(f"{brand} {model}")
-
-    if not razors:
-        return 0
-
-    # Use pandas for deduplication
-    razor_series = pd.Series(razors)
-    return len(razor_series.unique())
+    return scan_record_metrics(records)["unique_razors"]
 
 
 def calculate_unique_blades(records: List[Dict[str, Any]]) -> int:
     """Calculate number of unique blades from records."""
-    if not records:
-        return 0
-
-    df = pd.DataFrame(records)
-
-    # Extract blade data and filter for valid entries
-    blades = []
-    for _, row in df.iterrows():
-        blade = row.get("blade")
-        if blade is not None and isinstance(blade, dict):
-            matched = blade.get("matched", {})
-            if matched and isinstance(matched, dict):
-                brand = matched.get("brand")
-                model = matched.get("model")
-                if brand and isinstance(brand, str) and model and isinstance(model, str):
-                    brand = brand.strip()
-                    model = model.strip()
-                    if brand and model:
-                        blades.append(f"{brand} {model}")
-
-    if not blades:
-        return 0
-
-    # Use pandas for deduplication
-    blade_series = pd.Series(blades)
-    return len(blade_series.unique())
+    return scan_record_metrics(records)["unique_blades"]
 
 
 def calculate_unique_brushes(records: List[Dict[str, Any]]) -> int:
     """Calculate number of unique brushes from records."""
-    if not records:
-        return 0
-
-    df = pd.DataFrame(records)
-
-    # Extract brush data and filter for valid entries
-    brushes = []
-    for _, row in df.iterrows():
-        brush = row.get("brush")
-        if brush is not None and isinstance(brush, dict):
-            matched = brush.get("matched", {})
-            if matched and isinstance(matched, dict):
-                brand = matched.get("brand")
-                model = matched.get("model")
-                if brand and isinstance(brand, str) and model and isinstance(model, str):
-                    brand = brand.strip()
-                    model = model.strip()
-                    if brand and model:
-                        brushes.append(f"{brand} {model}")
-
-    if not brushes:
-        return 0
-
-    # Use pandas for deduplication
-    brush_series = pd.Series(brushes)
-    return len(brush_series.unique())
+    return scan_record_metrics(records)["unique_brushes"]
 
 
 def add_rank_field(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -370,46 +244,11 @@ def calculate_metadata(records: List[Dict[str, Any]], month: str) -> Dict[str, A
         total_samples, sample_users, sample_brands, unique_sample_soaps,
         unique_razors, unique_blades, and unique_brushes
     """
-    total_shaves = calculate_shaves(records)
-
-    unique_shavers = calculate_unique_users(records)
-
-    avg_shaves_per_user = calculate_avg_shaves_per_user(records)
-
-    median_shaves_per_user = calculate_median_shaves_per_user(records)
-
-    unique_soaps = calculate_unique_soaps(records)
-
-    unique_brands = calculate_unique_brands(records)
-
-    total_samples = calculate_total_samples(records)
-
-    sample_users = calculate_sample_users(records)
-
-    sample_brands = calculate_sample_brands(records)
-
-    unique_sample_soaps = calculate_unique_sample_soaps(records)
-
-    unique_razors = calculate_unique_razors(records)
-
-    unique_blades = calculate_unique_blades(records)
-
-    unique_brushes = calculate_unique_brushes(records)
+    # One pass over the records computes every metric
+    metrics = scan_record_metrics(records)
 
     return {
         "month": month,
         "aggregated_at": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
-        "total_shaves": total_shaves,
-        "unique_shavers": unique_shavers,
-        "avg_shaves_per_user": avg_shaves_per_user,
-        "median_shaves_per_user": median_shaves_per_user,
-        "unique_soaps": unique_soaps,
-        "unique_brands": unique_brands,
-        "total_samples": total_samples,
-        "sample_users": sample_users,
-        "sample_brands": sample_brands,
-        "unique_sample_soaps": unique_sample_soaps,
-        "unique_razors": unique_razors,
-        "unique_blades": unique_blades,
-        "unique_brushes": unique_brushes,
+        **metrics,
     }
@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from sotd.utils.file_io import ARTIFACT_COMPRESSIONS, zstd_available
+
 
 class BaseCLIParser(argparse.ArgumentParser):
     """
@@ -202,6 +204,25 @@ class BaseCLIParser(argparse.ArgumentParser):
             "(YYYY-MM,YYYY-MM,...)",
         )
 
+    def add_incremental_arguments(self) -> None:
+        """Add standardized incremental (dirty-record) processing argument."""
+        self.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Re-run months but only reprocess records whose inputs changed since the "
+            "last incremental run, reusing existing output for the rest",
+        )
+
+    def add_compression_arguments(self) -> None:
+        """Add standardized artifact compression argument."""
+        self.add_argument(
+            "--compress",
+            choices=list(ARTIFACT_COMPRESSIONS),
+            default="none",
+            help="Write month artifacts as compact compressed JSON (YYYY-MM.json.zst or "
+            "YYYY-MM.json.gz; zstd needs zstandard). Every form is readable (default: none)",
+        )
+
     def parse_args(self, args=None, namespace=None):  # type: ignore
         """Parse arguments and validate them."""
         parsed_args = super().parse_args(args, namespace)
@@ -209,6 +230,9 @@ class BaseCLIParser(argparse.ArgumentParser):
 
     def validate_args(self, args: argparse.Namespace) -> argparse.Namespace:
         """Validate parsed arguments."""
+        if getattr(args, "compress", None) == "zstd" and not zstd_available():
+            self.error("--compress zstd requires zstandard (pip install zstandard)")
+
         # Special case: --list-months and --audit can work without date arguments
         # These are utility operations that don't require date ranges
         has_primary_date = bool(
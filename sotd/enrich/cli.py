@@ -6,6 +6,7 @@ using the BaseCLIParser to eliminate code duplication.
 """
 
 from sotd.cli_utils.base_parser import BaseCLIParser
+from sotd.utils.columnar_artifact import ARTIFACT_FORMATS
 
 
 def get_parser() -> BaseCLIParser:
@@ -17,6 +18,14 @@ def get_parser() -> BaseCLIParser:
     """
     parser = BaseCLIParser(description="Enrich SOTD data with detailed specifications")
 
+    # Optional columnar copy of enriched/YYYY-MM for aggregation (parquet needs pyarrow)
+    parser.add_argument(
+        "--artifact-format",
+        choices=ARTIFACT_FORMATS,
+        default="json",
+        help="Also write enriched/YYYY-MM.parquet for aggregation with 'parquet' (default: json)",
+    )
+
     # Add standardized parallel processing arguments
     parser.add_parallel_processing_arguments(
         default_max_workers=8,
@@ -26,4 +35,10 @@ def get_parser() -> BaseCLIParser:
     # Add delta processing support
     parser.add_delta_arguments()
 
+    # Reprocess only records whose inputs changed (hashes stored in output metadata)
+    parser.add_incremental_arguments()
+
+    # Compressed month artifacts (readers accept either form)
+    parser.add_compression_arguments()
+
     return parser
@@ -314,6 +314,18 @@ class EnrichmentOverrideManager:
         """
         return self.get_override(month, comment_id, field, enrichment_key) is not None
 
+    def get_comment_overrides(self, month: str, comment_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get all enrichment overrides for a comment.
+
+        Args:
+            month: Month in YYYY-MM format
+            comment_id: Reddit comment ID
+
+        Returns:
+            Dictionary of field to {enrichment_key: override_spec} (empty if none)
+        """
+        return self.overrides.get(month, {}).get(comment_id, {})
+
     def validate_overrides(self, data: List[Dict[str, Any]], month: str) -> None:
         """Validate that all override comment IDs exist in the data.
 
@@ -1,56 +1,48 @@
 import argparse
 import json
 import logging
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
 from sotd.cli_utils.date_span import month_span
 from sotd.enrich.cli import get_parser
 from sotd.enrich.enrich import enrich_comments, setup_enrichers
 from sotd.enrich.override_manager import EnrichmentOverrideManager
-from sotd.enrich.save import calculate_enrichment_stats, load_matched_data, save_enriched_data
+from sotd.enrich.save import (
+    add_enrichment_stats,
+    build_enrichment_metadata,
+    new_enrichment_stats,
+)
+from sotd.utils.columnar_artifact import (
+    columnar_path_for,
+    pyarrow_available,
+    write_columnar_copy,
+)
 from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import json_file_exists, set_artifact_compression
+from sotd.utils.json_stream import JsonRecordReader, JsonRecordWriter
 from sotd.utils.logging_config import setup_pipeline_logging
 from sotd.utils.parallel_processor import create_parallel_processor
 from sotd.utils.performance import PerformanceMonitor, PipelineOutputFormatter
+from sotd.utils.record_hash import IncrementalRun, compute_phase_fingerprint, hash_record_inputs
 
 logger = logging.getLogger(__name__)
 
+# Code and catalogs (besides the matched records and overrides) that affect every
+# enriched record, including the match helpers the enrichers import
+ENRICH_SOURCE_PACKAGES = (
+    "enrich",
+    "utils",
+    "match.brush.strategies.utils",
+    "match.types",
+    "match.utils.regex_error_utils",
+)
+ENRICH_INPUT_FILES = ("handles.yaml", "knots.yaml")
 
-def _process_month(
-    year: int, month: int, base_path: Path, debug: bool, force: bool
-) -> Optional[dict]:
-    """Process enrichment for a single month."""
-    ym = f"{year:04d}-{month:02d}"
-    monitor = PerformanceMonitor("enrich")
-    monitor.start_total_timing()
-    in_path = base_path / "matched" / f"{year:04d}-{month:02d}.json"
-    out_path = base_path / "enriched" / f"{year:04d}-{month:02d}.json"
-
-    if not in_path.exists():
-        return {
-            "status": "error",
-            "month": ym,
-            "error": f"Missing input file: {in_path}. Run match phase first.",
-        }
-
-    # Check if output already exists and force is not set
-    if out_path.exists() and not force:
-        return {"status": "skipped", "month": ym, "reason": "output exists"}
-
-    monitor.start_file_io_timing()
-    try:
-        original_metadata, comments = load_matched_data(in_path)
-    except (FileNotFoundError, ValueError, json.JSONDecodeError, OSError) as e:
-        monitor.end_file_io_timing()
-        return {
-            "status": "error",
-            "month": ym,
-            "error": f"Failed to load matched data from {in_path}: {e}",
-        }
-    monitor.end_file_io_timing()
 
-    # Initialize enrichment override manager
+def _load_override_manager(base_path: Path) -> EnrichmentOverrideManager:
+    """Load data_dir/enrichment_overrides.yaml, continuing without overrides on errors."""
     override_file_path = base_path / "enrichment_overrides.yaml"
     override_manager = EnrichmentOverrideManager(override_file_path)
     try:
@@ -60,10 +52,41 @@ def _process_month(
     except Exception as e:
         logger.warning("Failed to load enrichment overrides from %s: %s", override_file_path, e)
         # Continue without overrides if file doesn't exist or has errors
+    return override_manager
+
 
-    # Extract original comment texts for enrichment - optimized version
-    original_comments = []
-    for comment in comments:
+class _MatchedDataError(Exception):
+    """The matched input file could not be read (as opposed to enriching or writing failing)."""
+
+
+def _read_matched(reader: JsonRecordReader) -> Iterator[dict]:
+    """Yield matched records, tagging read errors so they are reported as load failures."""
+    try:
+        yield from reader
+    except (ValueError, json.JSONDecodeError, OSError) as e:
+        raise _MatchedDataError(e) from e
+
+
+def _enrich_records(
+    records: Iterable[Any],
+    ym: str,
+    override_manager: EnrichmentOverrideManager,
+    enrichment_stats: dict,
+    incremental_run: Optional[IncrementalRun],
+    source: Any,
+) -> Iterator[dict]:
+    """Enrich matched records one at a time, updating enrichment_stats as they go."""
+    for comment in records:
+        if not isinstance(comment, dict):
+            raise _MatchedDataError(f"Expected dict records in 'data' in {source}")
+        if incremental_run is not None:
+            comment_id = comment.get("id")
+            overrides = override_manager.get_comment_overrides(ym, comment_id) if comment_id else {}
+            previous = incremental_run.reuse(comment_id, hash_record_inputs(comment, overrides))
+            if previous is not None:
+                add_enrichment_stats(enrichment_stats, previous)
+                yield previous
+                continue
         # Get the original comment text from the extracted field if available
         # This is the user's original input that we want to enrich from
         original_text = (
@@ -73,50 +96,186 @@ def _process_month(
             or comment.get("soap_extracted")
             or ""
         )
-        original_comments.append(original_text)
         # Add month to record metadata for override lookups
         comment["_month"] = ym
+        enriched = enrich_comments([comment], [original_text])[0]
+        add_enrichment_stats(enrichment_stats, enriched)
+        yield enriched
+
+
+def _update_columnar_copy(out_path: Path, artifact_format: str) -> None:
+    """Write the Parquet copy of an enriched file, or remove a stale one."""
+    if artifact_format == "parquet":
+        # Streams the committed JSON file, so the month is never held in memory
+        write_columnar_copy(out_path)
+    else:
+        # Don't leave a copy of the previous run behind
+        columnar_path_for(out_path).unlink(missing_ok=True)
+
+
+def save_enriched_output(out_path: Path, output: dict, artifact_format: str = "json") -> None:
+    """Save an enriched document returned with write_output=False (and its columnar copy)."""
+    with JsonRecordWriter(out_path) as writer:
+        writer.write_many(output["data"])
+        writer.commit(after={"meta": output["meta"]})
+    _update_columnar_copy(out_path, artifact_format)
+
+
+def _process_month(
+    year: int,
+    month: int,
+    base_path: Path,
+    debug: bool,
+    force: bool,
+    artifact_format: str = "json",
+    incremental: bool = False,
+    records: Optional[Sequence[dict]] = None,
+    original_metadata: Optional[dict] = None,
+    write_output: bool = True,
+) -> Optional[dict]:
+    """Process enrichment for a single month.
+
+    With artifact_format "parquet", a columnar copy of the enriched records is
+    written next to the JSON file for aggregation to read. With incremental,
+    records whose matched data and enrichment overrides are unchanged are copied
+    from the existing enriched file.
+
+    ``records`` (and the matched file's ``original_metadata``) supply the matched
+    records in memory instead of reading matched/YYYY-MM.json. With
+    ``write_output=False`` nothing is written and the enriched document is
+    returned under "output" (see save_enriched_output).
+    """
+    ym = f"{year:04d}-{month:02d}"
+    monitor = PerformanceMonitor("enrich")
+    monitor.start_total_timing()
+    in_path = base_path / "matched" / f"{year:04d}-{month:02d}.json"
+    out_path = base_path / "enriched" / f"{year:04d}-{month:02d}.json"
+
+    if records is None and not json_file_exists(in_path):
+        return {
+            "status": "error",
+            "month": ym,
+            "error": f"Missing input file: {in_path}. Run match phase first.",
+        }
+
+    # Check if output already exists and force is not set (incremental runs
+    # always refresh the month, reusing unchanged records)
+    if json_file_exists(out_path) and not force and not incremental:
+        return {"status": "skipped", "month": ym, "reason": "output exists"}
 
     # Setup enrichers with override manager
+    override_manager = _load_override_manager(base_path)
     setup_enrichers(override_manager=override_manager)
 
-    # Enrich the comments
-    enriched_comments = enrich_comments(comments, original_comments)
+    incremental_run = None
+    if incremental:
+        incremental_run = IncrementalRun(
+            compute_phase_fingerprint(
+                ENRICH_SOURCE_PACKAGES, [base_path / name for name in ENRICH_INPUT_FILES]
+            ),
+            out_path,
+        )
+
+    # Stream records from the matched file to the enriched file one at a time so
+    # only the record being enriched is held in memory
+    enrichment_stats = new_enrichment_stats()
+    enriched_records: list[dict] = []
+    try:
+        with ExitStack() as stack:
+            reader = None
+            source: Iterable[Any]
+            if records is None:
+                reader = stack.enter_context(JsonRecordReader(in_path))
+                source = _read_matched(reader)
+            else:
+                source = records
+            writer = stack.enter_context(JsonRecordWriter(out_path)) if write_output else None
+            for enriched in _enrich_records(
+                source,
+                ym,
+                override_manager,
+                enrichment_stats,
+                incremental_run,
+                in_path,
+            ):
+                if writer is not None:
+                    writer.write(enriched)
+                else:
+                    enriched_records.append(enriched)
+
+            if reader is not None:
+                if not reader.found_key:
+                    raise _MatchedDataError(f"Missing 'data' section in {in_path}")
+                original_metadata = reader.fields.get("meta", {})
+                if not isinstance(original_metadata, dict):
+                    raise _MatchedDataError(
+                        f"Expected dict for 'meta' in {in_path}, got {type(original_metadata)}"
+                    )
+
+            record_count = writer.record_count if writer is not None else len(enriched_records)
+            meta = build_enrichment_metadata(
+                original_metadata or {}, record_count, enrichment_stats
+            )
+            if incremental_run is not None:
+                meta.update(incremental_run.meta())
+                logger.info("%s: %s", ym, incremental_run.summary())
+            if writer is not None:
+                monitor.start_file_io_timing()
+                writer.commit(after={"meta": meta})
+                monitor.end_file_io_timing()
+    except _MatchedDataError as e:
+        return {
+            "status": "error",
+            "month": ym,
+            "error": f"Failed to load matched data from {in_path}: {e}",
+        }
+    except (ValueError, json.JSONDecodeError, OSError) as e:
+        return {
+            "status": "error",
+            "month": ym,
+            "error": f"Failed to enrich {ym} and write {out_path}: {e}",
+        }
 
-    # Calculate enrichment statistics
-    enrichment_stats = calculate_enrichment_stats(enriched_comments)
+    if write_output:
+        monitor.start_file_io_timing()
+        _update_columnar_copy(out_path, artifact_format)
+        monitor.end_file_io_timing()
 
-    monitor.set_record_count(len(enriched_comments))
+    monitor.set_record_count(record_count)
     monitor.set_file_sizes(in_path, out_path)
-
-    monitor.start_file_io_timing()
-    save_enriched_data(
-        out_path, enriched_comments, original_metadata, enrichment_stats, force=force
-    )
-    monitor.end_file_io_timing()
     monitor.end_total_timing()
 
     if debug:
         monitor.print_summary()
-        logger.debug(f"Enriched {len(enriched_comments)} records for {ym}")
+        logger.debug(f"Enriched {record_count} records for {ym}")
         logger.debug(f"  Blade enriched: {enrichment_stats['blade_enriched']}")
         logger.debug(f"  Razor enriched: {enrichment_stats['razor_enriched']}")
         logger.debug(f"  Brush enriched: {enrichment_stats['brush_enriched']}")
         logger.debug(f"  Soap enriched: {enrichment_stats['soap_enriched']}")
 
-    return {
+    result = {
         "status": "completed",
         "month": ym,
-        "records_processed": len(enriched_comments),
+        "records_processed": record_count,
         **enrichment_stats,
         "performance": monitor.get_summary(),
     }
+    if not write_output:
+        result["output"] = {"data": enriched_records, "meta": meta}
+    return result
 
 
 def run(args: argparse.Namespace) -> bool:
     """Run the enrich phase for the specified date range."""
     months = list(month_span(args))
     base_path = get_data_dir(args.data_dir)
+    set_artifact_compression(getattr(args, "compress", "none"))
+    artifact_format = getattr(args, "artifact_format", "json")
+    incremental = getattr(args, "incremental", False)
+    if artifact_format == "parquet" and not pyarrow_available():
+        # Fail fast rather than enriching every month and failing at the end
+        logger.error("--artifact-format parquet requires pyarrow (pip install pyarrow)")
+        return True
 
     # Set up enrichers once at the start - this is a major performance optimization
     setup_enrichers()
@@ -133,7 +292,11 @@ def run(args: argparse.Namespace) -> bool:
 
         # Process months in parallel
         results = processor.process_months_parallel(
-            months, _process_month, (base_path, args.debug, args.force), max_workers, "Processing"
+            months,
+            _process_month,
+            (base_path, args.debug, args.force, artifact_format, incremental),
+            max_workers,
+            "Processing",
         )
 
         # Print parallel processing summary
@@ -142,7 +305,10 @@ def run(args: argparse.Namespace) -> bool:
     else:
         # Process months sequentially
         results = processor.process_months_sequential(
-            months, _process_month, (base_path, args.debug, args.force), "Months"
+            months,
+            _process_month,
+            (base_path, args.debug, args.force, artifact_format, incremental),
+            "Months",
         )
 
     # Filter out None results and check for errors
@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-from sotd.utils.file_io import load_json_data, save_json_data
+from sotd.utils.file_io import json_file_exists, load_json_data, save_json_data
 
 
 def load_matched_data(file_path: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
@@ -28,7 +28,7 @@ def load_matched_data(file_path: Path) -> Tuple[Dict[str, Any], List[Dict[str, A
         json.JSONDecodeError: If the file is not valid JSON
         OSError: If there are file system issues
     """
-    if not file_path.exists():
+    if not json_file_exists(file_path):
         # Fail fast on missing required files - this is a configuration error
         raise FileNotFoundError(f"Matched data file not found: {file_path}")
 
@@ -61,6 +61,31 @@ def load_matched_data(file_path: Path) -> Tuple[Dict[str, Any], List[Dict[str, A
     return metadata, data
 
 
+def build_enrichment_metadata(
+    original_metadata: Dict[str, Any], record_count: int, enrichment_stats: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the metadata block written alongside enriched data.
+
+    Args:
+        original_metadata: Metadata from the matched data
+        record_count: Number of enriched records written
+        enrichment_stats: Statistics about the enrichment process
+
+    Returns:
+        Dictionary with enrichment metadata
+    """
+    return {
+        "month": original_metadata.get("month", ""),
+        "extracted_at": original_metadata.get("extracted_at", ""),
+        "enriched_at": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
+        "records_input": record_count,
+        "record_count": record_count,
+        "fields": ["razor", "blade", "soap", "brush"],
+        **enrichment_stats,
+    }
+
+
 def save_enriched_data(
     file_path: Path,
     enriched_data: List[Dict[str, Any]],
@@ -81,27 +106,47 @@ def save_enriched_data(
     # Create output directory if it doesn't exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Generate enrichment metadata
-    enrichment_metadata = {
-        "month": original_metadata.get("month", ""),
-        "extracted_at": original_metadata.get("extracted_at", ""),
-        "enriched_at": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
-        "records_input": len(enriched_data),
-        "record_count": len(enriched_data),
-        "fields": ["razor", "blade", "soap", "brush"],
-        **enrichment_stats,
-    }
-
     # Prepare output structure
     output = {
         "data": enriched_data,
-        "meta": enrichment_metadata,
+        "meta": build_enrichment_metadata(
+            original_metadata, len(enriched_data), enrichment_stats
+        ),
     }
 
     # Write to file using unified utilities
     save_json_data(output, file_path, indent=2)
 
 
+def new_enrichment_stats() -> Dict[str, Any]:
+    """Return zeroed enrichment statistics for use with add_enrichment_stats."""
+    return {
+        "blade_enriched": 0,
+        "razor_enriched": 0,
+        "brush_enriched": 0,
+        "soap_enriched": 0,
+        "total_enriched": 0,
+    }
+
+
+def add_enrichment_stats(stats: Dict[str, Any], comment: Dict[str, Any]) -> None:
+    """
+    Count a single enriched comment record into running enrichment statistics.
+
+    Args:
+        stats: Statistics dictionary from new_enrichment_stats (updated in place)
+        comment: Enriched comment record
+    """
+    enriched_any = False
+    for field in ("blade", "razor", "brush", "soap"):
+        product = comment.get(field)
+        if isinstance(product, dict) and "enriched" in product and product["enriched"]:
+            stats[f"{field}_enriched"] += 1
+            enriched_any = True
+    if enriched_any:
+        stats["total_enriched"] += 1
+
+
 def calculate_enrichment_stats(enriched_data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate statistics about the enrichment process.
@@ -112,22 +157,7 @@ def calculate_enrichment_stats(enriched_data: List[Dict[str, Any]]) -> Dict[str,
     Returns:
         Dictionary with enrichment statistics
     """
-    stats = {
-        "blade_enriched": 0,
-        "razor_enriched": 0,
-        "brush_enriched": 0,
-        "soap_enriched": 0,
-        "total_enriched": 0,
-    }
-
+    stats = new_enrichment_stats()
     for comment in enriched_data:
-        enriched_any = False
-        for field in ("blade", "razor", "brush", "soap"):
-            product = comment.get(field)
-            if isinstance(product, dict) and "enriched" in product and product["enriched"]:
-                stats[f"{field}_enriched"] += 1
-                enriched_any = True
-        if enriched_any:
-            stats["total_enriched"] += 1
-
+        add_enrichment_stats(stats, comment)
     return stats
@@ -7,6 +7,7 @@ from typing import Iterable
 
 from sotd.extract.fields import extract_field_with_pattern, get_patterns
 from sotd.utils.aliases import FIELD_ALIASES
+from sotd.utils.file_io import open_json_text
 from sotd.utils.text import preprocess_body
 
 
@@ -20,7 +21,7 @@ def analyze_skipped_patterns(
 
     for path in paths:
         try:
-            with open(path, "r", encoding="utf-8") as f:
+            with open_json_text(path) as f:
                 data = json.load(f)
         except FileNotFoundError:
             print(f"Warning: Skipped missing file: {path}")
@@ -67,7 +68,7 @@ def analyze_garbage_leading_chars(
     fields = ["razor", "blade", "brush", "soap"]
 
     for path in paths:
-        with open(path, "r", encoding="utf-8") as f:
+        with open_json_text(path) as f:
             data = json.load(f)
             for comment in data.get("data", []):
                 for field in fields:
@@ -124,7 +125,7 @@ def analyze_common_prefixes(
 
     for path in paths:
         try:
-            with open(path, "r", encoding="utf-8") as f:
+            with open_json_text(path) as f:
                 data = json.load(f)
         except FileNotFoundError:
             print(f"Warning: Skipped missing file: {path}")
@@ -213,7 +214,7 @@ def analyze_pattern_usage(paths: Iterable[Path]) -> None:
     # Process all comment files
     for path in paths:
         try:
-            with open(path, "r", encoding="utf-8") as f:
+            with open_json_text(path) as f:
                 data = json.load(f)
         except FileNotFoundError:
             print(f"Warning: Skipped missing file: {path}")
@@ -30,6 +30,12 @@ def get_parser() -> BaseCLIParser:
     # Add delta processing support
     parser.add_delta_arguments()
 
+    # Reprocess only records whose inputs changed (hashes stored in output metadata)
+    parser.add_incremental_arguments()
+
+    # Compressed month artifacts (readers accept either form)
+    parser.add_compression_arguments()
+
     # Note: override file is now automatically relative to --data-dir
     # No need for --override-file flag - it's always data_dir/extract_overrides.yaml
 
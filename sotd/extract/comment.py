@@ -1,4 +1,3 @@
-import json
 import logging
 import re
 from collections import OrderedDict
@@ -9,6 +8,9 @@ from sotd.extract.fields import extract_field_with_pattern, get_patterns
 from sotd.extract.override_manager import OverrideManager
 from sotd.utils.aliases import FIELD_ALIASES
 from sotd.utils.extract_normalization import normalize_for_matching
+from sotd.utils.file_io import json_file_exists
+from sotd.utils.json_stream import iter_json_records
+from sotd.utils.record_hash import IncrementalRun, hash_record_inputs
 from sotd.utils.text import preprocess_body
 
 logger = logging.getLogger(__name__)
@@ -125,21 +127,43 @@ def parse_comment(
 
 
 def run_extraction_for_month(
-    month: str, base_path: str = "data", override_manager: Optional[OverrideManager] = None
+    month: str,
+    base_path: str = "data",
+    override_manager: Optional[OverrideManager] = None,
+    incremental: Optional[IncrementalRun] = None,
 ) -> Optional[dict]:
+    """Extract every comment of a month.
+
+    With ``incremental``, comments whose content and overrides are unchanged since
+    the previous run reuse their previous extracted (or skipped) record.
+    """
     input_path = Path(base_path) / "comments" / f"{month}.json"
-    if not input_path.exists():
+    if not json_file_exists(input_path):
         logger.warning("Skipping extraction for missing input file: %s", input_path)
         return None
 
-    with open(input_path, encoding="utf-8") as f:
-        raw = json.load(f)
-        comments = raw.get("data", [])
-
     extracted = []
     skipped = []
-
-    for comment in comments:
+    comment_count = 0
+
+    # Stream comments from the input file rather than loading the whole month
+    for comment in iter_json_records(input_path):
+        comment_count += 1
+        if incremental is not None:
+            comment_id = comment.get("id")
+            overrides = (
+                override_manager.get_comment_overrides(month, comment_id)
+                if override_manager and comment_id
+                else {}
+            )
+            previous = incremental.reuse(comment_id, hash_record_inputs(comment, overrides))
+            if previous is not None:
+                # Parsed comments always carry at least one product field
+                if any(field in previous for field in ("razor", "blade", "brush", "soap")):
+                    extracted.append(previous)
+                else:
+                    skipped.append(previous)
+                continue
         parsed = parse_comment(comment, override_manager, processing_month=month)
         if parsed:
             extracted.append(parsed)
@@ -155,7 +179,7 @@ def run_extraction_for_month(
     return {
         "meta": {
             "month": month,
-            "comment_count": len(comments),
+            "comment_count": comment_count,
             "shave_count": len(extracted),
             "skipped_count": len(skipped),
             "field_coverage": field_coverage,
@@ -237,6 +237,18 @@ class OverrideManager:
         comment_overrides = month_overrides.get(comment_id, {})
         return comment_overrides.get(field)
 
+    def get_comment_overrides(self, month: str, comment_id: str) -> Dict[str, str]:
+        """Get all field overrides for a comment.
+
+        Args:
+            month: Month in YYYY-MM format
+            comment_id: Reddit comment ID
+
+        Returns:
+            Dictionary of field name to override value (empty if none)
+        """
+        return self.overrides.get(month, {}).get(comment_id, {})
+
     def validate_overrides(self, data: List[Dict[str, Any]]) -> None:
         """Validate that all override comment IDs exist in the data.
 
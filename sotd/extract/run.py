@@ -5,9 +5,11 @@ from typing import Optional, Sequence
 
 from sotd.cli_utils.date_span import month_span
 from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import remove_json_file, set_artifact_compression
 from sotd.utils.logging_config import setup_pipeline_logging
 from sotd.utils.parallel_processor import create_parallel_processor
 from sotd.utils.performance import PerformanceMonitor, PipelineOutputFormatter
+from sotd.utils.record_hash import IncrementalRun, compute_phase_fingerprint
 
 from .cli import get_parser
 from .comment import run_extraction_for_month
@@ -16,6 +18,10 @@ from .save import save_month_file
 
 logger = logging.getLogger(__name__)
 
+# Code and data files (besides the comments and overrides) that affect every extracted record
+EXTRACT_SOURCE_PACKAGES = ("extract", "utils")
+EXTRACT_INPUT_FILES = ("competition_tags.yaml",)
+
 
 def _process_month(
     year: int,
@@ -24,14 +30,34 @@ def _process_month(
     debug: bool,
     force: bool,
     override_manager: Optional[OverrideManager] = None,
+    incremental: bool = False,
+    write_output: bool = True,
 ) -> Optional[dict]:
+    """Extract one month and save extracted/YYYY-MM.json (unless write_output is False).
+
+    Returns the saved document, or None if the month has no comments file.
+    """
     ym = f"{year:04d}-{month:02d}"
     monitor = PerformanceMonitor("extract")
     monitor.start_total_timing()
+    out_path = base_path / "extracted" / f"{year:04d}-{month:02d}.json"
+
+    incremental_run = None
+    if incremental:
+        incremental_run = IncrementalRun(
+            compute_phase_fingerprint(
+                EXTRACT_SOURCE_PACKAGES, [base_path / name for name in EXTRACT_INPUT_FILES]
+            ),
+            out_path,
+            record_keys=("data", "missing", "skipped"),
+        )
 
     monitor.start_file_io_timing()
     all_comments = run_extraction_for_month(
-        ym, base_path=str(base_path), override_manager=override_manager
+        ym,
+        base_path=str(base_path),
+        override_manager=override_manager,
+        incremental=incremental_run,
     )
     monitor.end_file_io_timing()
     if all_comments is None:
@@ -64,30 +90,28 @@ def _process_month(
         "missing": missing,
         "skipped": skipped,
     }
-    out_path = base_path / "extracted" / f"{year:04d}-{month:02d}.json"
+    if incremental_run is not None:
+        result["meta"].update(incremental_run.meta())
+        logger.info("%s: %s", ym, incremental_run.summary())
     monitor.set_record_count(len(extracted))
     monitor.set_file_sizes(base_path / "comments" / f"{ym}.json", out_path)
-    if force and out_path.exists():
-        out_path.unlink()
-    monitor.start_file_io_timing()
-    save_month_file(month=ym, result=result, out_dir=base_path / "extracted")
-    monitor.end_file_io_timing()
+    if write_output:
+        if force:
+            remove_json_file(out_path)
+        monitor.start_file_io_timing()
+        save_month_file(month=ym, result=result, out_dir=base_path / "extracted")
+        monitor.end_file_io_timing()
     monitor.end_total_timing()
     if debug:
         monitor.print_summary()
     return result
 
 
-def run(args) -> None:
-    """Run the extract phase with the given arguments."""
-    months = list(month_span(args))
-    base_path = get_data_dir(args.data_dir)
-
+def load_override_manager(base_path: Path, debug: bool = False) -> OverrideManager:
+    """Load data_dir/extract_overrides.yaml, logging and re-raising any error."""
     # Override file is always relative to data directory
     override_file_path = base_path / "extract_overrides.yaml"
 
-    # Initialize override manager
-    override_manager = None
     try:
         override_manager = OverrideManager(override_file_path)
         override_manager.load_overrides()
@@ -98,11 +122,22 @@ def run(args) -> None:
     except Exception as e:
         error_msg = f"Failed to load overrides from {override_file_path}: {e}"
         logger.error(error_msg)
-        if args.debug:
+        if debug:
             import traceback
 
             logger.error("Full traceback:\n%s", traceback.format_exc())
         raise
+    return override_manager
+
+
+def run(args) -> None:
+    """Run the extract phase with the given arguments."""
+    months = list(month_span(args))
+    base_path = get_data_dir(args.data_dir)
+    set_artifact_compression(getattr(args, "compress", "none"))
+    override_manager = load_override_manager(base_path, args.debug)
+
+    incremental = getattr(args, "incremental", False)
 
     # Create parallel processor for extract phase
     processor = create_parallel_processor("extract")
@@ -118,7 +153,7 @@ def run(args) -> None:
         results = processor.process_months_parallel(
             months,
             _process_month,
-            (base_path, args.debug, args.force, override_manager),
+            (base_path, args.debug, args.force, override_manager, incremental),
             max_workers,
             "Processing",
         )
@@ -129,7 +164,10 @@ def run(args) -> None:
     else:
         # Process months sequentially
         results = processor.process_months_sequential(
-            months, _process_month, (base_path, args.debug, args.force, override_manager), "Months"
+            months,
+            _process_month,
+            (base_path, args.debug, args.force, override_manager, incremental),
+            "Months",
         )
 
     # Convert results to expected format for summary
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict, List
 
+from sotd.utils.file_io import iter_json_files, json_file_exists, load_json_data
+
 
 def _audit_months(months: list[tuple[int, int]], out_dir: str) -> dict:
     """
@@ -26,8 +27,8 @@ def _audit_months(months: list[tuple[int, int]], out_dir: str) -> dict:
         threads_path = out / "threads" / f"{yyyymm}.json"
         comments_path = out / "comments" / f"{yyyymm}.json"
         # File checks
-        found_threads = threads_path.exists()
-        found_comments = comments_path.exists()
+        found_threads = json_file_exists(threads_path)
+        found_comments = json_file_exists(comments_path)
         if not found_threads:
             missing_files.append(str(threads_path.relative_to(out)))
         if not found_comments:
@@ -36,7 +37,7 @@ def _audit_months(months: list[tuple[int, int]], out_dir: str) -> dict:
         if found_threads:
             checked_months += 1
             try:
-                data = json.loads(threads_path.read_text())
+                data = load_json_data(threads_path)
                 meta = data.get("meta", {})
                 m_days = meta.get("missing_days", [])
                 if not isinstance(m_days, list):
@@ -65,7 +66,7 @@ def list_available_months(out_dir: str) -> list[str]:
         dir_path = out / subdir
         if not dir_path.is_dir():
             continue
-        for file in dir_path.glob("*.json"):
+        for file in iter_json_files(dir_path):
             # Accept files named 'YYYY-MM.json'
             name = file.stem
             if len(name) == 7 and name[4] == "-" and name[:4].isdigit() and name[5:].isdigit():
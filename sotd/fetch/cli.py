@@ -26,5 +26,14 @@ def get_parser() -> BaseCLIParser:
         action="store_true",
         help="List months with existing threads or comments files",
     )
+    parser.add_argument(
+        "--delta-comments",
+        action="store_true",
+        help="Only fetch comments newer than each thread's high-water mark in the "
+        "existing comments file",
+    )
+
+    # Compressed threads/ and comments/ files (readers accept either form)
+    parser.add_compression_arguments()
 
     return parser
@@ -0,0 +1,139 @@
+"""
+Per-thread comment high-water marks for incremental (delta) comment fetching.
+
+Every comments file records, for each thread, the newest comment seen so far::
+
+    "thread_marks": {
+        "abc123": {
+            "latest_created_utc": "2025-05-14T21:03:11Z",
+            "latest_comment_id": "mq1x2yz",
+            "comment_count": 57
+        }
+    }
+
+With ``--delta-comments`` the fetchers read these marks, list each thread's
+comments newest first and stop expanding "more" stubs once they reach a
+comment at or before the thread's mark, so a daily update only downloads the
+comments posted since the last run. Comments are merged into the month file
+by id as before, and the file is only rewritten when something changed.
+
+Comments that appear later with an older timestamp (e.g. approved after
+moderation) are not picked up by a delta fetch; a full fetch (without
+``--delta-comments``) still merges them in.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def iso_to_timestamp(iso: str) -> float:
+    """Return the POSIX timestamp of an ISO 8601 UTC time such as "2025-05-01T12:00:00Z"."""
+    return datetime.fromisoformat(iso.replace("Z", "+00:00")).astimezone(timezone.utc).timestamp()
+
+
+def compute_thread_marks(comments: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute the high-water mark of every thread from its comment records.
+
+    Args:
+        comments: Comment records (with thread_id, id and created_utc)
+
+    Returns:
+        Dictionary mapping thread ID to latest_created_utc, latest_comment_id and
+        comment_count
+    """
+    marks: Dict[str, Dict[str, Any]] = {}
+    latest: Dict[str, float] = {}
+    for comment in comments:
+        thread_id = comment.get("thread_id")
+        created_utc = comment.get("created_utc")
+        if not thread_id or not created_utc:
+            continue
+        timestamp = iso_to_timestamp(created_utc)
+        mark = marks.get(thread_id)
+        if mark is None:
+            marks[thread_id] = {
+                "latest_created_utc": created_utc,
+                "latest_comment_id": comment.get("id"),
+                "comment_count": 1,
+            }
+            latest[thread_id] = timestamp
+            continue
+        mark["comment_count"] += 1
+        if timestamp > latest[thread_id]:
+            mark["latest_created_utc"] = created_utc
+            mark["latest_comment_id"] = comment.get("id")
+            latest[thread_id] = timestamp
+    return marks
+
+
+def load_thread_marks(meta: Any, comments: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the thread marks stored in a comments file, computing them if absent.
+
+    Args:
+        meta: Comments file metadata (may be None)
+        comments: Comment records from the same file
+
+    Returns:
+        Dictionary mapping thread ID to its high-water mark
+    """
+    marks = meta.get("thread_marks") if isinstance(meta, dict) else None
+    if isinstance(marks, dict):
+        return marks
+    return compute_thread_marks(comments)
+
+
+def since_by_thread(marks: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """Return each thread's latest_created_utc, the point a delta fetch may stop at."""
+    return {
+        thread_id: mark["latest_created_utc"]
+        for thread_id, mark in marks.items()
+        if mark.get("latest_created_utc")
+    }
+
+
+def reached_mark(newest_first: List[Dict[str, Any]], since: str) -> bool:
+    """
+    Return True if a newest-first page of comments reaches a thread's mark.
+
+    The last comment of the page is its oldest (pinned comments are always at
+    the top), so once it is at or before ``since`` no older page is needed. An
+    empty page also ends the listing.
+
+    Args:
+        newest_first: Comment records in newest-first order
+        since: The thread's latest_created_utc
+
+    Returns:
+        True if fetching further pages is unnecessary
+    """
+    if not newest_first:
+        return True
+    return iso_to_timestamp(newest_first[-1]["created_utc"]) <= iso_to_timestamp(since)
+
+
+def comments_file_unchanged(
+    existing: Optional[Tuple[Any, List[Dict[str, Any]]]],
+    meta: Dict[str, Any],
+    records_changed: bool,
+) -> bool:
+    """
+    Return True if a comments file would be rewritten with identical content.
+
+    Args:
+        existing: (meta, data) of the file on disk, or None if there is none
+        meta: Metadata about to be written
+        records_changed: Whether the merge added or replaced any comment record
+
+    Returns:
+        True if no records changed and the metadata only differs in extracted_at
+    """
+    if existing is None or records_changed or not isinstance(existing[0], dict):
+        return False
+    ignored = {"extracted_at"}
+    return {k: v for k, v in existing[0].items() if k not in ignored} == {
+        k: v for k, v in meta.items() if k not in ignored
+    }
@@ -8,10 +8,10 @@ import calendar
 import os
 import time
 from datetime import date as _date
-from typing import List, Sequence, TypeVar, cast
+from typing import Dict, List, Optional, Sequence, TypeVar, cast
 
 import praw
-from praw.models import Comment, Submission
+from praw.models import Comment, MoreComments, Submission
 from prawcore.exceptions import NotFound, RequestException
 
 import logging
@@ -355,8 +355,25 @@ def filter_valid_threads(
 # --------------------------------------------------------------------------- #
 # comments                                                                    #
 # --------------------------------------------------------------------------- #
-def fetch_top_level_comments(submission: Submission) -> List[Comment]:
-    """Return only root comments (shaves)."""
+def fetch_top_level_comments(
+    submission: Submission, since: Optional[float] = None
+) -> List[Comment]:
+    """Return only root comments (shaves).
+
+    With ``since`` (the POSIX time of the newest comment already stored for the
+    thread) the thread is listed newest first, and "more" stubs are only
+    expanded when the first page does not reach back to ``since``.
+    """
+    if since is not None:
+        submission.comment_sort = "new"
+        forest = submission.comments
+        top_level = [forest[i] for i in range(len(forest))]
+        roots = [c for c in top_level if isinstance(c, Comment)]
+        has_more = any(isinstance(c, MoreComments) for c in top_level)
+        # Pinned comments stay on top, so the last root is the page's oldest
+        if not has_more or (roots and roots[-1].created_utc <= since):
+            return [c for c in roots if getattr(c, "is_root", False)]
+
     safe_call(submission.comments.replace_more, limit=None)
 
     return cast(
@@ -376,6 +393,7 @@ def fetch_top_level_comments_parallel(
     adaptive_workers: bool = False,
     fallback_to_sequential: bool = True,
     return_metrics: bool = False,
+    since_by_id: Optional[Dict[str, float]] = None,
 ) -> List[List[Comment]] | tuple[List[List[Comment]], dict]:
     """Fetch top-level comments for multiple submissions in parallel.
 
@@ -387,13 +405,15 @@ def fetch_top_level_comments_parallel(
         adaptive_workers: Whether to adjust worker count based on rate limits
         fallback_to_sequential: Whether to fall back to sequential processing if parallel fails
         return_metrics: Whether to return performance metrics along with results
+        since_by_id: Optional high-water marks (submission ID -> POSIX time of the newest
+            stored comment) for delta fetching
 
     Returns:
         List of comment lists (one per submission) or tuple of (results, metrics)
     """
     import concurrent.futures
     import time
-    from typing import Optional, Tuple
+    from typing import Tuple
 
     if not submissions:
         return ([], {}) if return_metrics else []
@@ -403,13 +423,19 @@ def fetch_top_level_comments_parallel(
     rate_limit_hits = 0
     worker_utilization = 0.0
 
+    def fetch_comments(submission: Submission) -> Optional[List[Comment]]:
+        since = (since_by_id or {}).get(submission.id)
+        if since is None:
+            return safe_call(fetch_top_level_comments, submission)
+        return safe_call(fetch_top_level_comments, submission, since=since)
+
     def fetch_comments_worker(submission: Submission) -> Tuple[str, List[Comment]]:
         """Worker function to fetch comments for a single submission."""
         nonlocal rate_limit_hits
 
         try:
             # Use safe_call to handle rate limits properly
-            comments = safe_call(fetch_top_level_comments, submission)
+            comments = fetch_comments(submission)
             if comments is None:
                 # safe_call returned None due to error
                 return (submission.id, [])
@@ -428,7 +454,7 @@ def fetch_top_level_comments_parallel(
             sequential_results: List[List[Comment]] = []
             for submission in submissions:
                 try:
-                    comments = safe_call(fetch_top_level_comments, submission)
+                    comments = fetch_comments(submission)
                     if comments is None:
                         sequential_results.append([])
                     else:
@@ -502,6 +528,7 @@ def fetch_top_level_comments_parallel(
                 max_workers=0,
                 fallback_to_sequential=True,
                 return_metrics=return_metrics,
+                since_by_id=since_by_id,
             )
         else:
             raise
@@ -28,6 +28,13 @@ from tqdm import tqdm
 from sotd.cli_utils.date_span import month_span
 from sotd.fetch.audit import _audit_months, list_available_months
 from sotd.fetch.cli import get_parser
+from sotd.fetch.delta import (
+    comments_file_unchanged,
+    compute_thread_marks,
+    iso_to_timestamp,
+    load_thread_marks,
+    since_by_thread,
+)
 from sotd.fetch.merge import merge_records
 from sotd.fetch.reddit import (
     fetch_top_level_comments_parallel,
@@ -37,6 +44,7 @@ from sotd.fetch.reddit import (
 from sotd.fetch.save import load_month_file, write_month_file
 from sotd.utils import parse_thread_date
 from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import remove_json_file, set_artifact_compression
 from sotd.utils.logging_config import setup_pipeline_logging, should_disable_tqdm
 
 import logging
@@ -93,10 +101,8 @@ def _process_month(
     comments_path = data_dir / "comments" / f"{year:04d}-{month:02d}.json"
 
     if args.force:
-        if threads_path.exists():
-            threads_path.unlink()
-        if comments_path.exists():
-            comments_path.unlink()
+        remove_json_file(threads_path)
+        remove_json_file(comments_path)
 
     # thread records
     new_thread_records = [
@@ -133,11 +139,21 @@ def _process_month(
             "missing_days": [d.isoformat() for d in missing],
         }
 
+    # High-water marks of the comments already on disk, for delta fetching
+    existing_c = None if args.force else load_month_file(comments_path)
+    since_by_id = None
+    if getattr(args, "delta_comments", False) and existing_c is not None:
+        marks = load_thread_marks(*existing_c)
+        since_by_id = {
+            thread_id: iso_to_timestamp(created_utc)
+            for thread_id, created_utc in since_by_thread(marks).items()
+        }
+
     # comment records with parallel processing
     if args.verbose:
         logger.info(f"Fetching comments for {len(threads)} threads using parallel processing...")
     comment_results = fetch_top_level_comments_parallel(
-        threads, max_workers=10, return_metrics=True
+        threads, max_workers=10, return_metrics=True, since_by_id=since_by_id
     )
 
     if isinstance(comment_results, tuple):
@@ -167,12 +183,12 @@ def _process_month(
                 }
             )
 
-    existing_c = None if args.force else load_month_file(comments_path)
     merged_comments = (
         merge_records(existing_c[1], comment_records)
         if existing_c is not None
         else sorted(comment_records, key=lambda r: r["created_utc"])
     )
+    comments_changed = existing_c is None or merged_comments != existing_c[1]
 
     # metadata + write
     missing = _calc_missing(year, month, threads)
@@ -197,8 +213,12 @@ def _process_month(
         "threads_missing_comments": [
             t["id"] for t in merged_threads if t["id"] not in threads_with_comments
         ],
+        "thread_marks": compute_thread_marks(merged_comments),
     }
-    write_month_file(comments_path, comments_meta, merged_comments)
+    if comments_file_unchanged(existing_c, comments_meta, comments_changed):
+        logger.info(f"No new comments for {threads_meta['month']}; comments file left as is")
+    else:
+        write_month_file(comments_path, comments_meta, merged_comments)
 
     # summary dictionary return
     return {
@@ -225,6 +245,8 @@ def main(argv: Sequence[str] | None = None) -> int:  # easier to test
         if args.debug:
             logging.getLogger().setLevel(logging.DEBUG)
 
+        set_artifact_compression(args.compress)
+
         # If --list-months is set, list months and exit
         if args.list_months:
             data_dir = get_data_dir(args.data_dir)
@@ -13,7 +13,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, List, Tuple
 
-from sotd.utils.file_io import load_json_data, save_json_data
+from sotd.utils.file_io import json_file_exists, load_json_data, save_json_data
 
 
 def write_month_file(path: Path, meta: dict[str, Any], data: List[dict[str, Any]]) -> None:
@@ -24,7 +24,7 @@ def write_month_file(path: Path, meta: dict[str, Any], data: List[dict[str, Any]
 
 def load_month_file(path: Path) -> Tuple[dict[str, Any], List[dict[str, Any]]] | None:  # noqa: D401
     """Return (meta, data) if file exists, else ``None``."""
-    if not path.is_file():
+    if not json_file_exists(path):
         return None
     try:
         obj = load_json_data(path)
@@ -0,0 +1,387 @@
+"""Asyncio comment fetching via JSON API.
+
+The thread-pool path in ``comments.py`` spends most of its time waiting on
+serial round trips: each worker lists one thread, then resolves its "more"
+stubs, then moves on. This module fetches the same data with
+``httpx.AsyncClient``: every thread listing and every ``morechildren`` batch is
+its own task, so a month backfill keeps as many requests in flight as the
+shared ``RateLimitBudget`` allows and finishes as fast as the rate limit (not
+the latency) permits. Retries (429 and server errors) wait on the same budget,
+so a rate-limit response pauses every task instead of just one.
+
+Results match ``fetch_comments_for_threads_json`` in sequential mode (same
+parsing and comment fields, in thread order). The one difference in requests is
+that "more" IDs are resolved in batches of 100, the most morechildren accepts,
+instead of one oversized request.
+
+httpx is an optional dependency, only needed when this engine is selected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from sotd.fetch.delta import reached_mark
+from sotd.fetch_via_json.comments import (
+    MORE_CHILDREN_BATCH_SIZE,
+    _more_children_url,
+    _parse_more_children,
+    _split_comment_listing,
+    _thread_json_url,
+)
+from sotd.fetch_via_json.json_scraper import (
+    USER_AGENT,
+    _calculate_delay,
+    _rate_limit_wait_time,
+    ensure_json_url,
+    get_reddit_cookies,
+)
+from sotd.fetch_via_json.rate_limit import RateLimitBudget
+from sotd.fetch_via_json.response_cache import ResponseCache
+
+# Same retry policy as the requests session: 3 retries for server errors
+# (exponential backoff) and 3 waits for rate-limit responses
+MAX_RETRIES = 3
+RETRY_STATUSES = {500, 502, 503, 504}
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError("httpx is required for --async-comments (pip install httpx)") from e
+    return httpx
+
+
+def httpx_available() -> bool:
+    """Return True if the asyncio comment fetcher can be used."""
+    try:
+        _import_httpx()
+    except ImportError:
+        return False
+    return True
+
+
+def create_async_client(cookies: Optional[dict] = None, max_connections: int = 10) -> Any:
+    """Create an ``httpx.AsyncClient`` configured like ``get_reddit_session``.
+
+    Args:
+        cookies: Dictionary of cookies (e.g., {"reddit_session": "abc123..."})
+        max_connections: Maximum number of concurrent connections
+
+    Returns:
+        httpx.AsyncClient (close it with ``await client.aclose()``)
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    httpx = _import_httpx()
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        cookies=cookies or None,
+        timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        ),
+    )
+
+
+async def get_reddit_json_async(
+    client: Any,
+    url: str,
+    rate_limiter: RateLimitBudget,
+    cache: Optional[ResponseCache] = None,
+    immutable_since: Optional[float] = None,
+) -> Any:
+    """Fetch JSON from a Reddit URL, taking every attempt from the shared budget.
+
+    Uses the response cache like ``get_reddit_json``: URLs cached after
+    ``immutable_since`` need no request and other cached URLs are revalidated.
+
+    Args:
+        client: httpx.AsyncClient
+        url: Reddit URL to fetch
+        rate_limiter: Budget shared by all tasks (and threads) fetching concurrently
+        cache: Optional response cache
+        immutable_since: Time after which the thread no longer changes; responses cached
+            after it are used without revalidation
+
+    Returns:
+        Parsed JSON
+
+    Raises:
+        httpx.HTTPError: If the request still fails after retries
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    httpx = _import_httpx()
+    url = ensure_json_url(url)
+    cached = cache.lookup(url) if cache is not None else None
+    if cache is not None and cached is not None and cache.is_immutable(cached, immutable_since):
+        return cache.use(cached)
+    request_headers = ResponseCache.conditional_headers(cached)
+    rate_limited = 0
+    failures = 0
+
+    while True:
+        await rate_limiter.acquire_async()
+        try:
+            response = await client.get(url, headers=request_headers)
+        except httpx.TransportError:
+            rate_limiter.release()
+            if failures >= MAX_RETRIES:
+                raise
+            failures += 1
+            await asyncio.sleep(2 ** (failures - 1))
+            continue
+        except BaseException:
+            rate_limiter.release()
+            raise
+        rate_limiter.update(response.headers)
+
+        if response.status_code == 429 and rate_limited < MAX_RETRIES:
+            rate_limited += 1
+            wait_time = _rate_limit_wait_time(response.headers, rate_limiter.base_delay)
+            rate_limiter.pause(wait_time or 0)
+            continue
+        if response.status_code in RETRY_STATUSES and failures < MAX_RETRIES:
+            failures += 1
+            await asyncio.sleep(2 ** (failures - 1))
+            continue
+
+        if response.status_code == 429:
+            raise httpx.HTTPStatusError(
+                f"Rate limit exceeded after {MAX_RETRIES} retries. "
+                f"Please wait before making more requests.",
+                request=response.request,
+                response=response,
+            )
+        if response.status_code == 304 and cache is not None and cached is not None:
+            return cache.use(cached, revalidated=True)
+        response.raise_for_status()
+        json_data = response.json()
+        if cache is not None:
+            cache.store(url, json_data, response.headers)
+        return json_data
+
+
+async def fetch_more_comments_async(
+    client: Any,
+    thread_id: str,
+    comment_ids: List[str],
+    rate_limiter: RateLimitBudget,
+    cache: Optional[ResponseCache] = None,
+    immutable_since: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Resolve "more" comment IDs with concurrent morechildren requests.
+
+    Args:
+        client: httpx.AsyncClient
+        thread_id: Reddit thread ID (without t3_ prefix)
+        comment_ids: Comment IDs to fetch (without t1_ prefix)
+        rate_limiter: Shared rate-limit budget
+        cache: Optional response cache
+        immutable_since: Time after which the thread no longer changes; responses cached
+            after it are used without revalidation
+
+    Returns:
+        List of comment dictionaries, in the order the IDs were given
+    """
+
+    async def fetch_batch(batch: List[str]) -> List[Dict[str, Any]]:
+        try:
+            json_data = await get_reddit_json_async(
+                client, _more_children_url(thread_id, batch), rate_limiter, cache, immutable_since
+            )
+        except Exception as e:
+            print(f"[WARN] Failed to fetch more comments: {e}")
+            return []
+        return _parse_more_children(json_data)
+
+    batches = [
+        comment_ids[i : i + MORE_CHILDREN_BATCH_SIZE]
+        for i in range(0, len(comment_ids), MORE_CHILDREN_BATCH_SIZE)
+    ]
+    results = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+    return [comment for batch_comments in results for comment in batch_comments]
+
+
+async def fetch_thread_comments_async(
+    client: Any,
+    thread: Dict[str, Any],
+    rate_limiter: RateLimitBudget,
+    cache: Optional[ResponseCache] = None,
+    since: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch top-level comments for one thread, expanding "more" stubs concurrently.
+
+    With ``since`` (delta fetching) comments are listed newest first and the
+    "more" batches are fetched one after another until one reaches the mark.
+
+    Args:
+        client: httpx.AsyncClient
+        thread: Thread dictionary (must have 'id'; 'title', 'url' and 'created_utc' are
+            used if present)
+        rate_limiter: Shared rate-limit budget
+        cache: Optional response cache (threads it considers immutable need no request)
+        since: created_utc of the newest comment already stored for the thread
+
+    Returns:
+        List of comment dictionaries with thread_id and thread_title added
+    """
+    thread_id = thread.get("id")
+    if not thread_id:
+        return []
+    immutable_since = (
+        cache.immutable_since(thread.get("created_utc")) if cache is not None else None
+    )
+
+    try:
+        json_data = await get_reddit_json_async(
+            client,
+            _thread_json_url(thread_id, thread.get("url", ""), newest_first=since is not None),
+            rate_limiter,
+            cache,
+            immutable_since,
+        )
+        comments, more_comment_ids = _split_comment_listing(json_data)
+        if since is not None:
+            for start in range(0, len(more_comment_ids), MORE_CHILDREN_BATCH_SIZE):
+                if reached_mark(comments, since):
+                    break
+                batch = more_comment_ids[start : start + MORE_CHILDREN_BATCH_SIZE]
+                comments.extend(
+                    await fetch_more_comments_async(
+                        client, thread_id, batch, rate_limiter, cache, immutable_since
+                    )
+                )
+        elif more_comment_ids:
+            comments.extend(
+                await fetch_more_comments_async(
+                    client, thread_id, more_comment_ids, rate_limiter, cache, immutable_since
+                )
+            )
+    except Exception as e:
+        print(f"[WARN] Failed to fetch comments for thread {thread_id}: {e}")
+        return []
+
+    thread_title = thread.get("title", "")
+    for comment in comments:
+        comment["thread_id"] = thread_id
+        comment["thread_title"] = thread_title
+    return comments
+
+
+async def fetch_comments_for_threads_async(
+    threads: List[Dict[str, Any]],
+    *,
+    cookies: Optional[dict] = None,
+    client: Optional[Any] = None,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    max_concurrency: int = 10,
+    verbose: bool = False,
+    cache: Optional[ResponseCache] = None,
+    since_by_thread: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch top-level comments for many threads concurrently.
+
+    Args:
+        threads: List of thread dictionaries
+        cookies: Optional cookies for authentication (looked up when not given)
+        client: Optional httpx.AsyncClient; its connection pool bounds the requests in
+            flight (one pooling max_concurrency connections is created and closed when
+            not given)
+        rate_limiter: Optional rate-limit budget (created from the auth status when not given)
+        max_concurrency: Maximum number of requests in flight when creating the client
+        verbose: Enable verbose output
+        cache: Optional response cache
+        since_by_thread: Optional high-water marks (thread ID -> created_utc of the newest
+            stored comment) for delta fetching
+
+    Returns:
+        List of all comment dictionaries, in thread order
+    """
+    if not threads:
+        return []
+
+    if cookies is None:
+        cookies = get_reddit_cookies()
+    if rate_limiter is None:
+        rate_limiter = RateLimitBudget(_calculate_delay(cookies))
+    own_client = client is None
+    http_client = (
+        create_async_client(cookies, max_connections=max_concurrency) if own_client else client
+    )
+
+    if verbose:
+        print(
+            f"[INFO] Fetching comments for {len(threads)} threads "
+            f"(async, up to {max_concurrency} requests in flight)..."
+        )
+
+    completed = 0
+    total_comments = 0
+
+    async def fetch_one(thread: Dict[str, Any]) -> List[Dict[str, Any]]:
+        nonlocal completed, total_comments
+        since = (since_by_thread or {}).get(thread.get("id", ""))
+        comments = await fetch_thread_comments_async(
+            http_client, thread, rate_limiter, cache, since
+        )
+        completed += 1
+        total_comments += len(comments)
+        if verbose and (completed % 10 == 0 or completed == len(threads)):
+            print(
+                f"[INFO] Fetched comments for {completed}/{len(threads)} threads "
+                f"({total_comments} total comments)"
+            )
+        return comments
+
+    try:
+        results = await asyncio.gather(*(fetch_one(thread) for thread in threads))
+    finally:
+        if own_client:
+            await http_client.aclose()
+
+    return [comment for thread_comments in results for comment in thread_comments]
+
+
+def fetch_comments_async(
+    threads: List[Dict[str, Any]],
+    *,
+    cookies: Optional[dict] = None,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    max_concurrency: int = 10,
+    verbose: bool = False,
+    cache: Optional[ResponseCache] = None,
+    since_by_thread: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Run ``fetch_comments_for_threads_async`` from synchronous code.
+
+    Args:
+        threads: List of thread dictionaries
+        cookies: Optional cookies for authentication
+        rate_limiter: Optional rate-limit budget
+        max_concurrency: Maximum number of requests in flight at once
+        verbose: Enable verbose output
+        cache: Optional response cache
+        since_by_thread: Optional high-water marks for delta fetching
+
+    Returns:
+        List of all comment dictionaries, in thread order
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    _import_httpx()
+    return asyncio.run(
+        fetch_comments_for_threads_async(
+            threads,
+            cookies=cookies,
+            rate_limiter=rate_limiter,
+            max_concurrency=max_concurrency,
+            verbose=verbose,
+            cache=cache,
+            since_by_thread=since_by_thread,
+        )
+    )
@@ -7,9 +7,20 @@ from __future__ import annotations
 
 import html
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sotd.fetch_via_json.json_scraper import get_reddit_cookies, get_reddit_json, get_reddit_session
+from sotd.fetch.delta import reached_mark
+from sotd.fetch_via_json.json_scraper import (
+    _calculate_delay,
+    get_reddit_cookies,
+    get_reddit_json,
+    get_reddit_session,
+)
+from sotd.fetch_via_json.rate_limit import RateLimitBudget
+from sotd.fetch_via_json.response_cache import ResponseCache
+
+# Reddit's morechildren endpoint resolves at most 100 IDs per request
+MORE_CHILDREN_BATCH_SIZE = 100
 
 
 def parse_comment_from_json(json_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -100,12 +111,62 @@ def parse_comment_from_json(json_data: Dict[str, Any]) -> Optional[Dict[str, Any
     }
 
 
+def _more_children_url(thread_id: str, comment_ids: List[str]) -> str:
+    """Build the morechildren API URL for a thread's "more" comment IDs."""
+    api_url = "https://www.reddit.com/api/morechildren.json"
+
+    # Build parameters
+    link_id = f"t3_{thread_id}"
+    children_param = ",".join(comment_ids)
+
+    params = {
+        "link_id": link_id,
+        "children": children_param,
+        "api_type": "json",
+    }
+
+    # Build query string
+    query_string = "&".join(f"{k}={v}" for k, v in params.items())
+    return f"{api_url}?{query_string}"
+
+
+def _parse_more_children(json_data: Any) -> List[Dict[str, Any]]:
+    """Parse root comments from a morechildren API response."""
+    # Reddit's morechildren response structure:
+    # {"json": {"data": {"things": [{"kind": "t1", "data": {...}}, ...]}}}
+    if isinstance(json_data, dict):
+        if "json" in json_data and "data" in json_data["json"]:
+            things = json_data["json"]["data"].get("things", [])
+        elif "data" in json_data and "things" in json_data["data"]:
+            things = json_data["data"]["things"]
+        else:
+            things = []
+    else:
+        things = []
+
+    comments = []
+    for thing in things:
+        if thing.get("kind") == "t1":
+            # Only include root comments (parent_id starts with t3_)
+            data = thing.get("data", {})
+            parent_id = data.get("parent_id", "")
+            if parent_id.startswith("t3_"):
+                parsed = parse_comment_from_json(thing)
+                if parsed:
+                    comments.append(parsed)
+
+    return comments
+
+
 def fetch_more_comments(
     thread_id: str,
     comment_ids: List[str],
     *,
     cookies: Optional[dict] = None,
     session: Optional[Any] = None,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    immutable_since: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch additional comments using Reddit's morechildren API.
 
@@ -120,6 +181,10 @@ def fetch_more_comments(
         comment_ids: List of comment IDs to fetch (without t1_ prefix)
         cookies: Optional cookies for authentication
         session: Optional requests.Session
+        rate_limiter: Optional rate-limit budget shared with other workers
+        cache: Optional response cache
+        immutable_since: Time after which the thread no longer changes; responses cached
+            after it are used without revalidation
 
     Returns:
         List of comment dictionaries
@@ -132,62 +197,79 @@ def fetch_more_comments(
             cookies = get_reddit_cookies()
         session = get_reddit_session(cookies=cookies)
 
-    # Build API URL
-    api_url = "https://www.reddit.com/api/morechildren.json"
-
-    # Build parameters
-    link_id = f"t3_{thread_id}"
-    children_param = ",".join(comment_ids)
-
-    params = {
-        "link_id": link_id,
-        "children": children_param,
-        "api_type": "json",
-    }
-
-    # Build query string
-    query_string = "&".join(f"{k}={v}" for k, v in params.items())
-    url = f"{api_url}?{query_string}"
+    url = _more_children_url(thread_id, comment_ids)
 
     try:
         # Fetch JSON
-        json_data = get_reddit_json(url, cookies=cookies, session=session)
-
-        # Reddit's morechildren response structure:
-        # {"json": {"data": {"things": [{"kind": "t1", "data": {...}}, ...]}}}
-        if isinstance(json_data, dict):
-            if "json" in json_data and "data" in json_data["json"]:
-                things = json_data["json"]["data"].get("things", [])
-            elif "data" in json_data and "things" in json_data["data"]:
-                things = json_data["data"]["things"]
-            else:
-                things = []
-        else:
-            things = []
-
-        comments = []
-        for thing in things:
-            if thing.get("kind") == "t1":
-                # Only include root comments (parent_id starts with t3_)
-                data = thing.get("data", {})
-                parent_id = data.get("parent_id", "")
-                if parent_id.startswith("t3_"):
-                    parsed = parse_comment_from_json(thing)
-                    if parsed:
-                        comments.append(parsed)
+        json_data = get_reddit_json(
+            url,
+            cookies=cookies,
+            session=session,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            immutable_since=immutable_since,
+        )
 
-        return comments
+        return _parse_more_children(json_data)
     except Exception as e:
         print(f"[WARN] Failed to fetch more comments: {e}")
         return []
 
 
+def _split_comment_listing(json_data: Any) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Split a thread's comment listing into parsed top-level comments and "more" IDs.
+
+    Args:
+        json_data: List of listings from Reddit JSON API
+
+    Returns:
+        Tuple of (top-level comment dictionaries, top-level "more" comment IDs to fetch)
+    """
+    if not isinstance(json_data, list) or len(json_data) < 2:
+        return [], []
+
+    # Second element contains comments
+    comments_listing = json_data[1]
+    if "data" not in comments_listing or "children" not in comments_listing["data"]:
+        return [], []
+
+    children = comments_listing["data"]["children"]
+    top_level_comments = []
+    more_comment_ids = []
+
+    for child in children:
+        kind = child.get("kind")
+
+        if kind == "t1":
+            # Top-level comment - verify it's actually root (parent_id starts with t3_)
+            data = child.get("data", {})
+            parent_id = data.get("parent_id", "")
+            if parent_id.startswith("t3_"):
+                parsed = parse_comment_from_json(child)
+                if parsed:
+                    top_level_comments.append(parsed)
+        elif kind == "more":
+            # "More" object - indicates additional comments to fetch
+            more_data = child.get("data", {})
+            # Only fetch top-level "more" comments (depth=0 or parent_id starts with t3_)
+            if more_data.get("depth", 1) == 0 or more_data.get("parent_id", "").startswith("t3_"):
+                more_ids = more_data.get("children", [])
+                # Remove t1_ prefix if present
+                more_ids = [id.replace("t1_", "") for id in more_ids if id]
+                more_comment_ids.extend(more_ids)
+
+    return top_level_comments, more_comment_ids
+
+
 def extract_top_level_comments(
     json_data: List[Dict[str, Any]],
     thread_id: str,
     *,
     cookies: Optional[dict] = None,
     session: Optional[Any] = None,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    immutable_since: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Extract top-level comments from Reddit's JSON response, including "more" comments.
 
@@ -221,53 +303,98 @@ def extract_top_level_comments(
         thread_id: Reddit thread ID (for fetching more comments)
         cookies: Optional cookies for authentication
         session: Optional requests.Session
+        rate_limiter: Optional rate-limit budget shared with other workers
+        cache: Optional response cache for the "more" comment requests
+        immutable_since: Time after which the thread no longer changes; responses cached
+            after it are used without revalidation
 
     Returns:
         List of top-level comment dictionaries
     """
-    if not isinstance(json_data, list) or len(json_data) < 2:
-        return []
-
-    # Second element contains comments
-    comments_listing = json_data[1]
-    if "data" not in comments_listing or "children" not in comments_listing["data"]:
-        return []
-
-    children = comments_listing["data"]["children"]
-    top_level_comments = []
-    more_comment_ids = []
-
-    for child in children:
-        kind = child.get("kind")
-
-        if kind == "t1":
-            # Top-level comment - verify it's actually root (parent_id starts with t3_)
-            data = child.get("data", {})
-            parent_id = data.get("parent_id", "")
-            if parent_id.startswith("t3_"):
-                parsed = parse_comment_from_json(child)
-                if parsed:
-                    top_level_comments.append(parsed)
-        elif kind == "more":
-            # "More" object - indicates additional comments to fetch
-            more_data = child.get("data", {})
-            # Only fetch top-level "more" comments (depth=0 or parent_id starts with t3_)
-            if more_data.get("depth", 1) == 0 or more_data.get("parent_id", "").startswith("t3_"):
-                more_ids = more_data.get("children", [])
-                # Remove t1_ prefix if present
-                more_ids = [id.replace("t1_", "") for id in more_ids if id]
-                more_comment_ids.extend(more_ids)
+    top_level_comments, more_comment_ids = _split_comment_listing(json_data)
 
     # Fetch "more" comments if any
     if more_comment_ids:
         more_comments = fetch_more_comments(
-            thread_id, more_comment_ids, cookies=cookies, session=session
+            thread_id,
+            more_comment_ids,
+            cookies=cookies,
+            session=session,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            immutable_since=immutable_since,
         )
         top_level_comments.extend(more_comments)
 
     return top_level_comments
 
 
+def _thread_json_url(thread_id: str, thread_url: str, newest_first: bool = False) -> str:
+    """Build the JSON URL listing a thread's top-level comments (optionally newest first)."""
+    # Build JSON URL: https://www.reddit.com/r/wetshaving/comments/{thread_id}/.json
+    # Extract subreddit from thread_url if possible, or use default
+    if "/r/" in thread_url:
+        # Extract subreddit from URL
+        parts = thread_url.split("/r/")
+        if len(parts) > 1:
+            subreddit = parts[1].split("/")[0]
+        else:
+            subreddit = "wetshaving"
+    else:
+        subreddit = "wetshaving"
+
+    url = f"https://www.reddit.com/r/{subreddit}/comments/{thread_id}/.json?limit=100&depth=1"
+    return f"{url}&sort=new" if newest_first else url
+
+
+def _extract_comments_since(
+    json_data: List[Dict[str, Any]],
+    thread_id: str,
+    since: str,
+    *,
+    cookies: Optional[dict] = None,
+    session: Optional[Any] = None,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    immutable_since: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Extract top-level comments from a newest-first listing down to a high-water mark.
+
+    "More" stubs are resolved one batch at a time, oldest last, until a batch
+    reaches a comment at or before ``since``.
+
+    Args:
+        json_data: Newest-first list of listings from Reddit JSON API
+        thread_id: Reddit thread ID
+        since: created_utc of the newest comment already stored for the thread
+        cookies: Optional cookies for authentication
+        session: Optional requests.Session
+        rate_limiter: Optional rate-limit budget shared with other workers
+        cache: Optional response cache
+        immutable_since: Time after which the thread no longer changes; responses cached
+            after it are used without revalidation
+
+    Returns:
+        Top-level comment dictionaries, newest first (may include already stored ones)
+    """
+    comments, more_comment_ids = _split_comment_listing(json_data)
+    for start in range(0, len(more_comment_ids), MORE_CHILDREN_BATCH_SIZE):
+        if reached_mark(comments, since):
+            break
+        comments.extend(
+            fetch_more_comments(
+                thread_id,
+                more_comment_ids[start : start + MORE_CHILDREN_BATCH_SIZE],
+                cookies=cookies,
+                session=session,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                immutable_since=immutable_since,
+            )
+        )
+    return comments
+
+
 def fetch_thread_comments_json(
     thread_id: str,
     thread_title: str,
@@ -275,6 +402,10 @@ def fetch_thread_comments_json(
     *,
     cookies: Optional[dict] = None,
     session: Optional[Any] = None,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    created_utc: Optional[str] = None,
+    since: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch top-level comments for a thread using JSON API.
 
@@ -284,32 +415,52 @@ def fetch_thread_comments_json(
         thread_url: Thread URL (for comment records)
         cookies: Optional cookies for authentication
         session: Optional requests.Session
+        rate_limiter: Optional rate-limit budget shared with other workers
+        cache: Optional response cache
+        created_utc: Thread creation time (ISO 8601); with a cache, threads older than
+            the cache's immutable_after_days are served from it without a request
+        since: created_utc of the newest comment already stored for the thread; when
+            given, comments are listed newest first and only fetched down to it
 
     Returns:
         List of comment dictionaries with thread_id and thread_title added
     """
-    # Build JSON URL: https://www.reddit.com/r/wetshaving/comments/{thread_id}/.json
-    # Extract subreddit from thread_url if possible, or use default
-    if "/r/" in thread_url:
-        # Extract subreddit from URL
-        parts = thread_url.split("/r/")
-        if len(parts) > 1:
-            subreddit = parts[1].split("/")[0]
-        else:
-            subreddit = "wetshaving"
-    else:
-        subreddit = "wetshaving"
-
-    json_url = f"https://www.reddit.com/r/{subreddit}/comments/{thread_id}/.json?limit=100&depth=1"
+    json_url = _thread_json_url(thread_id, thread_url, newest_first=since is not None)
+    immutable_since = cache.immutable_since(created_utc) if cache is not None else None
 
     try:
         # Fetch JSON
-        json_data = get_reddit_json(json_url, cookies=cookies, session=session)
+        json_data = get_reddit_json(
+            json_url,
+            cookies=cookies,
+            session=session,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            immutable_since=immutable_since,
+        )
 
         # Extract top-level comments (including "more" comments)
-        comments = extract_top_level_comments(
-            json_data, thread_id, cookies=cookies, session=session
-        )
+        if since is None:
+            comments = extract_top_level_comments(
+                json_data,
+                thread_id,
+                cookies=cookies,
+                session=session,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                immutable_since=immutable_since,
+            )
+        else:
+            comments = _extract_comments_since(
+                json_data,
+                thread_id,
+                since,
+                cookies=cookies,
+                session=session,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                immutable_since=immutable_since,
+            )
 
         # Add thread context to each comment
         for comment in comments:
@@ -333,19 +484,33 @@ def fetch_comments_for_threads_json(
     skip_unchanged: bool = False,
     existing_threads: Optional[List[Dict[str, Any]]] = None,
     existing_comments: Optional[List[Dict[str, Any]]] = None,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    use_async: bool = False,
+    cache: Optional[ResponseCache] = None,
+    since_by_thread: Optional[Dict[str, str]] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch top-level comments for multiple threads.
 
     Args:
         threads: List of thread dictionaries (must have 'id', 'title', 'url', 'num_comments')
         cookies: Optional cookies for authentication
-        session: Optional requests.Session (not used in parallel mode - each thread gets its own session)
+        session: Optional requests.Session (shared by all workers in parallel mode, so its
+            connection pool should hold max_workers connections)
         verbose: Enable verbose output
         parallel: If True, use parallel processing (default: False)
         max_workers: Number of worker threads for parallel processing (default: 5)
         skip_unchanged: If True, skip fetching comments for threads where num_comments hasn't increased
         existing_threads: Optional list of existing thread dictionaries for comparison
         existing_comments: Optional list of existing comment dictionaries to reuse for skipped threads
+        rate_limiter: Optional rate-limit budget; parallel and async modes create one
+            shared by their workers when not given
+        use_async: If True, fetch with the asyncio engine (async_comments), keeping up to
+            max_workers requests in flight; takes precedence over parallel and ignores
+            session (requires httpx)
+        cache: Optional response cache; comment listings of old threads are served from
+            it and the rest are revalidated with conditional requests
+        since_by_thread: Optional high-water marks (thread ID -> created_utc of the newest
+            stored comment); threads listed here only fetch comments down to the mark
 
     Returns:
         List of all comment dictionaries (flattened across all threads)
@@ -411,13 +576,38 @@ def fetch_comments_for_threads_json(
     # Fetch comments for threads that need fetching
     fetched_comments = []
     if threads_to_fetch:
-        if parallel:
+        if use_async:
+            from sotd.fetch_via_json.async_comments import fetch_comments_async
+
+            fetched_comments = fetch_comments_async(
+                threads_to_fetch,
+                cookies=cookies,
+                rate_limiter=rate_limiter,
+                max_concurrency=max_workers,
+                verbose=verbose,
+                cache=cache,
+                since_by_thread=since_by_thread,
+            )
+        elif parallel:
             fetched_comments = _fetch_comments_parallel(
-                threads_to_fetch, cookies=cookies, verbose=verbose, max_workers=max_workers
+                threads_to_fetch,
+                cookies=cookies,
+                session=session,
+                verbose=verbose,
+                max_workers=max_workers,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                since_by_thread=since_by_thread,
             )
         else:
             fetched_comments = _fetch_comments_sequential(
-                threads_to_fetch, cookies=cookies, session=session, verbose=verbose
+                threads_to_fetch,
+                cookies=cookies,
+                session=session,
+                verbose=verbose,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                since_by_thread=since_by_thread,
             )
 
     # Add existing comments for skipped threads
@@ -442,6 +632,9 @@ def _fetch_comments_sequential(
     cookies: Optional[dict] = None,
     session: Optional[Any] = None,
     verbose: bool = False,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    since_by_thread: Optional[Dict[str, str]] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch comments sequentially (original implementation)."""
     if session is None:
@@ -464,7 +657,15 @@ def _fetch_comments_sequential(
 
         try:
             comments = fetch_thread_comments_json(
-                thread_id, thread_title, thread_url, cookies=cookies, session=session
+                thread_id,
+                thread_title,
+                thread_url,
+                cookies=cookies,
+                session=session,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                created_utc=thread.get("created_utc"),
+                since=(since_by_thread or {}).get(thread_id),
             )
             all_comments.extend(comments)
 
@@ -483,19 +684,29 @@ def _fetch_comments_parallel(
     threads: List[Dict[str, Any]],
     *,
     cookies: Optional[dict] = None,
+    session: Optional[Any] = None,
     verbose: bool = False,
     max_workers: int = 5,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    since_by_thread: Optional[Dict[str, str]] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch comments in parallel using ThreadPoolExecutor.
 
-    Note: Each thread gets its own session to avoid thread-safety issues.
-    Rate limiting delays are still applied per request.
+    All workers share one pooled session and one rate-limit budget, so together
+    they stay within the budget Reddit reports instead of each pacing itself
+    against the same headers.
 
     Args:
         threads: List of thread dictionaries
         cookies: Optional cookies for authentication
+        session: Optional requests.Session shared by the workers (a session pooling
+            max_workers connections is created when not given)
         verbose: Enable verbose output
         max_workers: Number of worker threads
+        rate_limiter: Optional rate-limit budget (created from the auth status when not given)
+        cache: Optional response cache shared by the workers
+        since_by_thread: Optional high-water marks for delta fetching
 
     Returns:
         List of all comment dictionaries
@@ -505,6 +716,10 @@ def _fetch_comments_parallel(
 
     if cookies is None:
         cookies = get_reddit_cookies()
+    if session is None:
+        session = get_reddit_session(cookies=cookies, pool_size=max_workers)
+    if rate_limiter is None:
+        rate_limiter = RateLimitBudget(_calculate_delay(cookies))
 
     if verbose:
         print(
@@ -520,12 +735,17 @@ def _fetch_comments_parallel(
         if not thread_id:
             return []
 
-        # Create a new session for this thread (thread-safe)
-        thread_session = get_reddit_session(cookies=cookies)
-
         try:
             comments = fetch_thread_comments_json(
-                thread_id, thread_title, thread_url, cookies=cookies, session=thread_session
+                thread_id,
+                thread_title,
+                thread_url,
+                cookies=cookies,
+                session=session,
+                rate_limiter=rate_limiter,
+                cache=cache,
+                created_utc=thread.get("created_utc"),
+                since=(since_by_thread or {}).get(thread_id),
             )
             return comments
         except Exception as e:
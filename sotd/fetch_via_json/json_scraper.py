@@ -14,7 +14,7 @@ import os
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -25,6 +25,15 @@ except ImportError:
     # Fallback for older requests versions
     from requests.packages.urllib3.util.retry import Retry  # type: ignore[attr-defined]
 
+from sotd.fetch_via_json.rate_limit import RateLimitBudget, pacing_delay, parse_rate_limit_headers
+from sotd.fetch_via_json.response_cache import ResponseCache
+
+# Browser User-Agent sent with every request to avoid bot detection
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
 
 def _find_project_root() -> Path:
     """Find project root by going up from this file's location.
@@ -188,13 +197,17 @@ def get_reddit_cookies(force_refresh: bool = False) -> dict:
 
 
 def get_reddit_session(
-    cookies: Optional[dict] = None, oauth_creds: Optional[dict] = None
+    cookies: Optional[dict] = None, oauth_creds: Optional[dict] = None, pool_size: int = 10
 ) -> requests.Session:
     """Create authenticated requests session with cookies or OAuth.
 
+    The session keeps up to ``pool_size`` connections per host open, so one
+    session can be shared by that many worker threads.
+
     Args:
         cookies: Dictionary of cookies (e.g., {"reddit_session": "abc123..."})
         oauth_creds: Dictionary with REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET (optional)
+        pool_size: Maximum number of pooled connections per host
 
     Returns:
         requests.Session configured with appropriate authentication
@@ -202,11 +215,7 @@ def get_reddit_session(
     session = requests.Session()
 
     # Set User-Agent to avoid bot detection
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-    )
+    session.headers.update({"User-Agent": USER_AGENT})
 
     # Add cookies if provided
     if cookies:
@@ -221,13 +230,24 @@ def get_reddit_session(
         status_forcelist=[500, 502, 503, 504],  # Server errors only, not rate limits
         allowed_methods=["GET", "POST"],
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
     return session
 
 
+def ensure_json_url(url: str) -> str:
+    """Return the URL with ``format=json`` added unless it already ends in .json."""
+    if not url.endswith(".json") and "format=json" not in url:
+        if "?" in url:
+            return f"{url}&format=json"
+        return f"{url}?format=json"
+    return url
+
+
 def _calculate_delay(cookies: Optional[dict] = None) -> float:
     """Calculate base delay between requests based on authentication status.
 
@@ -271,58 +291,8 @@ def _calculate_dynamic_delay(
     Returns:
         Calculated delay in seconds
     """
-    # Extract rate limit headers (case-insensitive)
-    headers = response.headers
-    remaining = None
-    reset = None
-    used = None
-
-    # Try various header name formats
-    for header_name in headers:
-        header_lower = header_name.lower()
-        if header_lower == "x-ratelimit-remaining":
-            try:
-                remaining = float(headers[header_name])
-            except (ValueError, TypeError):
-                pass
-        elif header_lower == "x-ratelimit-reset":
-            try:
-                reset = float(headers[header_name])
-            except (ValueError, TypeError):
-                pass
-        elif header_lower == "x-ratelimit-used":
-            try:
-                used = float(headers[header_name])
-            except (ValueError, TypeError):
-                pass
-
-    # If we don't have rate limit headers, use base delay
-    if remaining is None:
-        return base_delay
-
-    # Calculate dynamic delay using time-based pacing algorithm
-    if remaining > 20:
-        # Burst mode - plenty of requests remaining, use minimal delay
-        delay = base_delay
-    elif remaining > 10:
-        # Moderate remaining - slight increase, but also check reset time
-        if reset is not None and reset > 0:
-            time_per_request = (reset / remaining) * 0.9  # Safety margin
-            delay = max(base_delay * 1.5, time_per_request)
-        else:
-            delay = base_delay * 1.5
-    elif remaining > 0:
-        # Low remaining - pace across reset window using time-based calculation
-        if reset is not None and reset > 0:
-            time_per_request = (reset / remaining) * 0.9  # Safety margin
-            delay = max(time_per_request, base_delay)  # Don't go below base
-            delay = min(delay, 60.0)  # Cap at 60s to avoid excessive waits
-        else:
-            # No reset time available, use conservative multiplier
-            delay = base_delay * 5.0
-    else:
-        # Exhausted - should rarely happen, wait for reset
-        delay = reset if reset and reset > 0 else base_delay * 10.0
+    remaining, reset, used = parse_rate_limit_headers(response.headers)
+    delay = pacing_delay(remaining, reset, base_delay)
 
     if verbose and remaining is not None:
         reset_str = f", reset in {reset:.0f}s" if reset is not None else ""
@@ -334,63 +304,106 @@ def _calculate_dynamic_delay(
     return delay
 
 
-def _handle_rate_limit(
-    response: requests.Response, url: str, delay: float, session: requests.Session
+def _get_with_budget(
+    session: requests.Session,
+    url: str,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> requests.Response:
-    """Handle rate limiting by respecting Reddit's rate limit headers.
+    """GET a URL, taking a request from the shared budget first when one is given."""
+    if rate_limiter is None:
+        return session.get(url, timeout=30, headers=headers)
+    rate_limiter.acquire()
+    try:
+        response = session.get(url, timeout=30, headers=headers)
+    except BaseException:
+        rate_limiter.release()
+        raise
+    rate_limiter.update(response.headers)
+    return response
 
-    Reddit sends x-ratelimit-reset header indicating when the limit resets (in seconds).
-    If not available, falls back to exponential backoff.
 
-    This function may be called multiple times if rate limits persist.
+def _rate_limit_wait_time(headers: Mapping[str, Any], delay: float) -> Optional[float]:
+    """Return how long to wait after a 429 response, preferring Reddit's reset header.
 
     Args:
-        response: The rate-limited response
-        url: URL being fetched
-        delay: Base delay in seconds
-        session: requests.Session to use for retry
+        headers: Headers of the rate-limited response
+        delay: Base delay in seconds (exponential backoff fallback)
 
     Returns:
-        New response after waiting (may still be 429 if rate limit persists)
+        Seconds to wait, or None if only an invalid Retry-After header was sent
     """
+    wait_time: Optional[float] = None
+
     # Check for Reddit's rate limit reset header (preferred)
-    rate_limit_reset = response.headers.get("x-ratelimit-reset") or response.headers.get(
-        "X-RateLimit-Reset"
-    )
+    rate_limit_reset = headers.get("x-ratelimit-reset") or headers.get("X-RateLimit-Reset")
     if rate_limit_reset:
         try:
             wait_time = int(float(rate_limit_reset))
             print(
                 f"[WARN] Rate limit hit, waiting {wait_time}s (rate limit resets in {wait_time}s)"
             )
-            time.sleep(wait_time)
         except (ValueError, TypeError):
             # Fall through to exponential backoff if header is invalid
             rate_limit_reset = None
 
     # Fallback: Check for standard Retry-After header (some APIs use this)
     if not rate_limit_reset:
-        retry_after = response.headers.get("Retry-After")
+        retry_after = headers.get("Retry-After")
         if retry_after:
             try:
                 wait_time = int(retry_after)
                 print(f"[WARN] Rate limit hit, waiting {wait_time}s (from Retry-After header)")
-                time.sleep(wait_time)
             except (ValueError, TypeError):
                 # Fall through to exponential backoff
                 pass
 
     # Final fallback: exponential backoff
-    if not rate_limit_reset and not response.headers.get("Retry-After"):
+    if not rate_limit_reset and not headers.get("Retry-After"):
         wait_time = delay * 2
         print(
             f"[WARN] Rate limit hit, waiting {wait_time}s (exponential backoff, no reset time available)"
         )
+
+    return wait_time
+
+
+def _handle_rate_limit(
+    response: requests.Response,
+    url: str,
+    delay: float,
+    session: requests.Session,
+    rate_limiter: Optional[RateLimitBudget] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    """Handle rate limiting by respecting Reddit's rate limit headers.
+
+    Reddit sends x-ratelimit-reset header indicating when the limit resets (in seconds).
+    If not available, falls back to exponential backoff.
+
+    This function may be called multiple times if rate limits persist.
+
+    Args:
+        response: The rate-limited response
+        url: URL being fetched
+        delay: Base delay in seconds
+        session: requests.Session to use for retry
+        rate_limiter: Optional shared budget; when given, every worker using it
+            waits out the rate limit instead of only this one
+        headers: Extra request headers to send again with the retry
+
+    Returns:
+        New response after waiting (may still be 429 if rate limit persists)
+    """
+    wait_time = _rate_limit_wait_time(response.headers, delay)
+
+    if rate_limiter is not None:
+        rate_limiter.pause(wait_time or 0)
+    elif wait_time is not None:
         time.sleep(wait_time)
 
     # Retry the request (may still get 429, caller should check)
-    response = session.get(url, timeout=30)
-    return response
+    return _get_with_budget(session, url, rate_limiter, headers)
 
 
 def get_reddit_json(
@@ -398,21 +411,33 @@ def get_reddit_json(
     cookies: Optional[dict] = None,
     session: Optional[requests.Session] = None,
     verbose: bool = False,
-) -> Dict[str, Any]:
+    rate_limiter: Optional[RateLimitBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    immutable_since: Optional[float] = None,
+) -> Any:
     """Fetch JSON from Reddit URL with proper headers, cookies, and error handling.
 
     This function proactively manages rate limits by checking x-ratelimit-remaining
     and x-ratelimit-reset headers on every response, adjusting delays dynamically
-    to avoid 429 errors.
+    to avoid 429 errors. With a shared ``rate_limiter`` the request waits for its
+    slot in the budget before it is sent instead of sleeping afterwards.
+
+    With a ``cache``, a URL cached after ``immutable_since`` is answered without
+    a request; any other cached URL is revalidated with a conditional request
+    and a 304 response reuses the cached body.
 
     Args:
         url: Reddit URL to fetch (should end in .json or have ?format=json)
         cookies: Optional cookies dict
         session: Optional requests.Session (if provided, cookies are ignored)
         verbose: If True, print rate limit information
+        rate_limiter: Optional budget shared by all workers fetching concurrently
+        cache: Optional response cache
+        immutable_since: Time after which the URL's content no longer changes (see
+            ResponseCache.immutable_since); a response cached after it is used as-is
 
     Returns:
-        Parsed JSON as dictionary
+        Parsed JSON: a listing dictionary, or a list of listings for a thread
 
     Raises:
         requests.RequestException: If request fails after retries
@@ -421,24 +446,26 @@ def get_reddit_json(
     if session is None:
         session = get_reddit_session(cookies=cookies)
 
-    # Ensure URL ends with .json or has format=json
-    if not url.endswith(".json") and "format=json" not in url:
-        if "?" in url:
-            url = f"{url}&format=json"
-        else:
-            url = f"{url}?format=json"
+    url = ensure_json_url(url)
+
+    cached = cache.lookup(url) if cache is not None else None
+    if cache is not None and cached is not None and cache.is_immutable(cached, immutable_since):
+        return cache.use(cached)
+    request_headers = ResponseCache.conditional_headers(cached) or None
 
     base_delay = _calculate_delay(cookies)
     delay = base_delay  # Start with base delay, will be adjusted dynamically
 
     try:
-        response = session.get(url, timeout=30)
+        response = _get_with_budget(session, url, rate_limiter, request_headers)
 
         # Handle rate limiting - may need multiple retries
         max_rate_limit_retries = 3
         retry_count = 0
         while response.status_code == 429 and retry_count < max_rate_limit_retries:
-            response = _handle_rate_limit(response, url, delay, session)
+            response = _handle_rate_limit(
+                response, url, delay, session, rate_limiter, request_headers
+            )
             retry_count += 1
 
         # If still rate limited after retries, raise error
@@ -455,11 +482,18 @@ def get_reddit_json(
         # This helps avoid 429s by adjusting delay based on remaining requests
         delay = _calculate_dynamic_delay(response, base_delay, verbose=verbose)
 
-        # Parse JSON
-        json_data = response.json()
-
-        # Add delay between requests (dynamically calculated based on rate limit status)
-        time.sleep(delay)
+        # Parse JSON (a 304 confirms the cached body is still current)
+        if response.status_code == 304 and cache is not None and cached is not None:
+            json_data = cache.use(cached, revalidated=True)
+        else:
+            json_data = response.json()
+            if cache is not None:
+                cache.store(url, json_data, response.headers)
+
+        # Add delay between requests (dynamically calculated based on rate limit status);
+        # a shared budget already spaced this request, so it needs no extra wait
+        if rate_limiter is None:
+            time.sleep(delay)
 
         return json_data
     except requests.RequestException as e:
@@ -0,0 +1,250 @@
+"""Shared rate-limit budget for JSON API requests.
+
+Reddit reports the remaining request budget for the current window on every
+response (``x-ratelimit-remaining`` / ``x-ratelimit-reset``). When several
+worker threads each pace themselves from those headers, they all spend the
+same budget and collectively overshoot it. ``RateLimitBudget`` is a single
+token bucket that every worker acquires from before sending a request: it is
+refilled from the headers of every response and spaces request start times so
+the remaining budget is spread across the rest of the window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, Any],
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """Extract Reddit's rate limit headers (case-insensitive).
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Tuple of (remaining, reset, used); each is None if missing or invalid
+    """
+    values: dict[str, Optional[float]] = {"remaining": None, "reset": None, "used": None}
+    for header_name in headers:
+        header_lower = header_name.lower()
+        if header_lower.startswith("x-ratelimit-"):
+            key = header_lower[len("x-ratelimit-") :]
+            if key in values:
+                try:
+                    values[key] = float(headers[header_name])
+                except (ValueError, TypeError):
+                    pass
+    return values["remaining"], values["reset"], values["used"]
+
+
+def pacing_delay(remaining: Optional[float], reset: Optional[float], base_delay: float) -> float:
+    """Calculate the delay before the next request from the remaining budget.
+
+    Strategy (time-based pacing):
+    - High remaining (> 20): Burst mode - use minimal delay (base_delay)
+    - Medium remaining (10-20): Moderate - slight increase, consider reset time
+    - Low remaining (< 10): Time-based pacing - calculate delay = (reset / remaining) * 0.9
+      This ensures remaining requests are spread across the reset window to avoid
+      exhausting the budget before the window resets.
+
+    Args:
+        remaining: Requests remaining in the current window (None if unknown)
+        reset: Seconds until the window resets (None if unknown)
+        base_delay: Base delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    # If we don't have rate limit headers, use base delay
+    if remaining is None:
+        return base_delay
+
+    if remaining > 20:
+        # Burst mode - plenty of requests remaining, use minimal delay
+        delay = base_delay
+    elif remaining > 10:
+        # Moderate remaining - slight increase, but also check reset time
+        if reset is not None and reset > 0:
+            time_per_request = (reset / remaining) * 0.9  # Safety margin
+            delay = max(base_delay * 1.5, time_per_request)
+        else:
+            delay = base_delay * 1.5
+    elif remaining > 0:
+        # Low remaining - pace across reset window using time-based calculation
+        if reset is not None and reset > 0:
+            time_per_request = (reset / remaining) * 0.9  # Safety margin
+            delay = max(time_per_request, base_delay)  # Don't go below base
+            delay = min(delay, 60.0)  # Cap at 60s to avoid excessive waits
+        else:
+            # No reset time available, use conservative multiplier
+            delay = base_delay * 5.0
+    else:
+        # Exhausted - should rarely happen, wait for reset
+        delay = reset if reset and reset > 0 else base_delay * 10.0
+
+    return delay
+
+
+class RateLimitBudget:
+    """Thread-safe token bucket shared by all workers fetching from one API.
+
+    Each ``acquire()`` takes one request from the budget and reserves the next
+    free start time; the gap after it follows ``pacing_delay`` for the budget
+    left, so requests from all workers together never start faster than the
+    remaining budget allows. Every acquired request must be finished with
+    ``update()`` (passing the response headers) or ``release()``. Asyncio
+    tasks use ``acquire_async()``, so thread workers and tasks can share a budget.
+
+    Within a window the lowest reported remaining count wins, since local
+    bookkeeping already counts requests still in flight; a response reporting a
+    later reset starts a new window. When a window ends, the budget refills to
+    the last reported limit (remaining + used) less the requests in flight.
+
+    Example:
+        budget = RateLimitBudget(base_delay=0.1)
+        budget.acquire()
+        response = session.get(url)
+        budget.update(response.headers)
+    """
+
+    def __init__(
+        self,
+        base_delay: float,
+        *,
+        window_slack: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            base_delay: Minimum spacing between request starts while the budget is
+                plentiful or unknown
+            window_slack: Seconds two reset times may differ by and still refer to the
+                same window (Reddit reports whole seconds)
+            clock: Monotonic clock, replaceable for tests
+            sleep: Sleep function, replaceable for tests
+        """
+        self.base_delay = base_delay
+        self.window_slack = window_slack
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._remaining: Optional[float] = None
+        self._reset_at: Optional[float] = None
+        self._limit: Optional[float] = None
+        self._in_flight = 0
+        self._next_slot = 0.0
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Requests left in the current window, or None if unknown."""
+        with self._lock:
+            return self._remaining
+
+    def _roll_window(self, now: float) -> None:
+        if self._reset_at is not None and now >= self._reset_at:
+            self._reset_at = None
+            if self._limit is None:
+                self._remaining = None
+            else:
+                self._remaining = max(self._limit - self._in_flight, 0)
+
+    def _reserve(self) -> Tuple[bool, float]:
+        """Try to take a request from the budget.
+
+        Returns:
+            Tuple of (reserved, wait): when reserved, the request may start after
+            ``wait`` seconds; otherwise the budget is exhausted and the caller
+            should wait ``wait`` seconds and try again
+        """
+        with self._lock:
+            now = self._clock()
+            self._roll_window(now)
+            if self._remaining is None or self._remaining >= 1:
+                slot = max(now, self._next_slot)
+                reset = None
+                if self._remaining is not None:
+                    self._remaining -= 1
+                    if self._reset_at is not None:
+                        reset = max(self._reset_at - slot, 0.0)
+                self._next_slot = slot + pacing_delay(self._remaining, reset, self.base_delay)
+                self._in_flight += 1
+                return True, slot - now
+            # Budget exhausted: wait for the window to reset
+            if self._reset_at is None:
+                self._reset_at = now + self.base_delay * 10.0
+            return False, self._reset_at - now
+
+    def acquire(self) -> float:
+        """Block until a request may be sent.
+
+        Returns:
+            Seconds waited
+        """
+        waited = 0.0
+        while True:
+            reserved, wait = self._reserve()
+            if wait > 0:
+                self._sleep(wait)
+                waited += wait
+            if reserved:
+                return waited
+
+    async def acquire_async(self) -> float:
+        """Wait without blocking the event loop until a request may be sent.
+
+        Returns:
+            Seconds waited
+        """
+        waited = 0.0
+        while True:
+            reserved, wait = self._reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                waited += wait
+            if reserved:
+                return waited
+
+    def release(self) -> None:
+        """Finish an acquired request that produced no response."""
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+
+    def update(self, headers: Mapping[str, Any]) -> None:
+        """Finish an acquired request and refill the budget from its response headers."""
+        remaining, reset, used = parse_rate_limit_headers(headers)
+        with self._lock:
+            self._in_flight = max(self._in_flight - 1, 0)
+            if remaining is None:
+                return
+            if used is not None:
+                self._limit = remaining + used
+
+            now = self._clock()
+            self._roll_window(now)
+            reset_at = now + reset if reset is not None else self._reset_at
+            if (
+                self._remaining is None
+                or self._reset_at is None
+                or reset_at is None
+                or reset_at > self._reset_at + self.window_slack
+            ):
+                # First response from a new window; requests still in flight will
+                # most likely be counted against it too
+                self._remaining = max(remaining - self._in_flight, 0)
+                self._reset_at = reset_at
+            elif reset_at >= self._reset_at - self.window_slack:
+                self._remaining = min(self._remaining, remaining)
+            # Otherwise the response belongs to an earlier window and is ignored
+
+    def pause(self, seconds: float) -> None:
+        """Stop all workers for ``seconds`` (e.g. after a 429 response)."""
+        with self._lock:
+            resume_at = self._clock() + seconds
+            self._remaining = 0
+            self._reset_at = max(self._reset_at or resume_at, resume_at)
+            self._next_slot = max(self._next_slot, resume_at)
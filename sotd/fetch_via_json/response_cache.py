@@ -0,0 +1,215 @@
+"""On-disk HTTP response cache for JSON API fetches.
+
+Re-running fetch_json for a month re-downloads every comment listing, although
+almost all of them have not changed since the last run. This cache stores each
+response body under its URL in a SQLite database at ``data/.cache/http/``
+together with its ``ETag`` / ``Last-Modified`` validators and fetch time, and
+``get_reddit_json`` uses it in one of two ways:
+
+- **Immutable** responses (comment listings fetched once their thread was
+  older than ``immutable_after_days``) are answered from the cache without any
+  request. SOTD threads stop receiving comments within days, so a nightly
+  refetch of the current and previous month only touches the last few days'
+  threads. A listing cached while its thread was younger is revalidated, and a
+  ``304`` moves its fetch time past the cutoff.
+- Every other cached URL is revalidated with a conditional request
+  (``If-None-Match`` / ``If-Modified-Since``); a ``304 Not Modified`` response
+  reuses the cached body.
+
+With ``refresh=True`` (``--force``) cached bodies are never used, but fresh
+responses are still stored.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+
+CACHE_DIR_NAME = Path(".cache") / "http"
+CACHE_FILE_NAME = "responses.sqlite"
+
+DEFAULT_IMMUTABLE_AFTER_DAYS = 7.0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached response body and its validators."""
+
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+def _header(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    """Return a header value by case-insensitive name."""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return str(value)
+    return None
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache shared by all fetch workers.
+
+    One connection is shared under a lock, so the cache can be used from the
+    parallel thread workers and from the asyncio fetcher alike.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        *,
+        cache_dir: Optional[Path] = None,
+        immutable_after_days: float = DEFAULT_IMMUTABLE_AFTER_DAYS,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = cache_dir or data_dir / CACHE_DIR_NAME
+        self.cache_path = self.cache_dir / CACHE_FILE_NAME
+        self.immutable_after_days = immutable_after_days
+        self.refresh = refresh
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.cache_path), timeout=60, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+            "fetched_at REAL NOT NULL)"
+        )
+
+    def immutable_since(self, created_utc: Optional[str]) -> Optional[float]:
+        """
+        Return the time after which a thread created at ``created_utc`` no longer changes.
+
+        Args:
+            created_utc: ISO 8601 creation time (e.g. "2025-01-01T12:00:00Z")
+
+        Returns:
+            Unix time immutable_after_days after creation, or None if unknown
+        """
+        if not created_utc:
+            return None
+        try:
+            created = datetime.fromisoformat(created_utc.replace("Z", "+00:00")).timestamp()
+        except (ValueError, TypeError):
+            return None
+        return created + self.immutable_after_days * 86400
+
+    @staticmethod
+    def is_immutable(entry: CachedResponse, immutable_since: Optional[float]) -> bool:
+        """
+        Return True if a cached response can be used without a request.
+
+        Only a response fetched after its thread stopped changing is final; one
+        cached while the thread was younger may be missing later comments.
+
+        Args:
+            entry: Cached response
+            immutable_since: Result of immutable_since() for the response's thread
+
+        Returns:
+            True if the response was fetched at or after immutable_since
+        """
+        return immutable_since is not None and entry.fetched_at >= immutable_since
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL, or None (always None when refreshing)."""
+        if self.refresh:
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(url, *row)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """Return the request headers that revalidate a cached response."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def use(self, entry: CachedResponse, *, revalidated: bool = False) -> Any:
+        """
+        Return a cached body, recording whether a request confirmed it.
+
+        Args:
+            entry: Cached response
+            revalidated: True after a 304 response (refreshes the fetch time)
+
+        Returns:
+            Parsed JSON body
+        """
+        with self._lock:
+            if revalidated:
+                self.revalidated += 1
+                with self._connection:
+                    self._connection.execute(
+                        "UPDATE responses SET fetched_at = ? WHERE url = ?",
+                        (self._clock(), entry.url),
+                    )
+            else:
+                self.hits += 1
+        return json.loads(entry.body)
+
+    def store(self, url: str, body: Any, headers: Mapping[str, Any]) -> None:
+        """
+        Store a freshly downloaded response.
+
+        Args:
+            url: Requested URL
+            body: Parsed JSON body
+            headers: Response headers (for ETag and Last-Modified)
+        """
+        row = (
+            url,
+            json.dumps(body, ensure_ascii=False),
+            _header(headers, "ETag"),
+            _header(headers, "Last-Modified"),
+            self._clock(),
+        )
+        with self._lock:
+            self.downloads += 1
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                    row,
+                )
+
+    def summary(self) -> str:
+        """Return a one-line summary of cache use."""
+        return (
+            f"HTTP cache: {self.hits} served from cache, {self.revalidated} revalidated, "
+            f"{self.downloads} downloaded"
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -21,12 +21,25 @@ from typing import Sequence
 from tqdm import tqdm
 
 from sotd.cli_utils.date_span import month_span
+from sotd.fetch.delta import (
+    comments_file_unchanged,
+    compute_thread_marks,
+    load_thread_marks,
+    since_by_thread,
+)
 from sotd.fetch.merge import merge_records
 from sotd.fetch.save import load_month_file, write_month_file
 from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import (
+    ARTIFACT_COMPRESSIONS,
+    remove_json_file,
+    set_artifact_compression,
+    zstd_available,
+)
 from sotd.utils.logging_config import setup_pipeline_logging, should_disable_tqdm
 from sotd.fetch_via_json.comments import fetch_comments_for_threads_json
 from sotd.fetch_via_json.json_scraper import get_reddit_cookies, get_reddit_session
+from sotd.fetch_via_json.response_cache import DEFAULT_IMMUTABLE_AFTER_DAYS, ResponseCache
 from sotd.fetch_via_json.search import search_threads_json
 
 logger = logging.getLogger(__name__)
@@ -55,11 +68,36 @@ def get_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Use parallel processing for comment fetching",
     )
+    parser.add_argument(
+        "--async-comments",
+        action="store_true",
+        help="Fetch comments with the asyncio engine (requires httpx); "
+        "--max-workers sets the requests in flight",
+    )
     parser.add_argument(
         "--max-workers",
         type=int,
         default=5,
-        help="Max worker threads for parallel comment fetching (default: 5)",
+        help="Max worker threads (or async requests in flight) for comment fetching (default: 5)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache responses in data/.cache/http: comment listings of old threads are reused "
+        "without a request and the rest are revalidated with conditional requests",
+    )
+    parser.add_argument(
+        "--immutable-after-days",
+        type=float,
+        default=DEFAULT_IMMUTABLE_AFTER_DAYS,
+        help="With --http-cache, treat threads older than this many days as unchanging "
+        f"(default: {DEFAULT_IMMUTABLE_AFTER_DAYS:g})",
+    )
+    parser.add_argument(
+        "--delta-comments",
+        action="store_true",
+        help="Only fetch comments newer than each thread's high-water mark in the "
+        "existing comments file (listings newest first)",
     )
     parser.add_argument(
         "--skip-unchanged",
@@ -67,6 +105,13 @@ def get_parser() -> argparse.ArgumentParser:
         help="Skip fetching comments for threads where num_comments hasn't increased. "
         "Risk: If a comment is deleted and a new one is added (same count), changes may be missed.",
     )
+    parser.add_argument(
+        "--compress",
+        choices=list(ARTIFACT_COMPRESSIONS),
+        default="none",
+        help="Write threads/comments as compact compressed JSON (YYYY-MM.json.zst or "
+        "YYYY-MM.json.gz; zstd needs zstandard). Every form is readable (default: none)",
+    )
 
     return parser
 
@@ -93,10 +138,8 @@ def _process_month(
     comments_path = data_dir / "comments" / f"{year:04d}-{month:02d}.json"
 
     if args.force:
-        if threads_path.exists():
-            threads_path.unlink()
-        if comments_path.exists():
-            comments_path.unlink()
+        remove_json_file(threads_path)
+        remove_json_file(comments_path)
 
     # Convert to thread records (same format as PRAW implementation)
     new_thread_records = [
@@ -178,28 +221,51 @@ def _process_month(
             "Risk: If a comment is deleted and a new one is added (same count), changes may be missed."
         )
 
+    # High-water marks of the comments already on disk, for delta fetching
+    existing_c = None if args.force else load_month_file(comments_path)
+    since = None
+    if args.delta_comments and existing_c is not None:
+        since = since_by_thread(load_thread_marks(*existing_c))
+
     cookies = get_reddit_cookies()
-    session = get_reddit_session(cookies=cookies)
-
-    comment_records = fetch_comments_for_threads_json(
-        merged_threads,
-        cookies=cookies,
-        session=session,
-        verbose=args.verbose,
-        parallel=args.parallel_comments,
-        max_workers=args.max_workers,
-        skip_unchanged=args.skip_unchanged,
-        existing_threads=existing_threads,
-        existing_comments=existing_comments,
+    # Parallel workers share this session, so pool one connection per worker
+    session = get_reddit_session(cookies=cookies, pool_size=max(args.max_workers, 10))
+
+    # --force refetches everything but still refreshes the cache
+    cache = (
+        ResponseCache(
+            data_dir, immutable_after_days=args.immutable_after_days, refresh=args.force
+        )
+        if args.http_cache
+        else None
     )
+    try:
+        comment_records = fetch_comments_for_threads_json(
+            merged_threads,
+            cookies=cookies,
+            session=session,
+            verbose=args.verbose,
+            parallel=args.parallel_comments,
+            max_workers=args.max_workers,
+            use_async=args.async_comments,
+            skip_unchanged=args.skip_unchanged,
+            existing_threads=existing_threads,
+            existing_comments=existing_comments,
+            cache=cache,
+            since_by_thread=since,
+        )
+    finally:
+        if cache is not None:
+            logger.info(cache.summary())
+            cache.close()
 
     # Merge with existing comments
-    existing_c = None if args.force else load_month_file(comments_path)
     merged_comments = (
         merge_records(existing_c[1], comment_records)
         if existing_c is not None
         else sorted(comment_records, key=lambda r: r["created_utc"])
     )
+    comments_changed = existing_c is None or merged_comments != existing_c[1]
 
     # Write threads file
     ts_iso = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
@@ -223,8 +289,12 @@ def _process_month(
         "threads_missing_comments": [
             t["id"] for t in merged_threads if t["id"] not in threads_with_comments
         ],
+        "thread_marks": compute_thread_marks(merged_comments),
     }
-    write_month_file(comments_path, comments_meta, merged_comments)
+    if comments_file_unchanged(existing_c, comments_meta, comments_changed):
+        logger.info(f"No new comments for {threads_meta['month']}; comments file left as is")
+    else:
+        write_month_file(comments_path, comments_meta, merged_comments)
 
     if args.verbose:
         logger.info(
@@ -296,6 +366,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         if args.debug:
             logging.getLogger().setLevel(logging.DEBUG)
 
+        if args.compress == "zstd" and not zstd_available():
+            parser.error("--compress zstd requires zstandard (pip install zstandard)")
+        set_artifact_compression(args.compress)
+
         # Compute month span
         months = month_span(args)
 
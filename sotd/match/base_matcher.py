@@ -1,15 +1,18 @@
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from sotd.utils.catalog_validator import validate_patterns_format
 from sotd.utils.yaml_loader import UniqueKeyLoader, load_yaml_with_nfc
 
 from .types import MatchResult, create_match_result
+from .utils.pattern_index import PatternIndex
 
 # Global catalog cache for YAML files
 _catalog_cache = {}
 
+T = TypeVar("T")
+
 
 def clear_catalog_cache() -> None:
     """Clear the global catalog cache. Useful when catalog files are modified."""
@@ -17,6 +20,25 @@ def clear_catalog_cache() -> None:
     _catalog_cache.clear()
 
 
+def build_case_insensitive_index(entries: Iterable[Tuple[str, T]]) -> Dict[str, T]:
+    """
+    Build a lowercase-keyed index for O(1) case-insensitive correct match lookups.
+
+    When several keys differ only by case, the first one wins, as it would in a
+    linear scan over the same entries.
+
+    Args:
+        entries: (key, value) pairs in priority order
+
+    Returns:
+        Dictionary mapping lowercase keys to values
+    """
+    index: Dict[str, T] = {}
+    for key, value in entries:
+        index.setdefault(key.lower(), value)
+    return index
+
+
 class BaseMatcher:
     def __init__(
         self,
@@ -34,8 +56,10 @@ class BaseMatcher:
 
         # Lazy-loaded caches for performance optimization
         self._correct_matches_lookup: Optional[Dict[str, Dict[str, Any]]] = None
+        self._correct_matches_lower: Optional[Dict[str, Dict[str, Any]]] = None
         self._catalog_patterns: Optional[List[Dict[str, Any]]] = None
         self._compiled_patterns: Dict[str, Any] = {}  # Pattern -> compiled regex
+        self._pattern_indexes: Dict[str, PatternIndex] = {}  # Name -> literal prefilter index
 
     def _load_catalog(self) -> dict:
         # Use global cache to avoid repeated YAML loads
@@ -138,8 +162,16 @@ class BaseMatcher:
         """Lazy load field-specific correct matches lookup."""
         if self._correct_matches_lookup is None:
             self._correct_matches_lookup = self._build_correct_matches_lookup()
+            self._correct_matches_lower = None
         return self._correct_matches_lookup
 
+    def _get_correct_matches_lower_lookup(self) -> Dict[str, Dict[str, Any]]:
+        """Lazy load the lowercase-keyed index over the correct matches lookup."""
+        lookup = self._get_correct_matches_lookup()
+        if self._correct_matches_lower is None:
+            self._correct_matches_lower = build_case_insensitive_index(lookup.items())
+        return self._correct_matches_lower
+
     def _extract_patterns_from_catalog(self) -> List[Dict[str, Any]]:
         """
         Extract all patterns from catalog data for this field type.
@@ -199,6 +231,25 @@ class BaseMatcher:
                 return None
         return self._compiled_patterns[pattern_text]
 
+    def _get_pattern_index(
+        self, name: str, items: List[Any], pattern_getter: Callable[[Any], str]
+    ) -> PatternIndex:
+        """
+        Get or build the literal prefilter index for an ordered pattern list.
+
+        The index is rebuilt if the list has been replaced or modified since it was built.
+
+        Args:
+            name: Cache name for the pattern list (e.g. "patterns", "scent_patterns")
+            items: Ordered compiled pattern entries
+            pattern_getter: Function returning the raw pattern text of an entry
+        """
+        index = self._pattern_indexes.get(name)
+        if index is None or not index.is_current_for(items):
+            index = PatternIndex(items, pattern_getter)
+            self._pattern_indexes[name] = index
+        return index
+
     def _check_correct_matches(self, value: str) -> Optional[Dict[str, Any]]:
         # Use pre-normalized text from extraction
         if not value or not self.correct_matches:
@@ -213,12 +264,7 @@ class BaseMatcher:
             return result
 
         # Fall back to case-insensitive lookup for backward compatibility
-        normalized_lower = value.lower()
-        for key, match_data in lookup.items():
-            if key.lower() == normalized_lower:
-                return match_data
-
-        return None
+        return self._get_correct_matches_lower_lookup().get(value.lower())
 
     def _get_format_from_catalog(self, brand: str, model: str) -> str:
         """Get format from catalog for a brand/model combination."""
@@ -244,8 +290,10 @@ class BaseMatcher:
     def clear_caches(self) -> None:
         """Clear all caches (useful for testing or when files are updated)."""
         self._correct_matches_lookup = None
+        self._correct_matches_lower = None
         self._catalog_patterns = None
         self._compiled_patterns.clear()
+        self._pattern_indexes.clear()
 
     def match(
         self, value: str, original: str | None = None, bypass_correct_matches: bool = False
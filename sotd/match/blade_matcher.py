@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from sotd.utils.extract_normalization import normalize_for_matching
 
-from .base_matcher import BaseMatcher
+from .base_matcher import BaseMatcher, build_case_insensitive_index
 from .loaders import CatalogLoader
 from .types import MatchResult, MatchType, create_match_result
 from .utils.regex_error_utils import compile_regex_with_context, create_context_dict
@@ -79,14 +79,10 @@ class BladeMatcher(BaseMatcher):
         if self._case_insensitive_lookup is not None:
             return self._case_insensitive_lookup
 
-        lookup = {}
-
-        # Build lookup from normalized correct matches
-        for key, matches in self._normalized_correct_matches.items():
-            lookup[key.lower()] = matches
-
-        self._case_insensitive_lookup = lookup
-        return lookup
+        self._case_insensitive_lookup = build_case_insensitive_index(
+            self._normalized_correct_matches.items()
+        )
+        return self._case_insensitive_lookup
 
     def _normalize_with_cache(self, value: str) -> str:
         """
@@ -261,6 +257,21 @@ class BladeMatcher(BaseMatcher):
             compiled, key=lambda item: self._calculate_pattern_score(item, deprioritize_de=True)
         )
 
+    def _candidate_patterns(self, text: str, patterns: Optional[list] = None) -> list:
+        """
+        Return only the compiled patterns that could match text, in priority order.
+
+        Args:
+            text: Text the patterns will be searched against
+            patterns: Ordered pattern list to filter (defaults to self.patterns)
+        """
+        patterns = self.patterns if patterns is None else patterns
+        if patterns is not self.patterns:
+            # Ad-hoc orderings are not indexed; fall back to a full scan
+            return patterns
+        index = self._get_pattern_index("patterns", self.patterns, lambda item: item[3])
+        return index.candidates(text)
+
     def _get_context_aware_patterns(self, target_format: str, is_shavette: bool = False):
         """
         Get patterns sorted with context-aware prioritization.
@@ -268,20 +279,10 @@ class BladeMatcher(BaseMatcher):
         For Shavettes and Half DE razors, prioritize patterns from the target format and
         related formats over DE patterns to avoid incorrect fallback to DE.
         """
-        # Apply context-aware sorting for Shavettes and Half DE razors
-        is_half_de = target_format.upper() == "HALF DE"
-        if not is_shavette and not is_half_de:
-            return self.patterns
-
-        # For Shavettes and Half DE razors, re-sort patterns to prioritize target format and
-        # related formats
-
-        # Use the unified tiebreaker system with context-aware format prioritization
-        # The _calculate_pattern_score method handles format priority when deprioritize_de=True
-        return sorted(
-            self.patterns,
-            key=lambda item: self._calculate_pattern_score(item, deprioritize_de=True),
-        )
+        # Shavettes and Half DE razors use the unified tiebreaker system with context-aware
+        # format prioritization (deprioritize_de=True). self.patterns is already sorted with
+        # exactly that key, so re-sorting would reproduce the same order on every call.
+        return self.patterns
 
     def _count_non_optional_parts(self, pattern: str) -> int:
         """
@@ -379,7 +380,9 @@ class BladeMatcher(BaseMatcher):
             - non-optional parts and better specificity
         """
         # Try patterns in order until we find a match
-        for brand, model, fmt, pattern, compiled, entry in self.patterns:
+        for brand, model, fmt, pattern, compiled, entry in self._candidate_patterns(
+            normalized_text
+        ):
             if compiled.search(normalized_text):
                 match_data = {
                     "brand": brand,
@@ -496,7 +499,9 @@ class BladeMatcher(BaseMatcher):
 
         blade_text = normalized
 
-        for brand, model, fmt, raw_pattern, compiled, entry in self.patterns:
+        for brand, model, fmt, raw_pattern, compiled, entry in self._candidate_patterns(
+            blade_text
+        ):
             if compiled.search(blade_text):
                 match_data = {
                     "brand": brand,
@@ -592,12 +597,9 @@ class BladeMatcher(BaseMatcher):
         if normalized_value in self._normalized_correct_matches:
             all_matches = self._normalized_correct_matches[normalized_value]
         else:
-            # If no exact match, try case-insensitive match
-            normalized_value_lower = normalized_value.lower()
-            for key, matches in self._normalized_correct_matches.items():
-                if key.lower() == normalized_value_lower:
-                    all_matches = matches
-                    break
+            # If no exact match, try case-insensitive match using O(1) lookup
+            lookup = self._build_case_insensitive_lookup()
+            all_matches = lookup.get(normalized_value.lower(), [])
 
         # Filter to only include matches in the target format
         format_matches = [m for m in all_matches if m["format"].upper() == target_format.upper()]
@@ -621,7 +623,8 @@ class BladeMatcher(BaseMatcher):
         patterns_to_search = self._get_context_aware_patterns(target_format, is_shavette)
 
         # Search only patterns in the target format
-        for brand, model, fmt, raw_pattern, compiled, entry in patterns_to_search:
+        candidates = self._candidate_patterns(normalized_value, patterns_to_search)
+        for brand, model, fmt, raw_pattern, compiled, entry in candidates:
             if fmt.upper() == target_format.upper() and compiled.search(normalized_value):
                 match_data = {
                     "brand": brand,
@@ -984,7 +987,9 @@ class BladeMatcher(BaseMatcher):
         # Collect all regex matches with their patterns
         # Since self.patterns is already sorted by pattern specificity (with deprioritize_de=True),
         # the first match we find will be the most specific pattern
-        for brand, model, fmt, raw_pattern, compiled, entry in self.patterns:
+        for brand, model, fmt, raw_pattern, compiled, entry in self._candidate_patterns(
+            blade_text
+        ):
             if compiled.search(blade_text):
                 match_data = {
                     "brand": brand,
@@ -10,6 +10,8 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from sotd.utils.file_io import json_file_exists, open_json_text
+
 
 class BrushComparisonFramework:
     """
@@ -266,10 +268,10 @@ class BrushComparisonFramework:
             else:
                 file_path = self.new_dir / f"{month}.json"
 
-            if not file_path.exists():
+            if not json_file_exists(file_path):
                 return None
 
-            with open(file_path, "r", encoding="utf-8") as f:
+            with open_json_text(file_path) as f:
                 return json.load(f)
 
         except Exception:
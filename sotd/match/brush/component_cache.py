@@ -0,0 +1,87 @@
+"""
+Memo of handle and knot component matches shared by the brush strategies.
+
+For a single brush string, BrushMatcher's pre-computation, the full-input
+component strategy and the automated split strategy all run HandleMatcher and
+KnotMatcher on the same texts, and the same handle and knot texts recur across
+a month's brushes. BrushMatcher passes one ComponentMatchCache to every
+strategy as ``cached_results["component_matches"]`` so each distinct text is
+matched once. It is cleared at the start of each month.
+"""
+
+import copy
+from typing import Any, Callable, Optional
+
+from sotd.match.cache import MatchCache
+from sotd.match.types import MatchResult
+
+# Distinct component texts kept per month
+DEFAULT_MAX_SIZE = 20000
+
+# Stored for texts that did not match (MatchCache.get returns None on a miss)
+_NO_MATCH = object()
+
+
+class ComponentMatchCache:
+    """Bounded LRU memo of HandleMatcher and KnotMatcher results, keyed by text."""
+
+    def __init__(self, handle_matcher, knot_matcher, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize the memo.
+
+        Args:
+            handle_matcher: HandleMatcher instance for handle matching
+            knot_matcher: KnotMatcher instance for knot matching
+            max_size: Maximum number of component texts to keep
+        """
+        self.handle_matcher = handle_matcher
+        self.knot_matcher = knot_matcher
+        self._cache = MatchCache(max_size=max_size)
+
+    def _lookup(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return a copy of the memoized result for key, computing it on a miss.
+
+        Strategies modify the results they are given, so callers never share
+        the stored object. Exceptions from the matcher are not memoized.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return None if cached is _NO_MATCH else copy.deepcopy(cached)
+
+        result = compute()
+        self._cache.set(key, _NO_MATCH if result is None else copy.deepcopy(result))
+        return result
+
+    def match_handle(self, text: str) -> Optional[MatchResult]:
+        """Memoized HandleMatcher.match."""
+        return self._lookup(f"handle\0{text}", lambda: self.handle_matcher.match(text))
+
+    def match_handle_maker(self, text: str) -> Optional[dict]:
+        """Memoized HandleMatcher.match_handle_maker."""
+        result = self.match_handle(text)
+        return result.matched if result else None
+
+    def match_knot(self, text: str, full_string: Optional[str] = None) -> Optional[MatchResult]:
+        """Memoized KnotMatcher.match."""
+        if full_string is None:
+            return self._lookup(f"knot\0{text}\0{text}", lambda: self.knot_matcher.match(text))
+        return self._lookup(
+            f"knot\0{text}\0{full_string}",
+            lambda: self.knot_matcher.match(text, full_string=full_string),
+        )
+
+    def clear(self) -> None:
+        """Drop all memoized results and reset the statistics."""
+        self._cache.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get memo statistics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and hit_rate
+        """
+        stats = self._cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,127 @@
+"""
+Brush strategy diagnostics side files.
+
+The brush matcher scores every strategy for each brush string, and the match
+phase used to store all of those results as ``all_strategies`` on every brush
+record. They are only read by brush validation (CLI and webui) and make up a
+large share of each matched file, which enrich then parses only to drop them.
+
+Matched files now leave them out. ``match --diagnostics`` writes them to
+``matched/diagnostics/YYYY-MM.json.gz`` instead, as a gzipped JSON object
+mapping comment ``id`` to that record's brush strategy results. Readers call
+``attach_brush_diagnostics`` on the matched records, which opens the side file
+only when some brush entry has no ``all_strategies`` of its own (older matched
+files still carry them inline).
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, is_dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DIAGNOSTICS_DIR = "diagnostics"
+
+# Last side file read per path, with the (mtime_ns, size) it was read at; the
+# webui reads the same month for every page of a validation session
+_loaded: Dict[Path, Tuple[int, int, Dict[str, List[Any]]]] = {}
+
+
+def get_diagnostics_path(base_path: Path, month: str) -> Path:
+    """Return the diagnostics side file for a month's matched data."""
+    return base_path / "matched" / DIAGNOSTICS_DIR / f"{month}.json.gz"
+
+
+def _strategy_result_to_json(result: Any) -> Any:
+    """Convert one brush strategy result to a JSON value."""
+    if not is_dataclass(result) or isinstance(result, type):
+        return result
+    # The winning result is itself in all_strategies and holds the list, so each
+    # result is converted without its own strategy list
+    value = asdict(replace(result, all_strategies=None))
+    value.pop("all_strategies", None)
+    return value
+
+
+def strategy_results_to_json(strategies: Iterable[Any]) -> List[Any]:
+    """Convert a brush result's ``all_strategies`` (MatchResult objects) to JSON values."""
+    return [_strategy_result_to_json(result) for result in strategies]
+
+
+def save_diagnostics(path: Path, diagnostics: Dict[str, List[Any]]) -> None:
+    """
+    Write a diagnostics side file atomically.
+
+    Args:
+        path: Side file path (see get_diagnostics_path)
+        diagnostics: Brush strategy results by comment ID
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+            f.write(json.dumps(diagnostics, ensure_ascii=False).encode("utf-8"))
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_diagnostics(path: Path) -> Dict[str, List[Any]]:
+    """
+    Read a diagnostics side file.
+
+    Args:
+        path: Side file path (see get_diagnostics_path)
+
+    Returns:
+        Brush strategy results by comment ID (empty if there is no side file)
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {}
+
+    cached = _loaded.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        diagnostics = json.load(f)
+    _loaded[path] = (stat.st_mtime_ns, stat.st_size, diagnostics)
+    return diagnostics
+
+
+def attach_brush_diagnostics(
+    records: Iterable[Dict[str, Any]], base_path: Path, month: str
+) -> None:
+    """
+    Fill in ``all_strategies`` on brush entries from the month's diagnostics side file.
+
+    Entries that already have ``all_strategies`` are left as they are. The side
+    file is only read if at least one brush entry needs it.
+
+    Args:
+        records: Matched records (modified in place)
+        base_path: Data directory
+        month: Month in YYYY-MM format
+    """
+    diagnostics: Optional[Dict[str, List[Any]]] = None
+    for record in records:
+        brush_entry = record.get("brush")
+        if not isinstance(brush_entry, dict) or "all_strategies" in brush_entry:
+            continue
+        if diagnostics is None:
+            try:
+                diagnostics = load_diagnostics(get_diagnostics_path(base_path, month))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read brush diagnostics for {month}: {e}")
+                diagnostics = {}
+        strategies = diagnostics.get(record.get("id", ""))
+        if strategies is not None:
+            brush_entry["all_strategies"] = strategies
@@ -7,7 +7,7 @@ import yaml
 from sotd.match.types import MatchResult
 from sotd.match.utils.regex_error_utils import compile_regex_with_context, create_context_dict
 
-from .strategies.utils.pattern_cache import get_compiled_patterns
+from .strategies.utils.pattern_cache import get_compiled_patterns, iter_candidate_patterns
 
 
 class HandleMatcher:
@@ -83,7 +83,7 @@ class HandleMatcher:
         if not text:
             return None
 
-        for pattern_info in self.handle_patterns:
+        for pattern_info in iter_candidate_patterns(self.handle_patterns, text):
             if pattern_info["regex"].search(text):
                 matched_data = {
                     "handle_maker": pattern_info["maker"],
@@ -11,6 +11,7 @@ import yaml
 
 from sotd.match.types import MatchResult
 
+from .component_cache import ComponentMatchCache
 from .config import BrushScoringConfig
 from .handle_matcher import HandleMatcher
 from .knot_matcher import KnotMatcher
@@ -86,10 +87,18 @@ class BrushMatcher:
         knots_path: Optional[Path] = None,
         brush_scoring_config_path: Optional[Path] = None,
         debug: bool = False,
+        full_evaluation: bool = True,
     ):
-        """Initialize the brush matcher with catalog paths."""
+        """Initialize the brush matcher with catalog paths.
+
+        With full_evaluation=False, strategies that cannot beat the best result
+        found so far are skipped (see StrategyOrchestrator.run_strategies_pruned).
+        The match is the same, but all_strategies only lists the strategies that
+        ran, so diagnostics and analysis tools keep the default.
+        """
         # Store debug flag
         self.debug = debug
+        self.full_evaluation = full_evaluation
 
         # Store catalog paths FIRST (before validation)
         self.brushes_path = brushes_path
@@ -148,10 +157,15 @@ class BrushMatcher:
         knot_strategies = KnotMatcherFactory.create_knot_strategies(self._catalogs)
         self.knot_matcher = KnotMatcher(knot_strategies)
 
+        # Handle/knot matches shared by all strategies (cleared per month by the match phase)
+        self.component_cache = ComponentMatchCache(self.handle_matcher, self.knot_matcher)
+
         # Initialize components
         self.correct_matches_matcher = CorrectMatchesMatcher(correct_matches_data)
-        self.strategy_orchestrator = StrategyOrchestrator(self._create_strategies())
         self.scoring_engine = ScoringEngine(self.config, debug=self.debug)
+        self.strategy_orchestrator = StrategyOrchestrator(
+            self._create_strategies(), self.scoring_engine
+        )
 
         self.performance_monitor = PerformanceMonitor()
         self.conflict_resolver = ResultConflictResolver()
@@ -470,9 +484,11 @@ class BrushMatcher:
             FullInputComponentMatchingStrategy,
         )
 
-        strategies.append(
-            FullInputComponentMatchingStrategy(self.handle_matcher, self.knot_matcher, catalogs)
+        # Kept for _precompute_handle_knot_results, which needs the same strategy
+        self._full_input_strategy = FullInputComponentMatchingStrategy(
+            self.handle_matcher, self.knot_matcher, catalogs
         )
+        strategies.append(self._full_input_strategy)
 
         # Skip problematic component strategies for now - they expect
         # component-level data, not brush-level data
@@ -738,11 +754,12 @@ class BrushMatcher:
         Returns:
             Dictionary with cached handle and knot results
         """
-        cached_results = {}
+        # Every strategy matches handle/knot texts through the shared memo
+        cached_results: dict = {"component_matches": self.component_cache}
 
         # Pre-compute HandleMatcher result
         try:
-            handle_result = self.handle_matcher.match_handle_maker(value)
+            handle_result = self.component_cache.match_handle_maker(value)
             if handle_result:
                 cached_results["handle_result"] = handle_result
         except Exception:
@@ -751,7 +768,7 @@ class BrushMatcher:
 
         # Pre-compute KnotMatcher result
         try:
-            knot_result = self.knot_matcher.match(value)
+            knot_result = self.component_cache.match_knot(value)
             if knot_result:
                 cached_results["knot_result"] = knot_result
         except Exception:
@@ -760,18 +777,7 @@ class BrushMatcher:
 
         # Pre-compute FullInputComponentMatchingStrategy result for unified strategy caching
         try:
-            # Create a temporary instance of the unified strategy to avoid circular dependency
-            from .strategies.full_input_component_matching_strategy import (
-                FullInputComponentMatchingStrategy,
-            )
-
-            # Use instance-level cached catalogs to avoid repeated loading
-            catalogs = self._catalogs
-
-            unified_strategy = FullInputComponentMatchingStrategy(
-                self.handle_matcher, self.knot_matcher, catalogs
-            )
-            unified_result = unified_strategy.match(value)
+            unified_result = self._full_input_strategy.match(value, cached_results=cached_results)
             if unified_result:
                 cached_results["full_input_component_matching_result"] = unified_result
         except Exception:
@@ -858,7 +864,15 @@ class BrushMatcher:
             cached_results = self._precompute_handle_knot_results(value)
 
             # PHASE 2: Run all other strategies (excluding correct matches if bypassed)
-            strategy_results = self.strategy_orchestrator.run_all_strategies(value, cached_results)
+            if self.full_evaluation:
+                strategy_results = self.strategy_orchestrator.run_all_strategies(
+                    value, cached_results
+                )
+            else:
+                # Only the strategies that can still win run; their results come back scored
+                strategy_results = self.strategy_orchestrator.run_strategies_pruned(
+                    value, cached_results
+                )
 
             # If no strategy results, return None
             if not strategy_results:
@@ -877,9 +891,12 @@ class BrushMatcher:
             self.strategy_dependency_manager.get_execution_order(strategy_names)
 
             # Score the results
-            scored_results = self.scoring_engine.score_results(
-                executable_results, value, cached_results
-            )
+            if self.full_evaluation:
+                scored_results = self.scoring_engine.score_results(
+                    executable_results, value, cached_results
+                )
+            else:
+                scored_results = executable_results
 
             # Get the best result based on score
             best_result = self.scoring_engine.get_best_result(scored_results)
@@ -932,6 +949,7 @@ class BrushMatcher:
         return {
             "performance": self.performance_monitor.get_performance_stats(),
             "total_time": self.performance_monitor.get_total_time(),
+            "component_matches": self.component_cache.get_stats(),
         }
 
     def get_performance_stats(self) -> dict:
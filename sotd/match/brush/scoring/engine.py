@@ -4,14 +4,37 @@ Scoring Engine Component.
 This component scores strategy results based on configuration weights and criteria.
 """
 
-import re
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
 from sotd.match.types import MatchResult
 
+from .features import InputFeatures, KnotIndicatorIndex, build_knot_indicator_index
+
+# (lowest, highest) value each _modifier_* method returns, for ScoringEngine.get_max_score.
+# Catalog priorities start at 1, so priority_score is at most 3; handle_weight and
+# knot_weight are sums of the component points awarded in those methods.
+MODIFIER_VALUE_RANGES = {
+    "multiple_brands": (0.0, 1.0),
+    "same_brand": (0.0, 1.0),
+    "fiber_match": (0.0, 1.0),
+    "size_match": (0.0, 1.0),
+    "fiber_mismatch": (0.0, 1.0),
+    "dual_component": (0.0, 1.0),
+    "high_confidence": (0.0, 1.0),
+    "priority_score": (0.0, 3.0),
+    "handle_weight": (0.0, 12.0),
+    "knot_weight": (0.0, 19.0),
+    "handle_brand_without_knot_brand": (0.0, 1.0),
+    "knot_indicators": (0.0, 1.0),
+    "handle_indicators": (0.0, 1.0),
+    "knot_brand_without_handle_brand": (0.0, 1.0),
+    "neither_brand": (0.0, 1.0),
+    "brand_match": (0.0, 1.0),
+}
+
 
 class ScoringEngine:
     """
@@ -24,12 +47,15 @@ class ScoringEngine:
     # Class-level cache for knots.yaml data
     _knots_cache = None
     _knots_cache_timestamp = 0
+    # Known knot names and compiled patterns built from _knots_cache
+    _knot_indicator_index: Optional[KnotIndicatorIndex] = None
 
     @classmethod
     def clear_knots_cache(cls):
         """Clear the knots cache."""
         cls._knots_cache = None
         cls._knots_cache_timestamp = 0
+        cls._knot_indicator_index = None
 
     def __init__(self, config, debug: bool = False):
         """
@@ -41,6 +67,12 @@ class ScoringEngine:
         """
         self.config = config
         self.debug = debug
+        # Features of the input being scored (see _get_features)
+        self._features: Optional[InputFeatures] = None
+        # Compiled modifier pipelines by strategy name, for the config weights they were
+        # built from (see _get_modifier_pipeline)
+        self._pipeline_weights: Any = None
+        self._modifier_pipelines: Dict[str, List[Tuple[float, Optional[Callable]]]] = {}
 
     def score_results(
         self, results: List[MatchResult], value: str, cached_results: Optional[dict] = None
@@ -57,6 +89,8 @@ class ScoringEngine:
         """
         # Store cached_results for use in manufacturer detection
         self.cached_results = cached_results
+        # Input features are shared by every result scored for this value
+        self._get_features(value)
 
         if self.debug:
             print("🔍 Scoring {len(results)} strategy results...")
@@ -97,6 +131,35 @@ class ScoringEngine:
 
         return max(valid_results, key=lambda r: r.score or 0.0)
 
+    def get_max_score(self, strategy_name: str) -> float:
+        """
+        Get the highest score a result from a strategy can receive.
+
+        Each modifier contributes its weight times the modifier's value, so its
+        largest contribution is the weight times the top (or, for a negative
+        weight, the bottom) of MODIFIER_VALUE_RANGES.
+
+        Args:
+            strategy_name: Strategy name as used in brush_scoring_config.yaml
+
+        Returns:
+            Upper bound on the score, or infinity if a modifier's range is unknown
+        """
+        max_score = self.config.get_base_strategy_score(strategy_name)
+        for modifier_name in self.config.get_all_modifier_names(strategy_name):
+            weight = self.config.get_strategy_modifier(strategy_name, modifier_name)
+            if getattr(self, f"_modifier_{modifier_name}", None) is None:
+                # No modifier function: the weight is added as-is
+                max_score += weight
+                continue
+            value_range = MODIFIER_VALUE_RANGES.get(modifier_name)
+            if value_range is None:
+                return float("inf")
+            max_score += max(weight * value_range[0], weight * value_range[1])
+
+        # Results without valid data score 0.0 whatever the configuration
+        return max(max_score, 0.0)
+
     def _calculate_score(self, result: MatchResult, value: str) -> float:
         """
         Calculate score for a single result.
@@ -198,16 +261,8 @@ class ScoringEngine:
         """
         modifier_score = 0.0
 
-        # Get all available modifiers for this strategy
-        modifier_names = self.config.get_all_modifier_names(strategy_name)
-
-        for modifier_name in modifier_names:
-            # Get the modifier weight from configuration
-            modifier_weight = self.config.get_strategy_modifier(strategy_name, modifier_name)
-
-            # Apply the modifier function if it exists
-            modifier_function = getattr(self, f"_modifier_{modifier_name}", None)
-            if modifier_function is not None and hasattr(modifier_function, "__call__"):
+        for modifier_weight, modifier_function in self._get_modifier_pipeline(strategy_name):
+            if modifier_function is not None:
                 modifier_value = modifier_function(value, result, strategy_name)
                 modifier_score += modifier_value * modifier_weight
             else:
@@ -216,6 +271,62 @@ class ScoringEngine:
 
         return modifier_score
 
+    def _get_modifier_pipeline(self, strategy_name: str) -> List[Tuple[float, Optional[Callable]]]:
+        """
+        Get the (weight, modifier function) pairs that apply to a strategy.
+
+        Built once per strategy from the configuration, and rebuilt when the
+        configuration is reloaded. Zero-weight modifiers cannot change a score,
+        so they are left out and never called.
+
+        Args:
+            strategy_name: Name of the strategy
+
+        Returns:
+            List of (weight, function) pairs; function is None for modifiers
+            without a _modifier_* method, whose weight is added as-is
+        """
+        weights = getattr(self.config, "weights", None)
+        if weights is not self._pipeline_weights:
+            self._pipeline_weights = weights
+            self._modifier_pipelines = {}
+
+        pipeline = self._modifier_pipelines.get(strategy_name)
+        if pipeline is None:
+            pipeline = []
+            for modifier_name in self.config.get_all_modifier_names(strategy_name):
+                modifier_weight = self.config.get_strategy_modifier(strategy_name, modifier_name)
+                if not modifier_weight:
+                    continue
+                modifier_function = getattr(self, f"_modifier_{modifier_name}", None)
+                if modifier_function is not None and not callable(modifier_function):
+                    modifier_function = None
+                pipeline.append((modifier_weight, modifier_function))
+            self._modifier_pipelines[strategy_name] = pipeline
+        return pipeline
+
+    def _get_features(self, input_text: str) -> InputFeatures:
+        """
+        Get the features of an input string, reusing them while the same input is scored.
+
+        Args:
+            input_text: Original input string
+
+        Returns:
+            InputFeatures for input_text
+        """
+        features = self._features
+        if features is None or features.text != input_text:
+            features = InputFeatures(input_text, self._get_knot_indicator_index)
+            self._features = features
+        return features
+
+    def _get_knot_indicator_index(self) -> KnotIndicatorIndex:
+        """Get the known knot names and compiled patterns, built once from knots.yaml."""
+        if self._knot_indicator_index is None:
+            self._knot_indicator_index = build_knot_indicator_index(self._load_knots_data())
+        return self._knot_indicator_index
+
     def _modifier_multiple_brands(self, input_text: str, result, strategy_name: str) -> float:
         """
         Return score modifier for multiple brand mentions.
@@ -348,10 +459,7 @@ class ScoringEngine:
         Returns:
             Tuple of (has_conflict, user_fiber, catalog_fiber)
         """
-        # Use existing fiber_utils to detect user fiber
-        from ..strategies.utils.fiber_utils import match_fiber
-
-        user_fiber = match_fiber(input_text)
+        user_fiber = self._get_features(input_text).fiber
 
         # If no user fiber specified, no conflict possible
         if not user_fiber:
@@ -398,26 +506,7 @@ class ScoringEngine:
         if strategy_name not in ["handle_matching", "knot_matching", "handle_only", "knot_only"]:
             return 0.0
 
-        # Use fiber_utils to detect fiber in input text
-        try:
-            from ..strategies.utils.fiber_utils import match_fiber
-
-            fiber_type = match_fiber(input_text)
-            return 1.0 if fiber_type else 0.0
-        except ImportError:
-            # Fallback to simple pattern matching if fiber_utils not available
-            fiber_patterns = [
-                r"\bbadger\b",
-                r"\bboar\b",
-                r"\bsynthetic\b",
-                r"\bsilvertip\b",
-                r"\btwo_band\b",
-                r"\bthree_band\b",
-            ]
-            for pattern in fiber_patterns:
-                if re.search(pattern, input_text.lower()):
-                    return 1.0
-            return 0.0
+        return 1.0 if self._get_features(input_text).fiber else 0.0
 
     def _modifier_size_match(self, input_text: str, result: dict, strategy_name: str) -> float:
         """
@@ -435,24 +524,7 @@ class ScoringEngine:
         if strategy_name not in ["handle_matching", "knot_matching", "handle_only", "knot_only"]:
             return 0.0
 
-        # Use knot_size_utils to detect size in input text
-        try:
-            from ..strategies.utils.knot_size_utils import parse_knot_size
-
-            size_match = parse_knot_size(input_text)
-            return 1.0 if size_match else 0.0
-        except ImportError:
-            # Fallback to simple pattern matching if knot_size_utils not available
-            size_patterns = [
-                r"\b\d+mm\b",
-                r"\b\d+\.\d+mm\b",
-                r"\b\d+/\d+\b",
-                r"\b\d+\.\d+\b",
-            ]
-            for pattern in size_patterns:
-                if re.search(pattern, input_text.lower()):
-                    return 1.0
-            return 0.0
+        return 1.0 if self._get_features(input_text).has_size else 0.0
 
     def _modifier_fiber_mismatch(self, input_text: str, result: dict, strategy_name: str) -> float:
         """
@@ -720,29 +792,8 @@ class ScoringEngine:
             Modifier value (1.0 if knot indicators detected, 0.0 otherwise)
         """
         try:
-            # Use cached knots data
-            knots_data = self._load_knots_data()
-
-            if not knots_data or "known_knots" not in knots_data:
-                return 0.0
-
-            input_lower = input_text.lower()
-
-            # Extract all knot model names from known_knots section
-            for brand, brand_data in knots_data["known_knots"].items():
-                for model_name, model_data in brand_data.items():
-                    # Skip non-model keys like 'fiber' and 'knot_size_mm'
-                    if isinstance(model_data, dict) and "patterns" in model_data:
-                        # Check if model name appears in input (e.g., "Timberwolf", "v8", "G5")
-                        if model_name.lower() in input_lower:
-                            return 1.0
-
-                        # Also check the patterns for this model
-                        for pattern in model_data["patterns"]:
-                            if re.search(pattern, input_lower, re.IGNORECASE):
-                                return 1.0
-
-            return 0.0
+            # Known knot model names (e.g. "Timberwolf", "v8", "G5") or their patterns
+            return 1.0 if self._get_features(input_text).has_knot_indicator else 0.0
 
         except Exception as e:
             # Fail fast - log error and return 0
@@ -767,28 +818,7 @@ class ScoringEngine:
         if strategy_name not in ["handle_matching", "knot_matching", "handle_only", "knot_only"]:
             return 0.0
 
-        handle_indicators = [
-            r"\bhandle\b",
-            r"\bwood\b",
-            r"\bresin\b",
-            r"\bacrylic\b",
-            r"\bmetal\b",
-            r"\bbrass\b",
-            r"\baluminum\b",
-            r"\bsteel\b",
-            r"\btitanium\b",
-            r"\bebonite\b",
-            r"\bivory\b",
-            r"\bhorn\b",
-            r"\bbone\b",
-            r"\bstone\b",
-            r"\bmarble\b",
-            r"\bgranite\b",
-        ]
-        for pattern in handle_indicators:
-            if re.search(pattern, input_text.lower()):
-                return 1.0
-        return 0.0
+        return 1.0 if self._get_features(input_text).has_handle_indicator else 0.0
 
     def _modifier_knot_brand_without_handle_brand(
         self, input_text: str, result, strategy_name: str
@@ -0,0 +1,97 @@
+"""
+Input Features Component.
+
+Facts about a brush input string that scoring modifiers read. Every candidate
+result for an input is scored against the same string, so each fact is
+computed at most once per input instead of once per result and modifier.
+"""
+
+import re
+from functools import cached_property
+from typing import Callable, List, Optional, Pattern, Tuple
+
+from ..strategies.utils.fiber_utils import match_fiber
+from ..strategies.utils.knot_size_utils import parse_knot_size
+
+# Handle-specific terminology (handle_indicators modifier)
+HANDLE_INDICATOR_PATTERN = re.compile(
+    r"\b(?:handle|wood|resin|acrylic|metal|brass|aluminum|steel|titanium|ebonite|ivory"
+    r"|horn|bone|stone|marble|granite)\b"
+)
+
+# (lowercased model names, compiled patterns) of the known_knots catalog section
+KnotIndicatorIndex = Tuple[List[str], List[Pattern]]
+
+
+def build_knot_indicator_index(knots_data: dict) -> KnotIndicatorIndex:
+    """
+    Build the known knot model names and patterns the knot_indicators modifier looks for.
+
+    Args:
+        knots_data: Parsed knots.yaml
+
+    Returns:
+        Lowercased model names and their patterns compiled case-insensitively
+
+    Raises:
+        re.error: If a catalog pattern is not a valid regex
+    """
+    model_names: List[str] = []
+    patterns: List[Pattern] = []
+    for brand_data in (knots_data or {}).get("known_knots", {}).values():
+        for model_name, model_data in brand_data.items():
+            # Skip non-model keys like 'fiber' and 'knot_size_mm'
+            if isinstance(model_data, dict) and "patterns" in model_data:
+                model_names.append(model_name.lower())
+                patterns.extend(
+                    re.compile(pattern, re.IGNORECASE) for pattern in model_data["patterns"]
+                )
+    return model_names, patterns
+
+
+class InputFeatures:
+    """Lazily computed, memoized facts about one brush input string."""
+
+    def __init__(
+        self, text: str, knot_indicator_index: Optional[Callable[[], KnotIndicatorIndex]] = None
+    ):
+        """
+        Initialize features for an input string.
+
+        Args:
+            text: Original input string
+            knot_indicator_index: Callable returning the known knot index, called
+                only if has_knot_indicator is read
+        """
+        self.text = text
+        self._knot_indicator_index = knot_indicator_index
+
+    @cached_property
+    def lower(self) -> str:
+        """The input lowercased."""
+        return self.text.lower()
+
+    @cached_property
+    def fiber(self) -> Optional[str]:
+        """Fiber type mentioned in the input, if any."""
+        return match_fiber(self.text)
+
+    @cached_property
+    def has_size(self) -> bool:
+        """Whether the input specifies a knot size."""
+        return bool(parse_knot_size(self.text))
+
+    @cached_property
+    def has_handle_indicator(self) -> bool:
+        """Whether the input uses handle-specific terminology."""
+        return HANDLE_INDICATOR_PATTERN.search(self.lower) is not None
+
+    @cached_property
+    def has_knot_indicator(self) -> bool:
+        """Whether the input mentions a known knot model name or pattern."""
+        if self._knot_indicator_index is None:
+            return False
+        model_names, patterns = self._knot_indicator_index()
+        if any(model_name in self.lower for model_name in model_names):
+            return True
+        return any(pattern.search(self.lower) for pattern in patterns)
@@ -4,9 +4,12 @@ Strategy Orchestrator Component.
 This component runs all applicable brush matching strategies and collects results.
 """
 
-from typing import List, Optional
+import inspect
+from typing import Dict, List, Optional
 
-from sotd.match.types import MatchResult
+from sotd.match.types import MatchResult, create_match_result
+
+from ..strategies.base_brush_matching_strategy import BaseMultiResultBrushMatchingStrategy
 
 
 class StrategyOrchestrator:
@@ -14,17 +17,84 @@ class StrategyOrchestrator:
     Orchestrator for running all brush matching strategies.
 
     This component runs all available strategies and collects their results
-    for scoring and selection.
+    for scoring and selection. With a scoring engine it can also run them in
+    descending order of their maximum achievable score and stop as soon as no
+    remaining strategy can beat the best result so far (run_strategies_pruned).
     """
 
-    def __init__(self, strategies: List):
+    def __init__(self, strategies: List, scoring_engine=None):
         """
         Initialize the strategy orchestrator.
 
         Args:
             strategies: List of brush matching strategies to run
+            scoring_engine: Optional ScoringEngine, required by run_strategies_pruned
         """
         self.strategies = strategies
+        self.scoring_engine = scoring_engine
+        # Whether each strategy's match() takes cached_results, by id(strategy)
+        self._accepts_cached_results: Dict[int, bool] = {}
+        # (config weights, strategy indexes in evaluation order, score bounds)
+        self._evaluation_order: Optional[tuple] = None
+
+    def _strategy_accepts_cached_results(self, strategy) -> bool:
+        """Return whether strategy.match takes cached_results (inspected once per strategy)."""
+        key = id(strategy)
+        accepts = self._accepts_cached_results.get(key)
+        if accepts is None:
+            sig = inspect.signature(strategy.match)
+            accepts = len(sig.parameters) > 1  # Has more than just 'value'
+            self._accepts_cached_results[key] = accepts
+        return accepts
+
+    def _run_strategy(
+        self, strategy, value: str, cached_results: Optional[dict]
+    ) -> List[MatchResult]:
+        """
+        Run one strategy and return its results.
+
+        Args:
+            strategy: Brush matching strategy to run
+            value: The brush string to match
+            cached_results: Optional cached results to pass to the strategy
+
+        Returns:
+            List of MatchResult objects (several for multi-result strategies)
+        """
+        if isinstance(strategy, BaseMultiResultBrushMatchingStrategy):
+            # Get all possible results from multi-result strategies
+            if cached_results is not None:
+                multi_results = strategy.match_all(value, cached_results)
+            else:
+                multi_results = strategy.match_all(value)
+            return list(multi_results) if multi_results else []
+
+        # Standard strategy execution for all other strategies
+        # Pass cached results to strategies that support them
+        if cached_results is not None and self._strategy_accepts_cached_results(strategy):
+            result = strategy.match(value, cached_results)
+        else:
+            result = strategy.match(value)
+
+        if result is None:
+            return []
+
+        # Convert dict results to MatchResult objects
+        if isinstance(result, dict):
+            result = create_match_result(
+                original=value,
+                matched=result.get("matched", {}),
+                match_type=result.get("match_type", "unknown"),
+                pattern=result.get("pattern", "unknown"),
+                strategy=strategy.__class__.__name__,  # Set the strategy name
+            )
+        elif not isinstance(result, MatchResult):
+            # Skip results that are neither dict nor MatchResult
+            return []
+
+        # Always include results, even if they don't have matches
+        # This allows the analyzer to show what each strategy attempted
+        return [result]
 
     def run_all_strategies(
         self, value: str, cached_results: Optional[dict] = None
@@ -40,56 +110,96 @@ class StrategyOrchestrator:
             List of MatchResult objects from all strategies
         """
         results = []
-
         for strategy in self.strategies:
-            # Special handling for multi-result strategies
-            from ..strategies.base_brush_matching_strategy import (
-                BaseMultiResultBrushMatchingStrategy,
-            )
+            results.extend(self._run_strategy(strategy, value, cached_results))
+        return results
 
-            if isinstance(strategy, BaseMultiResultBrushMatchingStrategy):
-                # Get all possible results from multi-result strategies
-                multi_results = strategy.match_all(value)
-                if multi_results:
-                    # Add all results to the main results list
-                    results.extend(multi_results)
-                continue
+    def get_max_score(self, strategy) -> float:
+        """
+        Get the highest score a strategy's results can receive.
 
-            # Standard strategy execution for all other strategies
-            # Pass cached results to strategies that support them
-            if cached_results is not None:
-                # Check if the strategy's match method accepts cached_results parameter
-                import inspect
-
-                sig = inspect.signature(strategy.match)
-                if len(sig.parameters) > 1:  # Has more than just 'self' and 'value'
-                    result = strategy.match(value, cached_results)
-                else:
-                    result = strategy.match(value)
-            else:
-                result = strategy.match(value)
-
-            if result is not None:
-                # Convert dict results to MatchResult objects
-                if isinstance(result, dict):
-                    from sotd.match.types import create_match_result
-
-                    result = create_match_result(
-                        original=value,
-                        matched=result.get("matched", {}),
-                        match_type=result.get("match_type", "unknown"),
-                        pattern=result.get("pattern", "unknown"),
-                        strategy=strategy.__class__.__name__,  # Set the strategy name
-                    )
-                elif not isinstance(result, MatchResult):
-                    # Skip results that are neither dict nor MatchResult
-                    continue
+        Strategies declare the brush_scoring_config.yaml name their results are
+        scored under as ``scoring_name``; strategies without one are unbounded.
 
-                # Always include results, even if they don't have matches
-                # This allows the analyzer to show what each strategy attempted
-                results.append(result)
+        Args:
+            strategy: Brush matching strategy
 
-        return results
+        Returns:
+            Upper bound on the strategy's score (infinity if unknown)
+        """
+        scoring_name = getattr(strategy, "scoring_name", None)
+        if self.scoring_engine is None or not isinstance(scoring_name, str):
+            return float("inf")
+        return self.scoring_engine.get_max_score(scoring_name)
+
+    def _get_evaluation_order(self) -> tuple:
+        """Return (strategy indexes by descending max score, max scores by index).
+
+        Recomputed only when the strategies or the scoring configuration change.
+        """
+        config = self.scoring_engine.config if self.scoring_engine is not None else None
+        weights = getattr(config, "weights", None)
+        cached = self._evaluation_order
+        if cached is not None and cached[0] is weights and len(cached[2]) == len(self.strategies):
+            return cached[1], cached[2]
+
+        bounds = [self.get_max_score(strategy) for strategy in self.strategies]
+        # Stable: strategies with equal bounds keep their list order
+        order = sorted(range(len(self.strategies)), key=lambda index: -bounds[index])
+        self._evaluation_order = (weights, order, bounds)
+        return order, bounds
+
+    def run_strategies_pruned(
+        self, value: str, cached_results: Optional[dict] = None
+    ) -> List[MatchResult]:
+        """
+        Run strategies until no remaining one can beat the best result, and score them.
+
+        Strategies run in descending order of get_max_score. Evaluation stops when
+        the next strategy's bound is below the best score so far, or equal to it
+        and the strategy comes later in the list (ScoringEngine.get_best_result
+        keeps the first of equal scores). The best result is therefore the same
+        as scoring the output of run_all_strategies; strategies that were skipped
+        are simply missing from the returned list.
+
+        Args:
+            value: The brush string to match
+            cached_results: Optional cached results to pass to strategies
+
+        Returns:
+            Scored MatchResult objects from the strategies that ran, in list order
+        """
+        if self.scoring_engine is None:
+            raise ValueError("run_strategies_pruned requires a scoring_engine")
+
+        order, bounds = self._get_evaluation_order()
+        results_by_index: Dict[int, List[MatchResult]] = {}
+        best_score: Optional[float] = None
+        best_index = -1
+
+        for index in order:
+            if best_score is not None and (
+                bounds[index] < best_score or (bounds[index] == best_score and index > best_index)
+            ):
+                break
+
+            results = self._run_strategy(self.strategies[index], value, cached_results)
+            results_by_index[index] = self.scoring_engine.score_results(
+                results, value, cached_results
+            )
+            for result in results:
+                if not result.matched:
+                    continue
+                score = result.score or 0.0
+                if (
+                    best_score is None
+                    or score > best_score
+                    or (score == best_score and index < best_index)
+                ):
+                    best_score = score
+                    best_index = index
+
+        return [result for index in sorted(results_by_index) for result in results_by_index[index]]
 
     def get_strategy_count(self) -> int:
         """
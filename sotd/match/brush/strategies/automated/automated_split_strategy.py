@@ -23,6 +23,8 @@ from ..base_brush_matching_strategy import (
 class AutomatedSplitStrategy(BaseMultiResultBrushMatchingStrategy):
     """Unified strategy for automated split handling with priority-based scoring."""
 
+    scoring_name = "automated_split"
+
     def __init__(self, catalogs, scoring_config, handle_matcher, knot_matcher):
         """
         Initialize automated split strategy.
@@ -86,12 +88,14 @@ class AutomatedSplitStrategy(BaseMultiResultBrushMatchingStrategy):
             # Fail fast for debugging
             raise ValueError(f"Automated split matching failed for '{value}': {e}") from e
 
-    def match_all(self, value: str) -> list[MatchResult]:
+    def match_all(self, value: str, cached_results: Optional[dict] = None) -> list[MatchResult]:
         """
         Try to match using all possible automated split combinations.
 
         Args:
             value: The brush string to match
+            cached_results: Optional cached results; its "component_matches" memo,
+                if present, is used to match the handle and knot parts
 
         Returns:
             List of MatchResult objects for all possible splits, empty list if no splits found
@@ -104,6 +108,8 @@ class AutomatedSplitStrategy(BaseMultiResultBrushMatchingStrategy):
             # Skip all split strategies if should_not_split is True
             return []
 
+        component_matches = cached_results.get("component_matches") if cached_results else None
+
         try:
             all_results = []
 
@@ -112,7 +118,11 @@ class AutomatedSplitStrategy(BaseMultiResultBrushMatchingStrategy):
 
             for split_info in all_splits:
                 result = self._create_split_result(
-                    split_info["handle"], split_info["knot"], value, split_info["priority"]
+                    split_info["handle"],
+                    split_info["knot"],
+                    value,
+                    split_info["priority"],
+                    component_matches,
                 )
                 result.strategy = "automated_split"
                 all_results.append(result)
@@ -254,12 +264,22 @@ class AutomatedSplitStrategy(BaseMultiResultBrushMatchingStrategy):
         return None, None
 
     def _create_split_result(
-        self, handle: str, knot: str, original_value: str, priority: str
+        self,
+        handle: str,
+        knot: str,
+        original_value: str,
+        priority: str,
+        component_matches=None,
     ) -> MatchResult:
         """Create a MatchResult for a split brush."""
-        # Use the handle and knot matchers to match the split parts
-        handle_result = self.handle_matcher.match(handle)
-        knot_result = self.knot_matcher.match(knot, full_string=original_value)
+        # Use the handle and knot matchers (through the component memo when one is
+        # given) to match the split parts
+        if component_matches is not None:
+            handle_result = component_matches.match_handle(handle)
+            knot_result = component_matches.match_knot(knot, full_string=original_value)
+        else:
+            handle_result = self.handle_matcher.match(handle)
+            knot_result = self.knot_matcher.match(knot, full_string=original_value)
 
         # Create a basic match result structure
         result = MatchResult(
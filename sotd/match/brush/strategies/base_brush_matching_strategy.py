@@ -7,6 +7,10 @@ from sotd.match.types import MatchResult
 class BaseBrushMatchingStrategy(ABC):
     """Base class for strategies that return a single match result."""
 
+    # Strategy name in brush_scoring_config.yaml that this strategy's results are scored
+    # under. The orchestrator bounds the strategy's score with it; None means unbounded.
+    scoring_name: Optional[str] = None
+
     @abstractmethod
     def match(self, value: str, full_string: Optional[str] = None) -> Optional[MatchResult]:
         """Attempt to match the given string to a known brush pattern.
@@ -24,6 +28,9 @@ class BaseBrushMatchingStrategy(ABC):
 class BaseMultiResultBrushMatchingStrategy(ABC):
     """Base class for strategies that can return multiple match results."""
 
+    # See BaseBrushMatchingStrategy.scoring_name
+    scoring_name: Optional[str] = None
+
     @abstractmethod
     def match(self, value: str, full_string: Optional[str] = None) -> Optional[MatchResult]:
         """Attempt to match the given string to a known brush pattern.
@@ -39,9 +46,14 @@ class BaseMultiResultBrushMatchingStrategy(ABC):
         """
 
     @abstractmethod
-    def match_all(self, value: str) -> List[MatchResult]:
+    def match_all(self, value: str, cached_results: Optional[dict] = None) -> List[MatchResult]:
         """Attempt to match the given string and return all possible results.
 
+        Args:
+            value: The text to match against
+            cached_results: Optional results shared by all strategies for this
+                input (pre-computed matches and the component match memo)
+
         Returns a list of MatchResult objects for all possible matches,
         empty list if no matches are found.
         """
@@ -23,6 +23,8 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
     - If neither matches: Returns None
     """
 
+    scoring_name = "full_input_component_matching"
+
     def __init__(self, handle_matcher, knot_matcher, catalogs: dict):
         """
         Initialize the unified component matching strategy.
@@ -40,30 +42,42 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
         # Initialize BrushSplitsLoader to check should_not_split flag
         self.splits_loader = BrushSplitsLoader(Path("data/brush_splits.yaml"))
 
-    def match(self, value: str | dict, full_string: Optional[str] = None) -> Optional[MatchResult]:
+    def match(
+        self,
+        value: str | dict,
+        full_string: Optional[str] = None,
+        cached_results: Optional[dict] = None,
+    ) -> Optional[MatchResult]:
         """
         Match a brush string using unified component matching logic.
         Returns the best single result for backward compatibility.
 
         Args:
             value: The brush string or field data object to match
+            cached_results: Optional cached results (see match_all)
 
         Returns:
             MatchResult or None
         """
-        all_results = self.match_all(value)
+        all_results = self.match_all(value, cached_results)
         return all_results[0] if all_results else None
 
-    def match_all(self, value: str | dict) -> List[MatchResult]:
+    def match_all(
+        self, value: str | dict, cached_results: Optional[dict] = None
+    ) -> List[MatchResult]:
         """
         Match a brush string and return all possible brand combination results.
 
         Args:
             value: The brush string or field data object to match
+            cached_results: Optional cached results; its "component_matches" memo,
+                if present, is used for handle and knot matching
 
         Returns:
             List of MatchResult objects for all possible matches
         """
+        component_matches = cached_results.get("component_matches") if cached_results else None
+
         # Handle both string and field data object inputs
         if isinstance(value, dict):
             # Extract normalized text from field data object
@@ -88,13 +102,13 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
         knot_result = None
 
         try:
-            handle_result = self.handle_matcher.match_handle_maker(text)
+            handle_result = self._match_handle_maker(text, component_matches)
         except Exception:
             # Handle matcher failed, continue with None
             pass
 
         try:
-            knot_result = self.knot_matcher.match(text)
+            knot_result = self._match_knot(text, component_matches)
         except Exception:
             # Knot matcher failed, continue with None
             pass
@@ -120,7 +134,7 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
             if handle_brand and knot_brand and handle_brand == knot_brand:
                 # Same brand - generate alternative combinations
                 self._generate_alternative_combinations(
-                    text, handle_result, knot_result, results, seen_combinations
+                    text, handle_result, knot_result, results, seen_combinations, component_matches
                 )
         elif handle_result or knot_result:
             # Only one matched - single component
@@ -145,6 +159,7 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
         original_knot_result,
         results: List[MatchResult],
         seen_combinations: set,
+        component_matches=None,
     ) -> None:
         """
         Generate alternative brand combinations when both components have the same brand.
@@ -155,17 +170,21 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
             original_knot_result: Original knot match result
             results: List to add new results to
             seen_combinations: Set to track seen combinations for deduplication
+            component_matches: Optional ComponentMatchCache for handle and knot matching
         """
         original_handle_brand = self._extract_brand_from_result(original_handle_result)
         original_knot_brand = self._extract_brand_from_result(original_knot_result)
 
         # Try to find alternative handle with different brand
+        memo_kwargs = {} if component_matches is None else {"component_matches": component_matches}
         alternative_handle_result = self._match_handle_with_exclusions(
-            text, {original_handle_brand}
+            text, {original_handle_brand}, **memo_kwargs
         )
 
         # Try to find alternative knot with different brand
-        alternative_knot_result = self._match_knot_with_exclusions(text, {original_knot_brand})
+        alternative_knot_result = self._match_knot_with_exclusions(
+            text, {original_knot_brand}, **memo_kwargs
+        )
 
         # Generate all possible combinations
         combinations_to_try = []
@@ -196,21 +215,34 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
                     results.append(result)
                     seen_combinations.add(combination_key)
 
+    def _match_handle_maker(self, text: str, component_matches=None) -> Optional[dict]:
+        """Match a handle maker, through the component memo when one is given."""
+        if component_matches is not None:
+            return component_matches.match_handle_maker(text)
+        return self.handle_matcher.match_handle_maker(text)
+
+    def _match_knot(self, text: str, component_matches=None) -> Optional[MatchResult]:
+        """Match a knot, through the component memo when one is given."""
+        if component_matches is not None:
+            return component_matches.match_knot(text)
+        return self.knot_matcher.match(text)
+
     def _match_handle_with_exclusions(
-        self, text: str, excluded_brands: set[str]
-    ) -> Optional[MatchResult]:
+        self, text: str, excluded_brands: set[str], component_matches=None
+    ) -> Optional[dict]:
         """
         Match handle while excluding specific brands.
 
         Args:
             text: Text to match against
             excluded_brands: Set of brand names to exclude (case-insensitive)
+            component_matches: Optional ComponentMatchCache for matching
 
         Returns:
-            MatchResult if match found and brand not excluded, None otherwise
+            Handle match dict if match found and brand not excluded, None otherwise
         """
         try:
-            result = self.handle_matcher.match_handle_maker(text)
+            result = self._match_handle_maker(text, component_matches)
             if result is None:
                 return None
 
@@ -229,7 +261,7 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
             return None
 
     def _match_knot_with_exclusions(
-        self, text: str, excluded_brands: set[str]
+        self, text: str, excluded_brands: set[str], component_matches=None
     ) -> Optional[MatchResult]:
         """
         Match knot while excluding specific brands.
@@ -237,12 +269,13 @@ class FullInputComponentMatchingStrategy(BaseMultiResultBrushMatchingStrategy):
         Args:
             text: Text to match against
             excluded_brands: Set of brand names to exclude (case-insensitive)
+            component_matches: Optional ComponentMatchCache for matching
 
         Returns:
             MatchResult if match found and brand not excluded, None otherwise
         """
         try:
-            result = self.knot_matcher.match(text)
+            result = self._match_knot(text, component_matches)
             if result is None:
                 return None
 
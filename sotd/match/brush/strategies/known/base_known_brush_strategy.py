@@ -11,7 +11,7 @@ from ..base_brush_matching_strategy import (
 )
 from ..utils.fiber_utils import match_fiber
 from ..utils.knot_size_utils import parse_knot_size
-from ..utils.pattern_cache import get_compiled_patterns
+from ..utils.pattern_cache import get_compiled_patterns, iter_candidate_patterns
 from ..utils.pattern_utils import (
     compile_catalog_patterns,
 )
@@ -66,7 +66,7 @@ class BaseKnownBrushMatchingStrategy(BaseBrushMatchingStrategy, ABC):
             MatchResult with strategy name set
         """
         # Use compiled patterns from subclass
-        for pattern_data in self.patterns:
+        for pattern_data in iter_candidate_patterns(self.patterns, value):
             if self._pattern_matches(value, pattern_data):
                 result = self._create_match_result_from_pattern(value, pattern_data)
                 return self._create_match_result(
@@ -9,6 +9,8 @@ class KnownBrushMatchingStrategy(BaseKnownBrushMatchingStrategy):
     section of the catalog. It inherits all functionality from BaseKnownBrushMatchingStrategy.
     """
 
+    scoring_name = "known_brush"
+
     def get_strategy_name(self) -> str:
         """Return the strategy name for scoring purposes."""
         return "known_brush"
@@ -10,6 +10,8 @@ class KnownKnotBasedBrushMatchingStrategy(BaseKnownBrushMatchingStrategy):
     section of the catalog. It inherits all functionality from BaseKnownBrushMatchingStrategy.
     """
 
+    scoring_name = "known_knot_based_brush"
+
     def get_strategy_name(self) -> str:
         """Return the strategy name for scoring purposes."""
         return "known_knot_based_brush"
@@ -4,7 +4,7 @@ from sotd.match.types import MatchResult
 from sotd.match.utils.regex_error_utils import compile_regex_with_context, create_context_dict
 
 from ..utils.knot_size_utils import parse_knot_size
-from ..utils.pattern_cache import get_compiled_patterns
+from ..utils.pattern_cache import get_compiled_patterns, iter_candidate_patterns
 from ..utils.pattern_utils import (
     create_strategy_result,
     validate_string_input,
@@ -99,7 +99,7 @@ class KnownKnotMatchingStrategy:
         # When full_string is None, use value as full_string (backward compatibility)
         effective_full_string = full_string if full_string is not None else value
 
-        for pattern_data in self.patterns:
+        for pattern_data in iter_candidate_patterns(self.patterns, value):
             # Check pattern against both split text and full string
             # Pattern matches if it matches the split text AND the full string
             matches_split = pattern_data["compiled"].search(value)
@@ -14,12 +14,14 @@ from sotd.match.types import MatchResult
 from ..base_brush_matching_strategy import (
     BaseBrushMatchingStrategy,
 )
-from ..utils.pattern_cache import get_compiled_patterns
+from ..utils.pattern_cache import get_compiled_patterns, iter_candidate_patterns
 
 
 class KnownSplitWrapperStrategy(BaseBrushMatchingStrategy):
     """Strategy for matching known split brush patterns."""
 
+    scoring_name = "known_split"
+
     def __init__(self, known_splits_data: dict, handle_matcher=None, knot_matcher=None):
         """
         Initialize the strategy with known splits data and standard matchers.
@@ -80,7 +82,7 @@ class KnownSplitWrapperStrategy(BaseBrushMatchingStrategy):
             return None
 
         # Try to match against compiled patterns
-        for pattern_info in self.compiled_patterns:
+        for pattern_info in iter_candidate_patterns(self.compiled_patterns, value):
             if pattern_info["regex"].search(value):
                 split_data = pattern_info["data"]
 
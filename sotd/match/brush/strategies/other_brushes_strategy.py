@@ -8,13 +8,15 @@ from .base_brush_matching_strategy import (
 )
 from .utils.fiber_utils import match_fiber
 from .utils.knot_size_utils import parse_knot_size
-from .utils.pattern_cache import get_compiled_patterns
+from .utils.pattern_cache import get_compiled_patterns, iter_candidate_patterns
 from .utils.pattern_utils import (
     validate_catalog_structure,
 )
 
 
 class OtherBrushMatchingStrategy(BaseBrushMatchingStrategy):
+    scoring_name = "other_brush"
+
     @property
     def strategy_name(self) -> str:
         return "other_brush"
@@ -77,7 +79,7 @@ class OtherBrushMatchingStrategy(BaseBrushMatchingStrategy):
             text = value
 
         # Use precompiled patterns for performance optimization
-        for pattern_data in self.compiled_patterns:
+        for pattern_data in iter_candidate_patterns(self.compiled_patterns, text):
             if pattern_data["compiled"].search(text):
                 brand = pattern_data["brand"]
                 metadata = pattern_data["metadata"]
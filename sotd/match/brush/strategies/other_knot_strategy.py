@@ -3,7 +3,7 @@ from typing import Optional
 from sotd.match.utils.regex_error_utils import compile_regex_with_context, create_context_dict
 
 from .utils.fiber_utils import match_fiber
-from .utils.pattern_cache import get_compiled_patterns
+from .utils.pattern_cache import get_compiled_patterns, iter_candidate_patterns
 from .utils.pattern_utils import (
     create_strategy_result,
     validate_string_input,
@@ -81,7 +81,7 @@ class OtherKnotMatchingStrategy:
                 strategy_name="OtherKnotMatchingStrategy",
             )
 
-        for pattern_data in self.patterns:
+        for pattern_data in iter_candidate_patterns(self.patterns, value):
             if pattern_data["compiled"].search(value):
                 brand = pattern_data["brand"]
                 default_fiber = pattern_data["default_fiber"]
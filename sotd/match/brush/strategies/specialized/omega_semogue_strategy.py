@@ -10,6 +10,8 @@ from ..utils.pattern_utils import (
 
 
 class OmegaSemogueBrushMatchingStrategy:
+    scoring_name = "omega_semogue_brush"
+
     def match(self, value: str, full_string: Optional[str] = None) -> Optional[MatchResult]:
         # Use unified string validation
         normalized_text = validate_string_input(value)
@@ -10,6 +10,8 @@ from ..utils.pattern_utils import (
 
 
 class ZenithBrushMatchingStrategy:
+    scoring_name = "zenith_brush"
+
     def match(self, value: str, full_string: Optional[str] = None) -> Optional[MatchResult]:
         # Use unified string validation
         normalized_text = validate_string_input(value)
@@ -4,11 +4,54 @@ This module provides caching for compiled regex patterns to avoid redundant
 compilation during BrushMatcher initialization. Since ProcessPoolExecutor reuses
 worker processes, module-level caching within each process allows patterns to be
 compiled once per worker and reused for subsequent months.
+
+Each compiled list also carries a PatternIndex (see sotd.match.utils.pattern_index),
+built once with it, so matching a string searches only the patterns that can match it
+(iter_candidate_patterns) instead of the whole catalog.
 """
 
 import hashlib
 import json
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sotd.match.utils.pattern_index import PatternIndex
+
+# Brush model names are often two characters long (e.g. "b2", "v1"), so key on pairs
+BRUSH_KEY_LENGTH = 2
+
+
+def _entry_pattern(entry: Dict[str, Any]) -> str:
+    """Get the regex text of a compiled entry (stored under "compiled" or "regex")."""
+    regex = entry.get("compiled") or entry.get("regex")
+    return regex.pattern if regex is not None else ""
+
+
+class CompiledPatterns(list):
+    """List of compiled pattern entries, with an index of the text each pattern requires."""
+
+    def __init__(self, patterns: Iterable[Dict[str, Any]]):
+        super().__init__(patterns)
+        self.pattern_index = PatternIndex(self, _entry_pattern, key_length=BRUSH_KEY_LENGTH)
+
+
+def iter_candidate_patterns(patterns: List[Dict[str, Any]], text: str) -> Iterable[Dict[str, Any]]:
+    """Get the entries of a compiled pattern list that can match text, in list order.
+
+    Entries are skipped only when their PatternIndex shows they cannot match, so
+    the first entry whose regex matches is the same as when scanning every entry.
+
+    Args:
+        patterns: List returned by get_compiled_patterns (plain lists are returned whole)
+        text: Text the entries' regexes will be searched in
+
+    Returns:
+        The candidate entries
+    """
+    pattern_index: Optional[PatternIndex] = getattr(patterns, "pattern_index", None)
+    # Lists changed after compilation are no longer described by their index
+    if pattern_index is None or not pattern_index.is_current_for(patterns):
+        return patterns
+    return pattern_index.candidates(text)
 
 
 # Module-level cache (per process)
@@ -53,7 +96,8 @@ def get_compiled_patterns(
         compile_func: Function that compiles patterns from catalog data
 
     Returns:
-        List of compiled patterns with metadata
+        List of compiled patterns with metadata (a CompiledPatterns, for use with
+        iter_candidate_patterns)
     """
     # Fast path: Check cache by object identity first (O(1) dict lookup, no hashing)
     id_key = (id(catalog_data), pattern_type)
@@ -69,7 +113,7 @@ def get_compiled_patterns(
         return _pattern_cache_by_hash[cache_key]
 
     # Cache miss: Compile patterns and cache them
-    compiled = compile_func(catalog_data)
+    compiled = CompiledPatterns(compile_func(catalog_data))
     _pattern_cache_by_hash[cache_key] = compiled
     _pattern_cache_by_id[id_key] = compiled
     return compiled
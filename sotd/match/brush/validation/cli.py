@@ -5,7 +5,8 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from sotd.utils.file_io import load_json_data
+from sotd.match.brush.diagnostics import attach_brush_diagnostics
+from sotd.utils.file_io import json_file_exists, load_json_data
 
 from .counting import BrushValidationCountingService
 from .user_actions import BrushUserActionsManager
@@ -57,9 +58,10 @@ class BrushValidationCLI:
         try:
             # Get correct matches from matched data
             file_path = self.data_path / "matched" / f"{month}.json"
-            if file_path.exists():
+            if json_file_exists(file_path):
                 data = load_json_data(file_path)
                 records = data.get("data", [])
+                attach_brush_diagnostics(records, self.data_path, month)
 
                 if records:  # Only iterate if records is not None and not empty
                     for record in records:
@@ -164,6 +166,9 @@ class BrushValidationCLI:
             if not records:
                 return []
 
+            if system == "scoring":
+                attach_brush_diagnostics(records, self.data_path, month)
+
             # Get processed normalized texts (correct matches + user actions)
             processed_normalized_texts = self._get_processed_normalized_texts(month)
 
@@ -265,7 +270,7 @@ class BrushValidationCLI:
             else:
                 return []
 
-            if not file_path.exists():
+            if not json_file_exists(file_path):
                 return []
 
             data = load_json_data(file_path)
@@ -305,7 +310,7 @@ class BrushValidationCLI:
             else:
                 return None
 
-            if not file_path.exists():
+            if not json_file_exists(file_path):
                 return None
 
             data = load_json_data(file_path)
@@ -323,6 +328,8 @@ class BrushValidationCLI:
                     brush_entry = record["brush"]
                     normalized_text = brush_entry.get("normalized", "")
                     if normalized_text.lower() == input_text.lower():
+                        if system == "scoring":
+                            attach_brush_diagnostics([record], self.data_path, month)
                         # Return the matched data and all strategies
                         return {
                             "matched": brush_entry.get("matched"),
@@ -7,7 +7,8 @@ from typing import Any, Dict
 
 import yaml
 
-from sotd.utils.file_io import load_json_data
+from sotd.match.brush.diagnostics import attach_brush_diagnostics
+from sotd.utils.file_io import json_file_exists, load_json_data
 
 
 class BrushValidationCountingService:
@@ -238,20 +239,22 @@ class BrushValidationCountingService:
 
         # Load scoring system data
         scoring_file_path = self.data_path / "matched" / f"{month}.json"
-        if scoring_file_path.exists():
+        if json_file_exists(scoring_file_path):
             try:
                 scoring_data = load_json_data(scoring_file_path)
                 if "data" in scoring_data:
-                    combined_data["data"].extend(scoring_data.get("data", []))
+                    scoring_records = scoring_data.get("data", [])
                 else:
                     # Fallback to old structure
-                    combined_data["data"].extend(scoring_data.get("brush", []))
+                    scoring_records = scoring_data.get("brush", [])
+                attach_brush_diagnostics(scoring_records, self.data_path, month)
+                combined_data["data"].extend(scoring_records)
             except Exception as e:
                 self.logger.error(f"Error loading scoring data for {month}: {e}")
 
         # Load legacy system data
         legacy_file_path = self.data_path / "matched_legacy" / f"{month}.json"
-        if legacy_file_path.exists():
+        if json_file_exists(legacy_file_path):
             try:
                 legacy_data = load_json_data(legacy_file_path)
                 if "data" in legacy_data:
@@ -34,6 +34,29 @@ def get_parser() -> BaseCLIParser:
         help="Test a specific brush string directly through the matcher",
     )
 
+    # Persistent result cache (data/.cache/match/) keyed by catalog fingerprints
+    parser.add_argument(
+        "--no-match-cache",
+        action="store_true",
+        help="Disable the persistent match result cache and re-run every matcher",
+    )
+
+    # Pool for matching a month's unique strings (sequential month processing only)
+    parser.add_argument(
+        "--match-workers",
+        type=int,
+        default=1,
+        help="Worker processes for matching unique strings within a month (default: 1)",
+    )
+
+    # Brush strategy results are only written when asked for (validation tooling)
+    parser.add_argument(
+        "--diagnostics",
+        action="store_true",
+        help="Write every scored brush strategy to matched/diagnostics/YYYY-MM.json.gz "
+        "for brush validation",
+    )
+
     # Add standardized parallel processing arguments
     parser.add_parallel_processing_arguments(
         default_max_workers=8,
@@ -43,4 +66,10 @@ def get_parser() -> BaseCLIParser:
     # Add delta processing support
     parser.add_delta_arguments()
 
+    # Reprocess only records whose inputs changed (hashes stored in output metadata)
+    parser.add_incremental_arguments()
+
+    # Compressed month artifacts (readers accept either form)
+    parser.add_compression_arguments()
+
     return parser
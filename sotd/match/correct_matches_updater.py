@@ -1,62 +1,405 @@
-"""Correct matches updater for managing correct_matches directory operations."""
-
+"""Correct matches updater for managing correct_matches directory operations.
+
+Single entries (one click in the brush validation CLI or webui) are not written
+back to the field YAML files straight away: each one is applied to an in-memory
+copy of the directory and appended to an operation journal
+(``.journal.jsonl``). The journal is compacted back into sorted YAML once it
+holds ``compact_every`` operations, on an explicit ``compact()``, by the webui
+queue worker and before the match phase reads the directory. Bulk callers use
+``apply_operations``, which applies any number of operations with one write
+per affected field file.
+"""
+
+import json
+import logging
 import shutil
 import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = ".journal.jsonl"
+DEFAULT_COMPACT_EVERY = 100
+
+# Parsed correct_matches directories, with the journal replayed, keyed by
+# directory. Each entry holds the (name, mtime_ns, size) signature of the YAML
+# files and journal it was built from, the data, and the fields and number of
+# operations still only in the journal. Shared by every updater in the process,
+# so the webui (which builds a new updater per request) parses the YAML once.
+_states: Dict[Path, Dict[str, Any]] = {}
+_states_lock = threading.RLock()
+
+
+def _is_field_file(field_file: Path) -> bool:
+    """Return True for field YAML files (not backups or duplicate reports)."""
+    return (
+        not field_file.name.endswith((".backup", ".bk"))
+        and "duplicates_report" not in field_file.name
+    )
+
+
+def _pattern_fields(field_type: str, result_data: Dict[str, Any]) -> Set[str]:
+    """Return the field files an add operation for field_type writes to."""
+    if field_type != "split_brush":
+        return {field_type}
+    handle_data = result_data.get("handle", {})
+    knot_data = result_data.get("knot", {})
+    if handle_data and knot_data:
+        return {"handle", "knot"}
+    return {"brush"}
+
+
+def compact_pending_journal(correct_matches_path: Path) -> bool:
+    """Fold any journaled operations into the YAML files of a correct_matches directory.
+
+    Readers that parse the YAML files directly (the matchers) call this first.
+
+    Returns:
+        True if there was a journal to compact
+    """
+    if not (correct_matches_path / JOURNAL_FILENAME).exists():
+        return False
+    CorrectMatchesUpdater(correct_matches_path).compact()
+    return True
+
 
 class CorrectMatchesUpdater:
     """Handle YAML file operations for correct_matches directory."""
 
-    def __init__(self, correct_matches_path: Optional[Path] = None):
-        """Initialize updater with path to correct_matches directory."""
+    def __init__(
+        self,
+        correct_matches_path: Optional[Path] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
+        """Initialize updater with path to correct_matches directory.
+
+        Args:
+            correct_matches_path: The correct_matches directory
+            compact_every: Journaled operations after which the journal is
+                compacted back into the YAML files
+        """
         self.correct_matches_path = correct_matches_path or Path("data/correct_matches")
+        self.journal_path = self.correct_matches_path / JOURNAL_FILENAME
+        self.compact_every = compact_every
         self._ensure_directory_exists()
 
     def _ensure_directory_exists(self) -> None:
         """Ensure the directory for correct_matches exists."""
         self.correct_matches_path.mkdir(parents=True, exist_ok=True)
 
-    def load_correct_matches(self, field_type: Optional[str] = None) -> Dict[str, Any]:
-        """Load existing correct_matches data from directory structure."""
+    def _field_files(self) -> List[Path]:
+        """Return the field YAML files in the directory."""
+        return [f for f in sorted(self.correct_matches_path.glob("*.yaml")) if _is_field_file(f)]
+
+    def _signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Return (name, mtime_ns, size) for every field file and the journal."""
+        signature = []
+        for path in self._field_files() + [self.journal_path]:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _load_yaml_files(self, field_type: Optional[str] = None) -> Dict[str, Any]:
+        """Parse the field YAML files (all of them, or just field_type)."""
         if not self.correct_matches_path.exists():
             return {}
 
-        data = {}
-
         if field_type:
-            # Load specific field file
-            field_file = self.correct_matches_path / f"{field_type}.yaml"
-            if field_file.exists():
-                try:
-                    with field_file.open("r", encoding="utf-8") as f:
-                        field_data = yaml.safe_load(f)
-                        if field_data:
-                            data[field_type] = field_data
-                except (yaml.YAMLError, FileNotFoundError):
-                    pass
+            field_files = [self.correct_matches_path / f"{field_type}.yaml"]
         else:
-            # Load all field files
-            for field_file in self.correct_matches_path.glob("*.yaml"):
-                field_name = field_file.stem
-                # Skip backup and report files
-                if (
-                    field_file.name.endswith((".backup", ".bk"))
-                    or "duplicates_report" in field_file.name
-                ):
+            field_files = self._field_files()
+
+        data = {}
+        for field_file in field_files:
+            if not field_file.exists():
+                continue
+            try:
+                with field_file.open("r", encoding="utf-8") as f:
+                    field_data = yaml.safe_load(f)
+                    if field_data:
+                        data[field_file.stem] = field_data
+            except (yaml.YAMLError, FileNotFoundError):
+                pass
+        return data
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """Return the operations in the journal, skipping a torn final line."""
+        if not self.journal_path.exists():
+            return []
+        operations = []
+        with self.journal_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
                     continue
                 try:
-                    with field_file.open("r", encoding="utf-8") as f:
-                        field_data = yaml.safe_load(f)
-                        if field_data:
-                            data[field_name] = field_data
-                except (yaml.YAMLError, FileNotFoundError):
-                    pass
+                    operations.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping invalid line in {self.journal_path}")
+        return operations
+
+    def _state(self) -> Dict[str, Any]:
+        """Return the directory state, rebuilding it if any file changed on disk."""
+        signature = self._signature()
+        state = _states.get(self.correct_matches_path)
+        if state is not None and state["signature"] == signature:
+            return state
+
+        data = self._load_yaml_files()
+        pending_fields: Set[str] = set()
+        operations = self._read_journal()
+        for operation in operations:
+            pending_fields |= self._apply_operation(data, operation)[1]
+        state = {
+            "signature": signature,
+            "data": data,
+            "pending_fields": pending_fields,
+            "pending_count": len(operations),
+        }
+        _states[self.correct_matches_path] = state
+        return state
+
+    def _write_fields(self, state: Dict[str, Any], fields: Iterable[str]) -> None:
+        """Write fields of the state to their YAML files and drop the journal."""
+        data = state["data"]
+        for field_name in sorted(fields):
+            self.save_correct_matches({field_name: data.get(field_name, {})}, field_name)
+        self.journal_path.unlink(missing_ok=True)
+        state["pending_fields"] = set()
+        state["pending_count"] = 0
+        state["signature"] = self._signature()
 
-        return data
+    def load_correct_matches(self, field_type: Optional[str] = None) -> Dict[str, Any]:
+        """Load existing correct_matches data, including journaled operations.
+
+        The returned data is shared with the updater's in-memory state; callers
+        must not modify it.
+        """
+        if not self.correct_matches_path.exists():
+            return {}
+
+        with _states_lock:
+            data = self._state()["data"]
+        if field_type:
+            return {field_type: data[field_type]} if data.get(field_type) else {}
+        return {field_name: field_data for field_name, field_data in data.items() if field_data}
+
+    def _apply_operation(
+        self, data: Dict[str, Any], operation: Dict[str, Any]
+    ) -> Tuple[bool, Set[str]]:
+        """Apply one journal operation to data.
+
+        Returns:
+            Whether the operation found its entry (always True for adds), and the
+            fields whose YAML files it affects
+        """
+        field_type = operation.get("field_type", "brush")
+        if operation["op"] == "remove":
+            return self._remove_from(data, operation["input_text"], field_type), {field_type}
+        result_data = operation.get("result_data", {})
+        self._add_to(data, operation["input_text"], result_data, field_type)
+        return True, _pattern_fields(field_type, result_data)
+
+    def _add_to(
+        self,
+        data: Dict[str, Any],
+        input_text: str,
+        result_data: Dict[str, Any],
+        field_type: str,
+    ) -> None:
+        """Add an entry to data in place (see add_or_update_entry)."""
+        # Preserve original casing for storage, but normalize for lookup
+        original_text = input_text.strip()
+        normalized_text = input_text.lower().strip()
+
+        # For brush field, use the hierarchical structure
+        if field_type == "brush":
+            logger.debug("Processing brush field type")
+            # Ensure field section exists
+            if not data.get(field_type):
+                data[field_type] = {}
+
+            # Extract brand and model from result data
+            brand = result_data.get("brand")
+            model = result_data.get("model")
+
+            if brand:
+                # Ensure brand section exists
+                if brand not in data[field_type]:
+                    data[field_type][brand] = {}
+
+                # Handle dual-component brushes where model is null
+                if model is None:
+                    # For dual-component brushes, use a special model identifier
+                    # This allows them to be stored in correct_matches directory
+                    model_key = "dual_component"
+                else:
+                    model_key = model
+
+                # Ensure model section exists
+                if model_key not in data[field_type][brand]:
+                    data[field_type][brand][model_key] = []
+
+                # Add the original text as a pattern if not already present
+                # Check for case-insensitive duplicates to avoid storing the same text
+                # multiple times
+                existing_patterns = data[field_type][brand][model_key]
+                if not any(pattern.lower() == normalized_text for pattern in existing_patterns):
+                    existing_patterns.append(original_text)
+                    logger.debug(f"Added pattern '{original_text}' to brush/{brand}/{model_key}")
+
+        # For handle and knot fields, use flat structure
+        elif field_type in ["handle", "knot"]:
+            logger.debug(f"Processing {field_type} field type")
+            # Ensure field section exists
+            if not data.get(field_type):
+                data[field_type] = {}
+
+            # Add entry with original text as key, but check for case-insensitive duplicates
+            if not any(key.lower() == normalized_text for key in data[field_type]):
+                data[field_type][original_text] = result_data
+                logger.debug(f"Added entry '{original_text}' to {field_type} section")
+
+        # For split_brush field, store handle/knot mapping
+        elif field_type == "split_brush":
+            logger.debug("Processing split_brush field type")
+            # Extract handle and knot components from the dual-component brush
+            handle_data = result_data.get("handle", {})
+            knot_data = result_data.get("knot", {})
+
+            logger.debug(f"Handle data: {handle_data}")
+            logger.debug(f"Knot data: {knot_data}")
+
+            # Handle both string and dict formats for backward compatibility
+            if isinstance(handle_data, str):
+                handle_data = {"brand": "Unknown", "model": handle_data}
+            if isinstance(knot_data, str):
+                knot_data = {"brand": "Unknown", "model": knot_data}
+
+            if handle_data and knot_data:
+                # Store handle component in handle section
+                handle_brand = handle_data.get("brand")
+                handle_model = handle_data.get("model")
+
+                logger.debug(f"Processing handle: brand='{handle_brand}', model='{handle_model}'")
+
+                if handle_brand and handle_model:
+                    # Ensure handle section exists
+                    if not data.get("handle"):
+                        data["handle"] = {}
+                    if handle_brand not in data["handle"]:
+                        data["handle"][handle_brand] = {}
+                    if handle_model not in data["handle"][handle_brand]:
+                        data["handle"][handle_brand][handle_model] = []
+
+                    # Add the original text to handle section if not already present
+                    existing_patterns = data["handle"][handle_brand][handle_model]
+                    if not any(pattern.lower() == normalized_text for pattern in existing_patterns):
+                        existing_patterns.append(original_text)
+                        logger.debug(
+                            f"Added pattern '{original_text}' to "
+                            f"handle/{handle_brand}/{handle_model}"
+                        )
+
+                # Store knot component in knot section
+                knot_brand = knot_data.get("brand")
+                knot_model = knot_data.get("model")
+
+                logger.debug(f"Processing knot: brand='{knot_brand}', model='{knot_model}'")
+
+                if knot_brand and knot_model:
+                    # Ensure knot section exists
+                    if not data.get("knot"):
+                        data["knot"] = {}
+                    if knot_brand not in data["knot"]:
+                        data["knot"][knot_brand] = {}
+                    if knot_model not in data["knot"][knot_brand]:
+                        data["knot"][knot_brand][knot_model] = []
+
+                    # Add the original text to knot section if not already present
+                    existing_patterns = data["knot"][knot_brand][knot_model]
+                    if not any(pattern.lower() == normalized_text for pattern in existing_patterns):
+                        existing_patterns.append(original_text)
+                        logger.debug(
+                            f"Added pattern '{original_text}' to knot/{knot_brand}/{knot_model}"
+                        )
+            else:
+                logger.warning(
+                    f"Missing handle or knot data for split_brush: "
+                    f"handle={handle_data}, knot={knot_data}"
+                )
+                # Fallback: if we can't extract components, store as regular brush
+                # This shouldn't happen with proper dual-component data
+                if not data.get("brush"):
+                    data["brush"] = {}
+                if "dual_component" not in data["brush"]:
+                    data["brush"]["dual_component"] = []
+
+                existing_patterns = data["brush"]["dual_component"]
+                if not any(pattern.lower() == normalized_text for pattern in existing_patterns):
+                    existing_patterns.append(original_text)
+                    logger.debug(
+                        f"Added pattern '{original_text}' to brush/dual_component (fallback)"
+                    )
+
+    def _remove_from(self, data: Dict[str, Any], input_text: str, field_type: str) -> bool:
+        """Remove an entry from data in place (see remove_entry)."""
+        normalized_text = input_text.lower().strip()
+        field_data = data.get(field_type) or {}
+
+        if field_type == "brush":
+            # Search through brand/model hierarchy with case-insensitive lookup
+            for brand in field_data:
+                for model in field_data[brand]:
+                    # Find the actual text (preserving case) to remove
+                    for pattern in field_data[brand][model]:
+                        if pattern.lower() == normalized_text:
+                            field_data[brand][model].remove(pattern)
+                            # Remove empty model sections
+                            if not field_data[brand][model]:
+                                del field_data[brand][model]
+                            # Remove empty brand sections
+                            if not field_data[brand]:
+                                del field_data[brand]
+                            return True
+        else:
+            # For flat structures like handle, knot, split_brush
+            # Find the actual key (preserving case) to remove
+            for key in list(field_data.keys()):
+                if key.lower() == normalized_text:
+                    del field_data[key]
+                    return True
+
+        return False
+
+    def _journal(self, operation: Dict[str, Any]) -> bool:
+        """Apply one operation to the in-memory state and append it to the journal.
+
+        Returns:
+            Whether the operation found its entry
+        """
+        with _states_lock:
+            state = self._state()
+            found, fields = self._apply_operation(state["data"], operation)
+            if operation["op"] == "remove" and not found:
+                return False
+
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(operation, ensure_ascii=False) + "\n")
+            state["pending_fields"] |= fields
+            state["pending_count"] += 1
+            state["signature"] = self._signature()
+
+            if state["pending_count"] >= self.compact_every:
+                self._write_fields(state, state["pending_fields"])
+        return True
 
     def add_or_update_entry(
         self,
@@ -68,184 +411,65 @@ class CorrectMatchesUpdater:
         """
         Add new entry or update existing one in correct_matches directory.
 
+        The entry is journaled; it reaches the YAML files when the journal is
+        compacted (see the module docstring).
+
         Args:
             input_text: The input text to match (preserves original casing)
             result_data: The result data to store
             action_type: Type of action ("validated" or "overridden")
             field_type: Field type ("brush", "handle", "knot", etc.)
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         try:
             logger.debug(
                 f"Adding/updating entry: input_text='{input_text}', field_type='{field_type}'"
             )
+            self._journal(
+                {
+                    "op": "add",
+                    "input_text": input_text,
+                    "result_data": result_data,
+                    "action_type": action_type,
+                    "field_type": field_type,
+                }
+            )
+        except Exception as e:
+            logger.error(f"Error in add_or_update_entry: {e}")
+            raise
 
-            # Load existing data for the specific field
-            all_data = self.load_correct_matches()
-            data = {field_type: all_data.get(field_type, {})}
-
-            # Preserve original casing for storage, but normalize for lookup
-            original_text = input_text.strip()
-            normalized_text = input_text.lower().strip()
-
-            # For brush field, use the hierarchical structure
-            if field_type == "brush":
-                logger.debug("Processing brush field type")
-                # Ensure field section exists
-                if field_type not in data:
-                    data[field_type] = {}
-
-                # Extract brand and model from result data
-                brand = result_data.get("brand")
-                model = result_data.get("model")
-
-                if brand:
-                    # Ensure brand section exists
-                    if brand not in data[field_type]:
-                        data[field_type][brand] = {}
-
-                    # Handle dual-component brushes where model is null
-                    if model is None:
-                        # For dual-component brushes, use a special model identifier
-                        # This allows them to be stored in correct_matches directory
-                        model_key = "dual_component"
-                    else:
-                        model_key = model
-
-                    # Ensure model section exists
-                    if model_key not in data[field_type][brand]:
-                        data[field_type][brand][model_key] = []
-
-                    # Add the original text as a pattern if not already present
-                    # Check for case-insensitive duplicates to avoid storing the same text
-                    # multiple times
-                    existing_patterns = data[field_type][brand][model_key]
-                    if not any(pattern.lower() == normalized_text for pattern in existing_patterns):
-                        existing_patterns.append(original_text)
-                        logger.debug(
-                            f"Added pattern '{original_text}' to brush/{brand}/{model_key}"
-                        )
-
-            # For handle and knot fields, use flat structure
-            elif field_type in ["handle", "knot"]:
-                logger.debug(f"Processing {field_type} field type")
-                # Ensure field section exists
-                if field_type not in data:
-                    data[field_type] = {}
-
-                # Add entry with original text as key, but check for case-insensitive duplicates
-                if not any(key.lower() == normalized_text for key in data[field_type]):
-                    data[field_type][original_text] = result_data
-                    logger.debug(f"Added entry '{original_text}' to {field_type} section")
-
-            # For split_brush field, store handle/knot mapping
-            elif field_type == "split_brush":
-                logger.debug("Processing split_brush field type")
-                # Extract handle and knot components from the dual-component brush
-                handle_data = result_data.get("handle", {})
-                knot_data = result_data.get("knot", {})
-
-                logger.debug(f"Handle data: {handle_data}")
-                logger.debug(f"Knot data: {knot_data}")
-
-                # Handle both string and dict formats for backward compatibility
-                if isinstance(handle_data, str):
-                    handle_data = {"brand": "Unknown", "model": handle_data}
-                if isinstance(knot_data, str):
-                    knot_data = {"brand": "Unknown", "model": knot_data}
-
-                if handle_data and knot_data:
-                    # Store handle component in handle section
-                    handle_brand = handle_data.get("brand")
-                    handle_model = handle_data.get("model")
+    def apply_operations(self, operations: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Apply many add/remove operations with a single write per affected field file.
 
-                    logger.debug(
-                        f"Processing handle: brand='{handle_brand}', model='{handle_model}'"
-                    )
+        Each operation is a dict with "op" ("add" or "remove"), "input_text",
+        "field_type" (default "brush") and, for adds, "result_data" and
+        "action_type". Any journaled operations are compacted at the same time.
 
-                    if handle_brand and handle_model:
-                        # Ensure handle section exists
-                        if "handle" not in data:
-                            data["handle"] = {}
-                        if handle_brand not in data["handle"]:
-                            data["handle"][handle_brand] = {}
-                        if handle_model not in data["handle"][handle_brand]:
-                            data["handle"][handle_brand][handle_model] = []
-
-                        # Add the original text to handle section if not already present
-                        existing_patterns = data["handle"][handle_brand][handle_model]
-                        if not any(
-                            pattern.lower() == normalized_text for pattern in existing_patterns
-                        ):
-                            existing_patterns.append(original_text)
-                            logger.debug(
-                                f"Added pattern '{original_text}' to "
-                                f"handle/{handle_brand}/{handle_model}"
-                            )
-
-                    # Store knot component in knot section
-                    knot_brand = knot_data.get("brand")
-                    knot_model = knot_data.get("model")
-
-                    logger.debug(f"Processing knot: brand='{knot_brand}', model='{knot_model}'")
-
-                    if knot_brand and knot_model:
-                        # Ensure knot section exists
-                        if "knot" not in data:
-                            data["knot"] = {}
-                        if knot_brand not in data["knot"]:
-                            data["knot"][knot_brand] = {}
-                        if knot_model not in data["knot"][knot_brand]:
-                            data["knot"][knot_brand][knot_model] = []
-
-                        # Add the original text to knot section if not already present
-                        existing_patterns = data["knot"][knot_brand][knot_model]
-                        if not any(
-                            pattern.lower() == normalized_text for pattern in existing_patterns
-                        ):
-                            existing_patterns.append(original_text)
-                            logger.debug(
-                                f"Added pattern '{original_text}' to knot/{knot_brand}/{knot_model}"
-                            )
-                else:
-                    logger.warning(
-                        f"Missing handle or knot data for split_brush: "
-                        f"handle={handle_data}, knot={knot_data}"
-                    )
-                    # Fallback: if we can't extract components, store as regular brush
-                    # This shouldn't happen with proper dual-component data
-                    if "brush" not in data:
-                        data["brush"] = {}
-                    if "dual_component" not in data["brush"]:
-                        data["brush"]["dual_component"] = []
-
-                    existing_patterns = data["brush"]["dual_component"]
-                    if not any(pattern.lower() == normalized_text for pattern in existing_patterns):
-                        existing_patterns.append(original_text)
-                        logger.debug(
-                            f"Added pattern '{original_text}' to brush/dual_component (fallback)"
-                        )
-
-            # Save the updated data
-            # For split_brush, save handle and knot separately (not split_brush field)
-            if field_type == "split_brush":
-                logger.debug("Saving handle and knot sections for split_brush")
-                # Save handle and knot sections separately
-                if "handle" in data:
-                    self.save_correct_matches({"handle": data["handle"]}, "handle")
-                if "knot" in data:
-                    self.save_correct_matches({"knot": data["knot"]}, "knot")
-            else:
-                logger.debug(f"Saving updated correct_matches/{field_type}.yaml")
-                self.save_correct_matches(data, field_type)
-                logger.debug(f"Successfully saved correct_matches/{field_type}.yaml")
+        Args:
+            operations: Operations to apply, in order
 
-        except Exception as e:
-            logger.error(f"Error in add_or_update_entry: {e}")
-            raise
+        Returns:
+            For each operation, whether it found its entry (always True for adds)
+        """
+        with _states_lock:
+            state = self._state()
+            results = []
+            fields = set(state["pending_fields"])
+            for operation in operations:
+                found, affected = self._apply_operation(state["data"], operation)
+                results.append(found)
+                if found:
+                    fields |= affected
+            if fields or state["pending_count"]:
+                self._write_fields(state, fields)
+        return results
+
+    def compact(self) -> None:
+        """Write journaled operations back to the sorted YAML files and clear the journal."""
+        with _states_lock:
+            state = self._state()
+            if state["pending_count"] or self.journal_path.exists():
+                self._write_fields(state, state["pending_fields"])
 
     def save_correct_matches(
         self, data: Optional[Dict[str, Any]] = None, field_type: Optional[str] = None
@@ -302,6 +526,8 @@ class CorrectMatchesUpdater:
         """
         Remove an entry from correct_matches directory.
 
+        The removal is journaled like add_or_update_entry.
+
         Args:
             input_text: The input text to remove
             field_type: Field type to remove from
@@ -309,39 +535,7 @@ class CorrectMatchesUpdater:
         Returns:
             True if entry was removed, False if not found
         """
-        all_data = self.load_correct_matches()
-        data = {field_type: all_data.get(field_type, {})}
-        normalized_text = input_text.lower().strip()
-
-        if field_type not in data:
-            return False
-
-        if field_type == "brush":
-            # Search through brand/model hierarchy with case-insensitive lookup
-            for brand in data[field_type]:
-                for model in data[field_type][brand]:
-                    # Find the actual text (preserving case) to remove
-                    for pattern in data[field_type][brand][model]:
-                        if pattern.lower() == normalized_text:
-                            data[field_type][brand][model].remove(pattern)
-                            # Remove empty model sections
-                            if not data[field_type][brand][model]:
-                                del data[field_type][brand][model]
-                            # Remove empty brand sections
-                            if not data[field_type][brand]:
-                                del data[field_type][brand]
-                            self.save_correct_matches(data, field_type)
-                            return True
-        else:
-            # For flat structures like handle, knot, split_brush
-            # Find the actual key (preserving case) to remove
-            for key in list(data[field_type].keys()):
-                if key.lower() == normalized_text:
-                    del data[field_type][key]
-                    self.save_correct_matches(data, field_type)
-                    return True
-
-        return False
+        return self._journal({"op": "remove", "input_text": input_text, "field_type": field_type})
 
     def get_entry(self, input_text: str, field_type: str = "brush") -> Optional[Dict[str, Any]]:
         """
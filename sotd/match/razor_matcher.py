@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-from .base_matcher import BaseMatcher
+from .base_matcher import BaseMatcher, build_case_insensitive_index
 from .loaders import CatalogLoader
 from .types import MatchResult, MatchType, create_match_result
 from .utils.regex_error_utils import compile_regex_with_context, create_context_dict
@@ -43,11 +43,14 @@ class RazorMatcher(BaseMatcher):
         Returns:
             Dictionary mapping lowercase keys to match data
         """
-        if self._case_insensitive_lookup is not None:
-            return self._case_insensitive_lookup
-
-        lookup = {}
+        if self._case_insensitive_lookup is None:
+            self._case_insensitive_lookup = build_case_insensitive_index(
+                self._iter_correct_match_entries()
+            )
+        return self._case_insensitive_lookup
 
+    def _iter_correct_match_entries(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (correct string, match data) pairs from the correct matches."""
         # Check if correct_matches has a flat structure (key -> dict) or
         # nested structure (brand -> models)
         first_key = next(iter(self.correct_matches.keys()), None)
@@ -57,43 +60,32 @@ class RazorMatcher(BaseMatcher):
             and "brand" in self.correct_matches[first_key]
         ):
             # Flat structure: direct key -> match data
-            for key, match_data in self.correct_matches.items():
-                lookup[key.lower()] = match_data
-        else:
-            # Nested structure: brand -> models -> entries
-            for brand, models in self.correct_matches.items():
-                for model, entries in models.items():
-                    if isinstance(entries, list):
-                        # Simple string list format
-                        for entry in entries:
-                            key = entry.lower()
-                            # Get format from catalog entry
-                            fmt = "DE"  # Default format
-                            if brand in self.catalog and model in self.catalog[brand]:
-                                model_data = self.catalog[brand][model]
-                                if isinstance(model_data, dict):
-                                    fmt = model_data.get("format", "DE")
-                            lookup[key] = {"brand": brand, "model": model, "format": fmt}
-                    elif isinstance(entries, dict):
-                        # Nested format with additional data
-                        strings = entries.get("strings", [])
-                        for entry in strings:
-                            key = entry.lower()
-                            # Get format from catalog entry
-                            fmt = "DE"  # Default format
-                            if brand in self.catalog and model in self.catalog[brand]:
-                                model_data = self.catalog[brand][model]
-                                if isinstance(model_data, dict):
-                                    fmt = model_data.get("format", "DE")
-                            matched_data = {"brand": brand, "model": model, "format": fmt}
-                            # Copy additional fields from the entry
-                            for key_field, val in entries.items():
-                                if key_field != "strings":
-                                    matched_data[key_field] = val
-                            lookup[key] = matched_data
-
-        self._case_insensitive_lookup = lookup
-        return lookup
+            yield from self.correct_matches.items()
+            return
+
+        # Nested structure: brand -> models -> entries
+        for brand, models in self.correct_matches.items():
+            for model, entries in models.items():
+                # Get format from catalog entry
+                fmt = "DE"  # Default format
+                if brand in self.catalog and model in self.catalog[brand]:
+                    model_data = self.catalog[brand][model]
+                    if isinstance(model_data, dict):
+                        fmt = model_data.get("format", "DE")
+
+                if isinstance(entries, list):
+                    # Simple string list format
+                    for entry in entries:
+                        yield entry, {"brand": brand, "model": model, "format": fmt}
+                elif isinstance(entries, dict):
+                    # Nested format with additional data
+                    for entry in entries.get("strings", []):
+                        matched_data = {"brand": brand, "model": model, "format": fmt}
+                        # Copy additional fields from the entry
+                        for key_field, val in entries.items():
+                            if key_field != "strings":
+                                matched_data[key_field] = val
+                        yield entry, matched_data
 
     def _compile_patterns(self):
         compiled = []
@@ -120,6 +112,11 @@ class RazorMatcher(BaseMatcher):
                     compiled.append((brand, model, fmt, pattern, compiled_pattern, entry))
         return sorted(compiled, key=lambda x: len(x[3]), reverse=True)
 
+    def _candidate_patterns(self, text: str) -> list:
+        """Return only the compiled patterns that could match text, in priority order."""
+        index = self._get_pattern_index("patterns", self.patterns, lambda item: item[3])
+        return index.candidates(text)
+
     def _get_normalized_text(self, value: str) -> str:
         """
         Return normalized text directly.
@@ -161,7 +158,9 @@ class RazorMatcher(BaseMatcher):
 
         razor_text = normalized_text
 
-        for brand, model, fmt, raw_pattern, compiled, entry in self.patterns:
+        for brand, model, fmt, raw_pattern, compiled, entry in self._candidate_patterns(
+            razor_text
+        ):
             if compiled.search(razor_text):
                 matched_data = {
                     "brand": brand,
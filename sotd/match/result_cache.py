@@ -0,0 +1,321 @@
+"""
+Persistent on-disk cache of match results.
+
+The same product strings recur every month, so re-matching the full history
+repeats identical work. This cache stores the matcher output for each
+(field, normalized text, context) in a SQLite database under
+``data/.cache/match/`` and keys every entry with a fingerprint of the files
+that can influence that field's result: its catalog(s), its correct_matches
+file(s) and the match code itself. Changing any of those files changes the
+fingerprint, so stale entries are never returned and are pruned on open.
+
+Only the matcher call is cached. Intentionally-unmatched filtering still runs
+before the cache lookup, so ``intentionally_unmatched.yaml`` is not part of
+the fingerprint.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .types import MatchResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload layout changes
+CACHE_SCHEMA_VERSION = 1
+
+CACHE_DIR_NAME = Path(".cache") / "match"
+CACHE_FILE_NAME = "results.sqlite"
+
+# Catalog files (relative to the data directory) that influence each field's matches
+FIELD_CATALOG_FILES: Dict[str, List[str]] = {
+    "razor": ["razors.yaml"],
+    "blade": ["blades.yaml"],
+    "soap": ["soaps.yaml"],
+    "brush": [
+        "brushes.yaml",
+        "handles.yaml",
+        "knots.yaml",
+        "brush_scoring_config.yaml",
+        "brush_splits.yaml",
+    ],
+}
+
+# correct_matches files (relative to the correct_matches directory) for each field
+FIELD_CORRECT_MATCHES_FILES: Dict[str, List[str]] = {
+    "razor": ["razor.yaml"],
+    "blade": ["blade.yaml"],
+    "soap": ["soap.yaml"],
+    "brush": ["brush.yaml", "handle.yaml", "knot.yaml", "split_brush.yaml"],
+}
+
+_code_fingerprint: Optional[str] = None
+
+
+def _hash_file(hasher: Any, path: Path) -> None:
+    """Feed a file's name and contents (or a missing marker) into a hasher."""
+    hasher.update(path.name.encode("utf-8"))
+    if path.is_file():
+        hasher.update(path.read_bytes())
+    else:
+        hasher.update(b"<missing>")
+
+
+def get_code_fingerprint() -> str:
+    """
+    Return a hash of the match and shared utility source code.
+
+    Matching behaviour lives in code as well as in the catalogs, so any code
+    change must invalidate cached results. Computed once per process.
+    """
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        hasher = hashlib.sha256(f"schema:{CACHE_SCHEMA_VERSION}".encode("utf-8"))
+        package_root = Path(__file__).resolve().parent.parent
+        for source_dir in (package_root / "match", package_root / "utils"):
+            for source_file in sorted(source_dir.rglob("*.py")):
+                hasher.update(str(source_file.relative_to(package_root)).encode("utf-8"))
+                hasher.update(source_file.read_bytes())
+        _code_fingerprint = hasher.hexdigest()
+    return _code_fingerprint
+
+
+def compute_field_fingerprint(
+    field: str, data_dir: Path, correct_matches_path: Optional[Path] = None
+) -> str:
+    """
+    Compute the fingerprint of every input that can change a field's match results.
+
+    Args:
+        field: Field name ("razor", "blade", "soap", "brush")
+        data_dir: Data directory containing the catalog YAML files
+        correct_matches_path: correct_matches directory (or legacy single file)
+
+    Returns:
+        Hex digest identifying the current catalog, correct_matches and code state
+    """
+    if correct_matches_path is None:
+        correct_matches_path = data_dir / "correct_matches"
+
+    hasher = hashlib.sha256(f"{field}:{get_code_fingerprint()}".encode("utf-8"))
+    for file_name in FIELD_CATALOG_FILES[field]:
+        _hash_file(hasher, data_dir / file_name)
+    if correct_matches_path.is_file():
+        _hash_file(hasher, correct_matches_path)
+    else:
+        for file_name in FIELD_CORRECT_MATCHES_FILES[field]:
+            _hash_file(hasher, correct_matches_path / file_name)
+    return hasher.hexdigest()
+
+
+class MatchResultCache:
+    """
+    SQLite-backed cache of serialized match results.
+
+    Lookups are served from an in-memory memo first, so identical strings
+    within a month are matched only once, then from SQLite. New results are
+    buffered and written in one transaction by ``flush()`` so parallel month
+    workers do not contend on every record. With ``persistent=False`` only
+    the in-memory memo is used.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        correct_matches_path: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        persistent: bool = True,
+    ):
+        self.data_dir = data_dir
+        self.persistent = persistent
+        self.cache_dir = cache_dir or data_dir / CACHE_DIR_NAME
+        self.cache_path = self.cache_dir / CACHE_FILE_NAME
+        self._memo: Dict[Tuple[str, str, str], Optional[Dict[str, Any]]] = {}
+        self._pending: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self.fingerprints: Dict[str, str] = {}
+        if not persistent:
+            return
+
+        self.fingerprints = {
+            field: compute_field_fingerprint(field, data_dir, correct_matches_path)
+            for field in FIELD_CATALOG_FILES
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.cache_path), timeout=60)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS match_results ("
+            "field TEXT NOT NULL, fingerprint TEXT NOT NULL, context TEXT NOT NULL, "
+            "normalized TEXT NOT NULL, payload TEXT NOT NULL, "
+            "PRIMARY KEY (field, fingerprint, context, normalized))"
+        )
+        self._prune_stale_entries()
+
+    def _prune_stale_entries(self) -> None:
+        """Delete entries whose fingerprint no longer matches the current inputs."""
+        assert self._connection is not None
+        with self._connection:
+            for field, fingerprint in self.fingerprints.items():
+                self._connection.execute(
+                    "DELETE FROM match_results WHERE field = ? AND fingerprint != ?",
+                    (field, fingerprint),
+                )
+
+    @staticmethod
+    def _serialize(result: Optional[MatchResult]) -> Dict[str, Any]:
+        if result is None:
+            # Matchers (e.g. brush) return None for unmatched input; cache that too
+            return {"no_result": True}
+        return {
+            "matched": result.matched,
+            "match_type": result.match_type,
+            "pattern": result.pattern,
+            "strategy": result.strategy,
+        }
+
+    @staticmethod
+    def _deserialize(
+        payload: Dict[str, Any], original: str, normalized: str
+    ) -> Optional[MatchResult]:
+        if payload.get("no_result"):
+            return None
+        return MatchResult(
+            original=original,
+            normalized=normalized,
+            matched=copy.deepcopy(payload["matched"]),
+            match_type=payload["match_type"],
+            pattern=payload["pattern"],
+            strategy=payload["strategy"],
+        )
+
+    def _lookup(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        if key in self._memo:
+            return self._memo[key]
+        if self._connection is None:
+            return None
+        field, context, normalized = key
+        row = self._connection.execute(
+            "SELECT payload FROM match_results "
+            "WHERE field = ? AND fingerprint = ? AND context = ? AND normalized = ?",
+            (field, self.fingerprints[field], context, normalized),
+        ).fetchone()
+        if row is None:
+            return None
+        payload = json.loads(row[0])
+        self._memo[key] = payload
+        return payload
+
+    def get_or_match(
+        self,
+        field: str,
+        normalized: str,
+        original: str,
+        match_fn: Callable[[], Optional[MatchResult]],
+        context: str = "",
+    ) -> Optional[MatchResult]:
+        """
+        Return the cached result for a string, or run the matcher and cache its result.
+
+        Args:
+            field: Field name ("razor", "blade", "soap", "brush")
+            normalized: Normalized text passed to the matcher
+            original: Original text for the returned MatchResult
+            match_fn: Zero-argument callable running the real matcher
+            context: Extra matcher input that affects the result (e.g. razor format)
+
+        Returns:
+            MatchResult with original/normalized set for this record, or None if
+            the matcher returned None
+        """
+        key = (field, context, normalized)
+        payload = self._lookup(key)
+        if payload is not None:
+            self.hits += 1
+            return self._deserialize(payload, original, normalized)
+
+        self.misses += 1
+        result = match_fn()
+        payload = self._store(key, result)
+        if payload is None:
+            return result
+        return self._deserialize(payload, original, normalized)
+
+    def _store(
+        self, key: Tuple[str, str, str], result: Optional[MatchResult]
+    ) -> Optional[Dict[str, Any]]:
+        """Serialize a result into the memo and pending writes; None if unserializable."""
+        try:
+            # Round-trip through JSON so cached and fresh results are identical
+            payload = json.loads(json.dumps(self._serialize(result), ensure_ascii=False))
+        except (TypeError, ValueError):
+            logger.debug(f"Skipping match cache for unserializable {key[0]} result: {key[2]}")
+            return None
+
+        self._memo[key] = payload
+        if self.persistent:
+            self._pending[key] = payload
+        return payload
+
+    def contains(self, field: str, normalized: str, context: str = "") -> bool:
+        """Return True if a result for this key is already available."""
+        return self._lookup((field, context, normalized)) is not None
+
+    def prime(
+        self, field: str, normalized: str, result: Optional[MatchResult], context: str = ""
+    ) -> None:
+        """
+        Add a result computed elsewhere (e.g. in a worker process) to the cache.
+
+        Args:
+            field: Field name ("razor", "blade", "soap", "brush")
+            normalized: Normalized text the result was matched from
+            result: Matcher result (None for no result)
+            context: Extra matcher input that affects the result
+        """
+        self._store((field, context, normalized), result)
+
+    def flush(self) -> None:
+        """Write buffered results to disk in a single transaction."""
+        if not self._pending or self._connection is None:
+            return
+        rows = [
+            (
+                field,
+                self.fingerprints[field],
+                context,
+                normalized,
+                json.dumps(payload, ensure_ascii=False),
+            )
+            for (field, context, normalized), payload in self._pending.items()
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO match_results "
+                "(field, fingerprint, context, normalized, payload) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush pending results and close the database connection."""
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss statistics for performance reporting."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "unique_keys": len(self._memo),
+            "pending": len(self._pending),
+        }
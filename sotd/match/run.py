@@ -4,20 +4,40 @@ import subprocess
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 from sotd.cli_utils.date_span import month_span
 from sotd.match.blade_matcher import BladeMatcher
+from sotd.match.brush.diagnostics import (
+    get_diagnostics_path,
+    load_diagnostics,
+    save_diagnostics,
+    strategy_results_to_json,
+)
 from sotd.match.brush_matcher import BrushMatcher
 from sotd.match.cli import get_parser
+from sotd.match.correct_matches_updater import compact_pending_journal
 from sotd.match.razor_matcher import RazorMatcher
+from sotd.match.result_cache import (
+    FIELD_CATALOG_FILES,
+    FIELD_CORRECT_MATCHES_FILES,
+    MatchResultCache,
+    compute_field_fingerprint,
+)
 from sotd.match.soap_matcher import SoapMatcher
 from sotd.match.types import MatchResult
-from sotd.match.utils import calculate_match_statistics, format_match_statistics_for_display
+from sotd.match.utils import MatchStatisticsCollector, format_match_statistics_for_display
 from sotd.match.utils.performance import PerformanceMonitor
 from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import (
+    json_file_exists,
+    resolve_json_path,
+    set_artifact_compression,
+)
 from sotd.utils.filtered_entries import load_filtered_entries
+from sotd.utils.json_stream import JsonRecordWriter, iter_json_records
 from sotd.utils.logging_config import setup_pipeline_logging
+from sotd.utils.record_hash import IncrementalRun, compute_phase_fingerprint, hash_record_inputs
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +105,20 @@ def is_brush_matched(record: dict) -> bool:
     )
 
 
+def _run_matcher(
+    result_cache: Optional[MatchResultCache],
+    field: str,
+    normalized_text: str,
+    original_text: str,
+    match_fn: Callable[[], Optional[MatchResult]],
+    context: str = "",
+) -> Optional[MatchResult]:
+    """Run a matcher call, going through the persistent result cache when enabled."""
+    if result_cache is None:
+        return match_fn()
+    return result_cache.get_or_match(field, normalized_text, original_text, match_fn, context)
+
+
 def match_record(
     record: dict,
     razor_matcher: RazorMatcher,
@@ -97,6 +131,8 @@ def match_record(
     enable_blade: bool = True,
     enable_soap: bool = True,
     enable_brush: bool = True,
+    result_cache: Optional[MatchResultCache] = None,
+    diagnostics: bool = False,
 ) -> dict:
     result = record.copy()
     filtered_manager = _get_filtered_entries_manager()
@@ -133,7 +169,14 @@ def match_record(
             if debug:
                 logger.debug("    ⏭️  Razor filtered, skipping")
         else:
-            razor_result = razor_matcher.match(normalized_text, result["razor"]["original"])
+            razor_original = result["razor"]["original"]
+            razor_result = _run_matcher(
+                result_cache,
+                "razor",
+                normalized_text,
+                razor_original,
+                lambda: razor_matcher.match(normalized_text, razor_original),
+            )
             # Use MatchResult consistently
             if razor_result is not None and razor_result.matched:
                 # Update the MatchResult to include normalized field
@@ -212,8 +255,16 @@ def match_record(
 
                 # For other formats, use context-aware matching to ensure correct format
                 else:
-                    blade_result = blade_matcher.match_with_context(
-                        normalized_text, razor_format, result["blade"]["original"]
+                    blade_original = result["blade"]["original"]
+                    blade_result = _run_matcher(
+                        result_cache,
+                        "blade",
+                        normalized_text,
+                        blade_original,
+                        lambda: blade_matcher.match_with_context(
+                            normalized_text, razor_format, blade_original
+                        ),
+                        context=f"razor_format:{razor_format}",
                     )
                     # Update the MatchResult to include normalized field
                     if blade_result is not None:
@@ -259,8 +310,16 @@ def match_record(
                             logger.debug(f"    ⏭️  Blade irrelevant for {razor_format}")
                     else:
                         # For other formats, use context-aware matching to ensure correct format
-                        blade_result = blade_matcher.match_with_context(
-                            normalized_text, razor_format, result["blade"]["original"]
+                        blade_original = result["blade"]["original"]
+                        blade_result = _run_matcher(
+                            result_cache,
+                            "blade",
+                            normalized_text,
+                            blade_original,
+                            lambda: blade_matcher.match_with_context(
+                                normalized_text, razor_format, blade_original
+                            ),
+                            context=f"razor_format:{razor_format}",
                         )
                         result["blade"] = blade_result
                         if debug:
@@ -272,7 +331,14 @@ def match_record(
                                 logger.debug("    ❌ Blade no match")
                 else:
                     # No razor context, use basic matching
-                    blade_result = blade_matcher.match(normalized_text, result["blade"]["original"])
+                    blade_original = result["blade"]["original"]
+                    blade_result = _run_matcher(
+                        result_cache,
+                        "blade",
+                        normalized_text,
+                        blade_original,
+                        lambda: blade_matcher.match(normalized_text, blade_original),
+                    )
                     result["blade"] = blade_result
                     if debug:
                         if blade_result and blade_result.matched:
@@ -304,7 +370,14 @@ def match_record(
             if debug:
                 logger.debug("    ⏭️  Soap filtered, skipping")
         else:
-            soap_result = soap_matcher.match(normalized_text, result["soap"]["original"])
+            soap_original = result["soap"]["original"]
+            soap_result = _run_matcher(
+                result_cache,
+                "soap",
+                normalized_text,
+                soap_original,
+                lambda: soap_matcher.match(normalized_text, soap_original),
+            )
             result["soap"] = soap_result
             if debug:
                 if soap_result and soap_result.matched:
@@ -338,7 +411,15 @@ def match_record(
         else:
             if debug:
                 logger.debug("    🎯 Running brush matcher strategies...")
-            brush_result = brush_matcher.match(normalized_text, result["brush"]["original"])
+            brush_original = result["brush"]["original"]
+            # Cached results keep no strategy list, so diagnostics match every brush afresh
+            brush_result = _run_matcher(
+                None if diagnostics else result_cache,
+                "brush",
+                normalized_text,
+                brush_original,
+                lambda: brush_matcher.match(normalized_text, brush_original),
+            )
             # Convert MatchResult to dict for consistency
             if brush_result is not None:
                 result["brush"] = {
@@ -348,6 +429,9 @@ def match_record(
                     "match_type": brush_result.match_type,
                     "pattern": brush_result.pattern,
                 }
+                if diagnostics:
+                    # Moved to the diagnostics side file by process_month
+                    result["brush"]["all_strategies"] = brush_result.all_strategies
                 if debug:
                     if brush_result.matched:
                         brand = brush_result.matched.get("brand", "Unknown")
@@ -373,6 +457,212 @@ def match_record(
     return result
 
 
+def _create_matchers(
+    base_path: Path, correct_matches_path: Path, debug: bool = False
+) -> tuple[RazorMatcher, BladeMatcher, SoapMatcher, BrushMatcher]:
+    """Create the four field matchers using catalogs from the data directory."""
+    blade_matcher = BladeMatcher(
+        catalog_path=base_path / "blades.yaml", correct_matches_path=correct_matches_path
+    )
+
+    # Initialize brush matcher using the new multi-strategy scoring system
+    brush_matcher = BrushMatcher(
+        correct_matches_path=correct_matches_path,
+        brushes_path=base_path / "brushes.yaml",
+        handles_path=base_path / "handles.yaml",
+        knots_path=base_path / "knots.yaml",
+        brush_scoring_config_path=base_path / "brush_scoring_config.yaml",
+        debug=debug,
+    )
+
+    razor_matcher = RazorMatcher(
+        catalog_path=base_path / "razors.yaml", correct_matches_path=correct_matches_path
+    )
+    soap_matcher = SoapMatcher(
+        catalog_path=base_path / "soaps.yaml", correct_matches_path=correct_matches_path
+    )
+    return razor_matcher, blade_matcher, soap_matcher, brush_matcher
+
+
+# Matchers built in this process, keyed by (data dir, correct_matches path, debug).
+# Worker processes handle several months, so catalogs are loaded and compiled once
+# per worker instead of once per month.
+_matcher_cache: dict[tuple[str, str, bool], tuple[tuple, tuple]] = {}
+
+
+def _matcher_inputs_signature(base_path: Path, correct_matches_path: Path) -> tuple:
+    """Return (path, mtime, size) for every catalog and correct_matches file."""
+    paths = sorted({base_path / name for names in FIELD_CATALOG_FILES.values() for name in names})
+    if correct_matches_path.is_dir():
+        paths += sorted(
+            {
+                correct_matches_path / name
+                for names in FIELD_CORRECT_MATCHES_FILES.values()
+                for name in names
+            }
+        )
+    else:
+        paths.append(correct_matches_path)
+
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def _get_matchers(
+    base_path: Path, correct_matches_path: Path, debug: bool = False
+) -> tuple[RazorMatcher, BladeMatcher, SoapMatcher, BrushMatcher]:
+    """
+    Return matchers for a data directory, reusing ones already built in this process.
+
+    Matchers are rebuilt when any catalog or correct_matches file has changed on disk
+    since they were created.
+    """
+    key = (str(base_path), str(correct_matches_path), debug)
+    signature = _matcher_inputs_signature(base_path, correct_matches_path)
+    cached = _matcher_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    matchers = _create_matchers(base_path, correct_matches_path, debug)
+    _matcher_cache[key] = (signature, matchers)
+    return matchers
+
+
+def _init_month_worker(base_path: Path, debug: bool) -> None:
+    """Load catalogs and build matchers once when a month worker process starts."""
+    _get_matchers(base_path, base_path / "correct_matches", debug)
+
+
+# Fields whose matcher input is the normalized string alone. Blade matching also
+# depends on the razor result, so blades are deduplicated during the fan-out instead.
+CONTEXT_FREE_FIELDS = ("razor", "soap", "brush")
+
+
+def _collect_unique_match_keys(
+    records: Iterable[dict],
+    result_cache: MatchResultCache,
+    fields: Sequence[str] = CONTEXT_FREE_FIELDS,
+) -> dict[str, list[tuple[str, str]]]:
+    """
+    Collect the unique normalized strings per field that still need matching.
+
+    Filtered strings and strings already present in the result cache are skipped.
+
+    Returns:
+        Mapping of field to (normalized, first original) pairs in record order
+    """
+    filtered_manager = _get_filtered_entries_manager()
+    unique: dict[str, dict[str, str]] = {field: {} for field in fields}
+    for record in records:
+        for field in fields:
+            value = record.get(field)
+            if not isinstance(value, dict) or "normalized" not in value:
+                continue
+            normalized_text = str(value["normalized"])
+            if normalized_text in unique[field]:
+                continue
+            if filtered_manager.is_filtered(field, normalized_text):
+                continue
+            if result_cache.contains(field, normalized_text):
+                continue
+            unique[field][normalized_text] = str(value.get("original", normalized_text))
+    return {field: list(keys.items()) for field, keys in unique.items()}
+
+
+# Matchers owned by a match worker process (see _init_match_worker)
+_worker_matchers: Optional[dict[str, Any]] = None
+
+
+def _init_match_worker(base_path: Path, correct_matches_path: Path, debug: bool) -> None:
+    """Build the matchers once per worker process."""
+    global _worker_matchers
+    razor_matcher, _blade_matcher, soap_matcher, brush_matcher = _get_matchers(
+        base_path, correct_matches_path, debug
+    )
+    # Pre-matched results keep no strategy list, so losing brush strategies are skipped
+    brush_matcher.full_evaluation = False
+    _worker_matchers = {"razor": razor_matcher, "soap": soap_matcher, "brush": brush_matcher}
+
+
+def _match_unique_chunk(
+    field: str, keys: list[tuple[str, str]]
+) -> list[tuple[str, Optional[MatchResult]]]:
+    """Match a chunk of unique (normalized, original) strings inside a worker process."""
+    assert _worker_matchers is not None, "match worker was not initialized"
+    matcher = _worker_matchers[field]
+    return [
+        (normalized_text, matcher.match(normalized_text, original))
+        for normalized_text, original in keys
+    ]
+
+
+def _prematch_unique_keys(
+    records: Iterable[dict],
+    result_cache: MatchResultCache,
+    base_path: Path,
+    correct_matches_path: Path,
+    debug: bool,
+    match_workers: int,
+    fields: Sequence[str] = CONTEXT_FREE_FIELDS,
+) -> None:
+    """Match each unique razor/soap/brush string once across a process pool."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    unique = _collect_unique_match_keys(records, result_cache, fields)
+    total = sum(len(keys) for keys in unique.values())
+    if total == 0:
+        return
+
+    chunk_size = max(1, total // (match_workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=match_workers,
+        initializer=_init_match_worker,
+        initargs=(base_path, correct_matches_path, debug),
+    ) as executor:
+        futures = [
+            (field, executor.submit(_match_unique_chunk, field, keys[start : start + chunk_size]))
+            for field, keys in unique.items()
+            for start in range(0, len(keys), chunk_size)
+        ]
+        for field, future in futures:
+            for normalized_text, result in future.result():
+                result_cache.prime(field, normalized_text, result)
+
+    if debug:
+        logger.debug(f"Pre-matched {total} unique strings across {match_workers} workers")
+
+
+def _match_fingerprint(
+    base_path: Path, correct_matches_path: Path, diagnostics: bool = False
+) -> str:
+    """Return the incremental fingerprint: every field's match fingerprint plus filters."""
+    field_fingerprints: dict[str, Any] = {
+        field: compute_field_fingerprint(field, base_path, correct_matches_path)
+        for field in FIELD_CATALOG_FILES
+    }
+    if diagnostics:
+        # Records matched without diagnostics have none to carry over
+        field_fingerprints["diagnostics"] = True
+    return compute_phase_fingerprint(
+        (),
+        [_get_filtered_entries_manager().file_path],
+        extra=json.dumps(field_fingerprints, sort_keys=True),
+    )
+
+
+def save_matched_output(output_path: Path, output: dict) -> Path:
+    """Save a matched document returned by process_month with write_output=False."""
+    with JsonRecordWriter(output_path) as writer:
+        writer.write_many(output["data"])
+        return writer.commit(before={"metadata": output["metadata"]})
+
+
 def process_month(
     month: str,
     base_path: Path,
@@ -380,8 +670,35 @@ def process_month(
     debug: bool = False,
     max_workers: int = 1,
     correct_matches_path: Optional[Path] = None,
+    use_match_cache: bool = False,
+    match_workers: int = 1,
+    incremental: bool = False,
+    records: Optional[Sequence[dict]] = None,
+    write_output: bool = True,
+    diagnostics: bool = False,
 ) -> dict:
-    """Process a single month of data."""
+    """Process a single month of data.
+
+    Each unique (field, normalized, razor-format context) key is matched once and the
+    result is reused for every record with that key. When use_match_cache is True,
+    results are also read from and written to the persistent result cache under
+    data/.cache/match/. When match_workers > 1, unique razor, soap and brush strings
+    are matched up front across a process pool. When incremental is True, records
+    whose extracted data is unchanged (under unchanged catalogs, correct_matches and
+    code) are copied from the existing output instead of being matched again.
+
+    ``records`` supplies the extracted records in memory instead of reading
+    extracted/YYYY-MM.json. With ``write_output=False`` nothing is written and the
+    matched document ({"metadata": ..., "data": [...]}) is returned under "output".
+
+    Brush strategy results (``all_strategies``) are not stored in the matched records.
+    With ``diagnostics=True`` they are written to the month's diagnostics side file
+    (see sotd.match.brush.diagnostics); otherwise any existing side file is removed.
+    Cached brush results carry no strategy list, so with ``diagnostics=True`` brushes
+    are matched without the result cache.
+    """
+    result_cache: Optional[MatchResultCache] = None
+    writer: Optional[JsonRecordWriter] = None
     try:
         # Initialize performance monitor
         monitor = PerformanceMonitor("match", max_workers)
@@ -394,72 +711,110 @@ def process_month(
 
         # Load extracted data
         extracted_path = base_path / "extracted" / f"{month}.json"
-        if not extracted_path.exists():
+        if records is None and not json_file_exists(extracted_path):
             return {
                 "status": "error",
                 "month": month,
                 "error": f"Missing input file: {extracted_path}. Run extract phase first.",
             }
 
-        # Check if output already exists and force is not set
-        if data_manager.file_exists(month) and not force:
+        # Check if output already exists and force is not set (incremental runs
+        # always refresh the month, reusing unchanged records)
+        if data_manager.file_exists(month) and not force and not incremental:
             return {"status": "skipped", "month": month, "reason": "output exists"}
 
-        # Load data
-        monitor.start_file_io_timing()
-        with open(extracted_path) as f:
-            data = json.load(f)
-        monitor.end_file_io_timing()
-
         # Initialize matchers with catalog paths based on base_path
         monitor.start_processing_timing()
-        # Use base_path to construct catalog paths (base_path is the data directory)
-        blades_path = base_path / "blades.yaml"
-        razors_path = base_path / "razors.yaml"
-        soaps_path = base_path / "soaps.yaml"
-        brushes_path = base_path / "brushes.yaml"
-        handles_path = base_path / "handles.yaml"
-        knots_path = base_path / "knots.yaml"
-        brush_scoring_config_path = base_path / "brush_scoring_config.yaml"
 
         # Use base_path for correct_matches if not explicitly provided
         if correct_matches_path is None:
             correct_matches_path = base_path / "correct_matches"
 
-        blade_matcher = BladeMatcher(
-            catalog_path=blades_path, correct_matches_path=correct_matches_path
-        )
+        # Validation entries journaled by the webui/CLI must be in the YAML files
+        # before the matchers (and their fingerprints) read them
+        compact_pending_journal(correct_matches_path)
 
-        # Initialize brush matcher using the new multi-strategy scoring system
-        brush_matcher = BrushMatcher(
-            correct_matches_path=correct_matches_path,
-            brushes_path=brushes_path,
-            handles_path=handles_path,
-            knots_path=knots_path,
-            brush_scoring_config_path=brush_scoring_config_path,
-            debug=debug,
+        razor_matcher, blade_matcher, soap_matcher, brush_matcher = _get_matchers(
+            base_path, correct_matches_path, debug
         )
+        # Matchers are reused across months; the component memo (and its stats) is per month
+        brush_matcher.component_cache.clear()
+        # Brush strategies that cannot win are skipped unless their results are wanted
+        brush_matcher.full_evaluation = diagnostics
+
+        incremental_run = None
+        if incremental:
+            incremental_run = IncrementalRun(
+                _match_fingerprint(base_path, correct_matches_path, diagnostics),
+                data_manager.get_output_path(month),
+                meta_key="metadata",
+            )
 
-        razor_matcher = RazorMatcher(
-            catalog_path=razors_path, correct_matches_path=correct_matches_path
-        )
-        soap_matcher = SoapMatcher(
-            catalog_path=soaps_path, correct_matches_path=correct_matches_path
+        # Identical strings are matched once per month (and across months when the
+        # persistent cache is enabled), then fanned back out to every record
+        result_cache = MatchResultCache(
+            base_path, correct_matches_path=correct_matches_path, persistent=use_match_cache
         )
 
-        # Process records
-        records = data.get("data", [])
-        monitor.set_record_count(len(records))
+        def input_records() -> Iterable[dict]:
+            return iter_json_records(extracted_path) if records is None else records
+
+        if match_workers > 1:
+            records_to_match: Iterable[dict] = input_records()
+            if incremental_run is not None:
+                current = incremental_run
+                records_to_match = (
+                    record
+                    for record in records_to_match
+                    if not current.is_current(record.get("id"), hash_record_inputs(record))
+                )
+            _prematch_unique_keys(
+                records_to_match,
+                result_cache,
+                base_path,
+                correct_matches_path,
+                debug,
+                match_workers,
+                # Diagnostics match brushes in this process to keep their strategy lists
+                [field for field in CONTEXT_FREE_FIELDS if not (diagnostics and field == "brush")],
+            )
+
+        # Stream records from the extracted file and write each matched record as it is
+        # produced, so memory is bounded by one record rather than the whole month
+        matched_records: list[dict] = []
+        if write_output:
+            data_manager.create_directories()
+            writer = JsonRecordWriter(data_manager.get_output_path(month))
+            write: Callable[[dict], None] = writer.write
+        else:
+            write = matched_records.append
+        statistics_collector = MatchStatisticsCollector()
+
+        # Brush strategy results by comment ID, for the diagnostics side file
+        diagnostics_path = get_diagnostics_path(base_path, month)
+        brush_diagnostics: Optional[dict[str, list]] = {} if diagnostics else None
+        previous_diagnostics: dict[str, list] = {}
+        if brush_diagnostics is not None and incremental_run is not None:
+            previous_diagnostics = load_diagnostics(diagnostics_path)
 
         if debug:
-            logger.debug(f"🎯 Processing {len(records)} records...")
+            logger.debug("🎯 Processing records...")
 
-        for i, record in enumerate(records):
+        for i, record in enumerate(input_records()):
             if debug:
-                logger.debug(f"\n📝 Record {i + 1}/{len(records)}")
+                logger.debug(f"\n📝 Record {i + 1}")
                 comment_id = record.get("comment_id", "unknown")
                 logger.debug(f"   Comment ID: {comment_id}")
 
+            if incremental_run is not None:
+                previous = incremental_run.reuse(record.get("id"), hash_record_inputs(record))
+                if previous is not None:
+                    write(previous)
+                    statistics_collector.add(previous)
+                    if brush_diagnostics is not None and record.get("id") in previous_diagnostics:
+                        brush_diagnostics[record["id"]] = previous_diagnostics[record["id"]]
+                    continue
+
             # Use the match_record function that includes blade clearing logic
             matched_record = match_record(
                 record,
@@ -473,7 +828,17 @@ def process_month(
                 enable_blade=True,
                 enable_soap=True,
                 enable_brush=True,
+                result_cache=result_cache,
+                diagnostics=diagnostics,
             )
+            # Brush strategy scoring results go to the diagnostics side file
+            brush_value = matched_record.get("brush")
+            if isinstance(brush_value, dict):
+                all_strategies = brush_value.pop("all_strategies", None)
+            else:
+                all_strategies = getattr(brush_value, "all_strategies", None)
+            if brush_diagnostics is not None and all_strategies is not None and record.get("id"):
+                brush_diagnostics[record["id"]] = strategy_results_to_json(all_strategies)
             # Convert MatchResult objects to dicts for JSON serialization
             converted_record = {}
             for key, value in matched_record.items():
@@ -507,51 +872,51 @@ def process_month(
                     if strategy is not None:
                         base_fields["strategy"] = strategy
 
-                    # Add brush-specific strategy scoring fields only for brush records
-                    if key == "brush":
-                        base_fields.update(
-                            {
-                                "all_strategies": getattr(value, "all_strategies", None),
-                            }
-                        )
-
                     converted_record[key] = base_fields
                 else:
                     converted_record[key] = value
-            # Update the record in the list
-            records[i] = converted_record
+            write(converted_record)
+            statistics_collector.add(converted_record)
 
+        record_count = writer.record_count if writer is not None else len(matched_records)
+        monitor.set_record_count(record_count)
         monitor.end_processing_timing()
 
         # Record cache statistics
         brush_cache_stats = brush_matcher.get_cache_stats()
         monitor.record_cache_stats("brush_matcher", brush_cache_stats)
+        component_match_stats = brush_cache_stats.get("component_matches")
+        if component_match_stats is not None:
+            monitor.record_cache_stats("brush_component_matches", component_match_stats)
+        result_cache.flush()
+        monitor.record_cache_stats("match_result_cache", result_cache.stats())
 
         # Calculate enhanced match statistics
-        match_statistics = calculate_match_statistics(records)
+        match_statistics = statistics_collector.result()
 
-        # Save results using parallel data manager
+        # Write metadata ahead of the streamed records and move the file into place
         monitor.start_file_io_timing()
-
-        data_manager.create_directories()
-
-        output_data = {
-            "metadata": {
-                "month": month,
-                "matched_at": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
-                "record_count": len(records),
-                "performance": monitor.get_summary(),
-                "match_statistics": match_statistics,
-            },
-            "data": records,
+        metadata = {
+            "month": month,
+            "matched_at": datetime.utcnow().replace(tzinfo=timezone.utc).isoformat(),
+            "record_count": record_count,
+            "performance": monitor.get_summary(),
+            "match_statistics": match_statistics,
         }
-
-        output_path = data_manager.save_data(month, output_data)
+        if incremental_run is not None:
+            metadata.update(incremental_run.meta())
+            logger.info("%s: %s", month, incremental_run.summary())
+        if writer is not None:
+            output_path = writer.commit(before={"metadata": metadata})
+            if debug:
+                logger.debug(f"Saved data to: {output_path}")
+        if brush_diagnostics is not None:
+            save_diagnostics(diagnostics_path, brush_diagnostics)
+        else:
+            # Diagnostics from an earlier run no longer describe this month's records
+            diagnostics_path.unlink(missing_ok=True)
         monitor.end_file_io_timing()
 
-        if debug:
-            logger.debug(f"Saved data to: {output_path}")
-
         # End timing and get performance summary
         monitor.end_total_timing()
         performance = monitor.get_summary()
@@ -568,12 +933,15 @@ def process_month(
 
             sys.stdout.flush()
 
-        return {
+        result = {
             "status": "completed",
             "month": month,
-            "records_processed": len(records),
+            "records_processed": record_count,
             "performance": performance,
         }
+        if not write_output:
+            result["output"] = {"metadata": metadata, "data": matched_records}
+        return result
 
     except Exception as e:
         # Provide more detailed error information for debugging
@@ -609,16 +977,28 @@ def process_month(
             "month": month,
             "error": error_msg,
         }
+    finally:
+        if writer is not None:
+            writer.abort()
+        if result_cache is not None:
+            result_cache.close()
 
 
 def run_match(args):
     base_path = get_data_dir(args.data_dir)
     months = list(month_span(args))
+    set_artifact_compression(getattr(args, "compress", "none"))
 
     # Create parallel processor for match phase
     from sotd.utils.parallel_processor import create_parallel_processor
 
     processor = create_parallel_processor("match")
+    use_match_cache = not getattr(args, "no_match_cache", False)
+    # Month-level workers already use every core, so the per-month pool only
+    # applies to sequential runs
+    match_workers = getattr(args, "match_workers", 1) or 1
+    incremental = getattr(args, "incremental", False)
+    diagnostics = getattr(args, "diagnostics", False)
 
     # Determine if we should use parallel processing
     use_parallel = processor.should_use_parallel(months, args, args.debug)
@@ -631,9 +1011,21 @@ def run_match(args):
         results = processor.process_months_parallel(
             months,
             _process_month_for_parallel,
-            (base_path, args.force, args.debug, max_workers, None),
+            (
+                base_path,
+                args.force,
+                args.debug,
+                max_workers,
+                None,
+                use_match_cache,
+                1,
+                incremental,
+                diagnostics,
+            ),
             max_workers,
             "Processing",
+            initializer=_init_month_worker,
+            initargs=(base_path, args.debug),
         )
 
         # Print parallel processing summary
@@ -644,7 +1036,16 @@ def run_match(args):
         results = processor.process_months_sequential(
             months,
             _process_month_for_sequential,
-            (base_path, args.force, args.debug, None),
+            (
+                base_path,
+                args.force,
+                args.debug,
+                None,
+                use_match_cache,
+                match_workers,
+                incremental,
+                diagnostics,
+            ),
             "Months",
         )
 
@@ -678,10 +1079,25 @@ def _process_month_for_parallel(
     debug: bool,
     max_workers: int,
     correct_matches_path: Optional[Path],
+    use_match_cache: bool = False,
+    match_workers: int = 1,
+    incremental: bool = False,
+    diagnostics: bool = False,
 ) -> dict:
     """Process a single month for parallel processing."""
     month_str = f"{year:04d}-{month:02d}"
-    return process_month(month_str, base_path, force, debug, max_workers, correct_matches_path)
+    return process_month(
+        month_str,
+        base_path,
+        force,
+        debug,
+        max_workers,
+        correct_matches_path,
+        use_match_cache,
+        match_workers,
+        incremental,
+        diagnostics=diagnostics,
+    )
 
 
 def _process_month_for_sequential(
@@ -691,19 +1107,38 @@ def _process_month_for_sequential(
     force: bool,
     debug: bool,
     correct_matches_path: Optional[Path],
+    use_match_cache: bool = False,
+    match_workers: int = 1,
+    incremental: bool = False,
+    diagnostics: bool = False,
 ) -> dict:
     """Process a single month for sequential processing."""
     month_str = f"{year:04d}-{month:02d}"
-    return process_month(month_str, base_path, force, debug, 1, correct_matches_path)
+    return process_month(
+        month_str,
+        base_path,
+        force,
+        debug,
+        1,
+        correct_matches_path,
+        use_match_cache,
+        match_workers,
+        incremental,
+        diagnostics=diagnostics,
+    )
 
 
 def run_analysis(args):
     data_dir = get_data_dir(args.data_dir)
     for year, month in month_span(args):
         matched_path = data_dir / "matched" / f"{year:04d}-{month:02d}.json"
-        if matched_path.exists():
+        if json_file_exists(matched_path):
             subprocess.run(
-                ["python", "sotd/match/tools/analyze_unmatched_razors.py", str(matched_path)],
+                [
+                    "python",
+                    "sotd/match/tools/analyze_unmatched_razors.py",
+                    str(resolve_json_path(matched_path)),
+                ],
                 check=True,
             )
         elif args.debug:
@@ -9,6 +9,8 @@ import json
 from pathlib import Path
 from typing import Any, Dict
 
+from sotd.utils.file_io import iter_json_files, json_file_exists, open_json_text
+
 
 class SimpleDataManager:
     """
@@ -81,10 +83,10 @@ class SimpleDataManager:
         """
         file_path = self.get_output_path(month)
 
-        if not file_path.exists():
+        if not json_file_exists(file_path):
             raise FileNotFoundError(f"Data file not found: {file_path}")
 
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open_json_text(file_path) as f:
             return json.load(f)
 
     def file_exists(self, month: str) -> bool:
@@ -98,7 +100,7 @@ class SimpleDataManager:
             True if file exists, False otherwise
         """
         file_path = self.get_output_path(month)
-        return file_path.exists()
+        return json_file_exists(file_path)
 
     def get_metadata(self, month: str) -> Dict[str, Any]:
         """
@@ -125,7 +127,7 @@ class SimpleDataManager:
         """
         months = []
         if self.matched_dir.exists():
-            for file_path in self.matched_dir.glob("*.json"):
+            for file_path in iter_json_files(self.matched_dir):
                 month = file_path.stem
                 if month and len(month) == 7 and month[4] == "-":  # YYYY-MM format
                     months.append(month)
@@ -13,7 +13,7 @@ from sotd.utils.catalog_validator import validate_patterns_format
 from sotd.utils.extract_normalization import strip_trailing_periods
 from sotd.utils.yaml_loader import load_yaml_with_nfc
 
-from .base_matcher import BaseMatcher
+from .base_matcher import BaseMatcher, build_case_insensitive_index
 from .types import MatchResult, MatchType, create_match_result
 from .utils.regex_error_utils import compile_regex_with_context, create_context_dict
 
@@ -74,25 +74,21 @@ class SoapMatcher(BaseMatcher):
         if self._case_insensitive_lookup is not None:
             return self._case_insensitive_lookup
 
-        lookup = {}
-
         # Handle both direct structure and nested "soap" structure
         correct_matches_data = self.correct_matches
         if "soap" in self.correct_matches:
             correct_matches_data = self.correct_matches["soap"]
 
-        for brand, brand_data in correct_matches_data.items():
-            if not isinstance(brand_data, dict):
-                continue
-            for scent, strings in brand_data.items():
-                if not isinstance(strings, list):
-                    continue
-                for correct_string in strings:
-                    key = self._normalize_common_text(correct_string).lower()
-                    lookup[key] = {"brand": brand, "scent": scent}
-
-        self._case_insensitive_lookup = lookup
-        return lookup
+        entries = (
+            (self._normalize_common_text(correct_string), {"brand": brand, "scent": scent})
+            for brand, brand_data in correct_matches_data.items()
+            if isinstance(brand_data, dict)
+            for scent, strings in brand_data.items()
+            if isinstance(strings, list)
+            for correct_string in strings
+        )
+        self._case_insensitive_lookup = build_case_insensitive_index(entries)
+        return self._case_insensitive_lookup
 
     def _is_sample(self, text: str) -> bool:
         """Check if text contains sample indicators."""
@@ -201,6 +197,20 @@ class SoapMatcher(BaseMatcher):
         brand_compiled = sorted(brand_compiled, key=lambda x: len(x["pattern"]), reverse=True)
         return scent_compiled, brand_compiled
 
+    def _candidate_patterns(self, name: str, text: str) -> list:
+        """
+        Return only the compiled patterns from a pattern list that could match text.
+
+        Args:
+            name: Pattern list attribute ("scent_patterns" or "brand_patterns")
+            text: Text the patterns will be searched against
+
+        Returns:
+            Candidate pattern dictionaries in priority order
+        """
+        index = self._get_pattern_index(name, getattr(self, name), lambda item: item["pattern"])
+        return index.candidates(text)
+
     def _match_with_regex(self, normalized_text: str, original_text: str) -> MatchResult:
         """Match using regex patterns with REGEX match type."""
         # Check cache first - ensure cache key is always a string
@@ -282,7 +292,7 @@ class SoapMatcher(BaseMatcher):
         return result
 
     def _match_scent_pattern(self, original: str, normalized: str) -> Optional[dict]:
-        for pattern_info in self.scent_patterns:
+        for pattern_info in self._candidate_patterns("scent_patterns", normalized):
             if pattern_info["regex"].search(normalized):
                 matched = {"brand": pattern_info["brand"], "scent": pattern_info["scent"]}
                 # Include countable flag if present (defaults to True if not specified)
@@ -298,7 +308,7 @@ class SoapMatcher(BaseMatcher):
         return None
 
     def _match_brand_pattern(self, original: str, normalized: str) -> Optional[dict]:
-        for pattern_info in self.brand_patterns:
+        for pattern_info in self._candidate_patterns("brand_patterns", normalized):
             match = pattern_info["regex"].search(normalized)
             if match:
                 start, end = match.span()
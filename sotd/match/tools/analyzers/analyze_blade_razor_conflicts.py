@@ -32,6 +32,7 @@ if __name__ == "__main__":
     sys.path.insert(0, str(project_root))
 
 from sotd.cli_utils.date_span import month_span
+from sotd.utils.file_io import json_file_exists, open_json_text
 
 # Define compatible format combinations
 # Key: blade format, Value: list of compatible razor formats
@@ -131,7 +132,7 @@ def process_file(filepath: Path) -> None:
     """Process a single matched data file."""
     global stats, conflict_examples, acceptable_conflict_examples
 
-    with filepath.open("r", encoding="utf-8") as f:
+    with open_json_text(filepath) as f:
         try:
             obj = json.load(f)
             records = obj.get("data", [])
@@ -244,7 +245,7 @@ def get_files_for_months(months: List[Tuple[int, int]]) -> List[Path]:
     for year, month in months:
         filename = f"{year:04d}-{month:02d}.json"
         filepath = matched_dir / filename
-        if filepath.exists():
+        if json_file_exists(filepath):
             files.append(filepath)
         else:
             print(f"Warning: File not found: {filepath}")
@@ -29,6 +29,7 @@ if __name__ == "__main__":
     sys.path.insert(0, str(project_root))
 
 from sotd.cli_utils.date_span import month_span
+from sotd.utils.file_io import json_file_exists, open_json_text
 
 # Regex to match 'accu' at the start of a word, case-insensitive
 accu_regex = re.compile(r"accu.*\b", re.IGNORECASE)
@@ -75,7 +76,7 @@ def process_file(filepath: Path) -> None:
     global personna_total, personna_accu, accu_de_with_gem_razor, accu_de_total
     global accuforge_total, accuforge_de_with_de_razor, accuforge_de_with_gem_razor
 
-    with filepath.open("r", encoding="utf-8") as f:
+    with open_json_text(filepath) as f:
         try:
             obj = json.load(f)
             records = obj.get("data", [])
@@ -157,7 +158,7 @@ def get_files_for_months(months: list[tuple[int, int]]) -> list[Path]:
     for year, month in months:
         filename = f"{year:04d}-{month:02d}.json"
         filepath = matched_dir / filename
-        if filepath.exists():
+        if json_file_exists(filepath):
             files.append(filepath)
         else:
             print(f"Warning: File not found: {filepath}")
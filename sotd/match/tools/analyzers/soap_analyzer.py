@@ -15,6 +15,7 @@ if str(project_root) not in sys.path:
 from sotd.cli_utils.base_parser import BaseCLIParser  # noqa: E402
 from sotd.cli_utils.date_span import month_span  # noqa: E402
 from sotd.match.soap_matcher import analyze_soap_matches  # noqa: E402
+from sotd.utils.file_io import json_file_exists, open_json_text  # noqa: E402
 
 
 class SoapAnalyzer:
@@ -85,9 +86,9 @@ class SoapAnalyzer:
         all_matches = []
         for month in months:
             file_path = input_dir / f"{month}.json"
-            if not file_path.exists():
+            if not json_file_exists(file_path):
                 continue
-            with open(file_path, "r", encoding="utf-8") as f:
+            with open_json_text(file_path) as f:
                 content = json.load(f)
                 for record in content.get("data", []):
                     soap = record.get("soap")
@@ -105,9 +106,9 @@ class SoapAnalyzer:
         records = []
         for year, month in months:
             filename = out_dir / f"{year:04d}-{month:02d}.json"
-            if not filename.exists():
+            if not json_file_exists(filename):
                 continue
-            with filename.open("r", encoding="utf-8") as f:
+            with open_json_text(filename) as f:
                 data = json.load(f).get("data", [])
                 for record in data:
                     record["source_file"] = f"{year:04d}-{month:02d}.json"
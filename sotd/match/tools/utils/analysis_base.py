@@ -12,6 +12,7 @@ from rich.table import Table
 
 from sotd.cli_utils.base_parser import BaseCLIParser
 from sotd.cli_utils.date_span import month_span
+from sotd.utils.file_io import json_file_exists, open_json_text
 
 
 def extract_text(field_data: Any, field: str = "") -> str:
@@ -62,11 +63,11 @@ class AnalysisTool(ABC):
 
         for year, month in month_span(args):
             path = Path(args.out_dir) / "matched" / f"{year:04d}-{month:02d}.json"
-            if path.exists():
+            if json_file_exists(path):
                 if args.debug:
                     print(f"Loading: {path}")
 
-                with path.open("r", encoding="utf-8") as f:
+                with open_json_text(path) as f:
                     content = json.load(f)
                 data = content.get("data", [])
 
@@ -110,11 +111,11 @@ class AnalysisTool(ABC):
 
         for year, month in month_span(args):
             path = Path(args.out_dir) / "enriched" / f"{year:04d}-{month:02d}.json"
-            if path.exists():
+            if json_file_exists(path):
                 if args.debug:
                     print(f"Loading enriched data: {path}")
 
-                with path.open("r", encoding="utf-8") as f:
+                with open_json_text(path) as f:
                     content = json.load(f)
                 data = content.get("data", [])
 
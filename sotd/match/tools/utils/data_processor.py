@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from sotd.cli_utils.date_span import month_span
+from sotd.utils.file_io import json_file_exists, open_json_text
 
 
 def load_analysis_data(args: Any) -> List[Dict[str, Any]]:
@@ -15,8 +16,8 @@ def load_analysis_data(args: Any) -> List[Dict[str, Any]]:
     # Collect all data
     for year, month in month_span(args):
         path = Path(args.out_dir) / "matched" / f"{year:04d}-{month:02d}.json"
-        if path.exists():
-            with path.open("r", encoding="utf-8") as f:
+        if json_file_exists(path):
+            with open_json_text(path) as f:
                 content = json.load(f)
                 all_data.extend(content.get("data", []))
 
@@ -5,9 +5,14 @@ This package contains utility functions for the match phase including
 statistics calculation, performance monitoring, and data analysis.
 """
 
-from .match_statistics import calculate_match_statistics, format_match_statistics_for_display
+from .match_statistics import (
+    MatchStatisticsCollector,
+    calculate_match_statistics,
+    format_match_statistics_for_display,
+)
 
 __all__ = [
+    "MatchStatisticsCollector",
     "calculate_match_statistics",
     "format_match_statistics_for_display",
 ]
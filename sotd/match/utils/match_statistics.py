@@ -6,114 +6,132 @@ field type counts, match type breakdowns, and performance metrics.
 """
 
 from collections import Counter
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable
 
+FIELDS = ["razor", "blade", "brush", "soap"]
 
-def calculate_match_statistics(records: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """
-    Calculate comprehensive match statistics from processed records.
 
-    Args:
-        records: List of processed comment records with match data
+class MatchStatisticsCollector:
+    """
+    Accumulate match statistics one record at a time.
 
-    Returns:
-        Dictionary containing comprehensive match statistics
+    Used when records are streamed to disk as they are matched, so the month
+    never has to be held in memory to compute its statistics.
     """
-    # Initialize counters
-    field_counts = Counter()
-    match_type_counts = Counter()
-    field_match_type_counts = {
-        "razor": Counter(),
-        "blade": Counter(),
-        "brush": Counter(),
-        "soap": Counter(),
-    }
-
-    # Track total records and successful matches
-    total_records = len(records)
-    total_matched = 0
-    total_unmatched = 0
-
-    # Analyze each record
-    for record in records:
-        for field in ["razor", "blade", "brush", "soap"]:
+
+    def __init__(self):
+        self.total_records = 0
+        self.total_matched = 0
+        self.total_unmatched = 0
+        self.field_counts = Counter()
+        self.match_type_counts = Counter()
+        self.field_match_type_counts = {field: Counter() for field in FIELDS}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Add one processed record to the statistics."""
+        self.total_records += 1
+        for field in FIELDS:
             field_data = record.get(field, {})
 
             if field_data and isinstance(field_data, dict):
                 # Count field presence
-                field_counts[field] += 1
+                self.field_counts[field] += 1
 
                 # Analyze match results
                 matched = field_data.get("matched")
                 match_type = field_data.get("match_type")
 
                 if matched is not None:
-                    total_matched += 1
+                    self.total_matched += 1
                     if match_type:
-                        match_type_counts[match_type] += 1
-                        field_match_type_counts[field][match_type] += 1
+                        self.match_type_counts[match_type] += 1
+                        self.field_match_type_counts[field][match_type] += 1
                 else:
-                    total_unmatched += 1
+                    self.total_unmatched += 1
                     # Count unmatched fields
                     if match_type is None:
-                        field_match_type_counts[field]["unmatched"] += 1
-
-    # Calculate percentages
-    match_rate = (
-        (total_matched / (total_matched + total_unmatched) * 100)
-        if (total_matched + total_unmatched) > 0
-        else 0
-    )
-
-    # Build comprehensive statistics
-    statistics = {
-        "total_records": total_records,
-        "field_presence": dict(field_counts),
-        "match_summary": {
-            "total_matched": total_matched,
-            "total_unmatched": total_unmatched,
-            "match_rate_percent": round(match_rate, 2),
-        },
-        "match_types": {
-            "overall": dict(match_type_counts),
-            "by_field": {
-                field: dict(counter) for field, counter in field_match_type_counts.items()
+                        self.field_match_type_counts[field]["unmatched"] += 1
+
+    def result(self) -> Dict[str, Any]:
+        """Build the statistics dictionary for the records added so far."""
+        total_matched = self.total_matched
+        total_unmatched = self.total_unmatched
+
+        # Calculate percentages
+        match_rate = (
+            (total_matched / (total_matched + total_unmatched) * 100)
+            if (total_matched + total_unmatched) > 0
+            else 0
+        )
+
+        # Build comprehensive statistics
+        statistics = {
+            "total_records": self.total_records,
+            "field_presence": dict(self.field_counts),
+            "match_summary": {
+                "total_matched": total_matched,
+                "total_unmatched": total_unmatched,
+                "match_rate_percent": round(match_rate, 2),
             },
-        },
-        "field_analysis": {},
-    }
-
-    # Add detailed field analysis
-    for field in ["razor", "blade", "brush", "soap"]:
-        field_counter = field_match_type_counts[field]
-        field_total = field_counts[field]
-
-        if field_total > 0:
-            field_stats = {
-                "total_present": field_total,
-                "match_breakdown": dict(field_counter),
-                "success_rate_percent": round(
-                    (
-                        sum(
-                            count
-                            for match_type, count in field_counter.items()
-                            if match_type != "unmatched"
-                        )
-                        / field_total
-                        * 100
+            "match_types": {
+                "overall": dict(self.match_type_counts),
+                "by_field": {
+                    field: dict(counter)
+                    for field, counter in self.field_match_type_counts.items()
+                },
+            },
+            "field_analysis": {},
+        }
+
+        # Add detailed field analysis
+        for field in FIELDS:
+            field_counter = self.field_match_type_counts[field]
+            field_total = self.field_counts[field]
+
+            if field_total > 0:
+                field_stats = {
+                    "total_present": field_total,
+                    "match_breakdown": dict(field_counter),
+                    "success_rate_percent": round(
+                        (
+                            sum(
+                                count
+                                for match_type, count in field_counter.items()
+                                if match_type != "unmatched"
+                            )
+                            / field_total
+                            * 100
+                        ),
+                        2,
                     ),
-                    2,
-                ),
-            }
+                }
+
+                # Add specific match type percentages for each field
+                for match_type, count in field_counter.items():
+                    if field_total > 0:
+                        field_stats[f"{match_type}_percent"] = round(
+                            (count / field_total * 100), 2
+                        )
+
+                statistics["field_analysis"][field] = field_stats
+
+        return statistics
 
-            # Add specific match type percentages for each field
-            for match_type, count in field_counter.items():
-                if field_total > 0:
-                    field_stats[f"{match_type}_percent"] = round((count / field_total * 100), 2)
 
-            statistics["field_analysis"][field] = field_stats
+def calculate_match_statistics(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Calculate comprehensive match statistics from processed records.
 
-    return statistics
+    Args:
+        records: Processed comment records with match data
+
+    Returns:
+        Dictionary containing comprehensive match statistics
+    """
+    collector = MatchStatisticsCollector()
+    for record in records:
+        collector.add(record)
+    return collector.result()
 
 
 def format_match_statistics_for_display(statistics: Dict[str, Any]) -> str:
@@ -0,0 +1,291 @@
+"""
+Literal prefilter index for ordered catalog regex patterns.
+
+Matchers walk their compiled catalog patterns in priority order and return the
+first pattern that matches. Most patterns contain literal text that must appear
+in any string they match (e.g. ``gillette`` in ``gillette.*tech``), so a string
+that lacks that text can never match the pattern. This module extracts those
+required literals once per catalog and indexes patterns by a key (by default a
+trigram) of their rarest required literal, so each lookup only evaluates the
+patterns that could possibly match while keeping the original priority order.
+
+A pattern whose only required text is an alternation (e.g. ``(?:zenith|omega)``)
+is indexed under a key of every alternative, and is a candidate when any of
+them occurs.
+"""
+
+import re
+from collections import Counter, defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    # The stubs describe the parser under its deprecated public names
+    import sre_constants
+    import sre_parse
+else:
+    import re._constants as sre_constants
+    import re._parser as sre_parse
+
+T = TypeVar("T")
+
+# Trigrams are the shortest keys that are still selective across large catalogs
+KEY_LENGTH = 3
+
+_REPEAT_OPS = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    sre_constants.POSSESSIVE_REPEAT,
+}
+
+
+def _collect_requirements(parsed: Any) -> List[FrozenSet[str]]:
+    """
+    Collect the literal requirements that every match of a parsed regex must meet.
+
+    Each requirement is a set of lowercased ASCII literals of which every match
+    contains at least one. Plain literal runs, groups and repeats with a minimum
+    of at least one give single-literal requirements. An alternation gives one
+    requirement holding the best literal of each alternative, or nothing if any
+    alternative has none. Character classes, lookarounds and optional parts are
+    treated as unknown text and break the current literal run.
+
+    Args:
+        parsed: A parsed regex subpattern (from ``re._parser``)
+
+    Returns:
+        List of required literal sets
+    """
+    requirements: List[FrozenSet[str]] = []
+    current: List[str] = []
+
+    def flush() -> None:
+        if current:
+            run = "".join(current)
+            # Non-ASCII literals can match ASCII text case-insensitively, so they are not used
+            if run.isascii():
+                requirements.append(frozenset([run.lower()]))
+            current.clear()
+
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            current.append(chr(av))
+            continue
+        if op is sre_constants.AT:
+            # Anchors and word boundaries are zero-width; adjacent literals stay contiguous
+            continue
+        flush()
+        if op is sre_constants.SUBPATTERN:
+            requirements.extend(_collect_requirements(av[-1]))
+        elif op is sre_constants.ATOMIC_GROUP:
+            requirements.extend(_collect_requirements(av))
+        elif op in _REPEAT_OPS and av[0] >= 1:
+            requirements.extend(_collect_requirements(av[2]))
+        elif op is sre_constants.BRANCH:
+            alternatives = [_best_requirement(_collect_requirements(branch)) for branch in av[1]]
+            known = [alternative for alternative in alternatives if alternative]
+            if len(known) == len(alternatives):
+                requirements.append(frozenset().union(*known))
+    flush()
+    return requirements
+
+
+def _best_requirement(requirements: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    """Return the most selective requirement: longest shortest literal, then fewest literals."""
+    if not requirements:
+        return None
+    return max(
+        requirements, key=lambda requirement: (min(map(len, requirement)), -len(requirement))
+    )
+
+
+def extract_requirements(pattern: str) -> List[FrozenSet[str]]:
+    """
+    Extract the literal requirements that any match of a pattern must meet.
+
+    Every match contains at least one literal of each returned set. Literals are
+    lowercased ASCII; non-ASCII literals are dropped because case-insensitive
+    regex matching can fold them to ASCII characters (e.g. the Kelvin sign
+    matches ``k``), which a plain substring check would miss.
+
+    Args:
+        pattern: Regex pattern text as written in the catalog
+
+    Returns:
+        List of required literal sets. Empty if none can be proven.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except (re.error, RecursionError):
+        return []
+    return _collect_requirements(parsed)
+
+
+def extract_required_literals(pattern: str) -> List[str]:
+    """
+    Extract lowercased ASCII literals that must appear in any match of a pattern.
+
+    Alternations are not included here; see ``extract_requirements``.
+
+    Args:
+        pattern: Regex pattern text as written in the catalog
+
+    Returns:
+        List of required literals, longest first. Empty if none can be proven.
+    """
+    literals = {
+        literal
+        for requirement in extract_requirements(pattern)
+        if len(requirement) == 1
+        for literal in requirement
+    }
+    return sorted(literals, key=len, reverse=True)
+
+
+class PatternIndex(Generic[T]):
+    """
+    Prefilter index over an ordered list of compiled catalog pattern entries.
+
+    The index never changes which entry wins: ``candidates()`` returns a subset
+    of the entries in their original order, and every entry it omits is proven
+    unable to match the text. Callers keep their existing first-match loops and
+    simply iterate the candidates instead of the full list.
+    """
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        pattern_getter: Callable[[T], str],
+        key_length: int = KEY_LENGTH,
+    ):
+        """
+        Build the index.
+
+        Args:
+            items: Ordered compiled pattern entries
+            pattern_getter: Function returning the raw pattern text of an entry
+            key_length: Length of the literal slices used as index keys. Literals
+                shorter than this cannot be indexed.
+        """
+        self.items = items
+        self.key_length = key_length
+        self._size = len(items)
+        # Patterns without a usable literal must always be evaluated
+        self._always: List[int] = []
+        self._buckets: Dict[str, List[int]] = defaultdict(list)
+        # Literals of which a candidate's text must contain one
+        self._required: List[Optional[Tuple[str, ...]]] = []
+
+        requirements_by_item = [extract_requirements(pattern_getter(item)) for item in items]
+
+        # Count how many patterns share each key so each pattern is keyed on its
+        # most selective one
+        key_counts: Counter = Counter()
+        for requirements in requirements_by_item:
+            key_counts.update(
+                self._keys_of([literal for requirement in requirements for literal in requirement])
+            )
+
+        def rarest(keys: Set[str]) -> str:
+            return min(sorted(keys), key=lambda key: key_counts[key])
+
+        for position, requirements in enumerate(requirements_by_item):
+            literals = sorted(
+                (
+                    literal
+                    for requirement in requirements
+                    if len(requirement) == 1
+                    for literal in requirement
+                ),
+                key=len,
+                reverse=True,
+            )
+            keys = self._keys_of(literals)
+            if keys:
+                self._buckets[rarest(keys)].append(position)
+                self._required.append((literals[0],))
+                continue
+
+            alternation = _best_requirement(
+                [
+                    requirement
+                    for requirement in requirements
+                    if all(self._keys_of([literal]) for literal in requirement)
+                ]
+            )
+            if alternation is None:
+                self._always.append(position)
+                self._required.append(None)
+                continue
+            for key in {rarest(self._keys_of([literal])) for literal in alternation}:
+                self._buckets[key].append(position)
+            self._required.append(tuple(sorted(alternation)))
+
+    def _keys_of(self, literals: List[str]) -> Set[str]:
+        keys: Set[str] = set()
+        key_length = self.key_length
+        for literal in literals:
+            for start in range(len(literal) - key_length + 1):
+                keys.add(literal[start : start + key_length])
+        return keys
+
+    def is_current_for(self, items: Sequence[T]) -> bool:
+        """Return True if the index was built for this exact (unmodified) list."""
+        return items is self.items and len(items) == self._size
+
+    def candidates(self, text: str) -> List[T]:
+        """
+        Return the entries that could match ``text``, in original priority order.
+
+        Args:
+            text: Text that will be searched with each entry's compiled regex
+
+        Returns:
+            Ordered subset of the indexed entries
+        """
+        if not isinstance(text, str) or not text.isascii():
+            # Unicode case folding can make non-ASCII text match ASCII literals
+            return list(self.items)
+
+        lowered = text.lower()
+        key_length = self.key_length
+        positions = set(self._always)
+        seen: Set[str] = set()
+        for start in range(len(lowered) - key_length + 1):
+            key = lowered[start : start + key_length]
+            if key in seen:
+                continue
+            seen.add(key)
+            bucket = self._buckets.get(key)
+            if bucket:
+                positions.update(bucket)
+
+        required = self._required
+        items = self.items
+        matches: List[T] = []
+        for position in sorted(positions):
+            literals = required[position]
+            if literals is None or any(literal in lowered for literal in literals):
+                matches.append(items[position])
+        return matches
+
+    def stats(self) -> Dict[str, int]:
+        """Return index shape statistics for debugging and performance reports."""
+        return {
+            "patterns": self._size,
+            "always_evaluated": len(self._always),
+            "buckets": len(self._buckets),
+            "largest_bucket": max((len(bucket) for bucket in self._buckets.values()), default=0),
+        }
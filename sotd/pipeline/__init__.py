@@ -0,0 +1,5 @@
+"""In-memory runner for consecutive pipeline phases.
+
+Runs extract, match, enrich and aggregate for each month in one process,
+handing records from phase to phase without reading them back from disk.
+"""
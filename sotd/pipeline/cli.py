@@ -0,0 +1,138 @@
+"""
+CLI argument parsing for in-memory (fused) and scheduled pipeline runs.
+
+This module provides CLI argument parsing for running several consecutive
+phases per month in one process, or as a cross-month task graph, using the
+BaseCLIParser.
+"""
+
+import argparse
+from typing import Sequence
+
+from sotd.cli_utils.base_parser import BaseCLIParser
+from sotd.utils.columnar_artifact import ARTIFACT_FORMATS
+
+# Phases that can run in memory, in pipeline order
+IN_MEMORY_PHASES = ("extract", "match", "enrich", "aggregate")
+# Phases the task scheduler runs per month, in pipeline order
+SCHEDULED_PHASES = ("extract", "match", "enrich", "aggregate", "report")
+
+
+def _parse_phase_list(value: str, allowed: Sequence[str], minimum: int) -> list[str]:
+    """Parse a comma-separated list of consecutive phases from ``allowed``."""
+    phases = [phase.strip() for phase in value.split(",") if phase.strip()]
+    unknown = [phase for phase in phases if phase not in allowed]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Invalid phases: {', '.join(unknown)} (expected {', '.join(allowed)})"
+        )
+    if len(phases) < minimum:
+        raise argparse.ArgumentTypeError(f"At least {minimum} phase(s) needed: {value}")
+    start = allowed.index(phases[0])
+    if phases != list(allowed[start : start + len(phases)]):
+        raise argparse.ArgumentTypeError(
+            f"Phases must be consecutive and in pipeline order: {value}"
+        )
+    return phases
+
+
+def parse_phases(value: str) -> list[str]:
+    """Parse a comma-separated list of consecutive in-memory phases."""
+    return _parse_phase_list(value, IN_MEMORY_PHASES, 2)
+
+
+def parse_scheduled_phases(value: str) -> list[str]:
+    """Parse a comma-separated list of consecutive phases for the task scheduler."""
+    return _parse_phase_list(value, SCHEDULED_PHASES, 1)
+
+
+def _add_shared_arguments(parser: BaseCLIParser) -> None:
+    """Add the phase options shared by in-memory and scheduled runs."""
+    # Optional columnar copy of enriched/YYYY-MM for aggregation (parquet needs pyarrow)
+    parser.add_argument(
+        "--artifact-format",
+        choices=ARTIFACT_FORMATS,
+        default="json",
+        help="Also write enriched/YYYY-MM.parquet for aggregation with 'parquet' (default: json)",
+    )
+
+    # Add standardized parallel processing arguments
+    parser.add_parallel_processing_arguments(
+        default_max_workers=8,
+        help_max_workers="Maximum parallel workers for month processing (default: 8)",
+    )
+
+    # Add delta processing support
+    parser.add_delta_arguments()
+
+    # Reprocess only records whose inputs changed (extract, match and enrich)
+    parser.add_incremental_arguments()
+
+    # Compressed month artifacts (readers accept either form)
+    parser.add_compression_arguments()
+
+
+def get_parser() -> BaseCLIParser:
+    """
+    Get the argument parser for in-memory pipeline runs.
+
+    Returns:
+        BaseCLIParser: Configured argument parser
+    """
+    parser = BaseCLIParser(
+        description="Run consecutive SOTD phases per month without re-reading artifacts"
+    )
+
+    parser.add_argument(
+        "--phases",
+        type=parse_phases,
+        default=list(IN_MEMORY_PHASES),
+        help="Comma-separated consecutive phases to run (default: extract,match,enrich,aggregate)",
+    )
+
+    _add_shared_arguments(parser)
+
+    return parser
+
+
+def get_scheduler_parser() -> BaseCLIParser:
+    """
+    Get the argument parser for task-graph (pipelined) runs.
+
+    Returns:
+        BaseCLIParser: Configured argument parser
+    """
+    parser = BaseCLIParser(
+        description="Run SOTD phases as per-month tasks on one shared process pool"
+    )
+
+    parser.add_argument(
+        "--phases",
+        type=parse_scheduled_phases,
+        default=list(SCHEDULED_PHASES),
+        help="Comma-separated consecutive phases to run "
+        "(default: extract,match,enrich,aggregate,report)",
+    )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Run each month's extract..aggregate tasks as one in-memory task",
+    )
+
+    # Report options (as in the report phase)
+    parser.add_argument(
+        "--type",
+        choices=["hardware", "software", "all"],
+        default="all",
+        help="Report type: hardware, software, or all (default: all)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["markdown", "json", "both"],
+        default="markdown",
+        help="Output format: markdown, json, or both (default: markdown)",
+    )
+
+    _add_shared_arguments(parser)
+
+    return parser
@@ -0,0 +1,321 @@
+"""
+Run consecutive pipeline phases per month in one process.
+
+Running ``extract:aggregate`` phase by phase writes every month's records as
+JSON and the next phase parses them straight back in, so a large part of a
+backfill is spent encoding and decoding artifacts. Here each month goes through
+the selected phases in one worker: every phase receives the previous phase's
+records in memory, while the artifacts (extracted, matched and enriched files,
+which the webui, audits and later phase-by-phase runs still read) are written
+by a background thread as soon as each phase finishes.
+
+Phase behaviour is unchanged: the same skip rules (existing output without
+``--force``), incremental reuse and output formats apply, and a phase that is
+skipped hands its existing output file to the next phase as before.
+"""
+
+import argparse
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from sotd.aggregate.engine import save_month_aggregates
+from sotd.aggregate.load import load_enriched_data
+from sotd.aggregate.processor import aggregate_all
+from sotd.aggregate.run import _create_annual_files
+from sotd.cli_utils.date_span import month_span
+from sotd.enrich.run import _process_month as enrich_month
+from sotd.enrich.run import save_enriched_output
+from sotd.extract.override_manager import OverrideManager
+from sotd.extract.run import _process_month as extract_month
+from sotd.extract.run import load_override_manager
+from sotd.extract.save import save_month_file
+from sotd.match.run import _init_month_worker, save_matched_output
+from sotd.match.run import process_month as match_month
+from sotd.pipeline.cli import get_parser
+from sotd.utils.columnar_artifact import pyarrow_available
+from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import json_file_exists, set_artifact_compression
+from sotd.utils.logging_config import setup_pipeline_logging
+from sotd.utils.parallel_processor import create_parallel_processor
+from sotd.utils.performance import PipelineOutputFormatter
+
+logger = logging.getLogger(__name__)
+
+
+def _aggregate_month(
+    ym: str,
+    base_path: Path,
+    records: Optional[list],
+    enriched_written: Optional[Future],
+    debug: bool,
+    force: bool,
+) -> dict:
+    """Aggregate one month from in-memory enriched records (or the enriched file)."""
+    output_path = base_path / "aggregated" / f"{ym}.json"
+    if json_file_exists(output_path) and not force:
+        return {"status": "skipped", "month": ym, "reason": "output exists"}
+
+    if records is None:
+        records = load_enriched_data(ym, base_path)
+    aggregated_data = aggregate_all(records, ym, debug=debug)
+    # The month partial records the enriched file's size and mtime, so the file
+    # must be in place before it is built
+    if enriched_written is not None:
+        enriched_written.result()
+    save_month_aggregates(aggregated_data, records, ym, base_path)
+    return {"status": "completed", "month": ym, "record_count": len(records)}
+
+
+def process_month_in_memory(
+    year: int,
+    month: int,
+    base_path: Path,
+    phases: Sequence[str],
+    debug: bool = False,
+    force: bool = False,
+    incremental: bool = False,
+    artifact_format: str = "json",
+    override_manager: Optional[OverrideManager] = None,
+) -> dict:
+    """
+    Run consecutive phases for one month, passing records between them in memory.
+
+    Args:
+        year: Year to process
+        month: Month to process
+        base_path: Data directory
+        phases: Consecutive phases to run (see sotd.pipeline.cli.IN_MEMORY_PHASES)
+        debug: Enable debug logging
+        force: Overwrite existing outputs
+        incremental: Only reprocess records whose inputs changed (extract, match, enrich)
+        artifact_format: Enriched artifact format ("json" or "parquet")
+        override_manager: Extract overrides (loaded from base_path when not given)
+
+    Returns:
+        Dictionary with status, month and the result of each phase under "phases"
+    """
+    ym = f"{year:04d}-{month:02d}"
+    phase_results: dict[str, Any] = {}
+    # Output of the previous phase; None means the next phase reads that phase's file
+    records: Optional[list] = None
+    enriched_written: Optional[Future] = None
+
+    def failed(phase: str, error: str) -> dict:
+        return {"status": "error", "month": ym, "error": f"{phase}: {error}"}
+
+    # One writer thread keeps artifacts in phase order off the critical path;
+    # leaving the block waits for every pending write
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer") as writer:
+        pending: list[Future] = []
+        try:
+            if "extract" in phases:
+                if override_manager is None:
+                    override_manager = load_override_manager(base_path, debug)
+                extracted = extract_month(
+                    year,
+                    month,
+                    base_path,
+                    debug,
+                    force,
+                    override_manager,
+                    incremental,
+                    write_output=False,
+                )
+                if extracted is None:
+                    return {"status": "skipped", "month": ym, "reason": "no comments file"}
+                phase_results["extract"] = {"records_processed": len(extracted["data"])}
+                pending.append(
+                    writer.submit(save_month_file, ym, extracted, base_path / "extracted")
+                )
+                records = extracted["data"]
+
+            if "match" in phases:
+                matched = match_month(
+                    ym,
+                    base_path,
+                    force,
+                    debug,
+                    use_match_cache=True,
+                    incremental=incremental,
+                    records=records,
+                    write_output=False,
+                )
+                if "error" in matched:
+                    return failed("match", matched["error"])
+                phase_results["match"] = {
+                    "status": matched["status"],
+                    "records_processed": matched.get("records_processed", 0),
+                }
+                records = None
+                if matched["status"] == "completed":
+                    output = matched.pop("output")
+                    pending.append(
+                        writer.submit(
+                            save_matched_output, base_path / "matched" / f"{ym}.json", output
+                        )
+                    )
+                    records = output["data"]
+
+            if "enrich" in phases:
+                enriched = enrich_month(
+                    year,
+                    month,
+                    base_path,
+                    debug,
+                    force,
+                    artifact_format,
+                    incremental,
+                    # Enrichment adds fields to the top level of each record, which
+                    # must not reach the matched file still being written
+                    records=None if records is None else [dict(record) for record in records],
+                    original_metadata={},
+                    write_output=False,
+                )
+                if enriched is None or "error" in enriched:
+                    return failed("enrich", (enriched or {}).get("error", "no result"))
+                phase_results["enrich"] = {
+                    "status": enriched["status"],
+                    "records_processed": enriched.get("records_processed", 0),
+                }
+                records = None
+                if enriched["status"] == "completed":
+                    output = enriched.pop("output")
+                    enriched_written = writer.submit(
+                        save_enriched_output,
+                        base_path / "enriched" / f"{ym}.json",
+                        output,
+                        artifact_format,
+                    )
+                    pending.append(enriched_written)
+                    records = output["data"]
+
+            if "aggregate" in phases:
+                try:
+                    phase_results["aggregate"] = _aggregate_month(
+                        ym, base_path, records, enriched_written, debug, force
+                    )
+                except FileNotFoundError as e:
+                    return failed("aggregate", f"{e}. Run enrich phase first.")
+
+            for future in pending:
+                future.result()
+        except Exception as e:
+            return failed("pipeline", f"Failed to process {ym}: {e}")
+
+    return {"status": "completed", "month": ym, "phases": phase_results}
+
+
+def run(args: argparse.Namespace) -> bool:
+    """Run the selected phases in memory for the specified date range."""
+    months = list(month_span(args))
+    base_path = get_data_dir(args.data_dir)
+    set_artifact_compression(getattr(args, "compress", "none"))
+    phases = args.phases
+    artifact_format = getattr(args, "artifact_format", "json")
+    incremental = getattr(args, "incremental", False)
+    if artifact_format == "parquet" and "enrich" in phases and not pyarrow_available():
+        # Fail fast rather than processing every month and failing at the end
+        logger.error("--artifact-format parquet requires pyarrow (pip install pyarrow)")
+        return True
+
+    override_manager = load_override_manager(base_path, args.debug) if "extract" in phases else None
+    process_args = (
+        base_path,
+        phases,
+        args.debug,
+        args.force,
+        incremental,
+        artifact_format,
+        override_manager,
+    )
+
+    processor = create_parallel_processor("pipeline")
+    if processor.should_use_parallel(months, args, args.debug):
+        max_workers = processor.get_max_workers(months, args, default=8)
+        # Build matchers once per worker process rather than once per month
+        initializer = _init_month_worker if "match" in phases else None
+        results = processor.process_months_parallel(
+            months,
+            process_month_in_memory,
+            process_args,
+            max_workers,
+            "Processing",
+            initializer=initializer,
+            initargs=(base_path, args.debug) if initializer else (),
+        )
+        processor.print_parallel_summary(results, "pipeline")
+    else:
+        results = processor.process_months_sequential(
+            months, process_month_in_memory, process_args, "Months"
+        )
+
+    errors = [r for r in results if "error" in r]
+    skipped = [r for r in results if r.get("status") == "skipped"]
+    completed = [r for r in results if r.get("status") == "completed"]
+
+    if errors:
+        logger.error("\n❌ Error Details:")
+        for error_result in errors:
+            month = error_result.get("month", "unknown")
+            error_msg = error_result.get("error", "unknown error")
+            logger.error(f"  {month}: {error_msg}")
+
+    if skipped:
+        logger.warning("\n⚠️  Skipped Months:")
+        for skipped_result in skipped:
+            month = skipped_result.get("month", "unknown")
+            reason = skipped_result.get("reason", "unknown reason")
+            logger.warning(f"  {month}: {reason}")
+
+    if months:
+        start_year, start_month = months[0]
+        end_year, end_month = months[-1]
+        total_stats = {
+            "total_records": sum(
+                r["phases"].get(phases[0], {}).get("records_processed", 0) for r in completed
+            ),
+        }
+        summary = PipelineOutputFormatter.format_multi_month_summary(
+            "+".join(phases),
+            f"{start_year:04d}-{start_month:02d}",
+            f"{end_year:04d}-{end_month:02d}",
+            total_stats,
+        )
+        logger.info(summary)
+
+    # Like the aggregate phase, --year/--range runs also refresh the annual files
+    if "aggregate" in phases and (args.year or args.range) and not args.month:
+        month_strs = [f"{year:04d}-{month:02d}" for year, month in months]
+        _create_annual_files(month_strs, base_path, args.debug, args.force)
+
+    # Return True if there were errors, False otherwise
+    return len(errors) > 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Main CLI entry point for in-memory pipeline runs."""
+    # Setup logging with timestamp format matching shell script
+    setup_pipeline_logging(level=logging.INFO)
+
+    try:
+        parser = get_parser()
+        args = parser.parse_args(argv)
+
+        # Update logging level if debug is enabled
+        if args.debug:
+            logging.getLogger().setLevel(logging.DEBUG)
+
+        has_errors = run(args)
+        return 1 if has_errors else 0
+    except KeyboardInterrupt:
+        logger.info("In-memory run interrupted by user")
+        return 1  # Interrupted
+    except Exception as e:
+        logger.error(f"In-memory run failed: {e}")
+        return 1  # Error
+
+
+if __name__ == "__main__":
+    main()
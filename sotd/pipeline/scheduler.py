@@ -0,0 +1,445 @@
+"""
+Cross-month task-graph scheduler for consecutive pipeline phases.
+
+``run.py`` runs each phase for every month before starting the next, so on a
+long range the later phases wait for the slowest month of the earlier ones and
+the pool drains at the end of every phase. Here every (phase, month) pair is a
+task that only waits for what it actually reads:
+
+- a month's extract, match, enrich and aggregate tasks each wait for the
+  previous phase of the same month
+- a month's report also waits for the aggregates it compares against (one
+  month, one year and five years earlier) when those months are part of the run
+
+All tasks share one process pool. Whenever a worker frees up it takes the ready
+task with the longest chain of work still behind it, so a full-history rebuild
+keeps every core busy instead of idling between phases. Each task runs the same
+month function as its phase, so outputs, skip rules and ``--force`` behave as
+in a phase-by-phase run. When a task fails, the tasks depending on it are not
+run; other months carry on.
+"""
+
+import argparse
+import heapq
+import logging
+from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sotd.aggregate.engine import process_single_month
+from sotd.aggregate.run import _create_annual_files
+from sotd.cli_utils.date_span import month_span, parse_ym
+from sotd.enrich.run import _process_month as enrich_month
+from sotd.extract.override_manager import OverrideManager
+from sotd.extract.run import _process_month as extract_month
+from sotd.extract.run import load_override_manager
+from sotd.match.run import _init_month_worker
+from sotd.match.run import process_month as match_month
+from sotd.pipeline.cli import IN_MEMORY_PHASES, get_scheduler_parser
+from sotd.pipeline.run import process_month_in_memory
+from sotd.report.report_core import _process_month as report_month
+from sotd.utils.columnar_artifact import pyarrow_available
+from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import set_artifact_compression
+from sotd.utils.logging_config import setup_pipeline_logging
+from sotd.utils.parallel_processor import create_parallel_processor
+
+logger = logging.getLogger(__name__)
+
+# A unit of work: (phase, "YYYY-MM")
+Task = Tuple[str, str]
+
+# Months before a report's month whose aggregates it compares against
+# (see sotd.report.load.get_comparison_periods)
+REPORT_COMPARISON_OFFSETS = (1, 12, 60)
+
+
+@dataclass(frozen=True)
+class TaskOptions:
+    """Settings shared by every task of a scheduled run."""
+
+    base_path: Path
+    debug: bool = False
+    force: bool = False
+    incremental: bool = False
+    artifact_format: str = "json"
+    report_types: Tuple[str, ...] = ("hardware", "software")
+    report_format: str = "markdown"
+    in_memory_phases: Tuple[str, ...] = ()
+    override_manager: Optional[OverrideManager] = None
+
+
+def months_before(month: str, count: int) -> str:
+    """Return the YYYY-MM month ``count`` months before ``month``."""
+    year, month_number = parse_ym(month)
+    index = year * 12 + month_number - 1 - count
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def build_task_graph(
+    phases: Sequence[str],
+    months: Sequence[str],
+    report_months: Optional[Sequence[str]] = None,
+) -> Dict[Task, List[Task]]:
+    """
+    Build the task graph for running phases over months.
+
+    Args:
+        phases: Consecutive task phases in pipeline order; "in_memory" stands for
+            the fused extract..aggregate phases of a month
+        months: Months (YYYY-MM) to run the phases for
+        report_months: Months to report on, if different (e.g. delta runs)
+
+    Returns:
+        Dictionary mapping every task to the tasks it depends on
+    """
+    graph: Dict[Task, List[Task]] = {}
+    for phase in phases:
+        phase_months = report_months if phase == "report" and report_months else months
+        for month in phase_months:
+            graph[(phase, month)] = []
+
+    for phase, month in graph:
+        index = phases.index(phase)
+        if index > 0:
+            previous = (phases[index - 1], month)
+            if previous in graph:
+                graph[(phase, month)].append(previous)
+        if phase == "report" and index > 0:
+            for offset in REPORT_COMPARISON_OFFSETS:
+                compared = (phases[index - 1], months_before(month, offset))
+                if compared in graph:
+                    graph[(phase, month)].append(compared)
+    return graph
+
+
+def _dependents(graph: Dict[Task, List[Task]]) -> Dict[Task, List[Task]]:
+    """Return, for every task, the tasks that depend on it."""
+    dependents: Dict[Task, List[Task]] = defaultdict(list)
+    for task, dependencies in graph.items():
+        for dependency in dependencies:
+            dependents[dependency].append(task)
+    return dependents
+
+
+def _remaining_work(
+    graph: Dict[Task, List[Task]], dependents: Dict[Task, List[Task]]
+) -> Dict[Task, int]:
+    """Return, for every task, the length of the longest chain of tasks waiting on it."""
+    depth: Dict[Task, int] = {}
+
+    def visit(task: Task) -> int:
+        if task not in depth:
+            depth[task] = 1 + max((visit(d) for d in dependents[task]), default=0)
+        return depth[task]
+
+    for task in graph:
+        visit(task)
+    return depth
+
+
+def _failed(result: Any) -> bool:
+    return isinstance(result, dict) and "error" in result
+
+
+def _not_run_reason(task: Task, result: Any) -> Optional[str]:
+    """Return why a task's dependents cannot run, or None if they can."""
+    if _failed(result):
+        return f"{task[0]} failed for {task[1]}"
+    if isinstance(result, dict) and result.get("status") == "no_input":
+        return f"{result['reason']} for {task[1]}"
+    return None
+
+
+def run_task_graph(
+    graph: Dict[Task, List[Task]],
+    run_task: Callable[..., Any],
+    task_args: Tuple[Any, ...],
+    executor: Executor,
+    max_in_flight: int,
+) -> Dict[Task, Any]:
+    """
+    Run every task of a graph once its dependencies have completed.
+
+    At most ``max_in_flight`` tasks are handed to the executor at a time; the
+    rest wait in a ready queue ordered by remaining work, so a worker that frees
+    up always starts the task with the longest chain behind it.
+
+    Args:
+        graph: Task dependencies (see build_task_graph)
+        run_task: Called as ``run_task(phase, month, *task_args)`` in the executor
+        task_args: Extra arguments for run_task
+        executor: Executor the tasks run on
+        max_in_flight: Maximum number of tasks submitted at once
+
+    Returns:
+        Dictionary mapping every task to its result. Failed tasks (an exception or
+        a result with an "error" key) map to an error result, and tasks depending
+        on them, or on a task that found no input ("no_input" status), to a
+        "blocked" result.
+    """
+    dependents = _dependents(graph)
+    remaining = _remaining_work(graph, dependents)
+    waiting_on = {task: len(dependencies) for task, dependencies in graph.items()}
+
+    ready: List[Tuple[int, str, int, Task]] = []
+    order = {task: i for i, task in enumerate(graph)}
+
+    def push(task: Task) -> None:
+        heapq.heappush(ready, (-remaining[task], task[1], order[task], task))
+
+    def block(task: Task, reason: str) -> None:
+        for dependent in dependents[task]:
+            if dependent not in results:
+                results[dependent] = {"status": "blocked", "month": dependent[1], "reason": reason}
+                block(dependent, reason)
+
+    results: Dict[Task, Any] = {}
+    for task, count in waiting_on.items():
+        if count == 0:
+            push(task)
+
+    in_flight: Dict[Future, Task] = {}
+    while ready or in_flight:
+        while ready and len(in_flight) < max_in_flight:
+            task = heapq.heappop(ready)[-1]
+            if task in results:
+                continue  # Blocked by a failed dependency
+            in_flight[executor.submit(run_task, task[0], task[1], *task_args)] = task
+        if not in_flight:
+            continue
+
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            task = in_flight.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"status": "error", "month": task[1], "error": str(e)}
+            results[task] = result
+
+            reason = _not_run_reason(task, result)
+            if reason:
+                block(task, reason)
+                continue
+            for dependent in dependents[task]:
+                waiting_on[dependent] -= 1
+                if waiting_on[dependent] == 0 and dependent not in results:
+                    push(dependent)
+    return results
+
+
+def run_task(phase: str, month: str, options: TaskOptions) -> Any:
+    """Run one phase for one month with that phase's month function."""
+    year, month_number = parse_ym(month)
+    base_path = options.base_path
+    if phase == "extract":
+        result = extract_month(
+            year,
+            month_number,
+            base_path,
+            options.debug,
+            options.force,
+            options.override_manager,
+            options.incremental,
+        )
+        if result is None:
+            # Nothing fetched for this month: the later phases have nothing to read
+            return {"status": "no_input", "month": month, "reason": "no comments file"}
+        # The month's records are in its extracted file; only the counts go back
+        # to the scheduler process
+        meta = result["meta"]
+        return {
+            "status": "completed",
+            "month": month,
+            "records_processed": meta["shave_count"],
+            "missing_count": meta["missing_count"],
+            "skipped_count": meta["skipped_count"],
+        }
+    if phase == "match":
+        return match_month(
+            month,
+            base_path,
+            options.force,
+            options.debug,
+            use_match_cache=True,
+            incremental=options.incremental,
+        )
+    if phase == "enrich":
+        return enrich_month(
+            year,
+            month_number,
+            base_path,
+            options.debug,
+            options.force,
+            options.artifact_format,
+            options.incremental,
+        )
+    if phase == "aggregate":
+        return process_single_month(month, base_path, options.debug, options.force)
+    if phase == "report":
+        return report_month(
+            year,
+            month_number,
+            base_path,
+            base_path,
+            list(options.report_types),
+            options.force,
+            options.debug,
+            False,
+            options.report_format,
+        )
+    if phase == "in_memory":
+        return process_month_in_memory(
+            year,
+            month_number,
+            base_path,
+            options.in_memory_phases,
+            options.debug,
+            options.force,
+            options.incremental,
+            options.artifact_format,
+            options.override_manager,
+        )
+    raise ValueError(f"Unknown phase: {phase}")
+
+
+def _task_phases(phases: Sequence[str], in_memory: bool) -> Tuple[List[str], Tuple[str, ...]]:
+    """Return the task phases, with consecutive in-memory phases fused when requested."""
+    fused = tuple(phase for phase in phases if phase in IN_MEMORY_PHASES)
+    if not in_memory or len(fused) < 2:
+        return list(phases), ()
+    start = phases.index(fused[0])
+    return list(phases[:start]) + ["in_memory"] + list(phases[start + len(fused) :]), fused
+
+
+def run(args: argparse.Namespace) -> bool:
+    """Run the selected phases as a task graph for the specified date range."""
+    phases = args.phases
+    base_path = get_data_dir(args.data_dir)
+    set_artifact_compression(getattr(args, "compress", "none"))
+    months = [f"{year:04d}-{month:02d}" for year, month in month_span(args)]
+    # Like the report phase, reports cover the requested months, not the delta months
+    report_months = None
+    if "report" in phases and getattr(args, "delta_months", None):
+        plain_args = argparse.Namespace(**{**vars(args), "delta_months": None})
+        report_months = [f"{year:04d}-{month:02d}" for year, month in month_span(plain_args)]
+
+    artifact_format = getattr(args, "artifact_format", "json")
+    if artifact_format == "parquet" and "enrich" in phases and not pyarrow_available():
+        # Fail fast rather than processing every month and failing at the end
+        logger.error("--artifact-format parquet requires pyarrow (pip install pyarrow)")
+        return True
+
+    task_phases, in_memory_phases = _task_phases(phases, getattr(args, "in_memory", False))
+    options = TaskOptions(
+        base_path=base_path,
+        debug=args.debug,
+        force=args.force,
+        incremental=getattr(args, "incremental", False),
+        artifact_format=artifact_format,
+        report_types=("hardware", "software") if args.type == "all" else (args.type,),
+        report_format=args.format,
+        in_memory_phases=in_memory_phases,
+    )
+    if "extract" in phases:
+        options = replace(options, override_manager=load_override_manager(base_path, args.debug))
+
+    graph = build_task_graph(task_phases, months, report_months)
+    logger.info(
+        f"Scheduling {len(graph)} tasks ({', '.join(task_phases)}) for {len(months)} months"
+    )
+
+    processor = create_parallel_processor("pipeline")
+    month_tuples = [parse_ym(month) for month in months]
+    if processor.should_use_parallel(month_tuples, args, args.debug):
+        max_workers = processor.get_max_workers(month_tuples, args, default=8)
+        executor: Executor
+        if "match" in phases:
+            # Matchers are built once per worker process, which may run any month's match
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_month_worker,
+                initargs=(base_path, args.debug),
+            )
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        max_workers = 1
+        executor = ThreadPoolExecutor(max_workers=1)
+    with executor:
+        results = run_task_graph(graph, run_task, (options,), executor, max_workers)
+
+    has_errors = _report_results(results, task_phases)
+
+    # Like the aggregate phase, --year/--range runs also refresh the annual files
+    if "aggregate" in phases and (args.year or args.range) and not args.month:
+        _create_annual_files(months, base_path, args.debug, args.force)
+
+    return has_errors
+
+
+def _report_results(results: Dict[Task, Any], task_phases: Sequence[str]) -> bool:
+    """Log per-phase outcomes and return True if any task failed."""
+    errors = [(task, r) for task, r in results.items() if _failed(r)]
+    not_run_statuses = ("blocked", "no_input")
+    blocked = [
+        (task, r) for task, r in results.items() if r and r.get("status") in not_run_statuses
+    ]
+
+    for phase in task_phases:
+        phase_results = [r for (p, _), r in results.items() if p == phase]
+        failed = sum(1 for r in phase_results if _failed(r))
+        not_run = sum(1 for r in phase_results if r and r.get("status") in not_run_statuses)
+        logger.info(
+            f"  {phase}: {len(phase_results) - failed - not_run} months done, "
+            f"{failed} failed, {not_run} not run"
+        )
+
+    if errors:
+        logger.error("\n❌ Error Details:")
+        for (phase, month), error_result in sorted(errors, key=lambda item: item[0][1]):
+            logger.error(f"  {month} {phase}: {error_result.get('error', 'unknown error')}")
+
+    if blocked:
+        logger.warning("\n⚠️  Not Run:")
+        for (phase, month), blocked_result in sorted(blocked, key=lambda item: item[0][1]):
+            logger.warning(f"  {month} {phase}: {blocked_result['reason']}")
+
+    return len(errors) > 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Main CLI entry point for scheduled (pipelined) runs."""
+    # Setup logging with timestamp format matching shell script
+    setup_pipeline_logging(level=logging.INFO)
+
+    try:
+        parser = get_scheduler_parser()
+        args = parser.parse_args(argv)
+
+        # Update logging level if debug is enabled
+        if args.debug:
+            logging.getLogger().setLevel(logging.DEBUG)
+
+        has_errors = run(args)
+        return 1 if has_errors else 0
+    except KeyboardInterrupt:
+        logger.info("Scheduled run interrupted by user")
+        return 1  # Interrupted
+    except Exception as e:
+        logger.error(f"Scheduled run failed: {e}")
+        return 1  # Error
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import logging
 from pathlib import Path
 from typing import Dict, List
 
-from sotd.utils.file_io import load_json_data
+from sotd.utils.file_io import get_file_size_mb, json_file_exists, load_json_data
 from sotd.utils.performance import PerformanceMonitor
 
 logger = logging.getLogger(__name__)
@@ -44,7 +44,7 @@ class AnnualComparisonLoader:
             for year in years:
                 file_path = data_dir / f"{year}.json"
 
-                if not file_path.exists():
+                if not json_file_exists(file_path):
                     if self.debug:
                         logger.warning(f"Missing annual file for year {year}")
                         print(f"[DEBUG] Missing annual file for year {year}")
@@ -66,7 +66,7 @@ class AnnualComparisonLoader:
 
                     # Update file size metrics
                     try:
-                        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+                        file_size_mb = get_file_size_mb(file_path)
                         total_file_size_mb += file_size_mb
                     except OSError:
                         # File size calculation failed, continue
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from sotd.utils.file_io import json_file_exists
 from sotd.utils.performance import PerformanceMonitor
 from sotd.utils.template_processor import TemplateProcessor
 
@@ -419,7 +420,7 @@ def generate_annual_report(
         # Load annual data
         monitor.start_file_io_timing()
         annual_data_file = annual_load.get_annual_file_path(data_dir, year)
-        if not annual_data_file.exists():
+        if not json_file_exists(annual_data_file):
             raise FileNotFoundError(f"Annual data file not found: {annual_data_file}")
 
         metadata, data = annual_load.load_annual_data(annual_data_file, debug=debug)
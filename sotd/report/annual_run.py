@@ -12,6 +12,7 @@ from typing import Sequence
 
 from sotd.report.report_core import run_report  # Import run_report from new module
 from sotd.utils.data_dir import get_data_dir
+from sotd.utils.file_io import json_file_exists
 from sotd.utils.performance import PerformanceMonitor
 
 from . import cli
@@ -94,7 +95,7 @@ def run_annual_report(args) -> None:
 
                 # Load annual data
                 annual_data_file = get_annual_file_path(data_root, year)
-                if not annual_data_file.exists():
+                if not json_file_exists(annual_data_file):
                     years_failed += 1
                     logger.error(
                         f"Annual data not found for {year}. "
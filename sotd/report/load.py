@@ -2,9 +2,16 @@
 """Data loading functionality for the report phase."""
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from sotd.utils.file_io import load_json_data
+from sotd.utils.file_io import json_file_exists, load_json_data, resolve_json_path
+
+# Aggregated files already parsed, by path, with the (mtime_ns, size) they were
+# read at. A month's file is also a comparison period for the next month, the
+# same month next year and five years later, so a range report would otherwise
+# parse most files up to four times. Filled by use_aggregated_cache for the
+# duration of a range run; an entry whose file changed since is ignored.
+_aggregated_cache: Dict[Path, Tuple[int, int, Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
 
 
 def get_aggregated_file_path(base_dir: Path, year: int, month: int) -> Path:
@@ -29,6 +36,14 @@ def load_aggregated_data(
         json.JSONDecodeError: If the file contains invalid JSON
         KeyError: If the file doesn't have the expected structure
     """
+    cached = _aggregated_cache.get(file_path)
+    if cached is not None:
+        stat = resolve_json_path(file_path).stat()
+        if (stat.st_mtime_ns, stat.st_size) == cached[:2]:
+            if debug:
+                print(f"[DEBUG] Using preloaded aggregated data for: {file_path}")
+            return cached[2]
+
     if debug:
         print(f"[DEBUG] Loading aggregated data from: {file_path}")
 
@@ -84,7 +99,7 @@ def load_historical_data(
     """
     file_path = get_historical_file_path(base_dir, year, month)
 
-    if not file_path.exists():
+    if not json_file_exists(file_path):
         if debug:
             print(f"[DEBUG] Historical data not found: {file_path}")
         return None
@@ -214,7 +229,7 @@ def load_historical_data_from_dir(
     """
     file_path = base_dir / f"{year:04d}-{month:02d}.json"
 
-    if not file_path.exists():
+    if not json_file_exists(file_path):
         if debug:
             print(f"[DEBUG] Historical data not found: {file_path}")
         return None
@@ -225,3 +240,52 @@ def load_historical_data_from_dir(
         if debug:
             print(f"[DEBUG] Failed to load historical data from {file_path}: {e}")
         return None
+
+
+def preload_aggregated_data(
+    base_dir: Path, months: Iterable[Tuple[int, int]], debug: bool = False
+) -> Dict[Path, Tuple[int, int, Tuple[Dict[str, Any], Dict[str, Any]]]]:
+    """Load every aggregated file needed to report on the given months, once each.
+
+    Args:
+        base_dir: Data directory (containing the aggregated directory)
+        months: (year, month) tuples to be reported on
+        debug: Enable debug logging
+
+    Returns:
+        Cache entries for use_aggregated_cache. Missing or invalid files are left
+        out, so reporting on them fails or skips them as before.
+    """
+    needed = set()
+    for year, month in months:
+        needed.add((year, month))
+        periods = get_comparison_periods(year, month)
+        needed.update((comp_year, comp_month) for comp_year, comp_month, _ in periods)
+
+    cache = {}
+    for year, month in sorted(needed):
+        file_path = get_aggregated_file_path(base_dir, year, month)
+        try:
+            stat = resolve_json_path(file_path).stat()
+            cache[file_path] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                load_aggregated_data(file_path, debug),
+            )
+        except Exception as e:
+            if debug:
+                print(f"[DEBUG] Not preloading {file_path}: {e}")
+    return cache
+
+
+def use_aggregated_cache(
+    cache: Dict[Path, Tuple[int, int, Tuple[Dict[str, Any], Dict[str, Any]]]],
+) -> None:
+    """Serve load_aggregated_data from preloaded entries (an empty dict turns this off).
+
+    Used directly for sequential runs and as the worker initializer of parallel
+    ones, so each worker receives the parsed data instead of parsing it again.
+    Callers must treat the returned (metadata, data) as read-only.
+    """
+    global _aggregated_cache
+    _aggregated_cache = cache
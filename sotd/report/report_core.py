@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 
 from sotd.cli_utils.date_span import month_span
+from sotd.report.load import preload_aggregated_data, use_aggregated_cache
 from sotd.utils.data_dir import get_data_dir
 from sotd.utils.parallel_processor import create_parallel_processor
 from sotd.utils.performance import PerformanceMonitor
@@ -200,22 +201,35 @@ def run_report(args) -> bool:
     # Determine if we should use parallel processing
     use_parallel = processor.should_use_parallel(month_tuples, args, args.debug)
 
+    # Parse each aggregated file once, rather than once as the reported month and
+    # again as a comparison period for up to three other months
+    aggregated_cache = preload_aggregated_data(data_root, month_tuples, args.debug)
+    if args.debug:
+        logger.debug(f"Preloaded {len(aggregated_cache)} aggregated files")
+
+    process_args = (
+        data_root,
+        out_dir,
+        report_types,
+        args.force,
+        args.debug,
+        getattr(args, "delta", False),
+        args.format,
+    )
+
     if use_parallel:
         # Get max workers for parallel processing
         max_workers = processor.get_max_workers(month_tuples, args, default=8)
 
-        # Process months in parallel
-        process_args = (
-            data_root,
-            out_dir,
-            report_types,
-            args.force,
-            args.debug,
-            getattr(args, "delta", False),
-            args.format,
-        )
+        # Process months in parallel; each worker starts with the preloaded data
         results = processor.process_months_parallel(
-            month_tuples, _process_month, process_args, max_workers, "Processing"
+            month_tuples,
+            _process_month,
+            process_args,
+            max_workers,
+            "Processing",
+            initializer=use_aggregated_cache,
+            initargs=(aggregated_cache,),
         )
 
         # Print parallel processing summary
@@ -223,18 +237,13 @@ def run_report(args) -> bool:
 
     else:
         # Process months sequentially
-        process_args = (
-            data_root,
-            out_dir,
-            report_types,
-            args.force,
-            args.debug,
-            getattr(args, "delta", False),
-            args.format,
-        )
-        results = processor.process_months_sequential(
-            month_tuples, _process_month, process_args, "Months"
-        )
+        use_aggregated_cache(aggregated_cache)
+        try:
+            results = processor.process_months_sequential(
+                month_tuples, _process_month, process_args, "Months"
+            )
+        finally:
+            use_aggregated_cache({})
 
     # Filter results and check for errors
     valid_results = [r for r in results if r is not None]
@@ -0,0 +1,203 @@
+"""
+Precompiled binary snapshots of YAML catalogs.
+
+Parsing the catalogs and correct_matches files with the pure-Python YAML loader
+takes seconds on every run and in every worker process. ``compile`` parses each
+YAML file once, validates it and writes a pickled snapshot of the NFC-normalized
+data next to it (``<dir>/.snapshots/<name>.pickle``). ``load_yaml_with_nfc``
+transparently uses a snapshot when it is still current for its source file and
+falls back to parsing the YAML otherwise.
+
+A snapshot is current when the source file's size and mtime match the values
+recorded at compile time, or failing that, when its content hash still matches
+(e.g. after a checkout that only touched the file). Snapshots are never written
+implicitly; run the compile step again after editing catalogs.
+
+Usage:
+    python -m sotd.utils.catalog_snapshot compile [--data-dir DIR]
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from sotd.utils.catalog_validator import validate_patterns_format
+from sotd.utils.yaml_loader import UniqueKeyLoader, normalize_nfc
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_DIR_NAME = ".snapshots"
+SNAPSHOT_SUFFIX = ".pickle"
+
+# Directories (relative to the data directory) whose YAML files are compiled
+SNAPSHOT_SOURCE_DIRS = [".", "correct_matches"]
+
+# Catalog files whose 'patterns' keys are validated while compiling
+PATTERN_CATALOG_FILES = {
+    "razors.yaml",
+    "blades.yaml",
+    "soaps.yaml",
+    "brushes.yaml",
+    "handles.yaml",
+    "knots.yaml",
+}
+
+
+def snapshot_path_for(source_path: Path) -> Path:
+    """Return the snapshot path for a YAML source file."""
+    return source_path.parent / SNAPSHOT_DIR_NAME / f"{source_path.name}{SNAPSHOT_SUFFIX}"
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def read_snapshot(source_path: Path, require_unique_keys: bool = False) -> Optional[Any]:
+    """
+    Return the snapshot data for a YAML file, or None if there is no current snapshot.
+
+    Args:
+        source_path: Path to the YAML source file
+        require_unique_keys: Only use the snapshot if the source had no duplicate keys
+            (callers that load with UniqueKeyLoader must see the duplicate-key error)
+
+    Returns:
+        The NFC-normalized data, freshly unpickled so callers may mutate it
+    """
+    source_path = Path(source_path)
+    snapshot_path = snapshot_path_for(source_path)
+    try:
+        source_stat = source_path.stat()
+        with snapshot_path.open("rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    if require_unique_keys and not snapshot["unique_keys"]:
+        return None
+    if (source_stat.st_mtime_ns, source_stat.st_size) != (
+        snapshot["source_mtime_ns"],
+        snapshot["source_size"],
+    ):
+        if source_stat.st_size != snapshot["source_size"]:
+            return None
+        if _file_sha256(source_path) != snapshot["source_sha256"]:
+            return None
+    return snapshot["data"]
+
+
+def compile_snapshot(source_path: Path) -> List[str]:
+    """
+    Parse, validate and snapshot a single YAML file.
+
+    The snapshot is written even when the file has duplicate keys, so loaders
+    that tolerate them still benefit; it is flagged so that UniqueKeyLoader
+    callers keep parsing the YAML and see the error.
+
+    Args:
+        source_path: Path to the YAML source file
+
+    Returns:
+        List of validation problems (empty if the file is valid)
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    problems = []
+    source_bytes = source_path.read_bytes()
+    source_stat = source_path.stat()
+
+    data = normalize_nfc(yaml.load(source_bytes, Loader=yaml.SafeLoader))
+    try:
+        yaml.load(source_bytes, Loader=UniqueKeyLoader)
+        unique_keys = True
+    except yaml.constructor.ConstructorError as e:
+        unique_keys = False
+        line = f" (line {e.problem_mark.line + 1})" if e.problem_mark else ""
+        problems.append(f"{source_path}: {e.problem}{line}")
+
+    if source_path.name in PATTERN_CATALOG_FILES and isinstance(data, dict):
+        try:
+            validate_patterns_format(data, source_path)
+        except ValueError as e:
+            problems.append(str(e))
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "source_mtime_ns": source_stat.st_mtime_ns,
+        "source_size": source_stat.st_size,
+        "source_sha256": hashlib.sha256(source_bytes).hexdigest(),
+        "unique_keys": unique_keys,
+        "data": data,
+    }
+
+    snapshot_path = snapshot_path_for(source_path)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write atomically so concurrent readers never see a partial snapshot
+    fd, tmp_name = tempfile.mkstemp(dir=snapshot_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, snapshot_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return problems
+
+
+def compile_data_dir(data_dir: Path) -> Dict[Path, List[str]]:
+    """
+    Compile snapshots for every catalog and correct_matches YAML file.
+
+    Args:
+        data_dir: Data directory containing the catalogs
+
+    Returns:
+        Mapping of each compiled source file to its validation problems
+    """
+    results = {}
+    for source_dir in SNAPSHOT_SOURCE_DIRS:
+        for source_path in sorted((data_dir / source_dir).glob("*.yaml")):
+            results[source_path] = compile_snapshot(source_path)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from sotd.utils.data_dir import get_data_dir
+
+    parser = argparse.ArgumentParser(description="Manage precompiled catalog snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compile_parser = subparsers.add_parser(
+        "compile", help="Validate YAML catalogs and write binary snapshots"
+    )
+    compile_parser.add_argument("--data-dir", type=Path, help="Data directory (default: data)")
+    args = parser.parse_args(argv)
+
+    data_dir = get_data_dir(args.data_dir)
+    try:
+        results = compile_data_dir(data_dir)
+    except yaml.YAMLError as e:
+        print(f"❌ Failed to parse YAML: {e}")
+        return 1
+
+    problem_count = 0
+    for source_path, problems in results.items():
+        for problem in problems:
+            problem_count += 1
+            print(f"⚠️  {problem}")
+    print(f"Compiled {len(results)} catalog snapshots ({problem_count} validation problems)")
+    return 1 if problem_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,335 @@
+"""
+Optional columnar (Parquet) copies of enriched month artifacts.
+
+With ``--artifact-format parquet`` the enrich phase also writes
+``enriched/YYYY-MM.parquet`` next to the JSON file. The JSON file remains the
+source of truth; the Parquet copy holds one row per record with the fields
+aggregation reads:
+
+- every top-level scalar (``author``, ``created_utc``, ``comment_id``, ...)
+- every leaf under ``<product>.matched`` and ``<product>.enriched`` for razor,
+  blade, brush and soap, as dotted column names (``blade.enriched.use_count``)
+
+Free-text fields such as ``original``, ``normalized`` and ``pattern`` are not
+copied. Columns whose values mix types (e.g. knot sizes stored as both int and
+float) or hold lists are stored as JSON text and listed in the file metadata so
+they decode back to the exact original values.
+
+The copy is written from the committed JSON file in two streaming passes (one
+to settle each column's type, one to write row groups of ``ROW_GROUP_SIZE``
+rows), so only one row group is held in memory at a time.
+
+Readers use the copy only while it is current for its JSON source (same size
+and mtime as when it was written), so editing or re-running a phase without
+``--artifact-format parquet`` falls back to the JSON file automatically.
+Callers can load only the columns they need (see ``AGGREGATION_COLUMNS`` in
+``sotd.aggregate.load``); the comment body, for example, is never read back by
+aggregation.
+
+Parquet support requires ``pyarrow``, which is an optional dependency.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from sotd.utils.file_io import resolve_json_path
+from sotd.utils.json_stream import JsonRecordReader
+
+ARTIFACT_FORMATS = ["json", "parquet"]
+
+PRODUCT_FIELDS = ("razor", "blade", "brush", "soap")
+PRODUCT_SECTIONS = ("matched", "enriched")
+
+_JSON_COLUMNS_KEY = b"sotd.json_columns"
+_SOURCE_KEY = b"sotd.source"
+_INT64_MAX = (1 << 63) - 1
+
+# Rows buffered per Parquet row group while writing
+ROW_GROUP_SIZE = 10_000
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for --artifact-format parquet (pip install pyarrow)"
+        ) from e
+    return pa, pq
+
+
+def pyarrow_available() -> bool:
+    """Return True if Parquet artifacts can be read and written."""
+    try:
+        _import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def columnar_path_for(json_path: Path) -> Path:
+    """Return the Parquet path that accompanies a JSON month artifact."""
+    return json_path.with_suffix(".parquet")
+
+
+def _flatten_into(row: Dict[str, Any], prefix: str, value: Any) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _flatten_into(row, f"{prefix}.{key}", child)
+    elif value is not None:
+        row[prefix] = value
+
+
+def flatten_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a matched or enriched record into a single row of columns.
+
+    Args:
+        record: Matched or enriched comment record
+
+    Returns:
+        Dictionary mapping column names to values (None values are omitted)
+    """
+    row: Dict[str, Any] = {}
+    for key, value in record.items():
+        if key in PRODUCT_FIELDS:
+            if isinstance(value, dict):
+                for section in PRODUCT_SECTIONS:
+                    _flatten_into(row, f"{key}.{section}", value.get(section))
+        elif value is not None:
+            row[key] = value
+    return row
+
+
+def unflatten_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild a (partial) record from a flattened row.
+
+    Null columns are skipped, so a product only appears in the record when at
+    least one of its columns has a value.
+
+    Args:
+        row: Dictionary mapping column names to values
+
+    Returns:
+        Record with nested product dictionaries
+    """
+    record: Dict[str, Any] = {}
+    for column, value in row.items():
+        if value is None:
+            continue
+        *parents, leaf = column.split(".")
+        target = record
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    return record
+
+
+def _column_type(pa: Any, types: Set[type], wide_int: bool) -> Optional[Any]:
+    """Return the Arrow type for a column, or None if it must be stored as JSON."""
+    if len(types) != 1:
+        return pa.string() if not types else None
+    (value_type,) = types
+    if value_type is str:
+        return pa.string()
+    if value_type is bool:
+        return pa.bool_()
+    if value_type is float:
+        return pa.float64()
+    if value_type is int and not wide_int:
+        return pa.int64()
+    return None
+
+
+def _column_types(pa: Any, rows: Iterable[Dict[str, Any]]) -> Dict[str, Optional[Any]]:
+    """Scan rows once and return each column's Arrow type, in first-seen column order."""
+    types: Dict[str, Set[type]] = {}
+    wide_ints: Set[str] = set()
+    for row in rows:
+        for column, value in row.items():
+            column_types = types.setdefault(column, set())
+            if value is None:
+                continue
+            column_types.add(type(value))
+            if type(value) is int and not -_INT64_MAX - 1 <= value <= _INT64_MAX:
+                wide_ints.add(column)
+    return {
+        column: _column_type(pa, column_types, column in wide_ints)
+        for column, column_types in types.items()
+    }
+
+
+def _row_group(pa: Any, schema: Any, json_columns: Set[str], rows: List[Dict[str, Any]]) -> Any:
+    arrays = []
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if field.name in json_columns:
+            values = [
+                None if value is None else json.dumps(value, ensure_ascii=False) for value in values
+            ]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _write_rows(
+    rows: Callable[[], Iterable[Dict[str, Any]]], path: Path, source_path: Path
+) -> Path:
+    """Write rows in row groups; ``rows`` is called twice and must yield the same rows."""
+    pa, pq = _import_pyarrow()
+
+    column_types = _column_types(pa, rows())
+    if not column_types:
+        # Parquet needs at least one column to record the row count
+        column_types["id"] = pa.string()
+    json_columns = {column for column, arrow_type in column_types.items() if arrow_type is None}
+
+    source_stat = resolve_json_path(source_path).stat()
+    schema = pa.schema(
+        [(column, arrow_type or pa.string()) for column, arrow_type in column_types.items()],
+        metadata={
+            _JSON_COLUMNS_KEY: json.dumps(sorted(json_columns)),
+            _SOURCE_KEY: json.dumps(
+                {"size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns}
+            ),
+        },
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".parquet.tmp")
+    try:
+        with pq.ParquetWriter(temp_path, schema) as writer:
+            batch: List[Dict[str, Any]] = []
+            for row in rows():
+                batch.append(row)
+                if len(batch) >= ROW_GROUP_SIZE:
+                    writer.write_table(_row_group(pa, schema, json_columns, batch))
+                    batch = []
+            if batch:
+                writer.write_table(_row_group(pa, schema, json_columns, batch))
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def write_columnar_artifact(rows: Sequence[Dict[str, Any]], path: Path, source_path: Path) -> Path:
+    """
+    Write flattened rows to a Parquet file tied to its JSON source.
+
+    Call this after the JSON source has been written: the source's size and
+    mtime are recorded so readers can tell whether the copy is still current.
+
+    Args:
+        rows: Rows produced by flatten_record, in record order
+        path: Destination Parquet path
+        source_path: JSON artifact the rows were produced from
+
+    Returns:
+        Path to the written file
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    return _write_rows(lambda: rows, path, source_path)
+
+
+def write_columnar_copy(source_path: Path) -> Path:
+    """
+    Write the Parquet copy of a committed JSON month artifact.
+
+    The records are streamed from the JSON file twice, so memory use is
+    bounded by one row group rather than the month.
+
+    Args:
+        source_path: JSON month artifact (e.g. ``data/enriched/2025-01.json``)
+
+    Returns:
+        Path to the written Parquet file
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        json.JSONDecodeError: If the JSON file is not valid JSON
+    """
+
+    def rows() -> Iterator[Dict[str, Any]]:
+        with JsonRecordReader(source_path) as reader:
+            for record in reader:
+                yield flatten_record(record)
+
+    return _write_rows(rows, columnar_path_for(source_path), source_path)
+
+
+def _selected_columns(names: Iterable[str], columns: Optional[Sequence[str]]) -> List[str]:
+    names = list(names)
+    if columns is None:
+        return names
+    return [
+        name
+        for name in names
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in columns)
+    ]
+
+
+def read_columnar_records(
+    path: Path, source_path: Path, columns: Optional[Sequence[str]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load records from a Parquet artifact if it is current for its JSON source.
+
+    Args:
+        path: Parquet artifact path
+        source_path: JSON artifact the Parquet file was written from
+        columns: Column names or dotted prefixes to load (e.g. ``["author",
+            "razor.matched"]``); all columns when None
+
+    Returns:
+        Records rebuilt with unflatten_row, or None if there is no current
+        artifact or pyarrow is not installed (callers then read the JSON file)
+    """
+    if not path.exists():
+        return None
+    try:
+        pa, pq = _import_pyarrow()
+    except ImportError:
+        return None
+
+    try:
+        schema = pq.read_schema(path)
+        metadata = schema.metadata or {}
+        source = json.loads(metadata[_SOURCE_KEY])
+        source_stat = resolve_json_path(source_path).stat()
+        if (source_stat.st_size, source_stat.st_mtime_ns) != (source["size"], source["mtime_ns"]):
+            return None
+        json_columns = set(json.loads(metadata[_JSON_COLUMNS_KEY]))
+        table = pq.read_table(path, columns=_selected_columns(schema.names, columns))
+    except (OSError, KeyError, ValueError, pa.ArrowException):
+        return None
+
+    rows = table.to_pylist()
+    decode = [column for column in table.column_names if column in json_columns]
+    if decode:
+        for row in rows:
+            for column in decode:
+                if row[column] is not None:
+                    row[column] = json.loads(row[column])
+    return [unflatten_row(row) for row in rows]
+
+
+def load_records_with_columnar(
+    source_path: Path, columns: Optional[Sequence[str]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load a month's records from its Parquet copy when one is current.
+
+    Args:
+        source_path: JSON month artifact (e.g. ``data/enriched/2025-01.json``)
+        columns: Column names or dotted prefixes to load; all columns when None
+
+    Returns:
+        Records from the Parquet copy, or None if the JSON file must be read
+    """
+    return read_columnar_records(columnar_path_for(source_path), source_path, columns)
@@ -3,31 +3,211 @@ Unified file I/O utilities for the SOTD Pipeline.
 
 This module provides standardized file operations for JSON and YAML data,
 with atomic writes, error handling, and consistent formatting.
+
+Month artifacts can also be stored compressed. Code always refers to an
+artifact by its plain ``YYYY-MM.json`` path; with compression enabled (the
+phases' ``--compress`` option) the file is written as compact JSON to
+``YYYY-MM.json.gz`` or ``YYYY-MM.json.zst`` instead, and any other form of the
+same artifact is removed. ``load_json_data``, ``open_json_text`` and
+``json_file_exists`` accept the plain path and use whichever form exists.
+zstd support requires ``zstandard``, which is an optional dependency.
 """
 
+import gzip
+import io
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, TextIO
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Artifact compression: name -> file suffix appended to the plain .json path
+ARTIFACT_COMPRESSIONS = {"none": "", "zstd": ".zst", "gzip": ".gz"}
+# Set by set_artifact_compression; an environment variable so that worker
+# processes started by a phase write the same form as the phase itself
+ARTIFACT_COMPRESSION_ENV = "SOTD_ARTIFACT_COMPRESSION"
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstandard is required for zstd artifacts (pip install zstandard)") from e
+    return zstandard
+
+
+def zstd_available() -> bool:
+    """Return True if zstd-compressed artifacts can be read and written."""
+    try:
+        _import_zstandard()
+    except ImportError:
+        return False
+    return True
+
+
+def set_artifact_compression(compression: str) -> None:
+    """
+    Choose how month artifacts are written by this process and its workers.
+
+    Args:
+        compression: One of ARTIFACT_COMPRESSIONS ("none", "zstd" or "gzip")
+
+    Raises:
+        ValueError: If the compression is unknown
+    """
+    if compression not in ARTIFACT_COMPRESSIONS:
+        raise ValueError(f"Unknown artifact compression: {compression}")
+    os.environ[ARTIFACT_COMPRESSION_ENV] = compression
+
+
+def get_artifact_compression() -> str:
+    """Return the artifact compression in effect ("none" unless set)."""
+    compression = os.environ.get(ARTIFACT_COMPRESSION_ENV, "none")
+    return compression if compression in ARTIFACT_COMPRESSIONS else "none"
+
+
+def json_path_variants(file_path: Path) -> List[Path]:
+    """Return every form of a JSON artifact: the plain path, then compressed ones."""
+    return [
+        file_path.with_name(file_path.name + suffix) for suffix in ARTIFACT_COMPRESSIONS.values()
+    ]
+
+
+def resolve_json_path(file_path: Path) -> Path:
+    """Return the existing form of a JSON artifact (the plain path if none exists)."""
+    for variant in json_path_variants(file_path):
+        if variant.is_file():
+            return variant
+    return file_path
+
+
+def json_file_exists(file_path: Path) -> bool:
+    """Return True if a JSON artifact exists in any form."""
+    return any(variant.is_file() for variant in json_path_variants(file_path))
+
+
+def remove_json_file(file_path: Path) -> None:
+    """Remove every form of a JSON artifact."""
+    for variant in json_path_variants(file_path):
+        variant.unlink(missing_ok=True)
+
+
+def iter_json_files(directory: Path, pattern: str = "*") -> Iterator[Path]:
+    """
+    Yield the plain path of each JSON artifact in a directory, whatever its form.
+
+    Args:
+        directory: Directory to search
+        pattern: Glob pattern for the file stem (e.g. "????-??")
+
+    Yields:
+        Plain ``<stem>.json`` paths, sorted, once per artifact
+    """
+    found = set()
+    for suffix in ARTIFACT_COMPRESSIONS.values():
+        for path in directory.glob(f"{pattern}.json{suffix}"):
+            found.add(path.with_name(path.name[: len(path.name) - len(suffix)]))
+    yield from sorted(found)
+
+
+def compressed_json_path(file_path: Path, compression: str) -> Path:
+    """Return the path a JSON artifact is written to with the given compression."""
+    return file_path.with_name(file_path.name + ARTIFACT_COMPRESSIONS[compression])
+
+
+def _compression_for(path: Path) -> str:
+    for compression, suffix in ARTIFACT_COMPRESSIONS.items():
+        if suffix and path.name.endswith(suffix):
+            return compression
+    return "none"
 
-def save_json_data(data: Dict[str, Any], file_path: Path, indent: int = 2) -> None:
+
+def open_json_text(file_path: Path, mode: str = "r", compression: Optional[str] = None) -> TextIO:
+    """
+    Open a JSON artifact as UTF-8 text, compressing or decompressing as needed.
+
+    Args:
+        file_path: For reading, the plain path (whichever form exists is opened);
+            for writing, the exact path to write
+        mode: "r" or "w"
+        compression: Compression to write with (default: from the path's suffix)
+
+    Returns:
+        Text stream; close it (or use it as a context manager) when done
+    """
+    if mode == "r":
+        file_path = resolve_json_path(file_path)
+        compression = _compression_for(file_path)
+    elif compression is None:
+        compression = _compression_for(file_path)
+
+    if compression == "gzip":
+        raw = gzip.open(file_path, mode + "b", compresslevel=_GZIP_LEVEL)
+    elif compression == "zstd":
+        zstandard = _import_zstandard()
+        if mode == "r":
+            raw = zstandard.ZstdDecompressor().stream_reader(file_path.open("rb"), closefd=True)
+        else:
+            raw = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).stream_writer(
+                file_path.open("wb"), closefd=True
+            )
+    else:
+        raw = file_path.open(mode + "b")
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def replace_json_file(temp_path: Path, file_path: Path, compression: str) -> Path:
+    """
+    Atomically move a written artifact into place and remove its other forms.
+
+    Args:
+        temp_path: Fully written temporary file
+        file_path: Plain path of the artifact
+        compression: Compression the temporary file was written with
+
+    Returns:
+        Path the artifact now has
+    """
+    target = compressed_json_path(file_path, compression)
+    temp_path.replace(target)
+    for variant in json_path_variants(file_path):
+        if variant != target:
+            variant.unlink(missing_ok=True)
+    return target
+
+
+def save_json_data(
+    data: Dict[str, Any],
+    file_path: Path,
+    indent: int = 2,
+    compression: Optional[str] = None,
+) -> Path:
     """
     Save JSON data with atomic writes and proper formatting.
 
     Args:
         data: Dictionary data to save
         file_path: Path to save the file
-        indent: JSON indentation level (default: 2)
+        indent: JSON indentation level (default: 2; compressed files are compact)
+        compression: Artifact compression (default: get_artifact_compression())
+
+    Returns:
+        Path the data was written to (file_path plus any compression suffix)
 
     Raises:
         OSError: If file cannot be written
         TypeError: If data cannot be serialized to JSON
     """
+    if compression is None:
+        compression = get_artifact_compression()
+
     # Ensure directory exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -35,12 +215,16 @@ def save_json_data(data: Dict[str, Any], file_path: Path, indent: int = 2) -> No
     temp_path = file_path.with_suffix(".tmp")
 
     try:
-        with temp_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        with open_json_text(temp_path, "w", compression) as f:
+            if compression == "none":
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
 
         # Atomic move
-        temp_path.replace(file_path)
-        logger.debug(f"Saved JSON data to {file_path}")
+        target = replace_json_file(temp_path, file_path, compression)
+        logger.debug(f"Saved JSON data to {target}")
+        return target
 
     except (OSError, TypeError) as e:
         # Clean up temp file if it exists
@@ -53,6 +237,9 @@ def load_json_data(file_path: Path) -> Dict[str, Any]:
     """
     Load JSON data with error handling.
 
+    Compressed forms of the file (``.json.zst``, ``.json.gz``) are read
+    transparently when the plain file does not exist.
+
     Args:
         file_path: Path to the JSON file
 
@@ -64,11 +251,11 @@ def load_json_data(file_path: Path) -> Dict[str, Any]:
         json.JSONDecodeError: If file contains invalid JSON
         OSError: If file cannot be read
     """
-    if not file_path.exists():
+    if not json_file_exists(file_path):
         raise FileNotFoundError(f"JSON file not found: {file_path}")
 
     try:
-        with file_path.open("r", encoding="utf-8") as f:
+        with open_json_text(file_path) as f:
             data = json.load(f)
 
         logger.debug(f"Loaded JSON data from {file_path}")
@@ -155,8 +342,10 @@ def get_file_size_mb(file_path: Path) -> float:
         file_path: Path to the file
 
     Returns:
-        File size in megabytes (0.0 if file doesn't exist)
+        File size in megabytes (0.0 if file doesn't exist); for a JSON artifact,
+        the size of whichever form exists
     """
+    file_path = resolve_json_path(file_path)
     if not file_path.exists():
         return 0.0
 
@@ -204,8 +393,20 @@ def backup_file(file_path: Path, backup_suffix: str = ".backup") -> Optional[Pat
 
 
 __all__ = [
+    "ARTIFACT_COMPRESSIONS",
     "save_json_data",
     "load_json_data",
+    "set_artifact_compression",
+    "get_artifact_compression",
+    "zstd_available",
+    "json_path_variants",
+    "resolve_json_path",
+    "json_file_exists",
+    "remove_json_file",
+    "iter_json_files",
+    "compressed_json_path",
+    "open_json_text",
+    "replace_json_file",
     "save_yaml_data",
     "load_yaml_data",
     "get_file_size_mb",
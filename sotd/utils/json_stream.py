@@ -0,0 +1,369 @@
+"""
+Streaming reader and writer for month artifact JSON files.
+
+Phase artifacts are a single JSON object whose record array (usually under
+``"data"``) holds the whole month. ``JsonRecordReader`` yields those records
+one at a time and ``JsonRecordWriter`` writes them as they are produced, so a
+worker only holds the record it is working on instead of the whole month plus
+its output.
+
+The writer produces the same layout and values as ``json.dump(indent=2,
+ensure_ascii=False)``, or compact JSON when the artifact is written compressed
+(see ``sotd.utils.file_io``). Records are encoded with orjson when it is
+installed, which spells some float exponents differently (``1e16`` rather
+than ``1e+16``, ``1e-7`` rather than ``1e-07``) but decodes to the same
+values. Values orjson cannot encode, and records holding NaN or infinite
+floats (which orjson would write as ``null``), are encoded by the standard
+library instead. The reader decodes each record with the C scanner behind
+``json.JSONDecoder`` and reads compressed artifacts transparently.
+"""
+
+import json
+import math
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO
+
+from sotd.utils.file_io import (
+    get_artifact_compression,
+    open_json_text,
+    replace_json_file,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+_WHITESPACE = " \t\n\r"
+_DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Return True if a value contains a NaN or infinite float."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _encode(value: Any, fast: bool = True, compact: bool = False) -> str:
+    """
+    Encode a value as indent=2 (or compact) JSON with the values json.dumps would write.
+
+    The orjson output differs from json.dumps(ensure_ascii=False) only in how
+    some float exponents are spelled.
+    """
+    if fast and orjson is not None:
+        try:
+            option = 0 if compact else orjson.OPT_INDENT_2
+            encoded = orjson.dumps(value, option=option)
+        except TypeError:
+            # e.g. non-string keys or integers beyond 64 bits; let json handle them
+            pass
+        else:
+            # orjson writes NaN and infinities as null; json keeps them as NaN/Infinity
+            if b"null" not in encoded or not _has_non_finite(value):
+                return encoded.decode("utf-8")
+    if compact:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def _indent(text: str, prefix: str) -> str:
+    """Indent every line after the first (JSON strings never contain raw newlines)."""
+    return text.replace("\n", "\n" + prefix)
+
+
+class JsonRecordReader:
+    """
+    Iterate the records of a top-level JSON array field without loading the file.
+
+    Top-level fields other than the record array are decoded normally and
+    collected in ``fields`` as they are encountered; fields that follow the
+    array are only available once iteration has finished.
+
+    Example:
+        with JsonRecordReader(path) as reader:
+            for record in reader:
+                ...
+            meta = reader.fields.get("meta", {})
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the root is not an object or the field is not an array
+    """
+
+    def __init__(self, file_path: Path, key: str = "data", chunk_size: int = _DEFAULT_CHUNK_SIZE):
+        self.file_path = file_path
+        self.key = key
+        self.fields: Dict[str, Any] = {}
+        self.found_key = False
+        self.record_count = 0
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._file: Optional[TextIO] = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._started = False
+
+    def __enter__(self) -> "JsonRecordReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise RuntimeError(f"{self.file_path} records can only be iterated once")
+        self._started = True
+        self._file = open_json_text(self.file_path)
+        try:
+            yield from self._iter_top_level()
+        finally:
+            self.close()
+
+    def read_fields(self) -> Dict[str, Any]:
+        """Consume the stream (discarding records) and return the other top-level fields."""
+        for _record in self:
+            pass
+        return self.fields
+
+    # Buffer management
+
+    def _fill(self) -> bool:
+        """Read another chunk into the buffer; return False at end of file."""
+        if self._eof:
+            return False
+        assert self._file is not None
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos > len(self._buffer) // 2:
+            # Drop consumed text so the buffer stays bounded by one record
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += chunk
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(f"{message} in {self.file_path}", self._buffer, self._pos)
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of file)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise self._error(f"Expected one of {chars!r}")
+        self._pos += 1
+        return char
+
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal ending exactly at the buffer end may be truncated
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    # Structure
+
+    def _iter_top_level(self) -> Iterator[Any]:
+        if self._peek() != "{":
+            raise ValueError(f"Expected a JSON object at the root of {self.file_path}")
+        self._pos += 1
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            name = self._decode_value()
+            if not isinstance(name, str):
+                raise self._error("Expected a property name")
+            self._expect(":")
+            if name == self.key:
+                yield from self._iter_array()
+            else:
+                self.fields[name] = self._decode_value()
+            if self._expect(",}") == "}":
+                return
+
+    def _iter_array(self) -> Iterator[Any]:
+        if self._peek() != "[":
+            raise ValueError(f"Expected a list for '{self.key}' in {self.file_path}")
+        self.found_key = True
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            record = self._decode_value()
+            self.record_count += 1
+            yield record
+            if self._expect(",]") == "]":
+                return
+
+
+def iter_json_records(file_path: Path, key: str = "data") -> Iterator[Any]:
+    """
+    Yield the records of a top-level JSON array field one at a time.
+
+    Args:
+        file_path: Path to the JSON file
+        key: Name of the top-level field holding the record array
+
+    Yields:
+        Each record of the array, in file order
+    """
+    with JsonRecordReader(file_path, key) as reader:
+        yield from reader
+
+
+class JsonRecordWriter:
+    """
+    Write a JSON object with a record array, one record at a time.
+
+    Records are spooled to a temporary file next to the destination. ``commit()``
+    then writes the other top-level fields around the array and atomically
+    replaces the destination, so a failed run never leaves a partial file.
+    Leaving the ``with`` block without committing discards the output.
+
+    With compression (default: ``get_artifact_compression()``) the file is
+    written as compact JSON to the compressed form of ``file_path``.
+
+    Example:
+        with JsonRecordWriter(path) as writer:
+            for record in records:
+                writer.write(record)
+            writer.commit(before={"metadata": {...}})
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        key: str = "data",
+        fast: bool = True,
+        compression: Optional[str] = None,
+    ):
+        self.file_path = file_path
+        self.key = key
+        self.fast = fast
+        self.compression = compression or get_artifact_compression()
+        self.compact = self.compression != "none"
+        self.record_count = 0
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._body = tempfile.NamedTemporaryFile(
+            "w+",
+            encoding="utf-8",
+            dir=file_path.parent,
+            prefix=f".{file_path.name}.",
+            suffix=".records",
+            delete=False,
+        )
+        self._closed = False
+
+    def __enter__(self) -> "JsonRecordWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.abort()
+
+    def write(self, record: Any) -> None:
+        """Append a record to the array."""
+        if self.compact:
+            separator = "," if self.record_count else ""
+            self._body.write(separator + _encode(record, self.fast, compact=True))
+        else:
+            separator = ",\n    " if self.record_count else "\n    "
+            self._body.write(separator + _indent(_encode(record, self.fast), "    "))
+        self.record_count += 1
+
+    def write_many(self, records: Iterable[Any]) -> None:
+        for record in records:
+            self.write(record)
+
+    def commit(
+        self, before: Optional[Dict[str, Any]] = None, after: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """
+        Write the complete file and atomically move it into place.
+
+        Args:
+            before: Top-level fields written before the record array, in order
+            after: Top-level fields written after the record array, in order
+
+        Returns:
+            Path to the written file (file_path plus any compression suffix)
+        """
+        if self._closed:
+            raise RuntimeError(f"Writer for {self.file_path} is already closed")
+
+        def field(name: str, value: Any) -> str:
+            if self.compact:
+                return f"{json.dumps(name, ensure_ascii=False)}:{_encode(value, False, True)}"
+            encoded = json.dumps(value, indent=2, ensure_ascii=False)
+            return f"  {json.dumps(name, ensure_ascii=False)}: {_indent(encoded, '  ')}"
+
+        # Compact layout has no line breaks or indentation around the fields
+        newline, pad = ("", "") if self.compact else ("\n", "  ")
+        temp_path = self.file_path.with_suffix(".tmp")
+        try:
+            with open_json_text(temp_path, "w", self.compression) as out:
+                parts = [field(name, value) for name, value in (before or {}).items()]
+                out.write("{" + newline + "".join(part + "," + newline for part in parts))
+                out.write(f"{pad}{json.dumps(self.key, ensure_ascii=False)}:{pad and ' '}[")
+                if self.record_count:
+                    self._body.flush()
+                    self._body.seek(0)
+                    shutil.copyfileobj(self._body, out)
+                    out.write(newline + pad + "]")
+                else:
+                    out.write("]")
+                for name, value in (after or {}).items():
+                    out.write("," + newline + field(name, value))
+                out.write(newline + "}")
+            target = replace_json_file(temp_path, self.file_path, self.compression)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            self.abort()
+        return target
+
+    def abort(self) -> None:
+        """Discard spooled records (no-op after commit)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._body.close()
+        Path(self._body.name).unlink(missing_ok=True)
@@ -8,7 +8,7 @@ to eliminate code duplication across extract, match, enrich, and other phases.
 import logging
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from tqdm import tqdm
 
@@ -76,16 +76,24 @@ class ParallelMonthProcessor:
         process_args: Tuple[Any, ...],
         max_workers: int,
         desc: str = "Processing",
+        initializer: Optional[Callable] = None,
+        initargs: Tuple[Any, ...] = (),
     ) -> List[Dict[str, Any]]:
         """
         Process multiple months in parallel using ProcessPoolExecutor.
 
+        Worker processes are reused for several months, so phases with expensive
+        setup (e.g. catalog loading) can pass an initializer that builds that state
+        once per worker and have process_func reuse it.
+
         Args:
             months: List of (year, month) tuples
             process_func: Function to call for each month
             process_args: Additional arguments to pass to process_func
             max_workers: Maximum number of parallel workers
             desc: Description for progress bar
+            initializer: Optional callable run once in each worker process at startup
+            initargs: Arguments passed to initializer
 
         Returns:
             List of results from processing each month
@@ -95,7 +103,9 @@ class ParallelMonthProcessor:
         # Start wall clock timing
         wall_clock_start = time.time()
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=initializer, initargs=initargs
+        ) as executor:
             # Submit all month processing tasks
             future_to_month = {
                 executor.submit(process_func, year, month, *process_args): f"{year:04d}-{month:02d}"
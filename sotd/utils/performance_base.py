@@ -14,6 +14,8 @@ from typing import Dict, Optional
 
 import psutil
 
+from sotd.utils.file_io import resolve_json_path
+
 logger = logging.getLogger(__name__)
 
 
@@ -152,8 +154,12 @@ class BasePerformanceMonitor(ABC):
 
     def set_file_sizes(self, input_path: Path, output_path: Optional[Path] = None) -> None:
         """Set file size information."""
+        # Month artifacts may be stored compressed (see sotd.utils.file_io)
+        input_path = resolve_json_path(input_path)
         if input_path.exists():
             self.metrics.input_file_size_mb = input_path.stat().st_size / 1024 / 1024
+        if output_path:
+            output_path = resolve_json_path(output_path)
         if output_path and output_path.exists():
             self.metrics.output_file_size_mb = output_path.stat().st_size / 1024 / 1024
 
@@ -0,0 +1,187 @@
+"""
+Per-record input hashes for incremental phase runs.
+
+Re-running extract, match or enrich for a month processes every record again,
+although a daily refresh of the current month only adds a few comments or
+touches a few overrides. With ``--incremental`` a phase stores two things in
+its output metadata:
+
+- ``input_fingerprint``: a hash of everything that applies to all records (the
+  phase's source code and the catalog/config files it reads)
+- ``input_hashes``: for every record (by comment ``id``) a hash of its own
+  inputs, i.e. the input record plus any overrides for that comment
+
+On the next incremental run, a record whose hash is unchanged (under an
+unchanged fingerprint) is copied from the previous output instead of being
+processed again. Reused records are written unchanged, so they also hash the
+same in the next phase and a small change only flows through the records it
+touches.
+
+The previous output is read into memory, one month at a time. The first
+incremental run of a month (or any run after a code or catalog change)
+processes every record.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from sotd.utils.file_io import json_file_exists
+from sotd.utils.json_stream import JsonRecordReader
+
+logger = logging.getLogger(__name__)
+
+INPUT_FINGERPRINT_KEY = "input_fingerprint"
+INPUT_HASHES_KEY = "input_hashes"
+
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def hash_record_inputs(*inputs: Any) -> str:
+    """
+    Return a stable hash of a record's inputs.
+
+    Args:
+        *inputs: JSON-compatible values (dict key order does not matter)
+
+    Returns:
+        Hex digest identifying the inputs
+    """
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def compute_phase_fingerprint(
+    packages: Sequence[str], files: Iterable[Path] = (), extra: str = ""
+) -> str:
+    """
+    Compute the fingerprint of the inputs shared by every record of a phase.
+
+    Args:
+        packages: Dotted names, relative to ``sotd``, of the subpackages or modules
+            whose source code affects the phase (e.g. ``"enrich"``,
+            ``"match.utils.regex_error_utils"``)
+        files: Data files the phase reads (missing files are recorded as missing)
+        extra: Any further fingerprint to include (e.g. catalog fingerprints)
+
+    Returns:
+        Hex digest identifying the current code and data state
+    """
+    hasher = hashlib.sha256(extra.encode("utf-8"))
+    for package in packages:
+        package_path = _PACKAGE_ROOT.joinpath(*package.split("."))
+        if package_path.is_dir():
+            source_files = sorted(package_path.rglob("*.py"))
+        else:
+            source_files = [package_path.with_suffix(".py")]
+        for source_file in source_files:
+            hasher.update(str(source_file.relative_to(_PACKAGE_ROOT)).encode("utf-8"))
+            hasher.update(source_file.read_bytes())
+    for path in files:
+        hasher.update(path.name.encode("utf-8"))
+        hasher.update(path.read_bytes() if path.is_file() else b"<missing>")
+    return hasher.hexdigest()
+
+
+class IncrementalRun:
+    """
+    Reuse decisions for one phase run over one month.
+
+    Example:
+        run = IncrementalRun(fingerprint, out_path)
+        for record in records:
+            input_hash = hash_record_inputs(record)
+            output = run.reuse(record["id"], input_hash) or process(record)
+        meta.update(run.meta())
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        previous_output: Optional[Path] = None,
+        meta_key: str = "meta",
+        record_keys: Sequence[str] = ("data",),
+    ):
+        """
+        Args:
+            fingerprint: Current phase fingerprint (see compute_phase_fingerprint)
+            previous_output: Output file of the previous run, if any
+            meta_key: Top-level key of the metadata in that file
+            record_keys: Top-level keys of the record arrays in that file
+        """
+        self.fingerprint = fingerprint
+        self.input_hashes: Dict[str, str] = {}
+        self.reused = 0
+        self.processed = 0
+        self._previous_records: Dict[str, Any] = {}
+        self._previous_hashes: Dict[str, str] = {}
+        if previous_output is not None and json_file_exists(previous_output):
+            self._load(previous_output, meta_key, record_keys)
+
+    def _load(self, path: Path, meta_key: str, record_keys: Sequence[str]) -> None:
+        """Read the previous records, if they were produced under the same fingerprint."""
+        try:
+            with JsonRecordReader(path, key=record_keys[0]) as reader:
+                records = list(reader)
+                fields = reader.fields
+        except (ValueError, OSError) as e:
+            logger.debug("Not reusing records from %s: %s", path, e)
+            return
+
+        meta = fields.get(meta_key)
+        if not isinstance(meta, dict) or meta.get(INPUT_FINGERPRINT_KEY) != self.fingerprint:
+            return
+        hashes = meta.get(INPUT_HASHES_KEY)
+        if not isinstance(hashes, dict):
+            return
+
+        for key in record_keys[1:]:
+            extra_records = fields.get(key)
+            if isinstance(extra_records, list):
+                records.extend(extra_records)
+        self._previous_hashes = hashes
+        self._previous_records = {
+            record["id"]: record
+            for record in records
+            if isinstance(record, dict) and record.get("id") in hashes
+        }
+
+    def is_current(self, record_id: Optional[str], input_hash: str) -> bool:
+        """Return True if the previous output for a record can be reused."""
+        return (
+            record_id is not None
+            and self._previous_hashes.get(record_id) == input_hash
+            and record_id in self._previous_records
+        )
+
+    def reuse(self, record_id: Optional[str], input_hash: str) -> Optional[Any]:
+        """
+        Record a record's input hash and return its previous output if still current.
+
+        Args:
+            record_id: Comment ID of the record (records without one are always processed)
+            input_hash: Hash of the record's inputs (see hash_record_inputs)
+
+        Returns:
+            The previous output record, or None if the record must be processed
+        """
+        if record_id is not None:
+            self.input_hashes[record_id] = input_hash
+        if record_id is not None and self.is_current(record_id, input_hash):
+            self.reused += 1
+            return self._previous_records[record_id]
+        self.processed += 1
+        return None
+
+    def meta(self) -> Dict[str, Any]:
+        """Return the metadata entries to store with this run's output."""
+        return {
+            INPUT_FINGERPRINT_KEY: self.fingerprint,
+            INPUT_HASHES_KEY: self.input_hashes,
+        }
+
+    def summary(self) -> str:
+        """Return a one-line summary of reused and processed records."""
+        return f"{self.reused} unchanged records reused, {self.processed} processed"
@@ -33,6 +33,14 @@ def normalize_nfc(value: Any) -> Any:
 
 
 def load_yaml_with_nfc(path: Path, loader_cls=yaml.SafeLoader) -> Any:
+    # Use a compiled snapshot (see sotd.utils.catalog_snapshot) when it is current
+    if loader_cls in (yaml.SafeLoader, UniqueKeyLoader):
+        from sotd.utils.catalog_snapshot import read_snapshot
+
+        data = read_snapshot(path, require_unique_keys=loader_cls is UniqueKeyLoader)
+        if data is not None:
+            return data
+
     with path.open("r", encoding="utf-8") as f:
         raw = yaml.load(f, Loader=loader_cls)
     return normalize_nfc(raw)
@@ -0,0 +1,120 @@
+"""Parity tests for the single-pass metadata metrics and brush diversity keys.
+
+Expected values were produced by the previous row-by-row (DataFrame.iterrows /
+DataFrame.apply) implementations on the same records.
+"""
+
+import copy
+
+import pandas as pd
+
+from sotd.aggregate.aggregators.users.brush_diversity_aggregator import (
+    BrushDiversityAggregator,
+    aggregate_brush_diversity,
+)
+from sotd.aggregate.utils.metrics import calculate_metadata, scan_record_metrics
+
+RECORDS = [
+    {
+        "author": "alice",
+        "razor": {"matched": {"brand": "Karve", "model": "CB", "format": "DE"}},
+        "blade": {"matched": {"brand": "Feather", "model": "Hi-Stainless"}},
+        "brush": {
+            "matched": {
+                "brand": "Zenith",
+                "model": "B2",
+                "knot": {"brand": "Zenith", "model": "Boar", "fiber": "Boar"},
+                "handle": {"brand": "Zenith"},
+            }
+        },
+        "soap": {
+            "matched": {"brand": "Stirling Soap Co.", "scent": "Bay Rum"},
+            "enriched": {"sample_type": "tester"},
+        },
+    },
+    {
+        "author": " alice ",
+        "razor": {"matched": {"brand": "Karve", "model": "CB "}},
+        "blade": {"matched": {"brand": "Feather", "model": " "}},
+        "brush": {"matched": {"brand": "Omega", "model": "10049", "knot": None}},
+        "soap": {
+            "matched": {"brand": "stirling soap co.", "scent": "bay rum", "countable": False},
+            "enriched": {"sample_type": ""},
+        },
+    },
+    {
+        "author": "bob",
+        "razor": {"matched": None},
+        "blade": None,
+        "brush": {"matched": {}},
+        "soap": {
+            "matched": {"brand": " Declaration Grooming ", "scent": " Sellout "},
+            "enriched": {"sample_type": "sample"},
+        },
+    },
+    {
+        "author": "carol",
+        "soap": {"matched": {"brand": "B&M", "scent": "Seville", "countable": None}},
+    },
+    {"author": "carol", "soap": {"matched": {"brand": "B&M", "scent": ""}}},
+    {"author": "dave", "razor": {"matched": {"brand": "Gillette", "model": "Tech"}}},
+]
+
+EXPECTED_METRICS = {
+    "total_shaves": 6,
+    "unique_shavers": 4,
+    "avg_shaves_per_user": 1.5,
+    "median_shaves_per_user": 1.5,
+    "unique_soaps": 2,
+    "unique_brands": 4,
+    "total_samples": 2,
+    "sample_users": 2,
+    "sample_brands": 2,
+    "unique_sample_soaps": 2,
+    "unique_razors": 2,
+    "unique_blades": 1,
+    "unique_brushes": 2,
+}
+
+
+class TestMetadataParity:
+    """Test single-pass metadata against the previous per-metric results."""
+
+    def test_scan_record_metrics(self):
+        assert scan_record_metrics(copy.deepcopy(RECORDS)) == EXPECTED_METRICS
+
+    def test_calculate_metadata(self):
+        meta = calculate_metadata(copy.deepcopy(RECORDS), "2025-01")
+        assert meta.pop("month") == "2025-01"
+        assert meta.pop("aggregated_at")
+        assert meta == EXPECTED_METRICS
+
+
+class TestBrushDiversityParity:
+    """Test brush diversity keys against the previous DataFrame.apply results."""
+
+    def test_composite_keys(self):
+        aggregator = BrushDiversityAggregator()
+        df = pd.DataFrame(aggregator._extract_data(copy.deepcopy(RECORDS)))
+        assert aggregator._create_composite_name(df).tolist() == [
+            "Zenith B2 knot:Zenith knot:Boar handle:Zenith",
+            "Omega 10049",
+        ]
+
+    def test_aggregate_brush_diversity(self):
+        assert aggregate_brush_diversity(copy.deepcopy(RECORDS)) == [
+            {
+                "user": " alice ",
+                "unique_brushes": 1,
+                "shaves": 1,
+                "avg_shaves_per_brush": 1.0,
+                "rank": 1,
+            },
+            {
+                "user": "alice",
+                "unique_brushes": 1,
+                "shaves": 1,
+                "avg_shaves_per_brush": 1.0,
+                "rank": 2,
+            },
+        ]
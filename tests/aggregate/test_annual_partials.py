@@ -0,0 +1,143 @@
+"""
+Tests for mergeable monthly partial aggregates.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+from sotd.aggregate.annual_engine import AnnualAggregationEngine
+from sotd.aggregate.annual_partials import (
+    build_partial,
+    category_user_shaves,
+    load_month_partial,
+    merge_partials,
+    partial_path,
+    save_month_partial,
+)
+
+
+def _record(author, razor, knot_size=None, sample=False):
+    record = {
+        "author": author,
+        "razor": {"matched": {"brand": razor, "model": "One", "format": "DE"}},
+        "soap": {
+            "matched": {"brand": "Stirling", "scent": author.upper()},
+            "enriched": {"sample_type": "sample"} if sample else {},
+        },
+    }
+    if knot_size is not None:
+        record["brush"] = {
+            "matched": {
+                "brand": "Omega",
+                "model": "10049",
+                "knot": {"brand": "Omega", "fiber": "Boar", "knot_size_mm": knot_size},
+            }
+        }
+    return record
+
+
+JANUARY = [
+    _record("alice", "Karve", 24),
+    _record("alice", "Karve", 26, sample=True),
+    _record("bob", "Karve"),
+]
+FEBRUARY = [
+    _record("alice", "Karve", 24.0),
+    _record("carol", "Blackland", sample=True),
+]
+
+
+def _user_shaves(partial, category):
+    df = category_user_shaves(partial, category)
+    return {(row.composite_identifier, row.author): row.user_shaves for row in df.itertuples()}
+
+
+class TestPartials:
+    """Test building and merging partials."""
+
+    def test_merge_matches_combined_records(self):
+        merged = merge_partials([build_partial(JANUARY), build_partial(FEBRUARY)])
+        combined = build_partial(JANUARY + FEBRUARY)
+
+        for category in ("razors", "brush_knot_sizes", "soaps"):
+            assert _user_shaves(merged, category) == _user_shaves(combined, category)
+        assert _user_shaves(merged, "razors") == {
+            ("Karve One", "alice"): 3,
+            ("Karve One", "bob"): 1,
+            ("Blackland One", "carol"): 1,
+        }
+        assert merged["authors"] == ["alice", "bob", "carol"]
+        assert merged["total_samples"] == 2
+        assert merged["sample_users"] == ["alice", "carol"]
+
+    def test_empty_category(self):
+        assert category_user_shaves(build_partial(JANUARY), "blackbird_plates") is None
+
+
+class TestMonthPartials:
+    """Test saving partials and rebuilding stale ones."""
+
+    def _write_enriched(self, data_dir, month, records):
+        path = data_dir / "enriched" / f"{month}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"data": records}), encoding="utf-8")
+        return path
+
+    def test_current_partial_is_reused(self, tmp_path):
+        self._write_enriched(tmp_path, "2025-01", JANUARY)
+        path = save_month_partial(JANUARY, "2025-01", tmp_path)
+        assert path == partial_path("2025-01", tmp_path)
+
+        # A current partial is read as-is, without reloading enriched data
+        partial = json.loads(path.read_text(encoding="utf-8"))
+        partial["total_samples"] = 99
+        path.write_text(json.dumps(partial), encoding="utf-8")
+        assert load_month_partial("2025-01", tmp_path)["total_samples"] == 99
+
+    def test_stale_partial_is_rebuilt(self, tmp_path):
+        enriched = self._write_enriched(tmp_path, "2025-01", JANUARY)
+        save_month_partial(JANUARY, "2025-01", tmp_path)
+
+        self._write_enriched(tmp_path, "2025-01", JANUARY[:1])
+        stat = enriched.stat()
+        os.utime(enriched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_month_partial("2025-01", tmp_path)["authors"] == ["alice"]
+        saved = json.loads(partial_path("2025-01", tmp_path).read_text(encoding="utf-8"))
+        assert saved["authors"] == ["alice"]
+
+    def test_partial_built_by_other_code_is_rebuilt(self, tmp_path):
+        self._write_enriched(tmp_path, "2025-01", JANUARY)
+        path = save_month_partial(JANUARY, "2025-01", tmp_path)
+        partial = json.loads(path.read_text(encoding="utf-8"))
+        partial["total_samples"] = 99
+        path.write_text(json.dumps(partial), encoding="utf-8")
+
+        # Same enriched file, but the aggregator code has changed since
+        with patch(
+            "sotd.aggregate.annual_partials.partial_code_fingerprint", return_value="changed"
+        ):
+            rebuilt = load_month_partial("2025-01", tmp_path)
+        assert rebuilt["total_samples"] != 99
+        assert json.loads(path.read_text(encoding="utf-8"))["code"] == "changed"
+
+    def test_missing_enriched_month(self, tmp_path):
+        assert load_month_partial("2025-01", tmp_path) is None
+        assert save_month_partial(JANUARY, "2025-01", tmp_path) is None
+
+    def test_engine_metadata_from_partials(self, tmp_path):
+        self._write_enriched(tmp_path, "2025-01", JANUARY)
+        self._write_enriched(tmp_path, "2025-02", FEBRUARY)
+        engine = AnnualAggregationEngine("2025", tmp_path)
+        monthly_data = {
+            "2025-01": {"meta": {"total_shaves": 3}},
+            "2025-02": {"meta": {"total_shaves": 2}},
+        }
+
+        metadata = engine.generate_metadata(monthly_data)
+
+        assert metadata["unique_shavers"] == 3
+        assert metadata["total_samples"] == 2
+        assert metadata["sample_users"] == 2
+        assert partial_path("2025-02", tmp_path).exists()
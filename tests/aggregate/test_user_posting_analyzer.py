@@ -30,25 +30,22 @@ class TestUserPostingAnalyzer:
             ]
         }
 
-        with patch("pathlib.Path.exists", Mock(return_value=True)):
-            mock_file = Mock()
-            mock_file.__enter__ = Mock(return_value=mock_file)
-            mock_file.__exit__ = Mock(return_value=None)
+        module = "sotd.aggregate.aggregators.users.user_posting_analyzer"
+        with patch(f"{module}.json_file_exists", Mock(return_value=True)):
+            with patch(f"{module}.load_json_data", Mock(return_value=mock_data)):
+                analyzer = UserPostingAnalyzer()
+                result = analyzer.load_enriched_data("2025-06")
 
-            with patch("builtins.open", Mock(return_value=mock_file)):
-                with patch("json.load", Mock(return_value=mock_data)):
-                    analyzer = UserPostingAnalyzer()
-                    result = analyzer.load_enriched_data("2025-06")
-
-                    assert result is not None
-                    assert len(result) == 1
-                    assert result[0]["author"] == "test_user"
+                assert result is not None
+                assert len(result) == 1
+                assert result[0]["author"] == "test_user"
 
     def test_load_enriched_data_file_not_found(self):
         """Test handling of missing enriched data file."""
         analyzer = UserPostingAnalyzer()
 
-        with patch("pathlib.Path.exists", Mock(return_value=False)):
+        module = "sotd.aggregate.aggregators.users.user_posting_analyzer"
+        with patch(f"{module}.json_file_exists", Mock(return_value=False)):
             result = analyzer.load_enriched_data("2025-06")
             assert result == []
 
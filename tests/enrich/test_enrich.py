@@ -74,6 +74,23 @@ def test_process_month_invalid_json(tmp_path):
     assert "Failed to load matched data" in result["error"]
 
 
+def test_process_month_enrichment_error(tmp_path):
+    """Test that enrichment failures are not reported as load failures."""
+    base_path = Path(tmp_path)
+    matched_dir = base_path / "matched"
+    matched_dir.mkdir(parents=True)
+    (matched_dir / "2025-01.json").write_text(json.dumps({"data": [{"id": "1"}], "meta": {}}))
+
+    with patch("sotd.enrich.run.enrich_comments", side_effect=ValueError("bad blade")):
+        result = _process_month(2025, 1, base_path, debug=False, force=False)
+
+    assert result["status"] == "error"
+    assert "Failed to load matched data" not in result["error"]
+    assert result["error"].startswith("Failed to enrich 2025-01")
+    assert "bad blade" in result["error"]
+    assert not (base_path / "enriched" / "2025-01.json").exists()
+
+
 def test_process_month_valid_data(tmp_path):
     """Test processing a month with valid data."""
     base_path = Path(tmp_path)
@@ -117,6 +134,43 @@ def test_process_month_valid_data(tmp_path):
     assert enriched_file.exists()
 
 
+def test_process_month_incremental_reuses_unchanged_records(tmp_path):
+    """Test that an incremental run only enriches records whose input changed."""
+    base_path = Path(tmp_path)
+    matched_dir = base_path / "matched"
+    matched_dir.mkdir(parents=True)
+    records = [
+        {
+            "id": comment_id,
+            "blade": {
+                "original": f"Feather ({uses})",
+                "normalized": "Feather",
+                "matched": {"brand": "Feather", "model": "Hi-Stainless"},
+            },
+        }
+        for comment_id, uses in (("c1", 2), ("c2", 3))
+    ]
+    matched_file = matched_dir / "2025-01.json"
+    matched_file.write_text(json.dumps({"meta": {"month": "2025-01"}, "data": records}))
+
+    _process_month(2025, 1, base_path, debug=False, force=False, incremental=True)
+    enriched_file = base_path / "enriched" / "2025-01.json"
+    first = json.loads(enriched_file.read_text())
+
+    records[1]["blade"]["original"] = "Feather (4)"
+    matched_file.write_text(json.dumps({"meta": {"month": "2025-01"}, "data": records}))
+    with patch("sotd.enrich.run.enrich_comments", wraps=enrich_comments) as mock_enrich:
+        result = _process_month(2025, 1, base_path, debug=False, force=False, incremental=True)
+
+    second = json.loads(enriched_file.read_text())
+    assert result["records_processed"] == 2
+    assert mock_enrich.call_count == 1
+    assert mock_enrich.call_args[0][0][0]["id"] == "c2"
+    assert second["data"][0] == first["data"][0]
+    assert second["meta"]["input_hashes"]["c1"] == first["meta"]["input_hashes"]["c1"]
+    assert second["meta"]["input_hashes"]["c2"] != first["meta"]["input_hashes"]["c2"]
+
+
 def test_main_cli_help():
     """Test that the CLI help works."""
     with patch("sys.argv", ["test", "--help"]):
@@ -452,3 +452,36 @@ def test_blade_normalization_comprehensive_shave_counts(monkeypatch):
         assert result["data"][20]["blade"]["normalized"] == "Astra"
         assert result["data"][21]["blade"]["normalized"] == "Pro 500"
         assert result["data"][22]["blade"]["normalized"] == "Seagull"
+
+
+def test_run_extraction_for_month_incremental(tmp_path):
+    """Unchanged comments reuse their previous output; changed ones are parsed again."""
+    from unittest.mock import patch
+
+    from sotd.extract import comment as comment_module
+    from sotd.extract.run import _process_month
+
+    comments_path = tmp_path / "comments" / "2025-04.json"
+    comments_path.parent.mkdir(parents=True)
+    comments = [
+        {"id": "1", "body": "* **Razor:** Blackbird"},
+        {"id": "2", "body": "* **Blade:** Feather"},
+        {"id": "3", "body": "No product listed here"},
+    ]
+    comments_path.write_text(json.dumps({"data": comments}))
+
+    first = _process_month(2025, 4, tmp_path, debug=False, force=False, incremental=True)
+
+    comments[1]["body"] = "* **Blade:** Astra"
+    comments_path.write_text(json.dumps({"data": comments}))
+    with patch.object(
+        comment_module, "parse_comment", wraps=comment_module.parse_comment
+    ) as mock_parse:
+        second = _process_month(2025, 4, tmp_path, debug=False, force=False, incremental=True)
+
+    assert mock_parse.call_count == 1
+    assert [c["id"] for c in second["data"]] == ["1", "2"]
+    assert second["data"][0] == first["data"][0]
+    assert second["data"][1]["blade"]["original"] == "Astra"
+    assert second["skipped"] == first["skipped"]
+    assert set(second["meta"]["input_hashes"]) == {"1", "2", "3"}
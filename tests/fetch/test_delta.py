@@ -0,0 +1,78 @@
+"""Tests for per-thread comment high-water marks."""
+
+from sotd.fetch.delta import (
+    comments_file_unchanged,
+    compute_thread_marks,
+    iso_to_timestamp,
+    load_thread_marks,
+    reached_mark,
+    since_by_thread,
+)
+
+COMMENTS = [
+    {"id": "c1", "thread_id": "t1", "created_utc": "2025-05-01T10:00:00Z"},
+    {"id": "c2", "thread_id": "t1", "created_utc": "2025-05-01T12:00:00Z"},
+    {"id": "c3", "thread_id": "t1", "created_utc": "2025-05-01T11:00:00Z"},
+    {"id": "c4", "thread_id": "t2", "created_utc": "2025-05-02T09:00:00Z"},
+]
+
+
+class TestThreadMarks:
+    """Test computing and loading thread marks."""
+
+    def test_compute_thread_marks(self):
+        assert compute_thread_marks(COMMENTS) == {
+            "t1": {
+                "latest_created_utc": "2025-05-01T12:00:00Z",
+                "latest_comment_id": "c2",
+                "comment_count": 3,
+            },
+            "t2": {
+                "latest_created_utc": "2025-05-02T09:00:00Z",
+                "latest_comment_id": "c4",
+                "comment_count": 1,
+            },
+        }
+
+    def test_load_thread_marks_prefers_stored_marks(self):
+        stored = {"t9": {"latest_created_utc": "2025-05-03T00:00:00Z"}}
+        assert load_thread_marks({"thread_marks": stored}, COMMENTS) == stored
+        assert load_thread_marks("metadata", COMMENTS) == compute_thread_marks(COMMENTS)
+        assert load_thread_marks(None, []) == {}
+
+    def test_since_by_thread(self):
+        marks = compute_thread_marks(COMMENTS)
+        assert since_by_thread(marks) == {
+            "t1": "2025-05-01T12:00:00Z",
+            "t2": "2025-05-02T09:00:00Z",
+        }
+
+    def test_iso_to_timestamp(self):
+        assert iso_to_timestamp("2025-01-01T00:00:00Z") == 1735689600.0
+
+
+class TestReachedMark:
+    """Test the stop condition for newest-first pages."""
+
+    def test_page_reaching_mark(self):
+        page = [{"created_utc": "2025-05-01T12:00:00Z"}, {"created_utc": "2025-05-01T10:00:00Z"}]
+        assert reached_mark(page, "2025-05-01T10:00:00Z")
+        assert not reached_mark(page, "2025-05-01T09:00:00Z")
+
+    def test_empty_page_ends_listing(self):
+        assert reached_mark([], "2025-05-01T10:00:00Z")
+
+
+class TestCommentsFileUnchanged:
+    """Test skipping rewrites of unchanged comments files."""
+
+    def test_only_extracted_at_differs(self):
+        existing = ({"month": "2025-05", "extracted_at": "a"}, COMMENTS)
+        assert comments_file_unchanged(existing, {"month": "2025-05", "extracted_at": "b"}, False)
+
+    def test_changed_records_or_meta(self):
+        existing = ({"month": "2025-05", "extracted_at": "a"}, COMMENTS)
+        assert not comments_file_unchanged(existing, {"month": "2025-05"}, True)
+        assert not comments_file_unchanged(existing, {"month": "2025-06"}, False)
+        assert not comments_file_unchanged(None, {"month": "2025-05"}, False)
+        assert not comments_file_unchanged(("metadata", COMMENTS), {"month": "2025-05"}, False)
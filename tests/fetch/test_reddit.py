@@ -5,7 +5,7 @@ import time
 from unittest.mock import Mock, patch
 
 import pytest
-from praw.models import Submission
+from praw.models import Comment, MoreComments, Submission
 from prawcore.exceptions import TooManyRequests, RequestException
 import requests
 
@@ -768,6 +768,50 @@ class TestEnhancedRateLimitDetection:
         # This will be implemented in the actual code
 
 
+# --------------------------------------------------------------------------- #
+# Delta comment fetching tests                                                 #
+# --------------------------------------------------------------------------- #
+def _root(created_utc: float) -> Mock:
+    comment = Mock(spec=Comment)
+    comment.created_utc = created_utc
+    comment.is_root = True
+    return comment
+
+
+class _Forest(list):
+    """Comment forest stand-in: iterable top level plus replace_more/list."""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.replace_more = Mock()
+
+    def list(self):
+        return [c for c in self if isinstance(c, Comment)]
+
+
+class TestDeltaComments:
+    """Test fetch_top_level_comments with a high-water mark."""
+
+    def test_first_page_reaching_mark_skips_replace_more(self):
+        submission = Mock()
+        submission.comments = _Forest([_root(300), _root(200), _root(100), Mock(spec=MoreComments)])
+
+        result = fetch_top_level_comments(submission, since=150)
+
+        assert submission.comment_sort == "new"
+        assert [c.created_utc for c in result] == [300, 200, 100]
+        submission.comments.replace_more.assert_not_called()
+
+    def test_first_page_short_of_mark_expands_more(self):
+        submission = Mock()
+        submission.comments = _Forest([_root(300), _root(200), Mock(spec=MoreComments)])
+
+        result = fetch_top_level_comments(submission, since=50)
+
+        submission.comments.replace_more.assert_called_once_with(limit=None)
+        assert len(result) == 2
+
+
 # --------------------------------------------------------------------------- #
 # Environment variable tests                                                   #
 # --------------------------------------------------------------------------- #
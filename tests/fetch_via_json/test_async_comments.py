@@ -0,0 +1,202 @@
+"""Tests for the asyncio comment fetcher."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from sotd.fetch.delta import iso_to_timestamp  # noqa: E402
+from sotd.fetch_via_json.async_comments import (  # noqa: E402
+    fetch_comments_for_threads_async,
+    get_reddit_json_async,
+)
+from sotd.fetch_via_json.comments import _split_comment_listing  # noqa: E402
+from sotd.fetch_via_json.rate_limit import RateLimitBudget  # noqa: E402
+from sotd.fetch_via_json.response_cache import ResponseCache  # noqa: E402
+
+
+def _comment(comment_id: str, thread_id: str, created_utc: float = 1704067200.0) -> dict:
+    return {
+        "kind": "t1",
+        "data": {
+            "id": comment_id,
+            "author": f"user_{comment_id}",
+            "created_utc": created_utc,
+            "body": "Razor: Karve &amp; co",
+            "parent_id": f"t3_{thread_id}",
+            "permalink": f"/r/wetshaving/comments/{thread_id}/x/{comment_id}/",
+        },
+    }
+
+
+class FakeReddit:
+    """Mock transport handler serving thread listings and morechildren batches.
+
+    Each thread's comments are one minute apart, newest first: the listed ones,
+    then the ones behind the "more" stub.
+    """
+
+    def __init__(self, threads: int, listed: int, more: int, latency: float = 0.05):
+        self.threads = {f"t{n}": (listed, more) for n in range(threads)}
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+        self.rate_limited: set[str] = set()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return self._respond(request)
+        finally:
+            self.in_flight -= 1
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        url = urlparse(str(request.url))
+        if url.path in self.rate_limited:
+            self.rate_limited.discard(url.path)
+            return httpx.Response(429, headers={"x-ratelimit-reset": "0"})
+
+        if url.path == "/api/morechildren.json":
+            query = parse_qs(url.query)
+            thread_id = query["link_id"][0][3:]
+            ids = query["children"][0].split(",")
+            assert len(ids) <= 100
+            things = [_comment(i, thread_id, self._created(i)) for i in ids]
+            return httpx.Response(200, json={"json": {"data": {"things": things}}})
+
+        thread_id = url.path.split("/")[4]
+        listed, more = self.threads[thread_id]
+        children = [
+            _comment(f"{thread_id}c{n}", thread_id, self._created(f"{thread_id}c{n}"))
+            for n in range(listed)
+        ]
+        if more:
+            more_ids = [f"t1_{thread_id}m{n}" for n in range(more)]
+            children.append(
+                {"kind": "more", "data": {"depth": 0, "children": more_ids, "count": more}}
+            )
+        return httpx.Response(
+            200,
+            json=[{"kind": "Listing"}, {"kind": "Listing", "data": {"children": children}}],
+            headers={"x-ratelimit-remaining": "500", "x-ratelimit-reset": "60"},
+        )
+
+    def _created(self, comment_id: str) -> float:
+        thread_id, kind, n = re.fullmatch(r"(t\d+)([cm])(\d+)", comment_id).groups()
+        position = int(n) + (self.threads[thread_id][0] if kind == "m" else 0)
+        return 1704067200.0 - 60 * position
+
+
+def _threads(count: int) -> list:
+    return [
+        {
+            "id": f"t{n}",
+            "title": f"SOTD {n}",
+            "url": f"https://www.reddit.com/r/wetshaving/comments/t{n}/x/",
+        }
+        for n in range(count)
+    ]
+
+
+class TestAsyncCommentFetcher:
+    """Test concurrent thread listing and morechildren expansion."""
+
+    async def test_month_backfill_is_pipelined(self):
+        fake = FakeReddit(threads=30, listed=100, more=250)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+
+        async with client:
+            comments = await fetch_comments_for_threads_async(
+                _threads(30),
+                cookies={},
+                client=client,
+                rate_limiter=RateLimitBudget(0.0),
+                max_concurrency=10,
+            )
+
+        # One listing plus three morechildren batches per thread
+        assert fake.requests == 30 * 4
+        assert len(comments) == 30 * 350
+        assert len({c["id"] for c in comments}) == len(comments)
+        # Comments come back in thread order, listing first, with thread context
+        assert [c["id"] for c in comments[:2]] == ["t0c0", "t0c1"]
+        assert comments[100]["id"] == "t0m0"
+        assert comments[-1]["thread_id"] == "t29"
+        assert comments[0]["thread_title"] == "SOTD 0"
+        assert comments[0]["body"] == "Razor: Karve & co"
+        # Requests overlap instead of running one round trip at a time
+        assert fake.max_in_flight > 1
+
+    async def test_rate_limit_response_is_retried(self):
+        fake = FakeReddit(threads=1, listed=3, more=0)
+        fake.rate_limited.add("/r/wetshaving/comments/t0/.json")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(fake)) as client:
+            json_data = await get_reddit_json_async(
+                client,
+                "https://www.reddit.com/r/wetshaving/comments/t0/.json?limit=100&depth=1",
+                RateLimitBudget(0.0),
+            )
+
+        assert fake.requests == 2
+        comments, more_ids = _split_comment_listing(json_data)
+        assert [c["id"] for c in comments] == ["t0c0", "t0c1", "t0c2"]
+        assert more_ids == []
+
+    async def test_failed_thread_does_not_stop_others(self):
+        fake = FakeReddit(threads=2, listed=2, more=0)
+        threads = _threads(3)  # t2 is unknown to the fake and fails
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(fake)) as client:
+            comments = await fetch_comments_for_threads_async(
+                threads, cookies={}, client=client, rate_limiter=RateLimitBudget(0.0)
+            )
+
+        assert [c["thread_id"] for c in comments] == ["t0", "t0", "t1", "t1"]
+
+    async def test_old_threads_are_served_from_cache(self, tmp_path):
+        fake = FakeReddit(threads=2, listed=2, more=150)
+        threads = _threads(2)
+        threads[0]["created_utc"] = "2020-01-01T00:00:00Z"
+        cache = ResponseCache(tmp_path)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(fake)) as client:
+            kwargs = dict(cookies={}, client=client, rate_limiter=RateLimitBudget(0.0))
+            first = await fetch_comments_for_threads_async(threads, cache=cache, **kwargs)
+            assert fake.requests == 6
+            second = await fetch_comments_for_threads_async(threads, cache=cache, **kwargs)
+        cache.close()
+
+        # Only the recent thread (listing + two morechildren batches) is requested again
+        assert second == first
+        assert fake.requests == 9
+        assert cache.hits == 3
+
+    async def test_delta_fetch_stops_at_high_water_mark(self):
+        fake = FakeReddit(threads=1, listed=100, more=250)
+        # Newest stored comment is the 31st behind the "more" stub
+        since = "2023-12-31T21:50:00Z"
+        assert fake._created("t0m30") == iso_to_timestamp(since)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(fake)) as client:
+            comments_since = await fetch_comments_for_threads_async(
+                _threads(1),
+                cookies={},
+                client=client,
+                rate_limiter=RateLimitBudget(0.0),
+                since_by_thread={"t0": since},
+            )
+
+        # The listing and the first morechildren batch reach the mark
+        assert fake.requests == 2
+        assert len(comments_since) == 200
+        assert comments_since[0]["id"] == "t0c0"
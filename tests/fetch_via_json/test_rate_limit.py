@@ -0,0 +1,157 @@
+"""Tests for the shared rate-limit budget used by parallel JSON fetching."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sotd.fetch_via_json.json_scraper import get_reddit_json, get_reddit_session
+from sotd.fetch_via_json.rate_limit import RateLimitBudget, parse_rate_limit_headers
+
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestRateLimitBudget:
+    """Test token-bucket pacing from rate limit headers."""
+
+    def test_parse_headers(self):
+        headers = {
+            "X-Ratelimit-Remaining": "12.0",
+            "x-ratelimit-reset": "30",
+            "x-ratelimit-used": "x",
+        }
+        assert parse_rate_limit_headers(headers) == (12.0, 30.0, None)
+
+    def test_unknown_budget_uses_base_delay(self, clock):
+        budget = RateLimitBudget(0.5, clock=clock, sleep=clock.sleep)
+        assert [budget.acquire() for _ in range(3)] == [0.0, 0.5, 0.5]
+
+    def test_spreads_remaining_budget_across_window(self, clock):
+        budget = RateLimitBudget(0.1, clock=clock, sleep=clock.sleep)
+        budget.update({"x-ratelimit-remaining": "4", "x-ratelimit-reset": "10"})
+
+        starts = []
+        for _ in range(5):
+            budget.acquire()
+            starts.append(clock.now)
+
+        # Four requests fit in the window; the fifth waits for the reset
+        assert starts[:4] == sorted(starts[:4]) and starts[3] < 10
+        assert starts[4] >= 10
+
+    def test_lowest_remaining_wins_within_window(self, clock):
+        budget = RateLimitBudget(0.1, clock=clock, sleep=clock.sleep)
+        budget.update({"x-ratelimit-remaining": "50", "x-ratelimit-reset": "60"})
+        budget.update({"x-ratelimit-remaining": "40", "x-ratelimit-reset": "59.9"})
+        budget.update({"x-ratelimit-remaining": "45", "x-ratelimit-reset": "59.8"})
+        assert budget.remaining == 40
+
+        # A later reset starts a new window
+        budget.update({"x-ratelimit-remaining": "100", "x-ratelimit-reset": "120"})
+        assert budget.remaining == 100
+
+    def test_pause_blocks_all_workers(self, clock):
+        budget = RateLimitBudget(0.1, clock=clock, sleep=clock.sleep)
+        budget.pause(5)
+        assert budget.acquire() == 5
+
+
+class _StubState:
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.counts: dict[int, int] = {}
+        self.served = 0
+        self.rejected = 0
+
+
+def _make_handler(state: _StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with state.lock:
+                elapsed = time.monotonic() - state.started
+                window = int(elapsed // state.window)
+                used = state.counts.get(window, 0) + 1
+                state.counts[window] = used
+                reset = (window + 1) * state.window - elapsed
+                allowed = used <= state.limit
+                if allowed:
+                    state.served += 1
+                else:
+                    state.rejected += 1
+
+            body = json.dumps({"ok": allowed}).encode()
+            self.send_response(200 if allowed else 429)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("x-ratelimit-remaining", str(max(state.limit - used, 0)))
+            self.send_header("x-ratelimit-used", str(used))
+            self.send_header("x-ratelimit-reset", f"{reset:.3f}")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def stub_server():
+    state = _StubState(limit=5, window=0.6)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestSharedBudgetAgainstStubServer:
+    """Parallel workers sharing one budget stay within the server's limit."""
+
+    def test_parallel_workers_do_not_exceed_budget(self, stub_server):
+        base_url, state = stub_server
+        session = get_reddit_session(pool_size=4)
+        budget = RateLimitBudget(0.01, window_slack=0.2)
+        # Learn the current window before the workers start
+        get_reddit_json(f"{base_url}/warmup.json", session=session, rate_limiter=budget)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda i: get_reddit_json(
+                        f"{base_url}/t{i}.json", session=session, rate_limiter=budget
+                    ),
+                    range(11),
+                )
+            )
+
+        assert results == [{"ok": True}] * 11
+        assert state.rejected == 0
+        assert state.served == 12
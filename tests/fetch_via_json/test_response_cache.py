@@ -0,0 +1,154 @@
+"""Tests for the HTTP response cache used by JSON fetching."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sotd.fetch_via_json.json_scraper import get_reddit_json, get_reddit_session
+from sotd.fetch_via_json.rate_limit import RateLimitBudget
+from sotd.fetch_via_json.response_cache import ResponseCache
+
+# 2025-01-01T00:00:00Z
+NOW = 1735689600.0
+
+
+class _EtagHandler(BaseHTTPRequestHandler):
+    requests: list = []
+    etag = '"v1"'
+
+    def do_GET(self):
+        type(self).requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path, "etag": self.etag}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def etag_server():
+    _EtagHandler.requests = []
+    _EtagHandler.etag = '"v1"'
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EtagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache = ResponseCache(tmp_path, clock=lambda: NOW)
+    yield response_cache
+    response_cache.close()
+
+
+def _fetch(url, cache, immutable_since=None):
+    return get_reddit_json(
+        url,
+        session=get_reddit_session(),
+        rate_limiter=RateLimitBudget(0.0),
+        cache=cache,
+        immutable_since=immutable_since,
+    )
+
+
+class TestResponseCache:
+    """Test cache storage and the immutability policy."""
+
+    def test_immutable_since(self, cache):
+        assert cache.immutable_since("2024-12-20T12:00:00Z") == NOW - 4.5 * 86400
+        assert cache.immutable_since(None) is None
+        assert cache.immutable_since("not a date") is None
+
+    def test_is_immutable_depends_on_fetch_time(self, cache):
+        cache.store("https://x/a.json", {}, {})
+        entry = cache.lookup("https://x/a.json")
+
+        assert ResponseCache.is_immutable(entry, cache.immutable_since("2024-12-20T12:00:00Z"))
+        # Cached one day after the thread was created: later comments may be missing
+        assert not ResponseCache.is_immutable(entry, cache.immutable_since("2024-12-31T00:00:00Z"))
+        assert not ResponseCache.is_immutable(entry, None)
+
+    def test_store_and_lookup(self, tmp_path, cache):
+        cache.store("https://x/a.json", {"a": [1]}, {"etag": '"e"', "Last-Modified": "Wed"})
+        cache.close()
+
+        reopened = ResponseCache(tmp_path)
+        entry = reopened.lookup("https://x/a.json")
+        assert ResponseCache.conditional_headers(entry) == {
+            "If-None-Match": '"e"',
+            "If-Modified-Since": "Wed",
+        }
+        assert reopened.use(entry) == {"a": [1]}
+        assert ResponseCache(tmp_path, refresh=True).lookup("https://x/a.json") is None
+        reopened.close()
+
+
+class TestGetRedditJsonWithCache:
+    """Test conditional revalidation and immutable reuse against a stub server."""
+
+    def test_revalidates_with_etag(self, etag_server, cache):
+        url = f"{etag_server}/r/wetshaving/comments/abc/.json"
+
+        first = _fetch(url, cache)
+        second = _fetch(url, cache)
+
+        assert first == second == {"path": "/r/wetshaving/comments/abc/.json", "etag": '"v1"'}
+        assert "If-None-Match" not in _EtagHandler.requests[0]
+        assert _EtagHandler.requests[1]["If-None-Match"] == '"v1"'
+        assert (cache.downloads, cache.revalidated, cache.hits) == (1, 1, 0)
+
+    def test_changed_content_is_downloaded(self, etag_server, cache):
+        url = f"{etag_server}/thread.json"
+        _fetch(url, cache)
+        _EtagHandler.etag = '"v2"'
+
+        assert _fetch(url, cache)["etag"] == '"v2"'
+        assert cache.lookup(url).etag == '"v2"'
+
+    def test_immutable_url_needs_no_request(self, etag_server, cache):
+        url = f"{etag_server}/thread.json"
+        _fetch(url, cache)
+
+        immutable_since = cache.immutable_since("2024-12-20T12:00:00Z")
+        assert _fetch(url, cache, immutable_since)["etag"] == '"v1"'
+        assert len(_EtagHandler.requests) == 1
+        assert cache.hits == 1
+
+    def test_url_cached_while_thread_was_young_is_revalidated(self, etag_server, tmp_path):
+        now = [NOW]
+        cache = ResponseCache(tmp_path, clock=lambda: now[0])
+        url = f"{etag_server}/thread.json"
+        # Thread created two days before the first fetch
+        immutable_since = cache.immutable_since("2024-12-30T00:00:00Z")
+        _fetch(url, cache, immutable_since)
+
+        # Ten days later the thread is old, but the cached listing predates that
+        now[0] = NOW + 10 * 86400
+        _EtagHandler.etag = '"v2"'
+        assert _fetch(url, cache, immutable_since)["etag"] == '"v2"'
+        assert len(_EtagHandler.requests) == 2
+
+        # The listing fetched after the cutoff is final
+        assert _fetch(url, cache, immutable_since)["etag"] == '"v2"'
+        assert len(_EtagHandler.requests) == 2
+        assert (cache.downloads, cache.hits) == (2, 1)
+        cache.close()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Tests for per-input scoring features and the compiled modifier pipeline."""
+
+from unittest.mock import Mock, patch
+
+from sotd.match.brush.scoring.engine import ScoringEngine
+from sotd.match.brush.scoring.features import InputFeatures, build_knot_indicator_index
+from sotd.match.types import MatchResult
+
+KNOTS_DATA = {
+    "known_knots": {
+        "AP Shave Co": {
+            "G5C": {"patterns": [r"g5c"], "fiber": "Synthetic"},
+            "fiber": "Synthetic",
+        },
+        "Declaration Grooming": {"B2": {"patterns": [r"\bb2\b"]}},
+    }
+}
+
+
+class TestInputFeatures:
+    """Test InputFeatures."""
+
+    def test_features(self):
+        """Features describe the input string."""
+        features = InputFeatures("Chisel & Hound Walnut 26mm Badger")
+
+        assert features.lower == "chisel & hound walnut 26mm badger"
+        assert features.fiber == "Badger"
+        assert features.has_size is True
+        assert features.has_handle_indicator is False
+        assert features.has_knot_indicator is False
+
+    def test_handle_indicator_needs_whole_word(self):
+        """Handle words only count as whole words."""
+        assert InputFeatures("Dogwood resin handle").has_handle_indicator is True
+        assert InputFeatures("Hornet").has_handle_indicator is False
+
+    def test_knot_indicator_index(self):
+        """Known knot model names and patterns are indicators; brand-level keys are not."""
+        model_names, patterns = build_knot_indicator_index(KNOTS_DATA)
+        assert model_names == ["g5c", "b2"]
+        assert len(patterns) == 2
+
+        def index():
+            return model_names, patterns
+
+        assert InputFeatures("Paladin w/ G5C", index).has_knot_indicator is True
+        assert InputFeatures("Washington B2", index).has_knot_indicator is True
+        assert InputFeatures("Washington Synthetic", index).has_knot_indicator is False
+
+    def test_knot_index_is_not_built_unless_needed(self):
+        """The knots catalog is only read when knot indicators are looked at."""
+        index = Mock(return_value=([], []))
+        features = InputFeatures("Simpson Chubby 2", index)
+
+        assert features.fiber is None
+        index.assert_not_called()
+
+    def test_features_are_computed_once(self):
+        """Repeated reads reuse the first result."""
+        features = InputFeatures("Zenith B2 boar")
+        with patch("sotd.match.brush.scoring.features.match_fiber", return_value="Boar") as fiber:
+            assert features.fiber == "Boar"
+            assert features.fiber == "Boar"
+
+        assert fiber.call_count == 1
+
+
+class TestModifierPipeline:
+    """Test ScoringEngine's compiled modifier pipeline."""
+
+    def _engine(self, modifiers):
+        config = Mock()
+        config.weights = {"strategy_modifiers": {"knot_matching": modifiers}}
+        config.get_base_strategy_score.return_value = 30.0
+        config.get_all_modifier_names.side_effect = lambda name: list(modifiers)
+        config.get_strategy_modifier.side_effect = lambda name, modifier: modifiers[modifier]
+        return ScoringEngine(config)
+
+    def _results(self, count):
+        return [
+            MatchResult(
+                original="Zenith B2 28mm boar",
+                matched={"knot": {"brand": f"Brand {index}", "priority": 1}},
+                match_type="regex",
+                pattern="b2",
+                strategy="knot_matching",
+            )
+            for index in range(count)
+        ]
+
+    def test_zero_weight_modifiers_are_not_called(self):
+        """Modifiers weighted 0 cannot change a score, so their methods never run."""
+        engine = self._engine({"fiber_match": 5.0, "size_match": 0.0})
+
+        with patch.object(ScoringEngine, "_modifier_size_match") as size_match:
+            results = engine.score_results(self._results(2), "Zenith B2 28mm boar")
+
+        size_match.assert_not_called()
+        assert [result.score for result in results] == [35.0, 35.0]
+
+    def test_input_features_are_shared_by_all_results(self):
+        """Fiber and size are extracted once per input, however many results are scored."""
+        engine = self._engine({"fiber_match": 5.0, "size_match": 5.0, "priority_score": 5.0})
+
+        with (
+            patch("sotd.match.brush.scoring.features.match_fiber", return_value="Boar") as fiber,
+            patch("sotd.match.brush.scoring.features.parse_knot_size", return_value=28.0) as size,
+        ):
+            results = engine.score_results(self._results(5), "Zenith B2 28mm boar")
+
+        assert fiber.call_count == 1
+        assert size.call_count == 1
+        assert {result.score for result in results} == {30.0 + 5.0 + 5.0 + 15.0}
+
+    def test_pipeline_is_rebuilt_when_config_reloads(self):
+        """Reloading the configuration replaces the weights and the compiled pipeline."""
+        modifiers = {"fiber_match": 5.0}
+        engine = self._engine(modifiers)
+        engine.score_results(self._results(1), "boar")
+
+        modifiers["fiber_match"] = 10.0
+        engine.config.weights = {"strategy_modifiers": {"knot_matching": modifiers}}
+        results = engine.score_results(self._results(1), "boar")
+
+        assert results[0].score == 40.0
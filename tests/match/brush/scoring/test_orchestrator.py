@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Tests for StrategyOrchestrator."""
 
+import inspect
+
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
+from sotd.match.brush.scoring.engine import ScoringEngine
 from sotd.match.brush.scoring.orchestrator import StrategyOrchestrator
 from sotd.match.brush.strategies.base_brush_matching_strategy import (
     BaseBrushMatchingStrategy,
@@ -261,3 +264,125 @@ class TestStrategyOrchestrator:
         assert len(results) == 0
         assert orchestrator.get_strategy_count() == 0
         assert orchestrator.get_strategy_names() == []
+
+
+def _scoring_engine(base_scores, modifiers=None):
+    """ScoringEngine over an in-memory scoring configuration."""
+    modifiers = modifiers or {}
+    config = Mock()
+    config.weights = {"base_strategies": base_scores, "strategy_modifiers": modifiers}
+    config.get_base_strategy_score.side_effect = lambda name: base_scores.get(name, 0.0)
+    config.get_all_modifier_names.side_effect = lambda name: list(modifiers.get(name, {}))
+    config.get_strategy_modifier.side_effect = lambda name, modifier: modifiers[name][modifier]
+    return ScoringEngine(config)
+
+
+class _ScoredStrategy(BaseBrushMatchingStrategy):
+    """Strategy returning a fixed brand under a scoring name, counting its calls."""
+
+    def __init__(self, scoring_name, brand):
+        self.name = scoring_name
+        self.scoring_name = scoring_name
+        self.brand = brand
+        self.calls = 0
+
+    def match(self, value, full_string=None):
+        self.calls += 1
+        if self.brand is None:
+            return None
+        return MatchResult(
+            original=value,
+            matched={"brand": self.brand},
+            match_type="regex",
+            pattern=self.brand,
+            strategy=self.name,
+        )
+
+
+class TestScoreBoundPruning:
+    """Test score bounds and run_strategies_pruned."""
+
+    def test_max_score_uses_best_case_of_each_modifier(self):
+        """Positive weights count at their top value, penalties at zero."""
+        engine = _scoring_engine(
+            {"automated_split": 55.0},
+            {
+                "automated_split": {
+                    "multiple_brands": 125.0,
+                    "same_brand": -20.0,
+                    "knot_weight": 2.0,
+                    "unscored_bonus": 3.0,
+                }
+            },
+        )
+
+        assert engine.get_max_score("automated_split") == 55.0 + 125.0 + 2.0 * 19.0 + 3.0
+        assert engine.get_max_score("unknown_strategy") == 0.0
+
+    def test_stops_once_no_remaining_strategy_can_win(self):
+        """Strategies run by descending bound until the best result cannot be beaten."""
+        engine = _scoring_engine({"low": 70.0, "high": 155.0, "mid": 80.0})
+        low = _ScoredStrategy("low", "Low")
+        high = _ScoredStrategy("high", "High")
+        mid = _ScoredStrategy("mid", "Mid")
+        orchestrator = StrategyOrchestrator([low, high, mid], engine)
+
+        results = orchestrator.run_strategies_pruned("test brush", {})
+
+        assert [result.strategy for result in results] == ["high"]
+        assert results[0].score == 155.0
+        assert (low.calls, high.calls, mid.calls) == (0, 1, 0)
+
+    def test_matches_exhaustive_evaluation(self):
+        """A strategy without a match does not stop evaluation, and ties keep list order."""
+        engine = _scoring_engine({"first": 80.0, "second": 80.0, "best": 155.0})
+        strategies = [
+            _ScoredStrategy("first", "First"),
+            _ScoredStrategy("second", "Second"),
+            _ScoredStrategy("best", None),
+        ]
+        orchestrator = StrategyOrchestrator(strategies, engine)
+
+        pruned = orchestrator.run_strategies_pruned("test brush", {})
+        exhaustive = engine.score_results(orchestrator.run_all_strategies("test brush", {}), "")
+
+        assert engine.get_best_result(pruned).strategy == "first"
+        assert engine.get_best_result(exhaustive).strategy == "first"
+        assert [strategy.calls for strategy in strategies] == [2, 1, 2]
+
+    def test_equal_bound_earlier_in_list_still_runs(self):
+        """An earlier strategy that could tie the best score would win, so it runs."""
+        engine = _scoring_engine(
+            {"tied": 80.0, "bonus": 80.0}, {"bonus": {"multiple_brands": 20.0}}
+        )
+        tied = _ScoredStrategy("tied", "Tied")
+        bonus = _ScoredStrategy("bonus", "Bonus")
+        orchestrator = StrategyOrchestrator([tied, bonus], engine)
+
+        results = orchestrator.run_strategies_pruned("test brush", {})
+
+        assert [result.strategy for result in results] == ["tied", "bonus"]
+        assert engine.get_best_result(results).strategy == "tied"
+
+    def test_unbounded_strategies_always_run(self):
+        """Strategies without a scoring_name cannot be skipped."""
+        engine = _scoring_engine({"high": 155.0})
+        high = _ScoredStrategy("high", "High")
+        unbounded = _ScoredStrategy("other", "Other")
+        unbounded.scoring_name = None
+        orchestrator = StrategyOrchestrator([high, unbounded], engine)
+
+        orchestrator.run_strategies_pruned("test brush", {})
+
+        assert unbounded.calls == 1
+
+    def test_match_signature_is_inspected_once(self):
+        """Whether match() takes cached_results is worked out once per strategy."""
+        strategy = _ScoredStrategy("high", "High")
+        orchestrator = StrategyOrchestrator([strategy])
+
+        with patch("inspect.signature", wraps=inspect.signature) as signature:
+            for _ in range(3):
+                orchestrator.run_all_strategies("test brush", {"some": "cached data"})
+
+        assert signature.call_count == 1
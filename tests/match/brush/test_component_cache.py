@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Tests for the shared handle/knot component match memo."""
+
+from unittest.mock import Mock
+
+from sotd.match.brush.component_cache import ComponentMatchCache
+from sotd.match.brush.strategies.full_input_component_matching_strategy import (
+    FullInputComponentMatchingStrategy,
+)
+from sotd.match.types import MatchResult
+
+
+def _handle_result(text: str) -> MatchResult:
+    return MatchResult(
+        original=text,
+        matched={"handle_maker": "Declaration Grooming", "handle_model": "Washington"},
+        match_type="regex",
+        pattern="washington",
+    )
+
+
+def _knot_result(text: str) -> MatchResult:
+    return MatchResult(
+        original=text,
+        matched={"brand": "Declaration Grooming", "model": "B2", "fiber": "Badger"},
+        match_type="regex",
+        pattern="b2",
+    )
+
+
+class TestComponentMatchCache:
+    """Test ComponentMatchCache memoization and statistics."""
+
+    def setup_method(self):
+        """Set up mock matchers."""
+        self.handle_matcher = Mock()
+        self.handle_matcher.match.side_effect = _handle_result
+        self.knot_matcher = Mock()
+        self.knot_matcher.match.side_effect = lambda text, full_string=None: _knot_result(text)
+        self.cache = ComponentMatchCache(self.handle_matcher, self.knot_matcher)
+
+    def test_repeated_texts_are_matched_once(self):
+        """Each distinct text reaches the underlying matcher once."""
+        for _ in range(3):
+            assert self.cache.match_handle_maker("Washington")["handle_model"] == "Washington"
+            assert self.cache.match_knot("B2").matched["model"] == "B2"
+
+        assert self.handle_matcher.match.call_count == 1
+        assert self.knot_matcher.match.call_count == 1
+        stats = self.cache.get_stats()
+        assert stats["hits"] == 4
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == 4 / 6
+
+    def test_knot_key_includes_full_string(self):
+        """Knot patterns may look at the full string, so it is part of the key."""
+        self.cache.match_knot("B2", full_string="Washington w/ B2")
+        self.cache.match_knot("B2", full_string="Chisel & Hound w/ B2")
+
+        assert self.knot_matcher.match.call_count == 2
+
+    def test_no_match_is_memoized(self):
+        """Texts that do not match are not re-matched either."""
+        self.handle_matcher.match.side_effect = None
+        self.handle_matcher.match.return_value = None
+
+        assert self.cache.match_handle("unknown") is None
+        assert self.cache.match_handle("unknown") is None
+        assert self.handle_matcher.match.call_count == 1
+
+    def test_callers_get_independent_copies(self):
+        """Modifying a returned result does not change later lookups."""
+        first = self.cache.match_knot("B2")
+        first.matched["model"] = "changed"
+
+        assert self.cache.match_knot("B2").matched["model"] == "B2"
+
+    def test_bounded_size_and_clear(self):
+        """The memo evicts the least recently used text and clear() resets it."""
+        cache = ComponentMatchCache(self.handle_matcher, self.knot_matcher, max_size=2)
+        for text in ["a", "b", "c"]:
+            cache.match_handle(text)
+
+        assert cache.get_stats()["size"] == 2
+        assert cache.get_stats()["evictions"] == 1
+
+        cache.clear()
+        assert cache.get_stats() == {
+            "size": 0,
+            "max_size": 2,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "enabled": True,
+            "hit_rate": 0.0,
+        }
+
+    def test_strategy_uses_memo_from_cached_results(self):
+        """Strategies match components through cached_results["component_matches"]."""
+        strategy = FullInputComponentMatchingStrategy(
+            self.handle_matcher, self.knot_matcher, {"brushes": {}}
+        )
+        cached_results = {"component_matches": self.cache}
+
+        first = strategy.match_all("Washington B2", cached_results)
+        second = strategy.match_all("Washington B2", cached_results)
+
+        assert first == second
+        assert first[0].match_type == "composite"
+        assert self.handle_matcher.match.call_count == 1
+        assert self.knot_matcher.match.call_count == 1
+        self.handle_matcher.match_handle_maker.assert_not_called()
@@ -0,0 +1,127 @@
+"""Tests for brush strategy diagnostics side files."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+from sotd.match.brush.diagnostics import (
+    attach_brush_diagnostics,
+    get_diagnostics_path,
+    load_diagnostics,
+    save_diagnostics,
+    strategy_results_to_json,
+)
+from sotd.match.run import process_month
+from sotd.match.types import MatchResult
+
+
+def _strategies() -> list:
+    return strategy_results_to_json(
+        [
+            MatchResult(
+                original="Simpson Chubby 2",
+                matched={"brand": "Simpson", "model": "Chubby 2"},
+                match_type="exact",
+                pattern="chubby\\s*2",
+                strategy="known_brush",
+            )
+        ]
+    )
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    """Side files are gzipped JSON keyed by comment ID."""
+    path = get_diagnostics_path(tmp_path, "2025-01")
+    save_diagnostics(path, {"abc": _strategies()})
+
+    assert path == tmp_path / "matched" / "diagnostics" / "2025-01.json.gz"
+    loaded = load_diagnostics(path)
+    assert loaded["abc"][0]["strategy"] == "known_brush"
+    assert loaded["abc"][0]["matched"] == {"brand": "Simpson", "model": "Chubby 2"}
+
+
+def test_load_missing_file_is_empty(tmp_path: Path) -> None:
+    """A month matched without --diagnostics has no side file."""
+    assert load_diagnostics(get_diagnostics_path(tmp_path, "2025-01")) == {}
+
+
+def test_attach_fills_only_missing_entries(tmp_path: Path) -> None:
+    """Brush entries without all_strategies get them from the side file."""
+    save_diagnostics(get_diagnostics_path(tmp_path, "2025-01"), {"abc": _strategies()})
+    records = [
+        {"id": "abc", "brush": {"normalized": "Simpson Chubby 2"}},
+        {"id": "def", "brush": {"normalized": "Omega 10049", "all_strategies": []}},
+        {"id": "ghi", "brush": {"normalized": "Unknown brush"}},
+        {"id": "jkl", "razor": {"normalized": "Gillette Tech"}},
+    ]
+
+    attach_brush_diagnostics(records, tmp_path, "2025-01")
+
+    assert records[0]["brush"]["all_strategies"][0]["strategy"] == "known_brush"
+    assert records[1]["brush"]["all_strategies"] == []
+    assert "all_strategies" not in records[2]["brush"]
+    assert "brush" not in records[3]
+
+
+def test_attach_skips_side_file_when_not_needed(tmp_path: Path) -> None:
+    """Records that carry all_strategies inline never open the side file."""
+    path = get_diagnostics_path(tmp_path, "2025-01")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not gzip")
+    records = [{"id": "abc", "brush": {"all_strategies": []}}]
+
+    attach_brush_diagnostics(records, tmp_path, "2025-01")
+
+    assert records[0]["brush"]["all_strategies"] == []
+
+
+def test_process_month_writes_side_file(tmp_path: Path, monkeypatch) -> None:
+    """match --diagnostics records every brush's strategies, even for repeated strings."""
+    other_result = MatchResult(
+        original="Simpson Chubby 2",
+        matched={"brand": "Simpson", "model": "Chubby"},
+        match_type="regex",
+        pattern="chubby",
+        strategy="other_brush",
+    )
+
+    def match(normalized, original):
+        # Like BrushMatcher, the winning result is also listed in its own all_strategies
+        result = MatchResult(
+            original=original,
+            matched={"brand": "Simpson", "model": "Chubby 2"},
+            match_type="regex",
+            pattern="chubby\\s*2",
+            strategy="known_brush",
+        )
+        result.all_strategies = [result, other_result]
+        return result
+
+    brush_matcher = Mock()
+    brush_matcher.get_cache_stats.return_value = {}
+    brush_matcher.match.side_effect = match
+    monkeypatch.setattr(
+        "sotd.match.run._get_matchers", lambda *args: (Mock(), Mock(), Mock(), brush_matcher)
+    )
+    filtered_manager = Mock()
+    filtered_manager.is_filtered.return_value = False
+    filtered_manager.file_path = tmp_path / "intentionally_unmatched.yaml"
+    monkeypatch.setattr("sotd.match.run._get_filtered_entries_manager", lambda: filtered_manager)
+    brush = {"original": "Simpson Chubby 2", "normalized": "simpson chubby 2"}
+    extracted = tmp_path / "extracted" / "2025-01.json"
+    extracted.parent.mkdir()
+    extracted.write_text(
+        json.dumps(
+            {"meta": {}, "data": [{"id": "abc", "brush": brush}, {"id": "def", "brush": brush}]}
+        )
+    )
+
+    result = process_month("2025-01", tmp_path, diagnostics=True, use_match_cache=True)
+
+    assert result["status"] == "completed"
+    diagnostics = load_diagnostics(get_diagnostics_path(tmp_path, "2025-01"))
+    assert set(diagnostics) == {"abc", "def"}
+    assert [entry["strategy"] for entry in diagnostics["abc"]] == ["known_brush", "other_brush"]
+    assert "all_strategies" not in diagnostics["abc"][0]
+    matched = json.loads((tmp_path / "matched" / "2025-01.json").read_text())
+    assert all("all_strategies" not in record["brush"] for record in matched["data"])
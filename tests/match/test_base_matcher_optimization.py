@@ -245,3 +245,42 @@ class TestBaseMatcherOptimization:
         assert "pattern4" in pattern_dict
         assert pattern_dict["pattern4"]["brand"] == "Brand2"
         assert pattern_dict["pattern4"]["model"] == "Model3"
+
+    def test_case_insensitive_fallback_uses_index(self):
+        """Case-insensitive probes resolve through the lowercase index."""
+        matcher = BaseMatcher(Path("data/razors.yaml"), "razor")
+        matcher.correct_matches = {"Brand1": {"Model1": ["Mixed Case String", "mixed case string"]}}
+        matcher.catalog = {"Brand1": {"Model1": {"format": "DE"}}}
+
+        result = matcher._check_correct_matches("MIXED CASE STRING")
+        assert result is not None
+        assert result["model"] == "Model1"
+        assert matcher._check_correct_matches("other string") is None
+
+        matcher.clear_caches()
+        assert matcher._correct_matches_lower is None
+
+    def test_correct_matches_miss_does_not_scan(self):
+        """A miss is two dict lookups: no correct match is scanned and no index is rebuilt."""
+
+        class NoScanDict(dict):
+            def _scan(self, *args):
+                raise AssertionError("correct matches were scanned")
+
+            __iter__ = items = keys = values = _scan
+
+        matcher = BaseMatcher(Path("data/razors.yaml"), "razor")
+        matcher.correct_matches = {
+            "Brand": {"Model": [f"Correct String {i}" for i in range(50_000)]}
+        }
+        matcher.catalog = {"Brand": {"Model": {"format": "DE"}}}
+        matcher._check_correct_matches("warm up")
+        assert len(matcher._correct_matches_lower) == 50_000
+
+        matcher._correct_matches_lookup = NoScanDict(matcher._correct_matches_lookup)
+        matcher._correct_matches_lower = NoScanDict(matcher._correct_matches_lower)
+        lower_index = matcher._correct_matches_lower
+        for i in range(100):
+            assert matcher._check_correct_matches(f"unmatched razor {i}") is None
+        assert matcher._check_correct_matches("CORRECT STRING 7")["model"] == "Model"
+        assert matcher._correct_matches_lower is lower_index
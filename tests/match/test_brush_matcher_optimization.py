@@ -97,3 +97,31 @@ class TestBrushMatcherOptimization:
         # Old performance was ~0.0005s per lookup, new should be much better
         # Allow more time for system load variations (performance tests can be flaky)
         assert avg_time < 0.003, f"BrushMatcher not optimized enough: {avg_time:.6f}s"
+
+    def test_pruned_evaluation_matches_full_evaluation(self):
+        """Skipping strategies that cannot win picks the same match and score."""
+        full = BrushMatcher()
+        pruned = BrushMatcher(full_evaluation=False)
+        test_cases = [
+            "Declaration Grooming Washington w/ B2",
+            "Chisel & Hound Tahoe 26mm Fanchurian",
+            "Simpson Chubby 2",
+            "Dogwood Handcrafts / Zenith B2 28mm boar",
+            "Omega 10049",
+            "AP Shave Co G5C in a Paladin handle",
+            "Semogue 620",
+            "Maggard 24mm synthetic",
+            "not a brush at all",
+        ]
+
+        for test_case in test_cases:
+            expected = full.match(test_case, bypass_correct_matches=True)
+            result = pruned.match(test_case, bypass_correct_matches=True)
+            if expected is None:
+                assert result is None
+                continue
+            assert result is not None
+            assert result.matched == expected.matched
+            assert result.strategy == expected.strategy
+            assert result.score == expected.score
+            assert len(result.all_strategies) <= len(expected.all_strategies)
@@ -655,6 +655,9 @@ class TestBrushUserActionsManager:
             assert temp_correct_matches.exists(), "correct_matches directory should exist"
             assert temp_correct_matches.is_dir(), "correct_matches should be a directory"
 
+            # Journaled entries reach brush.yaml when the journal is compacted
+            temp_manager.correct_matches_updater.compact()
+
             # Verify brush.yaml file was created within the directory
             brush_file = temp_correct_matches / "brush.yaml"
             assert brush_file.exists(), "brush.yaml should exist in correct_matches directory"
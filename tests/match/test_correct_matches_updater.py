@@ -6,7 +6,12 @@ from pathlib import Path
 
 import yaml
 
-from sotd.match.correct_matches_updater import CorrectMatchesUpdater
+from sotd.match.correct_matches_updater import (
+    JOURNAL_FILENAME,
+    CorrectMatchesUpdater,
+    _states,
+    compact_pending_journal,
+)
 
 
 class TestCorrectMatchesUpdater:
@@ -272,3 +277,88 @@ class TestCorrectMatchesUpdater:
         assert "Updated Brand" in data["brush"]
         assert "Updated Model" in data["brush"]["Updated Brand"]
         assert "test brush input" in data["brush"]["Updated Brand"]["Updated Model"]
+
+    def test_add_is_journaled_until_compacted(self):
+        """Single entries go to the journal; compaction writes sorted YAML."""
+        result_data = {"brand": "Test Brand", "model": "Test Model"}
+        self.updater.add_or_update_entry("test brush input", result_data, "validated", "brush")
+
+        brush_file = self.correct_matches_path / "brush.yaml"
+        assert not brush_file.exists()
+        assert (self.correct_matches_path / JOURNAL_FILENAME).exists()
+        assert self.updater.has_entry("test brush input", "brush")
+
+        self.updater.compact()
+
+        assert not (self.correct_matches_path / JOURNAL_FILENAME).exists()
+        with open(brush_file, "r") as f:
+            assert yaml.safe_load(f) == {"Test Brand": {"Test Model": ["test brush input"]}}
+
+    def test_journal_is_replayed_from_disk(self):
+        """A fresh process sees journaled entries and removals."""
+        result_data = {"brand": "Test Brand", "model": "Test Model"}
+        self.updater.add_or_update_entry("first input", result_data, "validated", "brush")
+        self.updater.add_or_update_entry("second input", result_data, "validated", "brush")
+        assert self.updater.remove_entry("first input", "brush")
+
+        _states.clear()
+        updater = CorrectMatchesUpdater(self.correct_matches_path)
+
+        assert not updater.has_entry("first input", "brush")
+        assert updater.has_entry("second input", "brush")
+
+    def test_journal_compacts_after_threshold(self):
+        """The journal is folded into the YAML files every compact_every operations."""
+        updater = CorrectMatchesUpdater(self.correct_matches_path, compact_every=2)
+        updater.add_or_update_entry("first knot", {"brand": "A"}, "validated", "knot")
+        assert not (self.correct_matches_path / "knot.yaml").exists()
+
+        updater.add_or_update_entry("second knot", {"brand": "B"}, "validated", "knot")
+
+        assert not (self.correct_matches_path / JOURNAL_FILENAME).exists()
+        with open(self.correct_matches_path / "knot.yaml", "r") as f:
+            assert set(yaml.safe_load(f)) == {"first knot", "second knot"}
+
+    def test_apply_operations_writes_each_field_once(self, monkeypatch):
+        """Bulk operations (and pending journal entries) cost one write per field file."""
+        result_data = {"brand": "Test Brand", "model": "Test Model"}
+        self.updater.add_or_update_entry("journaled input", result_data, "validated", "brush")
+
+        saved_fields = []
+        original_save = self.updater.save_correct_matches
+
+        def counting_save(data=None, field_type=None):
+            saved_fields.append(field_type)
+            original_save(data, field_type)
+
+        monkeypatch.setattr(self.updater, "save_correct_matches", counting_save)
+
+        operations = [
+            {
+                "op": "add",
+                "input_text": f"input {i}",
+                "result_data": result_data,
+                "action_type": "validated",
+                "field_type": "brush",
+            }
+            for i in range(500)
+        ]
+        operations.append({"op": "remove", "input_text": "missing", "field_type": "handle"})
+        results = self.updater.apply_operations(operations)
+
+        assert results == [True] * 500 + [False]
+        assert saved_fields == ["brush"]
+        assert not (self.correct_matches_path / JOURNAL_FILENAME).exists()
+        with open(self.correct_matches_path / "brush.yaml", "r") as f:
+            patterns = yaml.safe_load(f)["Test Brand"]["Test Model"]
+        assert len(patterns) == 501
+        assert "journaled input" in patterns
+
+    def test_compact_pending_journal(self):
+        """Readers of the YAML files can fold in a pending journal first."""
+        assert compact_pending_journal(self.correct_matches_path) is False
+
+        self.updater.add_or_update_entry("test handle", {"brand": "A"}, "validated", "handle")
+
+        assert compact_pending_journal(self.correct_matches_path) is True
+        assert (self.correct_matches_path / "handle.yaml").exists()
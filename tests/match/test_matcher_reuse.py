@@ -0,0 +1,58 @@
+"""Tests for reusing matchers across months within one process."""
+
+import os
+
+import pytest
+
+import sotd.match.run as match_run
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "razors.yaml").write_text("{}\n")
+    (tmp_path / "correct_matches").mkdir()
+    (tmp_path / "correct_matches" / "razor.yaml").write_text("{}\n")
+    return tmp_path
+
+
+@pytest.fixture
+def created(monkeypatch):
+    calls = []
+
+    def fake_create_matchers(base_path, correct_matches_path, debug=False):
+        calls.append(base_path)
+        return (object(), object(), object(), object())
+
+    monkeypatch.setattr(match_run, "_matcher_cache", {})
+    monkeypatch.setattr(match_run, "_create_matchers", fake_create_matchers)
+    return calls
+
+
+class TestGetMatchers:
+    def test_matchers_are_reused(self, data_dir, created):
+        first = match_run._get_matchers(data_dir, data_dir / "correct_matches")
+        second = match_run._get_matchers(data_dir, data_dir / "correct_matches")
+        assert first is second
+        assert len(created) == 1
+
+    def test_catalog_change_rebuilds_matchers(self, data_dir, created):
+        first = match_run._get_matchers(data_dir, data_dir / "correct_matches")
+        catalog = data_dir / "razors.yaml"
+        catalog.write_text("Gillette: {}\n")
+        stat = catalog.stat()
+        os.utime(catalog, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = match_run._get_matchers(data_dir, data_dir / "correct_matches")
+        assert first is not second
+        assert len(created) == 2
+
+    def test_correct_matches_change_rebuilds_matchers(self, data_dir, created):
+        match_run._get_matchers(data_dir, data_dir / "correct_matches")
+        (data_dir / "correct_matches" / "blade.yaml").write_text("{}\n")
+        match_run._get_matchers(data_dir, data_dir / "correct_matches")
+        assert len(created) == 2
+
+    def test_worker_initializer_warms_cache(self, data_dir, created):
+        match_run._init_month_worker(data_dir, False)
+        match_run._get_matchers(data_dir, data_dir / "correct_matches", False)
+        assert len(created) == 1
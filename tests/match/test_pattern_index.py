@@ -0,0 +1,222 @@
+"""Tests for the literal prefilter pattern index used by catalog matchers."""
+
+import re
+
+import pytest
+
+from sotd.match.brush.strategies.utils.pattern_cache import (
+    CompiledPatterns,
+    iter_candidate_patterns,
+)
+from sotd.match.utils.pattern_index import (
+    PatternIndex,
+    extract_required_literals,
+    extract_requirements,
+)
+
+
+def _first_match(items, text):
+    for pattern, compiled in items:
+        if compiled.search(text):
+            return pattern
+    return None
+
+
+def _build(patterns):
+    return [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in patterns]
+
+
+class TestExtractRequiredLiterals:
+    def test_plain_literal(self):
+        assert extract_required_literals("gillette") == ["gillette"]
+
+    def test_wildcards_split_runs(self):
+        assert extract_required_literals("gillette.*tech") == ["gillette", "tech"]
+
+    def test_optional_parts_are_not_required(self):
+        assert extract_required_literals("(merkur.*)?34c") == ["34c"]
+
+    def test_alternation_is_not_required(self):
+        assert extract_required_literals("(?:atlas|kronos).*h2") == ["h2"]
+
+    def test_repeat_with_minimum_contributes_content(self):
+        assert extract_required_literals("(?:astra)+ sp") == ["astra", " sp"]
+
+    def test_literals_are_lowercased(self):
+        assert extract_required_literals("Wolfman") == ["wolfman"]
+
+    def test_word_boundaries_keep_runs_contiguous(self):
+        assert extract_required_literals(r"\bmuhle\b") == ["muhle"]
+
+    def test_invalid_pattern_has_no_literals(self):
+        assert extract_required_literals("[invalid") == []
+
+
+class TestExtractRequirements:
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            (r"(?:zenith|omega).*b\d+", {"zenith", "omega"}),
+            (r"(?:wolfman|karve)\s*\w+", {"wolfman", "karve"}),
+            (r"(?:c&h|zenith)", {"c&h", "zenith"}),
+            (r"(?:(?:simp)+son|kent)", {"simp", "kent"}),
+        ],
+    )
+    def test_alternation_requires_one_alternative(self, pattern, expected):
+        assert frozenset(expected) in extract_requirements(pattern)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"(?:b2|\d).*",  # One alternative has no literal
+            r"(?:chisel|omega)?\s*h",  # Optional alternation
+        ],
+    )
+    def test_alternation_without_literal_in_every_branch(self, pattern):
+        assert all(len(requirement) == 1 for requirement in extract_requirements(pattern))
+
+
+class TestPatternIndex:
+    @pytest.fixture
+    def items(self):
+        return _build(
+            [
+                r"gillette.*slim.*adjustable",
+                r"gillette.*tech",
+                r"(?:atlas|kronos).*h2",
+                r"astra.*(?:sp|superior platinum)",
+                r"\bfeather\b",
+                r"(merkur.*)?34c",
+                r"ka?r?ve",
+            ]
+        )
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Gillette Slim Adjustable",
+            "gillette tech",
+            "Kronos H2",
+            "Astra Superior Platinum",
+            "FEATHER",
+            "Merkur 34C",
+            "34c",
+            "Karve Christopher Bradley",
+            "nothing here",
+            "",
+        ],
+    )
+    def test_candidates_preserve_first_match(self, items, text):
+        index = PatternIndex(items, lambda item: item[0])
+        assert _first_match(index.candidates(text), text) == _first_match(items, text)
+
+    def test_candidates_keep_priority_order(self, items):
+        index = PatternIndex(items, lambda item: item[0])
+        candidates = index.candidates("gillette slim adjustable tech")
+        positions = [items.index(item) for item in candidates]
+        assert positions == sorted(positions)
+        assert items[0] in candidates and items[1] in candidates
+
+    def test_non_matching_patterns_are_pruned(self, items):
+        index = PatternIndex(items, lambda item: item[0])
+        candidates = index.candidates("feather")
+        assert items[1] not in candidates
+        assert items[4] in candidates
+
+    def test_non_ascii_text_evaluates_all_patterns(self, items):
+        index = PatternIndex(items, lambda item: item[0])
+        assert index.candidates("Mühle R89") == items
+
+    def test_is_current_for_detects_modification(self, items):
+        index = PatternIndex(items, lambda item: item[0])
+        assert index.is_current_for(items)
+        items.append(("new", re.compile("new")))
+        assert not index.is_current_for(items)
+        assert not index.is_current_for(list(items))
+
+    def test_stats(self, items):
+        stats = PatternIndex(items, lambda item: item[0]).stats()
+        assert stats["patterns"] == len(items)
+        # "ka?r?ve" only requires two-character literals
+        assert stats["always_evaluated"] == 1
+
+    def test_alternation_patterns_are_indexed(self):
+        items = _build([r"(?:zenith|omega).*b\d+", r"semogue"])
+        index = PatternIndex(items, lambda item: item[0])
+        assert index.candidates("Omega B10049") == [items[0]]
+        assert index.candidates("Zenith B35 and Semogue") == items
+        assert index.candidates("Semogue 1800") == [items[1]]
+
+    def test_key_length(self, items):
+        index = PatternIndex(items, lambda item: item[0], key_length=2)
+        # With pair keys the two-character literals are indexed too
+        assert index.stats()["always_evaluated"] == 0
+        for text in ["Kronos H2", "Karve", "Feather"]:
+            assert _first_match(index.candidates(text), text) == _first_match(items, text)
+
+
+def _entries(*patterns):
+    return [{"compiled": re.compile(pattern, re.IGNORECASE)} for pattern in patterns]
+
+
+class TestIterCandidatePatterns:
+    def test_uses_index(self):
+        patterns = CompiledPatterns(_entries(r"zenith", r"omega", r"\bb2\b"))
+        assert iter_candidate_patterns(patterns, "Omega boar") == [patterns[1]]
+        assert iter_candidate_patterns(patterns, "Zenith B2") == [patterns[0], patterns[2]]
+
+    def test_candidates_match_full_scan(self):
+        patterns = CompiledPatterns(
+            _entries(
+                r"(?:dg|declaration).*b\d+",
+                r"simpson.*chubby\s*[12]",
+                r"semogue",
+                r"b\d+",
+                r"chubby",
+            )
+        )
+        for text in [
+            "Declaration Grooming B2",
+            "DG B15 in Washington",
+            "Simpson Chubby 2",
+            "Semogue 1800",
+            "Zenith B35",
+            "Chubby",
+            "Omega 10049",
+        ]:
+            full = [entry for entry in patterns if entry["compiled"].search(text)]
+            candidates = iter_candidate_patterns(patterns, text)
+            assert [entry for entry in candidates if entry["compiled"].search(text)] == full
+
+    def test_plain_list_is_returned_whole(self):
+        patterns = _entries(r"zenith", r"omega")
+        assert iter_candidate_patterns(patterns, "Omega boar") is patterns
+
+    def test_changed_list_is_returned_whole(self):
+        patterns = CompiledPatterns(_entries(r"zenith"))
+        patterns.append(_entries(r"omega")[0])
+        assert iter_candidate_patterns(patterns, "Omega boar") is patterns
+
+    def test_handle_regex_key(self):
+        patterns = CompiledPatterns(
+            [{"regex": re.compile(p, re.IGNORECASE)} for p in (r"jayaruh", r"dogwood")]
+        )
+        assert iter_candidate_patterns(patterns, "Dogwood Handcrafts") == [patterns[1]]
+
+
+class TestMatcherIntegration:
+    def test_razor_matcher_index_rebuilds_after_pattern_change(self, tmp_path):
+        from sotd.match.razor_matcher import RazorMatcher
+
+        catalog = tmp_path / "razors.yaml"
+        catalog.write_text(
+            "Gillette:\n  Tech:\n    patterns:\n      - gillette.*tech\n    format: DE\n"
+        )
+        matcher = RazorMatcher(catalog_path=catalog, bypass_correct_matches=True)
+        assert matcher.match("Gillette Tech").matched["model"] == "Tech"
+
+        matcher.patterns.append(
+            ("Karve", "CB", "DE", "karve", re.compile("karve", re.IGNORECASE), {})
+        )
+        matcher.clear_cache()
+        assert matcher.match("Karve").matched["brand"] == "Karve"
@@ -0,0 +1,226 @@
+"""Tests for the persistent match result cache."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from sotd.match.result_cache import MatchResultCache, compute_field_fingerprint
+from sotd.match.run import _collect_unique_match_keys, match_record, process_month
+from sotd.match.types import MatchResult
+from sotd.match.utils.performance import PerformanceMonitor
+
+
+@pytest.fixture
+def data_dir(tmp_path) -> Path:
+    (tmp_path / "razors.yaml").write_text(
+        "Gillette:\n  Tech:\n    patterns:\n      - gillette.*tech\n    format: DE\n"
+    )
+    (tmp_path / "blades.yaml").write_text("DE: {}\n")
+    (tmp_path / "soaps.yaml").write_text("{}\n")
+    (tmp_path / "correct_matches").mkdir()
+    (tmp_path / "correct_matches" / "razor.yaml").write_text("{}\n")
+    return tmp_path
+
+
+def _razor_result(original: str) -> MatchResult:
+    return MatchResult(
+        original=original,
+        matched={"brand": "Gillette", "model": "Tech", "format": "DE"},
+        match_type="regex",
+        pattern="gillette.*tech",
+    )
+
+
+class TestMatchResultCache:
+    def test_miss_then_hit_across_instances(self, data_dir):
+        calls = []
+
+        def match_fn():
+            calls.append(1)
+            return _razor_result("Gillette Tech")
+
+        cache = MatchResultCache(data_dir)
+        first = cache.get_or_match("razor", "gillette tech", "Gillette Tech", match_fn)
+        cache.close()
+
+        cache = MatchResultCache(data_dir)
+        second = cache.get_or_match("razor", "gillette tech", "GILLETTE TECH!", match_fn)
+        cache.close()
+
+        assert len(calls) == 1
+        assert second.matched == first.matched
+        assert second.original == "GILLETTE TECH!"
+        assert second.normalized == "gillette tech"
+        assert cache.stats()["hits"] == 1
+
+    def test_returned_results_do_not_share_state(self, data_dir):
+        cache = MatchResultCache(data_dir)
+        first = cache.get_or_match("razor", "gt", "gt", lambda: _razor_result("gt"))
+        first.matched["brand"] = "Mutated"
+        second = cache.get_or_match("razor", "gt", "gt", lambda: _razor_result("gt"))
+        assert second.matched["brand"] == "Gillette"
+        cache.close()
+
+    def test_catalog_change_invalidates_field(self, data_dir):
+        cache = MatchResultCache(data_dir)
+        cache.get_or_match("razor", "gt", "gt", lambda: _razor_result("gt"))
+        cache.close()
+
+        with (data_dir / "razors.yaml").open("a") as f:
+            f.write("  Super Speed:\n    patterns:\n      - super.*speed\n    format: DE\n")
+
+        calls = []
+        cache = MatchResultCache(data_dir)
+        cache.get_or_match("razor", "gt", "gt", lambda: calls.append(1) or _razor_result("gt"))
+        cache.close()
+        assert calls == [1]
+
+    def test_correct_matches_change_changes_fingerprint(self, data_dir):
+        before = compute_field_fingerprint("razor", data_dir)
+        blade_before = compute_field_fingerprint("blade", data_dir)
+        (data_dir / "correct_matches" / "razor.yaml").write_text(
+            "Gillette:\n  Tech:\n    - gillette tech\n"
+        )
+        assert compute_field_fingerprint("razor", data_dir) != before
+        assert compute_field_fingerprint("blade", data_dir) == blade_before
+
+    def test_context_is_part_of_key(self, data_dir):
+        cache = MatchResultCache(data_dir)
+        cache.get_or_match("blade", "astra", "astra", lambda: _razor_result("astra"), "DE")
+        calls = []
+        cache.get_or_match(
+            "blade", "astra", "astra", lambda: calls.append(1) or _razor_result("astra"), "GEM"
+        )
+        assert calls == [1]
+        cache.close()
+
+    def test_none_results_are_cached(self, data_dir):
+        calls = []
+        cache = MatchResultCache(data_dir)
+        assert cache.get_or_match("brush", "x", "x", lambda: calls.append(1)) is None
+        assert cache.get_or_match("brush", "x", "x", lambda: calls.append(1)) is None
+        assert calls == [1]
+        cache.close()
+
+    def test_in_memory_mode_deduplicates_without_disk(self, data_dir):
+        calls = []
+        cache = MatchResultCache(data_dir, persistent=False)
+        for original in ("Gillette Tech", "gillette tech"):
+            result = cache.get_or_match(
+                "razor", "gillette tech", original, lambda: calls.append(1) or _razor_result("x")
+            )
+            assert result.original == original
+        cache.close()
+        assert calls == [1]
+        assert not (data_dir / ".cache").exists()
+
+    def test_prime_makes_result_available(self, data_dir):
+        cache = MatchResultCache(data_dir, persistent=False)
+        assert not cache.contains("razor", "gt")
+        cache.prime("razor", "gt", _razor_result("gt"))
+        assert cache.contains("razor", "gt")
+        result = cache.get_or_match("razor", "gt", "GT", lambda: pytest.fail("not cached"))
+        assert result.matched["model"] == "Tech"
+
+    def test_cache_lives_under_data_dir(self, data_dir):
+        cache = MatchResultCache(data_dir)
+        cache.close()
+        assert (data_dir / ".cache" / "match" / "results.sqlite").exists()
+
+
+class TestMonthDeduplication:
+    @pytest.fixture(autouse=True)
+    def no_filtered_entries(self, monkeypatch):
+        filtered_manager = Mock()
+        filtered_manager.is_filtered.return_value = False
+        monkeypatch.setattr(
+            "sotd.match.run._get_filtered_entries_manager", lambda: filtered_manager
+        )
+
+    def test_identical_strings_are_matched_once(self, data_dir):
+        razor_matcher = Mock()
+        razor_matcher.match.side_effect = lambda normalized, original: _razor_result(original)
+        cache = MatchResultCache(data_dir, persistent=False)
+        originals = ["Gillette Tech", "GILLETTE TECH", "gillette tech"]
+
+        results = [
+            match_record(
+                {"razor": {"original": original, "normalized": "gillette tech"}},
+                razor_matcher,
+                Mock(),
+                Mock(),
+                Mock(),
+                PerformanceMonitor("match"),
+                result_cache=cache,
+            )
+            for original in originals
+        ]
+
+        assert razor_matcher.match.call_count == 1
+        assert [r["razor"].original for r in results] == originals
+        assert all(r["razor"].matched["model"] == "Tech" for r in results)
+
+    def test_collect_unique_match_keys(self, data_dir):
+        cache = MatchResultCache(data_dir, persistent=False)
+        cache.prime("soap", "known", None)
+        records = [
+            {
+                "razor": {"original": "GT", "normalized": "gt"},
+                "soap": {"original": "K", "normalized": "known"},
+            },
+            {
+                "razor": {"original": "gt!", "normalized": "gt"},
+                "brush": {"original": "B", "normalized": "b"},
+            },
+            {"blade": {"original": "Astra", "normalized": "astra"}},
+        ]
+
+        unique = _collect_unique_match_keys(records, cache)
+
+        assert unique == {"razor": [("gt", "GT")], "soap": [], "brush": [("b", "B")]}
+
+
+class TestIncrementalMonth:
+    @pytest.fixture(autouse=True)
+    def no_filtered_entries(self, monkeypatch, data_dir):
+        filtered_manager = Mock()
+        filtered_manager.is_filtered.return_value = False
+        filtered_manager.file_path = data_dir / "intentionally_unmatched.yaml"
+        monkeypatch.setattr(
+            "sotd.match.run._get_filtered_entries_manager", lambda: filtered_manager
+        )
+
+    def test_only_changed_records_are_matched(self, data_dir, monkeypatch):
+        brush_matcher = Mock()
+        brush_matcher.get_cache_stats.return_value = {}
+        monkeypatch.setattr(
+            "sotd.match.run._get_matchers",
+            lambda *args: (Mock(), Mock(), Mock(), brush_matcher),
+        )
+        matched_ids = []
+
+        def fake_match_record(record, *args, **kwargs):
+            matched_ids.append(record["id"])
+            return {**record, "razor": {**record["razor"], "matched": {"model": "Tech"}}}
+
+        monkeypatch.setattr("sotd.match.run.match_record", fake_match_record)
+        records = [
+            {"id": "a", "razor": {"original": "GT", "normalized": "gt"}},
+            {"id": "b", "razor": {"original": "Tech", "normalized": "tech"}},
+        ]
+        extracted = data_dir / "extracted" / "2025-01.json"
+        extracted.parent.mkdir()
+        extracted.write_text(json.dumps({"meta": {}, "data": records}))
+
+        assert process_month("2025-01", data_dir, incremental=True)["status"] == "completed"
+        records[1]["razor"]["original"] = "Gillette Tech"
+        extracted.write_text(json.dumps({"meta": {}, "data": records}))
+        result = process_month("2025-01", data_dir, incremental=True)
+
+        assert result["records_processed"] == 2
+        assert matched_ids == ["a", "b", "b"]
+        output = json.loads((data_dir / "matched" / "2025-01.json").read_text())
+        assert output["data"][1]["razor"]["original"] == "Gillette Tech"
+        assert set(output["metadata"]["input_hashes"]) == {"a", "b"}
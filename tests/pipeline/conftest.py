@@ -0,0 +1,67 @@
+"""Shared fixtures for in-memory and scheduled pipeline runs."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+COMMENTS = [
+    {
+        "id": f"c{n}",
+        "author": f"user{n % 3}",
+        "created_utc": f"2025-01-{n + 1:02d}T12:00:00Z",
+        "thread_id": "t1",
+        "thread_title": "Wednesday SOTD Thread - Jan 01, 2025",
+        "url": f"https://www.reddit.com/r/wetshaving/comments/t1/x/c{n}/",
+        "body": f"* **Razor:** Gillette Tech\n* **Blade:** Astra SP ({n + 1})\n"
+        f"* **Brush:** Semogue 830\n* **Lather:** Barrister and Mann - Seville",
+    }
+    for n in range(6)
+]
+
+
+def _fake_match_record(record, *args, **kwargs):
+    matched = dict(record)
+    for field in ("razor", "blade", "brush", "soap"):
+        if field in record:
+            matched[field] = {
+                "original": record[field]["original"],
+                "normalized": record[field]["normalized"],
+                "matched": {"brand": "Acme", "model": record[field]["normalized"].title()},
+                "match_type": "exact",
+                "pattern": None,
+            }
+    return matched
+
+
+@pytest.fixture
+def fake_matchers(monkeypatch):
+    """Match every product to a made-up Acme product instead of loading catalogs."""
+    brush_matcher = Mock()
+    brush_matcher.get_cache_stats.return_value = {}
+    monkeypatch.setattr(
+        "sotd.match.run._get_matchers", lambda *args: (Mock(), Mock(), Mock(), brush_matcher)
+    )
+    monkeypatch.setattr("sotd.match.run.match_record", _fake_match_record)
+    filtered_manager = Mock()
+    filtered_manager.is_filtered.return_value = False
+    monkeypatch.setattr("sotd.match.run._get_filtered_entries_manager", lambda: filtered_manager)
+
+
+def _make_data_dir(path: Path, months=("2025-01",)) -> Path:
+    (path / "comments").mkdir(parents=True)
+    for month in months:
+        (path / "comments" / f"{month}.json").write_text(
+            json.dumps({"meta": {}, "data": COMMENTS})
+        )
+    for name in ("razors.yaml", "blades.yaml", "brushes.yaml", "soaps.yaml"):
+        (path / name).write_text("{}\n")
+    (path / "correct_matches").mkdir()
+    return path
+
+
+@pytest.fixture
+def make_data_dir():
+    """Return a function creating a data directory with comments for the given months."""
+    return _make_data_dir
@@ -0,0 +1,117 @@
+"""Tests for the in-memory (fused) pipeline runner."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from sotd.aggregate.engine import process_single_month
+from sotd.enrich.run import _process_month as enrich_month
+from sotd.extract.run import _process_month as extract_month
+from sotd.extract.run import load_override_manager
+from sotd.match.run import process_month as match_month
+from sotd.pipeline.run import process_month_in_memory
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from run import fuse_in_memory_phases  # noqa: E402
+
+pytestmark = pytest.mark.usefixtures("fake_matchers")
+
+# Fields that differ between any two runs
+VOLATILE_KEYS = {
+    "extracted_at",
+    "matched_at",
+    "enriched_at",
+    "aggregated_at",
+    "generated_at",
+    "performance",
+    "source",
+}
+
+
+def _stable(value):
+    if isinstance(value, dict):
+        return {k: _stable(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_stable(v) for v in value]
+    return value
+
+
+def _artifacts(path: Path) -> dict:
+    return {
+        str(file.relative_to(path)): _stable(json.loads(file.read_text()))
+        for folder in ("extracted", "matched", "enriched", "aggregated")
+        for file in sorted((path / folder).rglob("2025-01*.json"))
+    }
+
+
+class TestProcessMonthInMemory:
+    def test_matches_phase_by_phase_artifacts(self, tmp_path, make_data_dir):
+        phased = make_data_dir(tmp_path / "phased")
+        extract_month(2025, 1, phased, False, False, load_override_manager(phased))
+        assert match_month("2025-01", phased, use_match_cache=True)["status"] == "completed"
+        assert enrich_month(2025, 1, phased, False, False)["status"] == "completed"
+        assert "error" not in process_single_month("2025-01", phased)
+
+        fused = make_data_dir(tmp_path / "fused")
+        result = process_month_in_memory(
+            2025, 1, fused, ["extract", "match", "enrich", "aggregate"]
+        )
+
+        assert result["status"] == "completed", result
+        assert result["phases"]["enrich"]["records_processed"] == 6
+        expected = _artifacts(phased)
+        assert set(expected) == {
+            "extracted/2025-01.json",
+            "matched/2025-01.json",
+            "enriched/2025-01.json",
+            "aggregated/2025-01.json",
+            "aggregated/partials/2025-01.json",
+            "aggregated/product_usage/2025-01.json",
+            "aggregated/user_analysis/2025-01.json",
+        }
+        assert _artifacts(fused) == expected
+        # The matched file is written before enrichment adds its per-record fields
+        matched = json.loads((fused / "matched" / "2025-01.json").read_text())
+        assert "_month" not in matched["data"][0]
+
+    def test_skipped_phase_hands_its_file_to_the_next(self, tmp_path, make_data_dir):
+        data_dir = make_data_dir(tmp_path)
+        process_month_in_memory(2025, 1, data_dir, ["extract", "match"])
+        matched = data_dir / "matched" / "2025-01.json"
+        document = json.loads(matched.read_text())
+        document["data"] = document["data"][:2]
+        matched.write_text(json.dumps(document))
+
+        result = process_month_in_memory(2025, 1, data_dir, ["match", "enrich"])
+
+        assert result["phases"]["match"]["status"] == "skipped"
+        assert result["phases"]["enrich"]["records_processed"] == 2
+
+    def test_missing_comments_file_skips_month(self, tmp_path, make_data_dir):
+        result = process_month_in_memory(2025, 2, make_data_dir(tmp_path), ["extract", "match"])
+
+        assert result == {"status": "skipped", "month": "2025-02", "reason": "no comments file"}
+
+
+class TestFuseInMemoryPhases:
+    def test_fuses_consecutive_record_phases(self):
+        phases = ["fetch", "extract", "match", "enrich", "aggregate", "report"]
+
+        assert fuse_in_memory_phases(phases) == (
+            ["fetch", "in_memory", "report"],
+            ["extract", "match", "enrich", "aggregate"],
+        )
+
+    def test_annual_aggregation_stays_a_separate_phase(self):
+        assert fuse_in_memory_phases(["enrich", "aggregate", "report"], annual=True) == (
+            ["enrich", "aggregate", "report"],
+            [],
+        )
+        assert fuse_in_memory_phases(["match", "enrich", "aggregate"], annual=True) == (
+            ["in_memory", "aggregate"],
+            ["match", "enrich"],
+        )
@@ -0,0 +1,166 @@
+"""Tests for the cross-month task-graph scheduler."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sotd.pipeline.scheduler import (
+    TaskOptions,
+    build_task_graph,
+    months_before,
+    run_task,
+    run_task_graph,
+)
+
+MONTHS = [f"2024-{m:02d}" for m in range(1, 13)] + ["2025-01"]
+
+
+def test_months_before():
+    assert months_before("2025-03", 1) == "2025-02"
+    assert months_before("2025-01", 1) == "2024-12"
+    assert months_before("2025-01", 12) == "2024-01"
+    assert months_before("2025-06", 60) == "2020-06"
+
+
+class TestBuildTaskGraph:
+    def test_phases_of_a_month_form_a_chain(self):
+        graph = build_task_graph(["extract", "match", "enrich"], ["2025-01", "2025-02"])
+
+        assert graph[("extract", "2025-01")] == []
+        assert graph[("match", "2025-01")] == [("extract", "2025-01")]
+        assert graph[("enrich", "2025-02")] == [("match", "2025-02")]
+
+    def test_report_waits_for_compared_aggregates_in_the_run(self):
+        graph = build_task_graph(["aggregate", "report"], MONTHS)
+
+        assert graph[("report", "2025-01")] == [
+            ("aggregate", "2025-01"),
+            ("aggregate", "2024-12"),
+            ("aggregate", "2024-01"),
+        ]
+        # Months outside the run are read from disk as they are
+        assert graph[("report", "2024-01")] == [("aggregate", "2024-01")]
+
+    def test_delta_runs_only_report_on_requested_months(self):
+        graph = build_task_graph(["aggregate", "report"], MONTHS, report_months=["2025-01"])
+
+        assert [task for task in graph if task[0] == "report"] == [("report", "2025-01")]
+
+
+class TestRunTaskGraph:
+    def test_tasks_run_after_their_dependencies(self):
+        graph = build_task_graph(["extract", "match", "aggregate", "report"], MONTHS)
+        finished = []
+        lock = threading.Lock()
+
+        def run(phase, month):
+            for dependency in graph[(phase, month)]:
+                assert dependency in finished
+            time.sleep(0.001)
+            with lock:
+                finished.append((phase, month))
+            return {"status": "completed", "month": month}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = run_task_graph(graph, run, (), executor, 4)
+
+        assert set(results) == set(graph)
+        assert len(finished) == len(graph)
+
+    def test_longest_chain_starts_first(self):
+        graph = {
+            ("extract", "2025-01"): [],
+            ("extract", "2025-02"): [],
+            ("match", "2025-02"): [("extract", "2025-02")],
+        }
+        started = []
+
+        def run(phase, month):
+            started.append((phase, month))
+            return None
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            run_task_graph(graph, run, (), executor, 1)
+
+        assert started[0] == ("extract", "2025-02")
+
+    def test_failure_blocks_dependents_only(self):
+        graph = build_task_graph(["extract", "match", "enrich"], ["2025-01", "2025-02"])
+
+        def run(phase, month):
+            if (phase, month) == ("match", "2025-01"):
+                return {"status": "error", "month": month, "error": "boom"}
+            if (phase, month) == ("extract", "2025-02"):
+                raise RuntimeError("crashed")
+            return {"status": "completed", "month": month}
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = run_task_graph(graph, run, (), executor, 2)
+
+        assert results[("extract", "2025-01")]["status"] == "completed"
+        assert results[("match", "2025-01")]["error"] == "boom"
+        assert results[("enrich", "2025-01")] == {
+            "status": "blocked",
+            "month": "2025-01",
+            "reason": "match failed for 2025-01",
+        }
+        assert results[("extract", "2025-02")]["error"] == "crashed"
+        assert results[("match", "2025-02")]["status"] == "blocked"
+        assert results[("enrich", "2025-02")]["status"] == "blocked"
+
+
+class TestRunTask:
+    def test_scheduled_months_write_phase_outputs(self, tmp_path, make_data_dir, fake_matchers):
+        months = ["2025-01", "2025-02"]
+        data_dir = make_data_dir(tmp_path, months)
+        graph = build_task_graph(["extract", "match", "enrich", "aggregate"], months)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = run_task_graph(
+                graph, run_task, (TaskOptions(base_path=data_dir),), executor, 2
+            )
+
+        assert not [r for r in results.values() if r and "error" in r], results
+        for month in months:
+            for folder in ("extracted", "matched", "enriched", "aggregated"):
+                assert (data_dir / folder / f"{month}.json").exists()
+
+    def test_extract_task_returns_counts_not_records(self, tmp_path, make_data_dir):
+        data_dir = make_data_dir(tmp_path)
+
+        result = run_task("extract", "2025-01", TaskOptions(base_path=data_dir))
+
+        extracted = json.loads((data_dir / "extracted" / "2025-01.json").read_text())
+        assert result == {
+            "status": "completed",
+            "month": "2025-01",
+            "records_processed": extracted["meta"]["shave_count"],
+            "missing_count": extracted["meta"]["missing_count"],
+            "skipped_count": extracted["meta"]["skipped_count"],
+        }
+
+    def test_in_memory_task(self, tmp_path, make_data_dir, fake_matchers):
+        data_dir = make_data_dir(tmp_path)
+        options = TaskOptions(base_path=data_dir, in_memory_phases=("extract", "match"))
+
+        result = run_task("in_memory", "2025-01", options)
+
+        assert result["status"] == "completed"
+        assert (data_dir / "matched" / "2025-01.json").exists()
+
+    def test_month_without_comments_stops_its_later_phases(self, tmp_path, make_data_dir):
+        data_dir = make_data_dir(tmp_path)
+        graph = build_task_graph(["extract", "match"], ["2025-02"])
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = run_task_graph(
+                graph, run_task, (TaskOptions(base_path=data_dir),), executor, 1
+            )
+
+        assert results[("extract", "2025-02")]["status"] == "no_input"
+        assert results[("match", "2025-02")] == {
+            "status": "blocked",
+            "month": "2025-02",
+            "reason": "no comments file for 2025-02",
+        }
@@ -322,3 +322,56 @@ class TestFilePathGeneration:
         base_dir = Path("/test/data")
         path = load.get_historical_file_path(base_dir, 2024, 12)
         assert path == Path("/test/data/aggregated/2024-12.json")
+
+
+class TestAggregatedDataCache:
+    """Test preloading aggregated data for range reports."""
+
+    @staticmethod
+    def _write_month(aggregated_dir: Path, month: str, total_shaves: int = 100) -> Path:
+        file_path = aggregated_dir / f"{month}.json"
+        content = {
+            "meta": {"month": month, "total_shaves": total_shaves, "unique_shavers": 10},
+            "data": {"razors": [{"name": "Razor 1", "shaves": total_shaves}]},
+        }
+        file_path.write_text(json.dumps(content))
+        return file_path
+
+    @pytest.fixture
+    def aggregated_dir(self, tmp_path: Path):
+        aggregated_dir = tmp_path / "aggregated"
+        aggregated_dir.mkdir()
+        for month in ("2020-03", "2024-03", "2025-02", "2025-03", "2025-04"):
+            self._write_month(aggregated_dir, month)
+        yield aggregated_dir
+        load.use_aggregated_cache({})
+
+    def test_preloads_reported_and_comparison_months_once(self, aggregated_dir: Path) -> None:
+        """Each file needed by the range is loaded once; missing months are left out."""
+        cache = load.preload_aggregated_data(aggregated_dir.parent, [(2025, 3), (2025, 4)])
+
+        assert sorted(path.name for path in cache) == [
+            "2020-03.json",
+            "2024-03.json",
+            "2025-02.json",
+            "2025-03.json",
+            "2025-04.json",
+        ]
+
+    def test_comparison_data_is_served_from_cache(self, aggregated_dir: Path) -> None:
+        """Loads for the reported month and its comparisons share the preloaded data."""
+        load.use_aggregated_cache(load.preload_aggregated_data(aggregated_dir.parent, [(2025, 4)]))
+
+        _, current = load.load_aggregated_data(aggregated_dir / "2025-03.json")
+        comparison = load.load_comparison_data(aggregated_dir, 2025, 4)
+
+        assert comparison["2025-03"][1] is current
+
+    def test_changed_file_is_read_again(self, aggregated_dir: Path) -> None:
+        """A file rewritten after preloading is not served from the cache."""
+        load.use_aggregated_cache(load.preload_aggregated_data(aggregated_dir.parent, [(2025, 3)]))
+        file_path = self._write_month(aggregated_dir, "2025-03", total_shaves=12345)
+
+        metadata, _ = load.load_aggregated_data(file_path)
+
+        assert metadata["total_shaves"] == 12345
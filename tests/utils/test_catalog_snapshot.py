@@ -0,0 +1,103 @@
+"""
+Unit tests for precompiled catalog snapshots.
+"""
+
+import os
+import unicodedata
+
+import pytest
+import yaml
+
+from sotd.utils.catalog_snapshot import (
+    compile_data_dir,
+    compile_snapshot,
+    main,
+    read_snapshot,
+    snapshot_path_for,
+)
+from sotd.utils.yaml_loader import UniqueKeyLoader, load_yaml_with_nfc
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / "razors.yaml"
+    nfd_brand = unicodedata.normalize("NFD", "Mühle")
+    path.write_text(f"{nfd_brand}:\n  R89:\n    patterns:\n      - r89\n", encoding="utf-8")
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestCompileSnapshot:
+    """Test compiling and reading snapshots."""
+
+    def test_snapshot_matches_yaml_load(self, catalog):
+        expected = load_yaml_with_nfc(catalog)
+        assert compile_snapshot(catalog) == []
+        assert snapshot_path_for(catalog).exists()
+        assert read_snapshot(catalog) == expected
+        assert "Mühle" in read_snapshot(catalog)
+
+    def test_loader_uses_snapshot(self, catalog):
+        compile_snapshot(catalog)
+        # Make the YAML unparseable without changing size/mtime so only the snapshot can load
+        stat = catalog.stat()
+        catalog.write_bytes(b"!" * stat.st_size)
+        os.utime(catalog, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # Content hash no longer matches, but size and mtime do
+        assert "Mühle" in load_yaml_with_nfc(catalog, loader_cls=UniqueKeyLoader)
+
+    def test_edited_source_invalidates_snapshot(self, catalog):
+        compile_snapshot(catalog)
+        catalog.write_text("Gillette:\n  Tech:\n    patterns:\n      - tech\n")
+        _bump_mtime(catalog)
+        assert read_snapshot(catalog) is None
+        assert list(load_yaml_with_nfc(catalog)) == ["Gillette"]
+
+    def test_touched_source_with_same_content_keeps_snapshot(self, catalog):
+        compile_snapshot(catalog)
+        _bump_mtime(catalog)
+        assert read_snapshot(catalog) is not None
+
+    def test_returned_data_is_not_shared(self, catalog):
+        compile_snapshot(catalog)
+        read_snapshot(catalog)["Mühle"] = None
+        assert read_snapshot(catalog)["Mühle"] is not None
+
+    def test_duplicate_keys_are_reported_and_not_used_by_unique_loader(self, tmp_path):
+        path = tmp_path / "knots.yaml"
+        path.write_text("A:\n  x: 1\nA:\n  x: 2\n")
+        problems = compile_snapshot(path)
+        assert len(problems) == 1
+        assert "duplicate key" in problems[0]
+        assert read_snapshot(path) == {"A": {"x": 2}}
+        assert read_snapshot(path, require_unique_keys=True) is None
+        with pytest.raises(yaml.constructor.ConstructorError):
+            load_yaml_with_nfc(path, loader_cls=UniqueKeyLoader)
+
+    def test_invalid_patterns_format_is_reported(self, tmp_path):
+        path = tmp_path / "soaps.yaml"
+        path.write_text("Maker:\n  patterns: maker\n")
+        problems = compile_snapshot(path)
+        assert len(problems) == 1
+        assert "Invalid patterns format" in problems[0]
+
+
+class TestCompileDataDir:
+    """Test compiling a whole data directory."""
+
+    def test_compiles_catalogs_and_correct_matches(self, tmp_path, catalog):
+        (tmp_path / "correct_matches").mkdir()
+        (tmp_path / "correct_matches" / "razor.yaml").write_text("{}\n")
+        results = compile_data_dir(tmp_path)
+        assert set(results) == {catalog, tmp_path / "correct_matches" / "razor.yaml"}
+        assert read_snapshot(tmp_path / "correct_matches" / "razor.yaml") == {}
+
+    def test_main_exit_code(self, tmp_path, catalog):
+        assert main(["compile", "--data-dir", str(tmp_path)]) == 0
+        (tmp_path / "soaps.yaml").write_text("Maker:\n  patterns: maker\n")
+        assert main(["compile", "--data-dir", str(tmp_path)]) == 1
@@ -0,0 +1,180 @@
+"""
+Unit tests for columnar (Parquet) month artifacts.
+"""
+
+import json
+import os
+
+import pytest
+
+from sotd.aggregate.load import AGGREGATION_COLUMNS, load_enriched_data
+from sotd.aggregate.processor import aggregate_all
+from sotd.utils.columnar_artifact import (
+    columnar_path_for,
+    flatten_record,
+    load_records_with_columnar,
+    unflatten_row,
+    write_columnar_artifact,
+    write_columnar_copy,
+)
+
+RECORDS = [
+    {
+        "id": "c1",
+        "author": "alice",
+        "body": "* **Razor:** Blackbird\n* **Blade:** Feather (3)",
+        "created_utc": "2025-01-01T10:00:00Z",
+        "thread_title": "Wednesday SOTD Thread - Jan 01, 2025",
+        "razor": {
+            "original": "Blackbird",
+            "normalized": "blackbird",
+            "matched": {"brand": "Blackland", "model": "Blackbird", "format": "DE"},
+            "match_type": "exact",
+            "pattern": "blackbird",
+            "enriched": {"plate": "Lite"},
+        },
+        "blade": {
+            "original": "Feather (3)",
+            "matched": {"brand": "Feather", "model": "Hi-Stainless", "format": "DE"},
+            "enriched": {"use_count": 3},
+        },
+        "brush": {
+            "original": "Zenith B2",
+            "matched": {
+                "brand": "Zenith",
+                "model": "B2",
+                "handle": {"brand": "Zenith", "model": None},
+                "knot": {"brand": "Zenith", "fiber": "Boar", "knot_size_mm": 28},
+            },
+            "enriched": {"fiber": "Boar", "knot_size_mm": 28, "_user_override_reason": ["a"]},
+        },
+        "soap": {
+            "original": "Stirling - Bay Rum",
+            "matched": {"brand": "Stirling Soap Co.", "scent": "Bay Rum"},
+            "enriched": {"sample_type": None},
+        },
+    },
+    {
+        "id": "c2",
+        "author": "bob",
+        "created_utc": "2025-01-02T10:00:00Z",
+        "razor": {"original": "???", "matched": None, "match_type": None},
+        "blade": {"original": "Feather", "matched": {"brand": "Feather", "model": "Hi-Stainless"}},
+        "brush": {
+            "original": "Omega 10049",
+            "matched": {
+                "brand": "Omega",
+                "model": "10049",
+                "knot": {"brand": "Omega", "fiber": "Boar", "knot_size_mm": 24.5},
+            },
+        },
+    },
+]
+
+
+class TestFlattenRecord:
+    """Test flattening records into rows and back."""
+
+    def test_flatten_record(self):
+        row = flatten_record(RECORDS[0])
+        assert row["author"] == "alice"
+        assert row["blade.enriched.use_count"] == 3
+        assert row["brush.matched.knot.knot_size_mm"] == 28
+        assert "razor.original" not in row
+        assert "brush.matched.handle.model" not in row
+
+    def test_round_trip_keeps_aggregation_fields(self):
+        restored = unflatten_row(flatten_record(RECORDS[0]))
+        assert restored["razor"] == {
+            "matched": {"brand": "Blackland", "model": "Blackbird", "format": "DE"},
+            "enriched": {"plate": "Lite"},
+        }
+        assert restored["brush"]["matched"]["handle"] == {"brand": "Zenith"}
+        assert "soap" in restored and "enriched" not in restored["soap"]
+        assert "razor" not in unflatten_row(flatten_record(RECORDS[1]))
+
+    def test_aggregation_parity(self):
+        rows = [flatten_record(record) for record in RECORDS]
+        expected = aggregate_all(json.loads(json.dumps(RECORDS)), "2025-01")
+        actual = aggregate_all([unflatten_row(row) for row in rows], "2025-01")
+        expected["meta"].pop("aggregated_at", None)
+        actual["meta"].pop("aggregated_at", None)
+        assert actual == expected
+
+
+class TestColumnarArtifact:
+    """Test writing and reading Parquet copies of enriched data."""
+
+    @pytest.fixture(autouse=True)
+    def _require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    @pytest.fixture
+    def enriched_path(self, tmp_path):
+        path = tmp_path / "enriched" / "2025-01.json"
+        path.parent.mkdir()
+        path.write_text(json.dumps({"data": RECORDS, "meta": {}}), encoding="utf-8")
+        return path
+
+    def test_round_trip(self, enriched_path):
+        rows = [flatten_record(record) for record in RECORDS]
+        write_columnar_artifact(rows, columnar_path_for(enriched_path), enriched_path)
+
+        records = load_records_with_columnar(enriched_path)
+        assert records == [unflatten_row(row) for row in rows]
+        # Mixed int/float and list columns come back with their original values
+        assert records[0]["brush"]["matched"]["knot"]["knot_size_mm"] == 28
+        assert records[1]["brush"]["matched"]["knot"]["knot_size_mm"] == 24.5
+        assert records[0]["brush"]["enriched"]["_user_override_reason"] == ["a"]
+
+    def test_column_selection(self, enriched_path):
+        rows = [flatten_record(record) for record in RECORDS]
+        write_columnar_artifact(rows, columnar_path_for(enriched_path), enriched_path)
+        records = load_records_with_columnar(enriched_path, columns=["author", "blade.matched"])
+        assert records[0] == {
+            "author": "alice",
+            "blade": {"matched": {"brand": "Feather", "model": "Hi-Stainless", "format": "DE"}},
+        }
+
+    def test_copy_is_written_in_row_groups(self, enriched_path, monkeypatch):
+        pq = pytest.importorskip("pyarrow.parquet")
+        monkeypatch.setattr("sotd.utils.columnar_artifact.ROW_GROUP_SIZE", 1)
+
+        path = write_columnar_copy(enriched_path)
+
+        assert path == columnar_path_for(enriched_path)
+        assert pq.ParquetFile(path).num_row_groups == len(RECORDS)
+        records = load_records_with_columnar(enriched_path)
+        assert records == [unflatten_row(flatten_record(record)) for record in RECORDS]
+        assert records[1]["brush"]["matched"]["knot"]["knot_size_mm"] == 24.5
+
+    def test_aggregation_loads_only_its_columns(self, enriched_path):
+        write_columnar_copy(enriched_path)
+
+        records = load_enriched_data("2025-01", enriched_path.parent.parent)
+
+        assert "body" not in records[0] and "created_utc" not in records[0]
+        assert set().union(*records) <= set(AGGREGATION_COLUMNS)
+        expected = aggregate_all(json.loads(json.dumps(RECORDS)), "2025-01")
+        actual = aggregate_all(records, "2025-01")
+        expected["meta"].pop("aggregated_at", None)
+        actual["meta"].pop("aggregated_at", None)
+        assert actual == expected
+
+    def test_stale_copy_is_ignored(self, enriched_path):
+        write_columnar_artifact([], columnar_path_for(enriched_path), enriched_path)
+        assert load_records_with_columnar(enriched_path) == []
+
+        stat = enriched_path.stat()
+        os.utime(enriched_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_records_with_columnar(enriched_path) is None
+        assert len(load_enriched_data("2025-01", enriched_path.parent.parent)) == 2
+
+
+class TestMissingArtifact:
+    """Test fallback when there is no Parquet copy."""
+
+    def test_missing_copy_returns_none(self, tmp_path):
+        path = tmp_path / "2025-01.json"
+        path.write_text('{"data": []}')
+        assert load_records_with_columnar(path) is None
@@ -2,19 +2,27 @@
 Unit tests for unified file I/O utilities.
 """
 
+import gzip
 import json
 
 import pytest
 import yaml
 
 from sotd.utils.file_io import (
+    ARTIFACT_COMPRESSION_ENV,
     backup_file,
     ensure_directory_exists,
+    get_artifact_compression,
     get_file_size_mb,
+    iter_json_files,
+    json_file_exists,
     load_json_data,
     load_yaml_data,
+    remove_json_file,
     save_json_data,
     save_yaml_data,
+    set_artifact_compression,
+    zstd_available,
 )
 
 
@@ -386,3 +394,75 @@ class TestBackupFile:
 
         # Should return None on error
         assert result is None
+
+
+class TestCompressedArtifacts:
+    """Test compressed JSON artifacts and transparent reading."""
+
+    DATA = {"meta": {"month": "2025-01"}, "data": [{"id": "a", "body": "Razor: Karve “CB”"}]}
+
+    def test_save_gzip_writes_compact_compressed_file(self, tmp_path):
+        """Compressed artifacts get a suffix, compact JSON and replace the plain file."""
+        file_path = tmp_path / "2025-01.json"
+        file_path.write_text("{}")
+
+        written = save_json_data(self.DATA, file_path, compression="gzip")
+
+        assert written == tmp_path / "2025-01.json.gz"
+        assert not file_path.exists()
+        with gzip.open(written, "rt", encoding="utf-8") as f:
+            text = f.read()
+        assert text == json.dumps(self.DATA, ensure_ascii=False, separators=(",", ":"))
+
+    def test_load_reads_any_form(self, tmp_path):
+        """load_json_data takes the plain path whatever form the file is in."""
+        file_path = tmp_path / "2025-01.json"
+        save_json_data(self.DATA, file_path, compression="gzip")
+
+        assert json_file_exists(file_path)
+        assert load_json_data(file_path) == self.DATA
+        assert get_file_size_mb(file_path) > 0
+
+    def test_plain_save_removes_compressed_copy(self, tmp_path):
+        """Writing a plain file again leaves only the plain form."""
+        file_path = tmp_path / "2025-01.json"
+        save_json_data(self.DATA, file_path, compression="gzip")
+
+        assert save_json_data({"data": []}, file_path, compression="none") == file_path
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["2025-01.json"]
+        assert load_json_data(file_path) == {"data": []}
+
+    @pytest.mark.skipif(not zstd_available(), reason="zstandard not installed")
+    def test_zstd_round_trip(self, tmp_path):
+        """zstd artifacts round-trip when zstandard is installed."""
+        file_path = tmp_path / "2025-01.json"
+
+        assert save_json_data(self.DATA, file_path, compression="zstd").name == "2025-01.json.zst"
+        assert load_json_data(file_path) == self.DATA
+
+    def test_default_compression_from_setting(self, tmp_path, monkeypatch):
+        """Without an explicit compression the process-wide setting applies."""
+        # setenv first so the variable is restored (removed) after the test
+        monkeypatch.setenv(ARTIFACT_COMPRESSION_ENV, "none")
+        assert get_artifact_compression() == "none"
+
+        set_artifact_compression("gzip")
+        written = save_json_data(self.DATA, tmp_path / "2025-01.json")
+
+        assert written.name == "2025-01.json.gz"
+        with pytest.raises(ValueError):
+            set_artifact_compression("bz2")
+
+    def test_iter_and_remove_json_files(self, tmp_path):
+        """Listing yields each artifact once by its plain path; removal covers every form."""
+        save_json_data(self.DATA, tmp_path / "2025-01.json", compression="gzip")
+        save_json_data(self.DATA, tmp_path / "2025-02.json", compression="none")
+        (tmp_path / "notes.txt").write_text("x")
+
+        assert list(iter_json_files(tmp_path)) == [
+            tmp_path / "2025-01.json",
+            tmp_path / "2025-02.json",
+        ]
+
+        remove_json_file(tmp_path / "2025-01.json")
+        assert not json_file_exists(tmp_path / "2025-01.json")
@@ -0,0 +1,160 @@
+"""
+Unit tests for streaming JSON record reading and writing.
+"""
+
+import gzip
+import json
+import math
+
+import pytest
+
+from sotd.utils.json_stream import JsonRecordReader, JsonRecordWriter, iter_json_records
+
+RECORDS = [
+    {"id": "a", "body": "Razor: Karve — “CB” \\ {not: json}", "score": 1.5},
+    {"id": "b", "nested": {"list": [1, 2, {"x": None}], "empty": {}}, "flag": True},
+    {"id": "c", "big": 12345678901234567890, "neg": -3, "exp": 1e-7},
+    [],
+    "plain string",
+]
+
+
+def _dump(path, content):
+    path.write_text(json.dumps(content, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+class TestJsonRecordReader:
+    """Test iterating records without loading the whole file."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    def test_reads_records_and_fields(self, tmp_path, chunk_size):
+        path = tmp_path / "month.json"
+        _dump(path, {"metadata": {"month": "2025-01"}, "data": RECORDS, "meta": [1, 2]})
+
+        with JsonRecordReader(path, chunk_size=chunk_size) as reader:
+            assert list(reader) == RECORDS
+            assert reader.fields == {"metadata": {"month": "2025-01"}, "meta": [1, 2]}
+            assert reader.found_key
+            assert reader.record_count == len(RECORDS)
+
+    def test_compact_json(self, tmp_path):
+        path = tmp_path / "month.json"
+        path.write_text(json.dumps({"data": [1, 22, 333], "n": 4}, separators=(",", ":")))
+        reader = JsonRecordReader(path, chunk_size=2)
+        assert list(reader) == [1, 22, 333]
+        assert reader.fields == {"n": 4}
+
+    def test_empty_and_missing_array(self, tmp_path):
+        path = tmp_path / "month.json"
+        _dump(path, {"data": []})
+        assert list(iter_json_records(path)) == []
+
+        _dump(path, {"meta": {}})
+        reader = JsonRecordReader(path)
+        assert reader.read_fields() == {"meta": {}}
+        assert not reader.found_key
+
+    def test_custom_key(self, tmp_path):
+        path = tmp_path / "month.json"
+        _dump(path, {"data": [1], "missing": [2, 3]})
+        assert list(iter_json_records(path, key="missing")) == [2, 3]
+
+    def test_invalid_structure(self, tmp_path):
+        path = tmp_path / "month.json"
+        _dump(path, [1, 2])
+        with pytest.raises(ValueError, match="Expected a JSON object"):
+            list(iter_json_records(path))
+
+        _dump(path, {"data": {"a": 1}})
+        with pytest.raises(ValueError, match="Expected a list"):
+            list(iter_json_records(path))
+
+    @pytest.mark.parametrize("text", ['{"data": [1, 2', '{"data": [1 2]}', '{"data": [nope]}'])
+    def test_invalid_json(self, tmp_path, text):
+        path = tmp_path / "month.json"
+        path.write_text(text)
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_records(path))
+
+    def test_iterates_once(self, tmp_path):
+        path = tmp_path / "month.json"
+        _dump(path, {"data": [1]})
+        reader = JsonRecordReader(path)
+        list(reader)
+        with pytest.raises(RuntimeError):
+            list(reader)
+
+
+class TestJsonRecordWriter:
+    """Test writing records incrementally."""
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_round_trip(self, tmp_path, fast):
+        path = tmp_path / "out" / "month.json"
+        with JsonRecordWriter(path, fast=fast) as writer:
+            writer.write_many(RECORDS)
+            assert writer.commit(before={"metadata": {"n": 5}}, after={"meta": {}}) == path
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "metadata": {"n": 5},
+            "data": RECORDS,
+            "meta": {},
+        }
+        assert list(iter_json_records(path)) == RECORDS
+
+    @pytest.mark.parametrize("records", [[], [{"a": 1}], RECORDS[:2]])
+    def test_layout_matches_json_dump(self, tmp_path, records):
+        path = tmp_path / "month.json"
+        with JsonRecordWriter(path, fast=False) as writer:
+            writer.write_many(records)
+            writer.commit(before={"metadata": {"month": "2025-01"}}, after={"meta": [1]})
+
+        expected = {"metadata": {"month": "2025-01"}, "data": records, "meta": [1]}
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            expected, indent=2, ensure_ascii=False
+        )
+
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_non_finite_floats_round_trip(self, tmp_path, fast):
+        path = tmp_path / "month.json"
+        records = [{"id": "a", "score": float("nan"), "range": [float("inf"), -math.inf, None]}]
+        with JsonRecordWriter(path, fast=fast) as writer:
+            writer.write_many(records)
+            writer.commit()
+
+        (record,) = iter_json_records(path)
+        assert math.isnan(record["score"])
+        assert record["range"] == [math.inf, -math.inf, None]
+
+    def test_abort_leaves_no_files(self, tmp_path):
+        path = tmp_path / "month.json"
+        path.write_text("previous")
+        with JsonRecordWriter(path) as writer:
+            writer.write({"a": 1})
+        assert path.read_text() == "previous"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["month.json"]
+
+    def test_commit_leaves_no_temporary_files(self, tmp_path):
+        path = tmp_path / "month.json"
+        with JsonRecordWriter(path) as writer:
+            writer.write({"a": 1})
+            writer.commit()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["month.json"]
+        with pytest.raises(RuntimeError):
+            writer.commit()
+
+    @pytest.mark.parametrize("records", [[], RECORDS])
+    def test_compressed_round_trip(self, tmp_path, records):
+        path = tmp_path / "month.json"
+        path.write_text("previous plain copy")
+        with JsonRecordWriter(path, compression="gzip") as writer:
+            writer.write_many(records)
+            written = writer.commit(before={"metadata": {"n": 5}}, after={"meta": {}})
+
+        assert written == tmp_path / "month.json.gz"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["month.json.gz"]
+        with gzip.open(written, "rt", encoding="utf-8") as f:
+            text = f.read()
+        assert "\n" not in text
+        assert json.loads(text) == {"metadata": {"n": 5}, "data": records, "meta": {}}
+        assert list(iter_json_records(path)) == records
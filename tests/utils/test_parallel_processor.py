@@ -0,0 +1,41 @@
+"""Tests for the shared parallel month processor."""
+
+import os
+
+from sotd.utils.parallel_processor import ParallelMonthProcessor
+
+_worker_state = {}
+
+
+def _init_worker(label):
+    _worker_state["label"] = label
+    _worker_state["pid"] = os.getpid()
+
+
+def _process(year, month, suffix):
+    return {
+        "month": f"{year:04d}-{month:02d}",
+        "label": _worker_state.get("label", "") + suffix,
+        "initialized_in_worker": _worker_state.get("pid") == os.getpid(),
+    }
+
+
+class TestProcessMonthsParallel:
+    def test_initializer_runs_in_each_worker(self):
+        processor = ParallelMonthProcessor("test")
+        results = processor.process_months_parallel(
+            [(2025, 1), (2025, 2), (2025, 3)],
+            _process,
+            ("!",),
+            max_workers=2,
+            initializer=_init_worker,
+            initargs=("ready",),
+        )
+        assert sorted(r["month"] for r in results) == ["2025-01", "2025-02", "2025-03"]
+        assert all(r["label"] == "ready!" for r in results)
+        assert all(r["initialized_in_worker"] for r in results)
+
+    def test_initializer_is_optional(self):
+        processor = ParallelMonthProcessor("test")
+        results = processor.process_months_parallel([(2025, 1)], _process, ("!",), max_workers=1)
+        assert results[0]["label"] == "!"
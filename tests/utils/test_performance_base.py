@@ -6,7 +6,6 @@ across all pipeline phases.
 """
 
 import time
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -199,22 +198,29 @@ class TestBasePerformanceMonitor:
         monitor.set_record_count(100)
         assert monitor.metrics.record_count == 100
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.stat")
-    def test_file_sizes(self, mock_stat, mock_exists):
+    def test_file_sizes(self, tmp_path):
         """Test file size setting."""
-        mock_exists.return_value = True
-        mock_stat.return_value.st_size = 1024 * 1024  # 1MB
+        input_path = tmp_path / "input.json"
+        output_path = tmp_path / "output.json"
+        input_path.write_bytes(b" " * 1024 * 1024)  # 1MB
+        output_path.write_bytes(b" " * 1024 * 1024)
 
         monitor = ConcretePerformanceMonitor()
-        input_path = Path("input.json")
-        output_path = Path("output.json")
-
         monitor.set_file_sizes(input_path, output_path)
 
         assert monitor.metrics.input_file_size_mb == 1.0
         assert monitor.metrics.output_file_size_mb == 1.0
 
+    def test_file_sizes_of_compressed_artifacts(self, tmp_path):
+        """Sizes are read from whichever form of a month artifact exists."""
+        (tmp_path / "input.json.gz").write_bytes(b" " * 512 * 1024)
+
+        monitor = ConcretePerformanceMonitor()
+        monitor.set_file_sizes(tmp_path / "input.json", tmp_path / "missing.json")
+
+        assert monitor.metrics.input_file_size_mb == 0.5
+        assert monitor.metrics.output_file_size_mb == 0.0
+
     def test_derived_metrics_calculation(self):
         """Test derived metrics calculation."""
         monitor = ConcretePerformanceMonitor()
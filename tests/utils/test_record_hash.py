@@ -0,0 +1,107 @@
+"""Tests for per-record input hashes used by incremental phase runs."""
+
+import json
+
+from sotd.utils.record_hash import (
+    IncrementalRun,
+    compute_phase_fingerprint,
+    hash_record_inputs,
+)
+
+
+def _write_output(path, fingerprint, records, hashes, meta_key="meta"):
+    meta = {"input_fingerprint": fingerprint, "input_hashes": hashes}
+    path.write_text(json.dumps({meta_key: meta, "data": records}))
+
+
+class TestHashing:
+    """Test record hashes and phase fingerprints."""
+
+    def test_hash_ignores_key_order(self):
+        assert hash_record_inputs({"a": 1, "b": 2}, {}) == hash_record_inputs({"b": 2, "a": 1}, {})
+        assert hash_record_inputs({"a": 1}, {}) != hash_record_inputs({"a": 1}, {"razor": "x"})
+
+    def test_fingerprint_tracks_files(self, tmp_path):
+        catalog = tmp_path / "catalog.yaml"
+        missing = compute_phase_fingerprint((), [catalog])
+        catalog.write_text("a: 1")
+        first = compute_phase_fingerprint((), [catalog])
+        catalog.write_text("a: 2")
+
+        assert len({missing, first, compute_phase_fingerprint((), [catalog])}) == 3
+        assert compute_phase_fingerprint((), [catalog], extra="x") != compute_phase_fingerprint(
+            (), [catalog]
+        )
+
+    def test_fingerprint_tracks_packages_and_modules(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("sotd.utils.record_hash._PACKAGE_ROOT", tmp_path)
+        (tmp_path / "enrich").mkdir()
+        (tmp_path / "enrich" / "run.py").write_text("a = 1")
+        (tmp_path / "match" / "utils").mkdir(parents=True)
+        helper = tmp_path / "match" / "utils" / "helper.py"
+        helper.write_text("b = 1")
+        (tmp_path / "match" / "utils" / "other.py").write_text("c = 1")
+
+        packages = ("enrich", "match.utils.helper")
+        first = compute_phase_fingerprint(packages)
+        (tmp_path / "match" / "utils" / "other.py").write_text("c = 2")
+        assert compute_phase_fingerprint(packages) == first
+
+        helper.write_text("b = 2")
+        assert compute_phase_fingerprint(packages) != first
+
+    def test_enrich_fingerprint_covers_imported_match_helpers(self):
+        from sotd.enrich.run import ENRICH_SOURCE_PACKAGES
+
+        assert "match.brush.strategies.utils" in ENRICH_SOURCE_PACKAGES
+        # Every entry names an existing package or module
+        compute_phase_fingerprint(ENRICH_SOURCE_PACKAGES)
+
+
+class TestIncrementalRun:
+    """Test reuse decisions against a previous output file."""
+
+    def test_reuses_only_unchanged_records(self, tmp_path):
+        out_path = tmp_path / "out.json"
+        records = [{"id": "a", "value": 1}, {"id": "b", "value": 2}]
+        _write_output(out_path, "fp", records, {"a": "h1", "b": "h2"})
+
+        run = IncrementalRun("fp", out_path)
+
+        assert run.reuse("a", "h1") == {"id": "a", "value": 1}
+        assert run.reuse("b", "changed") is None
+        assert run.reuse("c", "h3") is None
+        assert run.reuse(None, "h4") is None
+        assert (run.reused, run.processed) == (1, 3)
+        assert run.meta() == {
+            "input_fingerprint": "fp",
+            "input_hashes": {"a": "h1", "b": "changed", "c": "h3"},
+        }
+
+    def test_changed_fingerprint_reprocesses_everything(self, tmp_path):
+        out_path = tmp_path / "out.json"
+        _write_output(out_path, "old", [{"id": "a"}], {"a": "h1"})
+
+        assert IncrementalRun("new", out_path).reuse("a", "h1") is None
+
+    def test_extra_record_keys_and_meta_key(self, tmp_path):
+        out_path = tmp_path / "out.json"
+        out_path.write_text(
+            json.dumps(
+                {
+                    "metadata": {"input_fingerprint": "fp", "input_hashes": {"a": "h", "s": "h"}},
+                    "data": [{"id": "a"}],
+                    "skipped": [{"id": "s", "body": "no products"}],
+                }
+            )
+        )
+
+        run = IncrementalRun("fp", out_path, meta_key="metadata", record_keys=("data", "skipped"))
+
+        assert run.reuse("s", "h") == {"id": "s", "body": "no products"}
+
+    def test_missing_or_invalid_previous_output(self, tmp_path):
+        assert IncrementalRun("fp", tmp_path / "none.json").reuse("a", "h") is None
+        broken = tmp_path / "broken.json"
+        broken.write_text("not json")
+        assert IncrementalRun("fp", broken).reuse("a", "h") is None
@@ -491,6 +491,7 @@ class TestBrushValidationAPI:
             "validated",
             "split_brush",  # This should trigger special handling
         )
+        updater.compact()
 
         # Verify the data structure
         assert saved_data is not None, "No data was saved"
@@ -44,7 +44,7 @@ class TestBrushSplitsAPI:
         assert data["statistics"]["total"] == 0
 
     @patch("webui.api.brush_splits.validator")
-    @patch("pathlib.Path.exists")
+    @patch("webui.api.brush_splits.json_file_exists")
     def test_load_brush_splits_success(self, mock_exists, mock_validator):
         """Test successful loading of brush splits."""
         # Mock file existence
@@ -80,7 +80,9 @@ class TestBrushSplitsAPI:
 
         try:
             # Mock the file opening to return our test data
-            with patch("builtins.open", return_value=open(temp_file_path, "r")):
+            with patch(
+                "webui.api.brush_splits.open_json_text", return_value=open(temp_file_path, "r")
+            ):
                 response = client.get("/api/brushes/splits/load?months=2025-01")
 
                 assert response.status_code == 200
@@ -106,7 +108,7 @@ class TestBrushSplitsAPI:
             Path(temp_file_path).unlink(missing_ok=True)
 
     @patch("webui.api.brush_splits.validator")
-    @patch("pathlib.Path.exists")
+    @patch("webui.api.brush_splits.json_file_exists")
     def test_load_brush_splits_file_not_found(self, mock_exists, mock_validator):
         """Test loading brush splits when file doesn't exist."""
         mock_exists.return_value = False
@@ -121,7 +123,7 @@ class TestBrushSplitsAPI:
         assert data["statistics"]["total"] == 0
 
     @patch("webui.api.brush_splits.validator")
-    @patch("pathlib.Path.exists")
+    @patch("webui.api.brush_splits.json_file_exists")
     def test_load_brush_splits_corrupted_file(self, mock_exists, mock_validator):
         """Test loading brush splits with corrupted JSON file."""
         mock_exists.return_value = True
@@ -131,7 +133,7 @@ class TestBrushSplitsAPI:
         mock_file.write("invalid json content")
         mock_file.close()
 
-        with patch("builtins.open", return_value=open(mock_file.name, "r")):
+        with patch("webui.api.brush_splits.open_json_text", return_value=open(mock_file.name, "r")):
             response = client.get("/api/brushes/splits/load?months=2025-01")
 
             assert response.status_code == 200
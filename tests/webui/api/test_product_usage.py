@@ -38,7 +38,7 @@ class TestProductUsageAPI:
         assert response.status_code == 400
         assert "Invalid product type" in response.json()["detail"]
 
-    @patch("webui.api.product_usage.Path.exists")
+    @patch("webui.api.product_usage.json_file_exists")
     def test_get_products_for_month_no_data(self, mock_exists):
         """Test handling when month has no data."""
         mock_exists.return_value = False
@@ -48,22 +48,21 @@ class TestProductUsageAPI:
         data = response.json()
         assert data == []
 
-    @patch("webui.api.product_usage.Path.open")
-    def test_get_products_for_month_razor(self, mock_open):
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
+    def test_get_products_for_month_razor(self, mock_open, mock_exists):
         """Test getting products for razor type."""
-        # Patch Path.exists directly on the class
-        original_exists = Path.exists
 
-        def exists_side_effect(self):
+        def exists_side_effect(path):
             # product_usage_file path should not exist
-            if "product_usage" in str(self):
+            if "product_usage" in str(path):
                 return False
             # enriched_file path should exist
-            if "enriched" in str(self):
+            if "enriched" in str(path):
                 return True
-            return original_exists(self)
+            return False
 
-        Path.exists = exists_side_effect
+        mock_exists.side_effect = exists_side_effect
 
         mock_file = Mock()
         mock_file.__enter__ = Mock(return_value=mock_file)
@@ -97,35 +96,30 @@ class TestProductUsageAPI:
             ]
         }
 
-        try:
-            with patch("webui.api.product_usage.json.load", return_value=enriched_data):
-                response = client.get("/api/product-usage/products/2025-06/razor")
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data) == 2
-                # Should be sorted by usage count
-                assert data[0]["brand"] == "Gillette"
-                assert data[0]["model"] == "Tech"
-                assert data[0]["usage_count"] == 2
-                assert data[0]["unique_users"] == 2
-        finally:
-            # Restore original exists method
-            Path.exists = original_exists
-
-    @patch("webui.api.product_usage.Path.open")
-    def test_get_products_for_month_with_search(self, mock_open):
+        with patch("webui.api.product_usage.json.load", return_value=enriched_data):
+            response = client.get("/api/product-usage/products/2025-06/razor")
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 2
+            # Should be sorted by usage count
+            assert data[0]["brand"] == "Gillette"
+            assert data[0]["model"] == "Tech"
+            assert data[0]["usage_count"] == 2
+            assert data[0]["unique_users"] == 2
+
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
+    def test_get_products_for_month_with_search(self, mock_open, mock_exists):
         """Test product search functionality."""
-        # Patch Path.exists directly on the class
-        original_exists = Path.exists
 
-        def exists_side_effect(self):
-            if "product_usage" in str(self):
+        def exists_side_effect(path):
+            if "product_usage" in str(path):
                 return False
-            if "enriched" in str(self):
+            if "enriched" in str(path):
                 return True
-            return original_exists(self)
+            return False
 
-        Path.exists = exists_side_effect
+        mock_exists.side_effect = exists_side_effect
 
         mock_file = Mock()
         mock_file.__enter__ = Mock(return_value=mock_file)
@@ -152,30 +146,26 @@ class TestProductUsageAPI:
             ]
         }
 
-        try:
-            with patch("webui.api.product_usage.json.load", return_value=enriched_data):
-                response = client.get("/api/product-usage/products/2025-06/razor?search=Gillette")
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data) == 1
-                assert data[0]["brand"] == "Gillette"
-        finally:
-            Path.exists = original_exists
+        with patch("webui.api.product_usage.json.load", return_value=enriched_data):
+            response = client.get("/api/product-usage/products/2025-06/razor?search=Gillette")
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 1
+            assert data[0]["brand"] == "Gillette"
 
-    @patch("webui.api.product_usage.Path.open")
-    def test_get_products_for_month_soap(self, mock_open):
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
+    def test_get_products_for_month_soap(self, mock_open, mock_exists):
         """Test getting products for soap type."""
-        # Patch Path.exists directly on the class
-        original_exists = Path.exists
 
-        def exists_side_effect(self):
-            if "product_usage" in str(self):
+        def exists_side_effect(path):
+            if "product_usage" in str(path):
                 return False
-            if "enriched" in str(self):
+            if "enriched" in str(path):
                 return True
-            return original_exists(self)
+            return False
 
-        Path.exists = exists_side_effect
+        mock_exists.side_effect = exists_side_effect
 
         mock_file = Mock()
         mock_file.__enter__ = Mock(return_value=mock_file)
@@ -195,31 +185,27 @@ class TestProductUsageAPI:
             ]
         }
 
-        try:
-            with patch("webui.api.product_usage.json.load", return_value=enriched_data):
-                response = client.get("/api/product-usage/products/2025-06/soap")
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data) == 1
-                assert data[0]["brand"] == "Grooming Dept"
-                assert data[0]["model"] == "Laundry II"
-        finally:
-            Path.exists = original_exists
-
-    @patch("webui.api.product_usage.Path.open")
-    def test_get_product_usage_analysis_success(self, mock_open):
+        with patch("webui.api.product_usage.json.load", return_value=enriched_data):
+            response = client.get("/api/product-usage/products/2025-06/soap")
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 1
+            assert data[0]["brand"] == "Grooming Dept"
+            assert data[0]["model"] == "Laundry II"
+
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
+    def test_get_product_usage_analysis_success(self, mock_open, mock_exists):
         """Test successful product usage analysis."""
-        # Patch Path.exists directly on the class
-        original_exists = Path.exists
 
-        def exists_side_effect(self):
-            if "product_usage" in str(self):
+        def exists_side_effect(path):
+            if "product_usage" in str(path):
                 return False
-            if "enriched" in str(self):
+            if "enriched" in str(path):
                 return True
-            return original_exists(self)
+            return False
 
-        Path.exists = exists_side_effect
+        mock_exists.side_effect = exists_side_effect
 
         mock_file = Mock()
         mock_file.__enter__ = Mock(return_value=mock_file)
@@ -256,38 +242,33 @@ class TestProductUsageAPI:
             ]
         }
 
-        try:
-            with patch("webui.api.product_usage.json.load", return_value=enriched_data):
-                with patch(
-                    "webui.api.product_usage._extract_date_from_thread_title"
-                ) as mock_extract:
-                    # Mock date extraction
-                    from datetime import datetime
-
-                    def extract_date(title):
-                        if "Jun 01" in title:
-                            return datetime(2025, 6, 1)
-                        elif "Jun 02" in title:
-                            return datetime(2025, 6, 2)
+        with patch("webui.api.product_usage.json.load", return_value=enriched_data):
+            with patch("webui.api.product_usage._extract_date_from_thread_title") as mock_extract:
+                # Mock date extraction
+                from datetime import datetime
+
+                def extract_date(title):
+                    if "Jun 01" in title:
                         return datetime(2025, 6, 1)
+                    elif "Jun 02" in title:
+                        return datetime(2025, 6, 2)
+                    return datetime(2025, 6, 1)
 
-                    mock_extract.side_effect = extract_date
-
-                    response = client.get("/api/product-usage/analysis/2025-06/razor/Gillette/Tech")
-                    assert response.status_code == 200
-                    data = response.json()
-                    assert data["product"]["brand"] == "Gillette"
-                    assert data["product"]["model"] == "Tech"
-                    assert data["total_usage"] == 3
-                    assert data["unique_users"] == 2
-                    assert len(data["users"]) == 2
-                    # user1 should have higher usage count
-                    assert data["users"][0]["username"] == "user1"
-                    assert data["users"][0]["usage_count"] == 2
-        finally:
-            Path.exists = original_exists
-
-    @patch("webui.api.product_usage.Path.exists")
+                mock_extract.side_effect = extract_date
+
+                response = client.get("/api/product-usage/analysis/2025-06/razor/Gillette/Tech")
+                assert response.status_code == 200
+                data = response.json()
+                assert data["product"]["brand"] == "Gillette"
+                assert data["product"]["model"] == "Tech"
+                assert data["total_usage"] == 3
+                assert data["unique_users"] == 2
+                assert len(data["users"]) == 2
+                # user1 should have higher usage count
+                assert data["users"][0]["username"] == "user1"
+                assert data["users"][0]["usage_count"] == 2
+
+    @patch("webui.api.product_usage.json_file_exists")
     def test_get_product_usage_analysis_no_data(self, mock_exists):
         """Test handling when month has no data."""
         mock_exists.return_value = False
@@ -295,8 +276,8 @@ class TestProductUsageAPI:
         response = client.get("/api/product-usage/analysis/2025-06/razor/Gillette/Tech")
         assert response.status_code == 404
 
-    @patch("webui.api.product_usage.Path.exists")
-    @patch("webui.api.product_usage.Path.open")
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
     def test_get_product_usage_analysis_product_not_found(self, mock_open, mock_exists):
         """Test handling when product is not found."""
         mock_exists.return_value = True
@@ -323,20 +304,19 @@ class TestProductUsageAPI:
             assert response.status_code == 404
             assert "not found" in response.json()["detail"].lower()
 
-    @patch("webui.api.product_usage.Path.open")
-    def test_get_products_for_month_brush(self, mock_open):
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
+    def test_get_products_for_month_brush(self, mock_open, mock_exists):
         """Test getting products for brush type."""
-        # Patch Path.exists directly on the class
-        original_exists = Path.exists
 
-        def exists_side_effect(self):
-            if "product_usage" in str(self):
+        def exists_side_effect(path):
+            if "product_usage" in str(path):
                 return False
-            if "enriched" in str(self):
+            if "enriched" in str(path):
                 return True
-            return original_exists(self)
+            return False
 
-        Path.exists = exists_side_effect
+        mock_exists.side_effect = exists_side_effect
 
         mock_file = Mock()
         mock_file.__enter__ = Mock(return_value=mock_file)
@@ -361,22 +341,19 @@ class TestProductUsageAPI:
             ]
         }
 
-        try:
-            with patch("webui.api.product_usage.json.load", return_value=enriched_data):
-                response = client.get("/api/product-usage/products/2025-06/brush")
-                assert response.status_code == 200
-                data = response.json()
-                assert len(data) == 1
-                assert data[0]["brand"] == "Semogue"
-                assert data[0]["model"] == "610"
-        finally:
-            Path.exists = original_exists
-
-    @patch("webui.api.product_usage.Path.exists")
-    @patch("webui.api.product_usage.Path.open")
+        with patch("webui.api.product_usage.json.load", return_value=enriched_data):
+            response = client.get("/api/product-usage/products/2025-06/brush")
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 1
+            assert data[0]["brand"] == "Semogue"
+            assert data[0]["model"] == "610"
+
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
     def test_get_product_yearly_summary_success(self, mock_open, mock_exists):
         """Test successful yearly summary retrieval."""
-        # Mock Path.exists to return True for all months
+        # Every month has an aggregated file
         mock_exists.return_value = True
 
         # Mock aggregated data
@@ -407,7 +384,7 @@ class TestProductUsageAPI:
             months_with_data = [m for m in data["months"] if m["has_data"]]
             assert len(months_with_data) > 0
 
-    @patch("webui.api.product_usage.Path.exists")
+    @patch("webui.api.product_usage.json_file_exists")
     def test_get_product_yearly_summary_missing_months(self, mock_exists):
         """Test yearly summary with missing months."""
         # Return False for all months (no aggregated files)
@@ -424,8 +401,8 @@ class TestProductUsageAPI:
             assert month_data["unique_users"] == 0
             assert month_data["rank"] is None
 
-    @patch("webui.api.product_usage.Path.exists")
-    @patch("webui.api.product_usage.Path.open")
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
     def test_get_product_yearly_summary_product_not_found(self, mock_open, mock_exists):
         """Test yearly summary when product is not found in some months."""
         mock_exists.return_value = True
@@ -459,8 +436,8 @@ class TestProductUsageAPI:
         assert response.status_code == 400
         assert "Invalid month format" in response.json()["detail"]
 
-    @patch("webui.api.product_usage.Path.exists")
-    @patch("webui.api.product_usage.Path.open")
+    @patch("webui.api.product_usage.json_file_exists")
+    @patch("webui.api.product_usage.open_json_text")
     def test_get_product_yearly_summary_soap_format(self, mock_open, mock_exists):
         """Test yearly summary for soap with correct name format."""
         mock_exists.return_value = True
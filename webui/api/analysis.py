@@ -34,6 +34,7 @@ def get_data_directory() -> Path:
 
 
 # Import the existing FilteredEntriesManager instead of duplicating logic
+from sotd.utils.file_io import json_file_exists, open_json_text  # noqa: E402
 from sotd.utils.filtered_entries import FilteredEntriesManager  # noqa: E402
 
 try:
@@ -346,9 +347,9 @@ def find_comment_by_id(comment_id: str, months: List[str]) -> tuple[Optional[dic
     # First, try enriched files (which contain both matched and enriched data)
     for month in months:
         enriched_path = get_data_directory() / "enriched" / f"{month}.json"
-        if enriched_path.exists():
+        if json_file_exists(enriched_path):
             try:
-                with enriched_path.open("r", encoding="utf-8") as f:
+                with open_json_text(enriched_path) as f:
                     data = json.load(f)
 
                 for record in data.get("data", []):
@@ -361,9 +362,9 @@ def find_comment_by_id(comment_id: str, months: List[str]) -> tuple[Optional[dic
     # Fallback to matched files
     for month in months:
         matched_path = get_data_directory() / "matched" / f"{month}.json"
-        if matched_path.exists():
+        if json_file_exists(matched_path):
             try:
-                with matched_path.open("r", encoding="utf-8") as f:
+                with open_json_text(matched_path) as f:
                     data = json.load(f)
 
                 for record in data.get("data", []):
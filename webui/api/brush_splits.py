@@ -19,6 +19,8 @@ import yaml
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from sotd.utils.file_io import json_file_exists, open_json_text
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
@@ -865,7 +867,7 @@ async def load_brush_splits(
 
         for month in months:
             file_path = Path(f"../data/matched/{month}.json")
-            if not file_path.exists():
+            if not json_file_exists(file_path):
                 logger.error(f"Month file not found: {file_path}")
                 failed_months.append(month)
                 continue
@@ -873,7 +875,7 @@ async def load_brush_splits(
             try:
                 # File reading with progress tracking
                 logger.info(f"Loading data from {month}.json")
-                with open(file_path, "r", encoding="utf-8") as f:
+                with open_json_text(file_path) as f:
                     data = json.load(f)
 
                 if not isinstance(data, dict) or "data" not in data:
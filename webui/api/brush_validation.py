@@ -8,7 +8,9 @@ from typing import Any, Dict, List, Literal, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, field_validator
 
+from sotd.match.brush.diagnostics import attach_brush_diagnostics
 from sotd.match.brush.validation.cli import BrushValidationCLI
+from sotd.utils.file_io import open_json_text
 from webui.api.files import get_available_months
 
 logger = logging.getLogger(__name__)
@@ -264,8 +266,9 @@ async def get_brush_validation_data(
                     project_root = Path(__file__).parent.parent.parent
                     matched_file = project_root / "data" / "matched" / f"{month}.json"
 
-                    with open(matched_file, "r") as f:
+                    with open_json_text(matched_file) as f:
                         raw_data = json.load(f)
+                    attach_brush_diagnostics(raw_data["data"], project_root / "data", month)
 
                     logger.info(f"Raw data loaded, entries: {len(raw_data['data'])}")
 
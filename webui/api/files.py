@@ -10,6 +10,8 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from sotd.utils.file_io import iter_json_files, json_file_exists, open_json_text, resolve_json_path
+
 logger = logging.getLogger(__name__)
 
 # Create router for file endpoints
@@ -47,7 +49,7 @@ def get_data_directory() -> Path:
 def validate_json_file(file_path: Path) -> bool:
     """Validate that a file contains valid JSON."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open_json_text(file_path) as f:
             json.load(f)
         return True
     except (json.JSONDecodeError, UnicodeDecodeError) as e:
@@ -68,15 +70,15 @@ async def get_available_months() -> AvailableMonths:
             logger.warning(f"Data directory does not exist: {data_dir}")
             return AvailableMonths(months=[], total_months=0)
 
-        # Find all JSON files in the directory
-        json_files = list(data_dir.glob("*.json"))
+        # Find all JSON files in the directory (plain or compressed)
+        json_files = list(iter_json_files(data_dir))
 
         # Extract month names from filenames (YYYY-MM.json format)
         months = []
         for file_path in json_files:
             if file_path.stem:
                 # Skip validation for performance - just check if file exists and has content
-                if file_path.stat().st_size > 0:
+                if resolve_json_path(file_path).stat().st_size > 0:
                     months.append(file_path.stem)
 
         # Sort months chronologically
@@ -97,7 +99,7 @@ async def get_month_data(month: str) -> MonthData:
         data_dir = get_data_directory()
         file_path = data_dir / f"{month}.json"
 
-        if not file_path.exists():
+        if not json_file_exists(file_path):
             raise HTTPException(
                 status_code=404,
                 detail=f"Month data not found: {month}. "
@@ -109,7 +111,7 @@ async def get_month_data(month: str) -> MonthData:
             raise HTTPException(status_code=500, detail=f"Invalid JSON in month file: {month}")
 
         # Read and parse the file
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open_json_text(file_path) as f:
             data = json.load(f)
 
         # Extract records from the data structure
@@ -137,11 +139,11 @@ async def get_month_summary(month: str) -> Dict[str, Any]:
         data_dir = get_data_directory()
         file_path = data_dir / f"{month}.json"
 
-        if not file_path.exists():
+        if not json_file_exists(file_path):
             raise HTTPException(status_code=404, detail=f"Month data not found: {month}")
 
         # Read the file
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open_json_text(file_path) as f:
             data = json.load(f)
 
         records = data.get("data", [])
@@ -150,7 +152,7 @@ async def get_month_summary(month: str) -> Dict[str, Any]:
         summary = {
             "month": month,
             "total_records": len(records),
-            "file_size_bytes": file_path.stat().st_size,
+            "file_size_bytes": resolve_json_path(file_path).stat().st_size,
             "fields_present": {},
             "match_stats": {"total_matched": 0, "total_unmatched": 0, "match_types": {}},
         }
@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from sotd.utils.file_io import json_file_exists, open_json_text
+
 logger = logging.getLogger(__name__)
 
 # Create router for format compatibility endpoints
@@ -184,13 +186,13 @@ async def analyze_format_compatibility(
     for month in month_list:
         enriched_file = ENRICHED_DATA_DIR / f"{month}.json"
 
-        if not enriched_file.exists():
+        if not json_file_exists(enriched_file):
             logger.warning(f"Enriched data file not found: {enriched_file}")
             failed_months.append(month)
             continue
 
         try:
-            with enriched_file.open("r", encoding="utf-8") as f:
+            with open_json_text(enriched_file) as f:
                 data = json.load(f)
 
             if not isinstance(data, dict) or "data" not in data:
@@ -18,6 +18,7 @@ from sotd.aggregate.aggregators.user_analysis import aggregate_user_analysis  #
 from sotd.aggregate.aggregators.users.user_aggregator import (  # noqa: E402
     aggregate_users,
 )
+from sotd.utils.file_io import iter_json_files, json_file_exists, open_json_text  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -61,14 +62,14 @@ async def get_available_months() -> List[MonthData]:
             return []
 
         months = []
-        for file_path in enriched_dir.glob("*.json"):
+        for file_path in iter_json_files(enriched_dir):
             month = file_path.stem
             if month and len(month) == 7 and month[4] == "-":  # YYYY-MM format
                 # Check if file has data
                 try:
                     import json
 
-                    with open(file_path, "r", encoding="utf-8") as f:
+                    with open_json_text(file_path) as f:
                         data = json.load(f)
                         user_count = len(
                             set(
@@ -105,9 +106,9 @@ async def get_users_for_month(
             project_root / "data" / "aggregated" / "user_analysis" / f"{month}.json"
         )
 
-        if user_analysis_file.exists():
+        if json_file_exists(user_analysis_file):
             try:
-                with user_analysis_file.open("r", encoding="utf-8") as f:
+                with open_json_text(user_analysis_file) as f:
                     user_analysis_data = json.load(f)
 
                 # Extract users from the analysis data
@@ -135,10 +136,10 @@ async def get_users_for_month(
         try:
             enriched_file = project_root / "data" / "enriched" / f"{month}.json"
 
-            if not enriched_file.exists():
+            if not json_file_exists(enriched_file):
                 return []
 
-            with enriched_file.open("r", encoding="utf-8") as f:
+            with open_json_text(enriched_file) as f:
                 enriched_data = json.load(f)
 
             # Use existing user aggregation logic
@@ -178,9 +179,9 @@ async def get_user_posting_analysis(month: str, username: str) -> UserPostingAna
             project_root / "data" / "aggregated" / "user_analysis" / f"{month}.json"
         )
 
-        if user_analysis_file.exists():
+        if json_file_exists(user_analysis_file):
             try:
-                with user_analysis_file.open("r", encoding="utf-8") as f:
+                with open_json_text(user_analysis_file) as f:
                     user_analysis_data = json.load(f)
 
                 # Find the specific user
@@ -206,10 +207,10 @@ async def get_user_posting_analysis(month: str, username: str) -> UserPostingAna
         try:
             enriched_file = project_root / "data" / "enriched" / f"{month}.json"
 
-            if not enriched_file.exists():
+            if not json_file_exists(enriched_file):
                 raise HTTPException(status_code=404, detail=f"No data available for {month}")
 
-            with enriched_file.open("r", encoding="utf-8") as f:
+            with open_json_text(enriched_file) as f:
                 enriched_data = json.load(f)
 
             # Generate user analysis on-demand
@@ -20,6 +20,7 @@ from sotd.aggregate.aggregators.product_usage import aggregate_product_usage  #
 from sotd.aggregate.aggregators.users.user_aggregator import (  # noqa: E402
     _extract_date_from_thread_title,
 )
+from sotd.utils.file_io import json_file_exists, open_json_text  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -172,9 +173,9 @@ async def get_products_for_month(
             project_root / "data" / "aggregated" / "product_usage" / f"{month}.json"
         )
 
-        if product_usage_file.exists():
+        if json_file_exists(product_usage_file):
             try:
-                with product_usage_file.open("r", encoding="utf-8") as f:
+                with open_json_text(product_usage_file) as f:
                     product_usage_data = json.load(f)
 
                 # Extract products from the product type category
@@ -216,10 +217,10 @@ async def get_products_for_month(
         try:
             enriched_file = project_root / "data" / "enriched" / f"{month}.json"
 
-            if not enriched_file.exists():
+            if not json_file_exists(enriched_file):
                 return []
 
-            with enriched_file.open("r", encoding="utf-8") as f:
+            with open_json_text(enriched_file) as f:
                 enriched_data = json.load(f)
 
             # Extract products from records
@@ -316,9 +317,9 @@ async def get_product_usage_analysis(
             project_root / "data" / "aggregated" / "product_usage" / f"{month}.json"
         )
 
-        if product_usage_file.exists():
+        if json_file_exists(product_usage_file):
             try:
-                with product_usage_file.open("r", encoding="utf-8") as f:
+                with open_json_text(product_usage_file) as f:
                     product_usage_data = json.load(f)
 
                 # Find product in the appropriate category
@@ -347,10 +348,10 @@ async def get_product_usage_analysis(
         try:
             enriched_file = project_root / "data" / "enriched" / f"{month}.json"
 
-            if not enriched_file.exists():
+            if not json_file_exists(enriched_file):
                 raise HTTPException(status_code=404, detail=f"No data available for {month}")
 
-            with enriched_file.open("r", encoding="utf-8") as f:
+            with open_json_text(enriched_file) as f:
                 enriched_data = json.load(f)
 
             # Generate product usage analysis on-demand
@@ -461,7 +462,7 @@ async def get_product_yearly_summary(
         for month_str in months:
             aggregated_file = aggregated_dir / f"{month_str}.json"
 
-            if not aggregated_file.exists():
+            if not json_file_exists(aggregated_file):
                 # Month has no aggregated data
                 monthly_summaries.append(
                     {
@@ -475,7 +476,7 @@ async def get_product_yearly_summary(
                 continue
 
             try:
-                with aggregated_file.open("r", encoding="utf-8") as f:
+                with open_json_text(aggregated_file) as f:
                     aggregated_data = json.load(f)
 
                 # Find product in category array
@@ -9,7 +9,7 @@ import time
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from rich.console import Console
 
@@ -335,17 +335,17 @@ class QueueManager:
 
         return operations
 
-    def _remove_operation_from_queue(self, operation_id: str) -> None:
+    def _remove_operations_from_queue(self, operation_ids: Set[str]) -> None:
         """
-        Remove completed operation from queue file.
+        Remove completed operations from queue file.
 
         Args:
-            operation_id: Operation ID to remove
+            operation_ids: Operation IDs to remove
         """
         if not self.queue_file.exists():
             return
 
-        # Read all lines, filter out the completed operation
+        # Read all lines, filter out the completed operations
         lines = []
         try:
             with self.queue_file.open("r", encoding="utf-8") as f:
@@ -355,7 +355,7 @@ class QueueManager:
                         continue
                     try:
                         operation = json.loads(line)
-                        if operation.get("operation_id") != operation_id:
+                        if operation.get("operation_id") not in operation_ids:
                             lines.append(line)
                     except json.JSONDecodeError:
                         # Keep invalid lines (don't lose data)
@@ -367,54 +367,48 @@ class QueueManager:
                 for line in lines:
                     f.write(line + "\n")
         except Exception as e:
-            logger.error(f"Failed to remove operation from queue: {e}")
+            logger.error(f"Failed to remove operations from queue: {e}")
 
-    def _process_operation(self, operation: Dict[str, Any]) -> bool:
+    def _apply_operation(self, manager: Any, operation: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Process a single operation.
+        Apply a single operation to the loaded correct matches (nothing is saved).
 
         Args:
+            manager: CorrectMatchesManager with correct matches loaded
             operation: Operation dictionary
 
         Returns:
-            True if successful, False otherwise
+            Result dictionary with marked_count and errors
         """
         operation_id = operation["operation_id"]
         operation_type = operation["type"]
         field = operation["field"]
         matches = operation["matches"]
 
-        try:
-            # Update status to processing
-            self._update_status(
-                operation_id, "processing", 0.1, f"Processing {len(matches)} matches..."
-            )
+        # Update status to processing
+        self._update_status(
+            operation_id, "processing", 0.1, f"Processing {len(matches)} matches..."
+        )
 
-            # Import here to avoid circular dependencies
-            from rich.console import Console
-            from sotd.match.tools.managers.correct_matches_manager import CorrectMatchesManager
+        marked_count = 0
+        errors = []
 
-            console = Console()
-            manager = CorrectMatchesManager(console, self.correct_matches_path)
+        # Progress is reported about ten times per operation rather than per match,
+        # since every update rewrites the status file
+        progress_every = max(1, len(matches) // 10)
 
-            # Load only the affected field (optimization)
-            # For now, we still load all fields, but this can be optimized later
-            manager.load_correct_matches()
-
-            marked_count = 0
-            errors = []
-
-            # Process each match
-            for i, match in enumerate(matches):
-                try:
-                    original = match.get("original", "")
-                    matched = match.get("matched", {})
+        # Process each match
+        for i, match in enumerate(matches):
+            try:
+                original = match.get("original", "")
+                matched = match.get("matched", {})
 
-                    if not original or not matched:
-                        errors.append(f"Invalid match data: {match}")
-                        continue
+                if not original or not matched:
+                    errors.append(f"Invalid match data: {match}")
+                    continue
 
-                    # Update progress
+                # Update progress
+                if i % progress_every == 0:
                     progress = 0.2 + (i / len(matches)) * 0.6  # 20% to 80%
                     self._update_status(
                         operation_id,
@@ -423,69 +417,111 @@ class QueueManager:
                         f"Processing match {i + 1}/{len(matches)}...",
                     )
 
-                    # Prepare match data
-                    if field == "blade" and "format" in matched:
-                        match_data_to_save = {
-                            "original": original,
-                            "matched": matched,
-                            "field": field,
-                        }
+                # Prepare match data
+                match_data_to_save = {
+                    "original": original,
+                    "matched": matched,
+                    "field": field,
+                }
+
+                # Mark or remove match
+                match_key = manager.create_match_key(field, original, matched)
+
+                if operation_type == "mark_correct":
+                    manager.mark_match_as_correct(match_key, match_data_to_save)
+                    marked_count += 1
+                elif operation_type == "remove_correct":
+                    # Use the manager's remove_match method
+                    if manager.remove_match(field, original, matched):
+                        marked_count += 1
                     else:
-                        match_data_to_save = {
-                            "original": original,
-                            "matched": matched,
-                            "field": field,
-                        }
+                        errors.append(f"Match not found: {original}")
 
-                    # Mark or remove match
-                    match_key = manager.create_match_key(field, original, matched)
+            except Exception as e:
+                errors.append(f"Error processing match {match}: {e}")
+                logger.error(f"Error processing match in operation {operation_id}: {e}")
 
-                    if operation_type == "mark_correct":
-                        manager.mark_match_as_correct(match_key, match_data_to_save)
-                        marked_count += 1
-                    elif operation_type == "remove_correct":
-                        # Use the manager's remove_match method
-                        if manager.remove_match(field, original, matched):
-                            marked_count += 1
-                        else:
-                            errors.append(f"Match not found: {original}")
+        return {"marked_count": marked_count, "errors": errors}
+
+    def apply_operations(self, operations: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Apply queued operations with one load and one save of the correct matches.
 
+        However many operations (and matches) are pending, the correct_matches
+        files are parsed once and written once, instead of once per operation.
+
+        Args:
+            operations: Operation dictionaries, in queue order
+
+        Returns:
+            Mapping of operation ID to whether it completed
+        """
+        # Import here to avoid circular dependencies
+        from sotd.match.correct_matches_updater import compact_pending_journal
+        from sotd.match.tools.managers.correct_matches_manager import CorrectMatchesManager
+
+        succeeded: Dict[str, bool] = {}
+        results: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            # Fold in entries journaled by brush validation first, so the save
+            # below writes them too
+            compact_pending_journal(self.correct_matches_path)
+
+            manager = CorrectMatchesManager(Console(), self.correct_matches_path)
+            manager.load_correct_matches()
+
+            for operation in operations:
+                if self._stop_event.is_set():
+                    logger.info("Stop event set, stopping queue processing")
+                    break
+
+                operation_id = operation["operation_id"]
+                try:
+                    results[operation_id] = self._apply_operation(manager, operation)
                 except Exception as e:
-                    errors.append(f"Error processing match {match}: {e}")
-                    logger.error(f"Error processing match in operation {operation_id}: {e}")
+                    logger.error(f"Error processing operation {operation_id}: {e}", exc_info=True)
+                    self._update_status(
+                        operation_id, "failed", 0.0, f"Error: {str(e)}", {"error": str(e)}
+                    )
+                    # Don't remove from queue on failure - allow retry
+                    succeeded[operation_id] = False
 
             # Save to file
-            if marked_count > 0:
-                self._update_status(operation_id, "processing", 0.9, "Saving changes to file...")
+            if any(result["marked_count"] > 0 for result in results.values()):
+                for operation_id in results:
+                    self._update_status(
+                        operation_id, "processing", 0.9, "Saving changes to file..."
+                    )
                 manager.save_correct_matches()
 
-            # Update status to completed
-            result = {"marked_count": marked_count, "errors": errors}
+        except Exception as e:
+            logger.error(f"Error processing queued operations: {e}", exc_info=True)
+            for operation_id in results:
+                self._update_status(
+                    operation_id, "failed", 0.0, f"Error: {str(e)}", {"error": str(e)}
+                )
+                succeeded[operation_id] = False
+            # Don't remove from queue on failure - allow retry
+            return succeeded
+
+        # Update status to completed
+        for operation_id, result in results.items():
             self._update_status(
                 operation_id,
                 "completed",
                 1.0,
-                f"Completed: {marked_count} matches processed",
+                f"Completed: {result['marked_count']} matches processed",
                 result,
             )
-
-            # Remove from queue
-            self._remove_operation_from_queue(operation_id)
-
-            logger.info(f"Operation {operation_id} completed: {marked_count} matches processed")
-            return True
-
-        except Exception as e:
-            logger.error(f"Error processing operation {operation_id}: {e}", exc_info=True)
-            self._update_status(
-                operation_id,
-                "failed",
-                0.0,
-                f"Error: {str(e)}",
-                {"error": str(e)},
+            succeeded[operation_id] = True
+            logger.info(
+                f"Operation {operation_id} completed: {result['marked_count']} matches processed"
             )
-            # Don't remove from queue on failure - allow retry
-            return False
+
+        # Remove from queue
+        self._remove_operations_from_queue(set(results))
+        return succeeded
 
     def _cleanup_old_completed_operations(self) -> None:
         """
@@ -554,16 +590,15 @@ class QueueManager:
 
             operations = self._read_queue()
             if not operations:
+                # Periodically fold entries journaled by brush validation into the
+                # YAML files so other readers see them
+                from sotd.match.correct_matches_updater import compact_pending_journal
+
+                compact_pending_journal(self.correct_matches_path)
                 return
 
             logger.info(f"Processing {len(operations)} queued operations")
-
-            for operation in operations:
-                if self._stop_event.is_set():
-                    logger.info("Stop event set, stopping queue processing")
-                    break
-
-                self._process_operation(operation)
+            self.apply_operations(operations)
 
         finally:
             self._processing = False
@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 # Import non-matches loading function and normalization
+from sotd.utils.file_io import json_file_exists, open_json_text
 from webui.api.utils.non_matches import (
     _canonicalize_brand_pair,
     _canonicalize_cross_brand_scent_key,
@@ -94,12 +95,12 @@ async def get_soap_duplicates(
 
         for month in month_list:
             month_file = data_dir / f"{month}.json"
-            if not month_file.exists():
+            if not json_file_exists(month_file):
                 logger.warning(f"No match data found for month: {month}")
                 continue
 
             try:
-                with open(month_file, "r") as f:
+                with open_json_text(month_file) as f:
                     match_data = json.load(f)
 
                 # Extract soap data from the data array
@@ -158,12 +159,12 @@ async def get_soap_pattern_suggestions(
 
         for month in month_list:
             month_file = data_dir / f"{month}.json"
-            if not month_file.exists():
+            if not json_file_exists(month_file):
                 logger.warning(f"No match data found for month: {month}")
                 continue
 
             try:
-                with open(month_file, "r") as f:
+                with open_json_text(month_file) as f:
                     match_data = json.load(f)
 
                 # Extract soap data from the data array
@@ -245,12 +246,12 @@ async def get_soap_neighbor_similarity(
 
         for month in month_list:
             month_file = data_dir / f"{month}.json"
-            if not month_file.exists():
+            if not json_file_exists(month_file):
                 logger.warning(f"No match data found for month: {month}")
                 continue
 
             try:
-                with open(month_file, "r") as f:
+                with open_json_text(month_file) as f:
                     match_data = json.load(f)
 
                 # Extract soap data from the data array
@@ -1069,12 +1070,12 @@ async def get_soap_group_by_matched(
         project_root = Path(__file__).parent.parent.parent
         for month in month_list:
             month_file = project_root / "data" / "matched" / f"{month}.json"
-            if not month_file.exists():
+            if not json_file_exists(month_file):
                 logger.warning(f"Month file not found: {month_file}")
                 continue
 
             try:
-                with open(month_file, "r", encoding="utf-8") as f:
+                with open_json_text(month_file) as f:
                     month_data = json.load(f)
                     # Extract soap data from the data array
                     if "data" in month_data and isinstance(month_data["data"], list):
@@ -18,6 +18,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from rapidfuzz import fuzz
 
+from sotd.utils.file_io import get_file_size_mb, json_file_exists, open_json_text
 from sotd.utils.wsdb_lookup import WSDBLookup
 
 logger = logging.getLogger(__name__)
@@ -1720,13 +1721,13 @@ async def batch_analyze_match_files(
             for month in month_list:
                 logger.info(f"📂 Loading match file: {month}.json")
                 month_file = data_dir / f"{month}.json"
-                if not month_file.exists():
+                if not json_file_exists(month_file):
                     logger.warning(f"⚠️ No match data found for month: {month}")
                     continue
 
                 try:
                     # Check file size before loading
-                    file_size_mb = month_file.stat().st_size / (1024 * 1024)
+                    file_size_mb = get_file_size_mb(month_file)
                     if file_size_mb > 10:
                         logger.warning(f"⚠️ Large file detected: {file_size_mb:.1f}MB for {month}")
                     if file_size_mb > 50:
@@ -1734,7 +1735,7 @@ async def batch_analyze_match_files(
                             f"📂 Loading large file ({file_size_mb:.1f}MB), this may take a moment..."
                         )
 
-                    with month_file.open("r", encoding="utf-8") as f:
+                    with open_json_text(month_file) as f:
                         match_data = json.load(f)
 
                     # Extract soap data from the data array